@@ -1,9 +1,10 @@
 # -*- mode: python ; coding: utf-8 -*-
 
-from PyInstaller.utils.hooks import collect_data_files
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules
 
 added_files = [
     ('../../src/utilities/*.py', 'utilities'),
+    ('../../src/utilities/catalogs/*.py', 'utilities/catalogs'),
     ('../../src/modules/*.py', 'modules')
 ]
 
@@ -12,7 +13,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=added_files,
-    hiddenimports=['_cffi_backend'],
+    hiddenimports=['_cffi_backend'] + collect_submodules('utilities.catalogs'),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,6 @@
+"""
+Micro benchmarks for the performance sensitive parts of pyRogue.
+
+They are not part of the shipped program. Run them from the src directory, e.g.:
+    python -m benchmarks.catalogBenchmark
+"""
@@ -0,0 +1,144 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Benchmark of the backup store on a directory of 500 backups.
+
+A login writes a backup of trainer.json and one of the slot file. Between two logins a few runs are
+played: play time and game stats grow, some dex entries and starters change, eggs are hatched and
+the slot holds a new run. The benchmark writes --logins logins as full indented copies, the way
+older versions did, and reports the disk usage. The copies are then migrated into the store, which
+reads every manifest back and compares it with the copy character for character before removing it.
+Most backups become deltas against the last keyframe of their series, --keyframes 0 stores every
+backup in full to compare.
+
+Objects are written without fsync by default; --fsync measures the writes as the tool does them.
+
+Usage Example:
+    cd src
+    python -m benchmarks.backupBenchmark --logins 250
+
+Output Example:
+    500 full copies                 ms/backup:    8.359   disk:    155.6 MiB
+    500 manifests, 2487 objects ms/backup:   49.025   disk:      2.3 MiB  (1.5 %)
+        manifests 500.5 KiB, objects 1.7 MiB, level 10, 238 deltas, keyframe every 21
+    Read backup                ms:   17.152  (trainer.json, byte-identical)
+    Write backup               ms:   38.837  (trainer.json, after a login)
+"""
+
+import argparse
+import copy
+import os
+import random
+import tempfile
+import time
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from modules import config
+from modules.data.backupStore import BackupStore
+from utilities import fh_dumpJSON, fh_writeJSONAtomic
+from benchmarks.jsonBenchmark import fh_realisticTrainerData
+from benchmarks.diffBenchmark import fh_bestOf
+
+def fh_realisticSlotData(rng: random.Random, trainerData: dict) -> dict:
+    # A run in progress: a full party, a few held items and the current wave.
+    species = [int(key) for key in trainerData['dexData']]
+    party = [{
+        'id': rng.randrange(2**31), 'player': True, 'species': rng.choice(species), 'formIndex': 0,
+        'abilityIndex': rng.randrange(3), 'passive': rng.random() < 0.3, 'shiny': rng.random() < 0.1,
+        'variant': 0, 'pokeball': rng.randrange(5), 'level': rng.randrange(1, 200), 'exp': rng.randrange(10**6),
+        'levelExp': rng.randrange(10**4), 'gender': rng.randrange(3), 'hp': rng.randrange(500),
+        'stats': [rng.randrange(500) for _ in range(6)], 'ivs': [rng.randrange(32) for _ in range(6)],
+        'nature': rng.randrange(25), 'natureOverride': -1, 'luck': 0, 'pauseEvolutions': False,
+        'friendship': rng.randrange(256), 'metLevel': 5, 'metBiome': rng.randrange(35), 'pokerus': False,
+        'moveset': [{'moveId': rng.randrange(900), 'ppUsed': rng.randrange(10), 'ppUp': 0, 'virtual': False} for _ in range(4)],
+        'status': None, 'fusionSpecies': None, 'fusionFormIndex': 0, 'fusionAbilityIndex': 0,
+        'fusionShiny': False, 'fusionVariant': 0, 'fusionGender': 0, 'fusionLuck': 0,
+        'boss': False, 'summonData': {'battleStats': [0] * 7, 'moveQueue': [], 'tags': []},
+    } for _ in range(6)]
+    modifiers = [{'player': True, 'typeId': f'ITEM_{rng.randrange(60)}', 'className': 'PokemonHeldItemModifier',
+                  'args': [party[rng.randrange(6)]['id']], 'stackCount': rng.randrange(1, 5)} for _ in range(12)]
+    return {
+        'seed': ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz0123456789') for _ in range(24)),
+        'playTime': rng.randrange(10**5), 'gameMode': 0, 'party': party, 'enemyParty': copy.deepcopy(party[:1]),
+        'modifiers': modifiers, 'enemyModifiers': [], 'arena': {'biome': rng.randrange(35), 'tags': []},
+        'pokeballCounts': {str(index): rng.randrange(20) for index in range(5)}, 'money': rng.randrange(10**6),
+        'score': 0, 'victoryCount': 0, 'faintCount': 0, 'reviveCount': 0, 'waveIndex': rng.randrange(1, 200),
+        'battleType': 0, 'trainer': None, 'gameVersion': '1.0.0', 'timestamp': trainerData['timestamp'], 'challenges': [],
+    }
+
+def fh_playBetweenLogins(rng: random.Random, trainerData: dict) -> None:
+    # What a few runs change in trainer.json.
+    trainerData['timestamp'] += rng.randrange(10**7)
+    for key in rng.sample(list(trainerData['gameStats']), 10):
+        trainerData['gameStats'][key] += rng.randrange(100)
+    for key in rng.sample(list(trainerData['dexData']), 5):
+        trainerData['dexData'][key]['seenCount'] += 1
+    if rng.random() < 0.5:
+        key = rng.choice(list(trainerData['starterData']))
+        trainerData['starterData'][key]['candyCount'] += rng.randrange(1, 20)
+    if rng.random() < 0.3:
+        trainerData['eggs'].pop(0)
+        trainerData['eggs'].append(dict(trainerData['eggs'][-1], id=rng.randrange(2**31)))
+
+def fh_directorySize(directory: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(directory) for name in files)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure the disk usage of backups before and after deduplication.')
+    parser.add_argument('--logins', type=int, default=250, help='Logins to simulate, each writes two backups.')
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions of the read measurement, the best run is reported.')
+    parser.add_argument('--level', type=int, help='zstd level of the stored sections, defaults to config.backupCompressionLevel.')
+    parser.add_argument('--keyframes', type=int, help='Deltas per keyframe, defaults to config.backupKeyframeInterval, 0 disables deltas.')
+    parser.add_argument('--fsync', action='store_true', help='Flush every written file to disk, as the tool does.')
+    args = parser.parse_args()
+    config.fsyncWrites = args.fsync
+
+    rng = random.Random(0)
+    trainerData = fh_realisticTrainerData()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # The full copies of older versions, two per login.
+        start = time.perf_counter()
+        for login in range(args.logins):
+            fh_playBetweenLogins(rng, trainerData)
+            timestamp = f'{1 + login // 3600:02d}.06.2024_{login // 60 % 60:02d}.{login % 60:02d}.00'
+            fh_writeJSONAtomic(os.path.join(directory, f'backup_gameData(2450)_{timestamp}.json'), trainerData)
+            fh_writeJSONAtomic(os.path.join(directory, f'backup_slotData(1_2450)_{timestamp}.json'), fh_realisticSlotData(rng, trainerData))
+        count = 2 * args.logins
+        before = fh_directorySize(directory)
+        print(f'{count} full copies{"":<16} ms/backup: {(time.perf_counter() - start) * 1000 / count:>8.3f}   disk: {before / 2**20:>8.1f} MiB')
+
+        store = BackupStore(directory, args.level, args.keyframes)
+        start = time.perf_counter()
+        migrated, kept = store.f_migrate()
+        seconds = time.perf_counter() - start
+        if kept:
+            raise SystemExit(f'{len(kept)} copies were not reassembled identically, first: {kept[0]}')
+        usage = store.f_diskUsage()
+        after = fh_directorySize(directory)
+        print(f'{usage["manifestCount"]} manifests, {usage["objectCount"]} objects ms/backup: {seconds * 1000 / len(migrated):>8.3f}'
+              f'   disk: {after / 2**20:>8.1f} MiB  ({after / before * 100:.1f} %)')
+        deltas = sum(record.keyframe is not None for record in store.index.f_list(2450))
+        print(f'    manifests {usage["manifests"] / 2**10:.1f} KiB, objects {usage["objects"] / 2**20:.1f} MiB, level {store.level}, '
+              f'{deltas} deltas, keyframe every {store.keyframeInterval + 1}')
+
+        # The latest backup, compared with the text a full copy would have. Usually a delta.
+        manifest = f'backup_gameData(2450)_{timestamp}.manifest.json'
+        if store.f_read(manifest) != fh_dumpJSON(trainerData):
+            raise SystemExit('The latest trainer backup does not reassemble to the data it was written from.')
+        seconds = fh_bestOf(lambda: store.f_read(manifest), args.repeat)
+        print(f'{"Read backup":<26} ms: {seconds * 1000:>8.3f}  (trainer.json, byte-identical)')
+
+        # A new backup only stores the sections that changed since the last one.
+        fh_playBetweenLogins(rng, trainerData)
+        start = time.perf_counter()
+        store.f_write('backup_gameData(2450)_31.12.2024_00.00.00', trainerData)
+        print(f'{"Write backup":<26} ms: {(time.perf_counter() - start) * 1000:>8.3f}  (trainer.json, after a login)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Benchmark of listing backups with the backup index against scanning the directory.
+
+The directory holds --count backup manifests of a few trainers and slots. Only the names and the
+manifest headers matter for listing, so the manifests reference no sections. Measured are:
+- the directory scan of older versions: os.listdir, a regular expression per name and strptime per match
+- the base backup check of older versions: any(f.startswith(...)) over the directory
+- the same two through the index, and rebuilding the index from the directory
+
+Usage Example:
+    cd src
+    python -m benchmarks.backupIndexBenchmark --count 5000
+
+Output Example:
+    5000 backups, 1250 listed
+    Directory scan   ms:   21.088
+    Index list       ms:    2.136
+    Base by scan     ms:    1.752
+    Index base       ms:    0.012
+    Index rebuild    ms:  193.290
+"""
+
+import argparse
+import os
+import re
+import tempfile
+from datetime import datetime, timedelta
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from modules.data.backupIndex import BackupIndex
+from utilities import fh_dumps
+from benchmarks.diffBenchmark import fh_bestOf
+
+def fh_scanDirectory(directory: str, trainerId: int) -> list:
+    # How older versions listed the game data backups of a trainer.
+    files = os.listdir(directory)
+    pattern = re.compile(rf'gameData\({trainerId}\)')
+    baseFiles = sorted([f for f in files if f.startswith('base_') and pattern.search(f)])
+    backupFiles = sorted(
+        [f for f in files if f.startswith('backup_') and pattern.search(f)],
+        key=lambda f: datetime.strptime(re.search(r'\d{2}\.\d{2}\.\d{4}_\d{2}\.\d{2}\.\d{2}', f).group(), '%d.%m.%Y_%H.%M.%S')
+    )
+    return baseFiles + backupFiles
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure listing backups with and without the index.')
+    parser.add_argument('--count', type=int, default=5000, help='Number of backups in the directory.')
+    parser.add_argument('--repeat', type=int, default=10, help='Repetitions per measurement, the best run is reported.')
+    args = parser.parse_args()
+
+    trainers = [2450, 3111]
+    with tempfile.TemporaryDirectory() as directory:
+        start = datetime(2024, 6, 1)
+        for number in range(args.count):
+            trainerId = trainers[number % 2]
+            timestamp = (start + timedelta(minutes=number)).strftime('%d.%m.%Y_%H.%M.%S')
+            name = f'backup_gameData({trainerId})_{timestamp}' if number % 4 < 2 else f'backup_slotData({number % 5}_{trainerId})_{timestamp}'
+            if number < 2:
+                name = 'base' + name[len('backup'):]
+            manifest = {'format': 1, 'indent': 4, 'size': 0, 'sha256': '0' * 64, 'sections': []}
+            with open(os.path.join(directory, f'{name}.manifest.json'), 'w') as file:
+                file.write(fh_dumps(manifest, compact=True))
+
+        index = BackupIndex(directory)
+        listed = index.f_list(2450, 'gameData')
+        if [record.filename for record in listed] != fh_scanDirectory(directory, 2450):
+            raise SystemExit('The index lists other backups than the directory scan.')
+        print(f'{args.count} backups, {len(listed)} listed')
+
+        measurements = [
+            ('Directory scan', lambda: fh_scanDirectory(directory, 2450)),
+            ('Index list', lambda: index.f_list(2450, 'gameData')),
+            ('Base by scan', lambda: any(f.startswith('base_gameData(2450)') for f in os.listdir(directory))),
+            ('Index base', lambda: index.f_hasBase(2450, 'gameData')),
+            ('Index rebuild', index.f_rebuild),
+        ]
+        for label, func in measurements:
+            print(f'{label:<16} ms: {fh_bestOf(func, args.repeat) * 1000:>8.3f}')
+        index.f_close()
+
+if __name__ == '__main__':
+    main()
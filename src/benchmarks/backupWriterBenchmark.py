@@ -0,0 +1,95 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Benchmark of the time a login waits for its backups, with and without the background writer.
+
+Each login backs up trainer.json and the slot file. Written directly, the login waits until both are
+stored; with the writer it only waits for the snapshots. The data is changed right after every
+submission, as the menu would, and every backup is read back and compared with the text of the data
+at the time it was submitted.
+
+Objects are written without fsync by default; --fsync measures the writes as the tool does them.
+
+Usage Example:
+    cd src
+    python -m benchmarks.backupWriterBenchmark --logins 20
+
+Output Example:
+    Direct write     ms/login:   69.010
+    Writer submit    ms/login:    8.103
+    Writer flush     ms:       1257.206  (40 backups, byte-identical)
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from modules import config
+from modules.data.backupStore import BackupStore
+from modules.data.backupWriter import BackupWriter
+from utilities import fh_dumpJSON
+from benchmarks.jsonBenchmark import fh_realisticTrainerData
+from benchmarks.backupBenchmark import fh_realisticSlotData, fh_playBetweenLogins
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure how long a login waits for its backups.')
+    parser.add_argument('--logins', type=int, default=20, help='Logins to simulate, each writes two backups.')
+    parser.add_argument('--fsync', action='store_true', help='Flush every written file to disk, as the tool does.')
+    args = parser.parse_args()
+    config.fsyncWrites = args.fsync
+
+    rng = random.Random(0)
+    trainerData = fh_realisticTrainerData()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.makedirs(os.path.join(directory, 'direct'))
+        os.makedirs(os.path.join(directory, 'writer'))
+        store = BackupStore(os.path.join(directory, 'direct'))
+        seconds = 0.0
+        for login in range(args.logins):
+            fh_playBetweenLogins(rng, trainerData)
+            slotData = fh_realisticSlotData(rng, trainerData)
+            start = time.perf_counter()
+            store.f_write(f'backup_gameData(2450)_01.06.2024_00.00.{login:02d}', trainerData)
+            store.f_write(f'backup_slotData(1_2450)_01.06.2024_00.00.{login:02d}', slotData)
+            seconds += time.perf_counter() - start
+        print(f'{"Direct write":<16} ms/login: {seconds * 1000 / args.logins:>8.3f}')
+
+        # One login only submits two backups, the queue never fills up. It does here without the room.
+        writer = BackupWriter(BackupStore(os.path.join(directory, 'writer')), 2 * args.logins)
+        expected = {}
+        seconds = 0.0
+        for login in range(args.logins):
+            fh_playBetweenLogins(rng, trainerData)
+            slotData = fh_realisticSlotData(rng, trainerData)
+            names = (f'backup_gameData(2450)_01.06.2024_00.00.{login:02d}', f'backup_slotData(1_2450)_01.06.2024_00.00.{login:02d}')
+            start = time.perf_counter()
+            writer.f_submit(names[0], trainerData)
+            writer.f_submit(names[1], slotData)
+            seconds += time.perf_counter() - start
+            expected[names[0]] = fh_dumpJSON(trainerData)
+            expected[names[1]] = fh_dumpJSON(slotData)
+            # Edits made right after the login must not reach the queued backup.
+            trainerData['gameStats']['battles'] = trainerData['gameStats'].get('battles', 0) + 1
+        print(f'{"Writer submit":<16} ms/login: {seconds * 1000 / args.logins:>8.3f}')
+
+        start = time.perf_counter()
+        writer.f_close()
+        seconds = time.perf_counter() - start
+        if writer.failed:
+            raise SystemExit(f'{len(writer.failed)} backups failed, first: {writer.failed[0]}')
+        for name, text in expected.items():
+            if writer.store.f_read(name + '.manifest.json') != text:
+                raise SystemExit(f'{name} does not read back as submitted.')
+        print(f'{"Writer flush":<16} ms:       {seconds * 1000:>8.3f}  ({len(expected)} backups, byte-identical)')
+
+if __name__ == '__main__':
+    main()
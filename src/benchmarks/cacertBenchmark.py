@@ -0,0 +1,161 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Check of the cacert.pem cache against a local stand-in for curl.se on 127.0.0.1.
+
+Every case prepares a bundle in a temporary directory, points f_fetchCaCert() or
+f_startCaCertRevalidation() at the stand-in server and checks the result, the requests the server
+received and how long the caller was blocked:
+- TTL hit: a fresh bundle is used without any request.
+- 304: a stale bundle is revalidated, only its timestamp is refreshed.
+- 200: a stale bundle is replaced by the new content.
+- Missing: the first start downloads the bundle.
+- Timeout: the server does not answer in time, the stale bundle is kept. Started in the background
+  the caller returns at once, as config does on startup.
+
+Usage Example:
+    cd src
+    python -m benchmarks.cacertBenchmark --timeout 0.5
+
+Output Example:
+    TTL hit          ms:    0.036  (0 requests)
+    304              ms:    8.331  (1 requests, timestamp refreshed)
+    200              ms:    7.069  (1 requests, bundle replaced)
+    Missing          ms:    3.262  (1 requests, bundle downloaded)
+    Timeout          ms:  504.760  (stale bundle kept)
+    Background       ms:    0.658  (stale bundle kept after 508.6 ms)
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from modules.config import f_fetchCaCert, f_startCaCertRevalidation
+
+OLD_BUNDLE = b'-----BEGIN CERTIFICATE-----\nold\n-----END CERTIFICATE-----\n'
+NEW_BUNDLE = b'-----BEGIN CERTIFICATE-----\nnew\n-----END CERTIFICATE-----\n'
+
+class StandInServer(ThreadingHTTPServer):
+    # Serves NEW_BUNDLE; conditional requests get a 304 unless the bundle `changed` on the server.
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.requests = 0
+        self.changed = False
+        self.delay = 0.0
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}/cacert.pem'
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server: StandInServer
+
+    def do_GET(self) -> None:
+        self.server.requests += 1
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        since = self.headers.get('If-Modified-Since')
+        try:
+            if since and not self.server.changed:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(NEW_BUNDLE)))
+            self.end_headers()
+            self.wfile.write(NEW_BUNDLE)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up after its timeout.
+            pass
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+def fh_writeBundle(path: str, age: float) -> None:
+    with open(path, 'wb') as file:
+        file.write(OLD_BUNDLE)
+    os.utime(path, (time.time() - age, time.time() - age))
+
+def fh_read(path: str) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Check the cacert.pem cache against a local HTTP server.')
+    parser.add_argument('--timeout', type=float, default=0.5, help='Request timeout in seconds of the timeout case.')
+    args = parser.parse_args()
+
+    ttl = timedelta(days=7)
+    stale = ttl.total_seconds() + 3600
+    server = StandInServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def fh_case(label: str, age, changed: bool = False, delay: float = 0.0):
+        # Runs f_fetchCaCert() on a bundle of the given age (None: missing), returns its path and the result.
+        path = os.path.join(directory, f'{label}.pem')
+        if age is not None:
+            fh_writeBundle(path, age)
+        server.requests, server.changed, server.delay = 0, changed, delay
+        start = time.perf_counter()
+        result = f_fetchCaCert(server.url, path, ttl, args.timeout)
+        return path, result, time.perf_counter() - start
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path, result, seconds = fh_case('ttl', 60)
+            if result != path or server.requests or fh_read(path) != OLD_BUNDLE:
+                raise SystemExit('A fresh bundle was revalidated.')
+            print(f'{"TTL hit":<16} ms: {seconds * 1000:>8.3f}  ({server.requests} requests)')
+
+            path, result, seconds = fh_case('304', stale)
+            if result != path or server.requests != 1 or fh_read(path) != OLD_BUNDLE or time.time() - os.path.getmtime(path) > 60:
+                raise SystemExit('A 304 response did not only refresh the timestamp.')
+            print(f'{"304":<16} ms: {seconds * 1000:>8.3f}  ({server.requests} requests, timestamp refreshed)')
+
+            path, result, seconds = fh_case('200', stale, changed=True)
+            if result != path or server.requests != 1 or fh_read(path) != NEW_BUNDLE:
+                raise SystemExit('A 200 response did not replace the bundle.')
+            print(f'{"200":<16} ms: {seconds * 1000:>8.3f}  ({server.requests} requests, bundle replaced)')
+
+            path, result, seconds = fh_case('missing', None)
+            if result != path or server.requests != 1 or fh_read(path) != NEW_BUNDLE:
+                raise SystemExit('A missing bundle was not downloaded.')
+            print(f'{"Missing":<16} ms: {seconds * 1000:>8.3f}  ({server.requests} requests, bundle downloaded)')
+
+            path, result, seconds = fh_case('timeout', stale, changed=True, delay=args.timeout * 4)
+            if result != path or fh_read(path) != OLD_BUNDLE or seconds > args.timeout * 3:
+                raise SystemExit('A timed out revalidation did not keep the stale bundle in time.')
+            print(f'{"Timeout":<16} ms: {seconds * 1000:>8.3f}  (stale bundle kept)')
+
+            # As on startup: the caller continues with the stale bundle while the thread waits.
+            path = os.path.join(directory, 'background.pem')
+            fh_writeBundle(path, stale)
+            server.requests, server.changed, server.delay = 0, True, args.timeout * 4
+            start = time.perf_counter()
+            thread = f_startCaCertRevalidation(server.url, path, ttl, args.timeout)
+            seconds = time.perf_counter() - start
+            if thread is None or fh_read(path) != OLD_BUNDLE:
+                raise SystemExit('The revalidation did not start in the background.')
+            thread.join()
+            finished = time.perf_counter() - start
+            if fh_read(path) != OLD_BUNDLE:
+                raise SystemExit('A timed out revalidation replaced the bundle.')
+            print(f'{"Background":<16} ms: {seconds * 1000:>8.3f}  (stale bundle kept after {finished * 1000:.1f} ms)')
+    finally:
+        server.shutdown()
+        server.server_close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Benchmark of the Catalog lookup tables against the dynamically built Enum classes they replace.
+
+For every catalog of the catalog store it measures the construction time, the memory retained by
+the constructed object and the time of name -> member and value -> member lookups.
+
+Usage Example:
+    cd src
+    python -m benchmarks.catalogBenchmark --repeat 20
+
+Output Example:
+    Catalog       Entries  Enum build ms  Catalog build ms  Enum KiB  Catalog KiB ...
+    species          1082          9.812             0.402    1016.3        150.2 ...
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from enum import Enum
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from utilities import fh_getCatalogStore
+from utilities.catalog import Catalog
+
+def fh_bestOf(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def fh_retainedBytes(func) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+def fh_lookupSeconds(byName, byValue, names, values, repeat: int) -> float:
+    def run():
+        for name in names:
+            byName(name)
+        for value in values:
+            byValue(value)
+    return fh_bestOf(run, repeat)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare Catalog against Enum construction time and memory.')
+    parser.add_argument('--repeat', type=int, default=10, help='Repetitions per measurement, the best run is reported.')
+    args = parser.parse_args()
+
+    catalogs = fh_getCatalogStore().f_getCatalogs()
+    print(f'{"Catalog":<13} {"Entries":>7} {"Enum build ms":>14} {"Catalog build ms":>17} '
+          f'{"Enum KiB":>9} {"Catalog KiB":>12} {"Enum lookup ms":>15} {"Catalog lookup ms":>18}')
+
+    totals = [0.0, 0.0, 0, 0]
+    for catalogName, data in catalogs.items():
+        enumBuild = fh_bestOf(lambda: Enum(catalogName, dict(data)), args.repeat)
+        catalogBuild = fh_bestOf(lambda: Catalog(catalogName, data), args.repeat)
+        enumBytes = fh_retainedBytes(lambda: Enum(catalogName, dict(data)))
+        catalogBytes = fh_retainedBytes(lambda: Catalog(catalogName, data))
+
+        enumClass = Enum(catalogName, dict(data))
+        catalog = Catalog(catalogName, data)
+        names = list(data.keys())
+        hashableValues = [value for value in data.values() if not isinstance(value, (dict, list))]
+        enumLookup = fh_lookupSeconds(enumClass.__getitem__, enumClass, names, hashableValues, args.repeat)
+        catalogLookup = fh_lookupSeconds(catalog.__getitem__, catalog, names, hashableValues, args.repeat)
+
+        totals[0] += enumBuild
+        totals[1] += catalogBuild
+        totals[2] += enumBytes
+        totals[3] += catalogBytes
+        print(f'{catalogName:<13} {len(data):>7} {enumBuild * 1000:>14.3f} {catalogBuild * 1000:>17.3f} '
+              f'{enumBytes / 1024:>9.1f} {catalogBytes / 1024:>12.1f} {enumLookup * 1000:>15.3f} {catalogLookup * 1000:>18.3f}')
+
+    print(f'{"total":<13} {"":>7} {totals[0] * 1000:>14.3f} {totals[1] * 1000:>17.3f} '
+          f'{totals[2] / 1024:>9.1f} {totals[3] / 1024:>12.1f}')
+
+if __name__ == '__main__':
+    main()
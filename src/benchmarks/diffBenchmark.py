@@ -0,0 +1,103 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Benchmark of SaveStore.f_diff on a full-dex trainer.json.
+
+The diff runs before every save, so it has to stay below 50 ms. Measured are the complete calls,
+including reading and parsing the saved file:
+- a typical edit: a few dexData and starterData entries and the voucher counts changed
+- the worst case: every dexData and starterData entry changed, as after "Unlock all starters"
+- a comparison against a backup that is already parsed, the whole document is compared
+
+Every patch is applied to the saved data and must reproduce the live data.
+
+Usage Example:
+    cd src
+    python -m benchmarks.diffBenchmark --repeat 20
+
+Output Example:
+    trainer.json: 634.3 KiB, 1082 dexData entries
+    Typical edit     ms:    9.995  (75 operations)
+    Unlock all       ms:   19.995  (10855 operations)
+    Against backup   ms:    4.276  (75 operations)
+"""
+
+import argparse
+import copy
+import os
+import tempfile
+import time
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from modules.data.saveStore import SaveStore
+from modules.data.saveDiff import fh_applyPatch
+from utilities import fh_writeJSONAtomic, fh_load
+from benchmarks.jsonBenchmark import fh_realisticTrainerData
+
+BUDGET_MS: float = 50.0
+
+def fh_bestOf(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def fh_typicalEdit(trainerData: dict) -> None:
+    for key in list(trainerData['dexData'])[:10]:
+        trainerData['dexData'][key]['caughtAttr'] = 255
+        trainerData['dexData'][key]['ivs'] = [31] * 6
+    for key in list(trainerData['starterData'])[:5]:
+        trainerData['starterData'][key]['candyCount'] += 50
+    trainerData['voucherCounts'] = {key: 300 for key in trainerData['voucherCounts']}
+
+def fh_unlockAll(trainerData: dict) -> None:
+    for entry in trainerData['dexData'].values():
+        entry.update(seenAttr=2**40 + 255, caughtAttr=2**40 + 255, natureAttr=2**26 - 1, ivs=[31] * 6)
+    for entry in trainerData['starterData'].values():
+        entry.update(abilityAttr=7, passiveAttr=3, valueReduction=2, eggMoves=15)
+
+def f_measure(directory: str, trainerData: dict, edit, sections, repeat: int, label: str) -> None:
+    store = SaveStore(directory)
+    live = store.f_checkout('trainer.json', *sections)
+    edit(live)
+    store.f_commit('trainer.json')
+
+    patch = store.f_diff('trainer.json')
+    if fh_applyPatch(copy.deepcopy(trainerData), copy.deepcopy(patch)) != live:
+        raise SystemExit(f'{label}: the patch does not reproduce the live data.')
+    seconds = fh_bestOf(lambda: store.f_diff('trainer.json'), repeat)
+    print(f'{label:<16} ms: {seconds * 1000:>8.3f}  ({len(patch)} operations)')
+    if seconds * 1000 > BUDGET_MS:
+        print(f'    over the budget of {BUDGET_MS} ms')
+    return store
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure the diff of the live trainer data against the saved file.')
+    parser.add_argument('--repeat', type=int, default=10, help='Repetitions per measurement, the best run is reported.')
+    parser.add_argument('--trainer', help='Path of a trainer.json to use instead of a synthetic one.')
+    args = parser.parse_args()
+
+    trainerData = fh_load(args.trainer) if args.trainer else fh_realisticTrainerData()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'trainer.json')
+        fh_writeJSONAtomic(path, trainerData)
+        print(f'trainer.json: {os.path.getsize(path) / 1024:.1f} KiB, {len(trainerData["dexData"])} dexData entries')
+
+        store = f_measure(directory, trainerData, fh_typicalEdit, ('dexData', 'starterData', 'voucherCounts'), args.repeat, 'Typical edit')
+        f_measure(directory, trainerData, fh_unlockAll, ('dexData', 'starterData'), args.repeat, 'Unlock all')
+
+        # A parsed backup is compared as a whole, no sections are known to be equal.
+        patch = store.f_diff('trainer.json', trainerData)
+        seconds = fh_bestOf(lambda: store.f_diff('trainer.json', trainerData), args.repeat)
+        print(f'{"Against backup":<16} ms: {seconds * 1000:>8.3f}  ({len(patch)} operations)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Benchmark of the JSON backends on a realistic trainer.json.
+
+Every installed backend (json, orjson, ujson) parses the document and serializes it in the two
+layouts this tool writes: indented (indent=4, the save files and backups) and compact (the upload
+payload and config.compactWorkingCopies). The rows marked "facade" go through utilities.jsonBackend,
+including its byte compatibility checks; their output must equal the standard library output.
+
+Without --trainer a synthetic trainer.json is used: a fully seen dex, every starter with a moveset,
+game stats, achievements, vouchers and a full egg list, with random but plausible values.
+
+Usage Example:
+    cd src
+    python -m benchmarks.jsonBenchmark --repeat 20
+    python -m benchmarks.jsonBenchmark --trainer ../trainer.json
+
+Output Example:
+    trainer.json: 634.3 KiB indented, 259.5 KiB compact
+    Backend          load ms  dump indent ms  dump compact ms
+    orjson             1.871           0.625            0.517
+    json               3.856          30.907            5.268
+    orjson facade      2.218          10.323            2.720
+"""
+
+import argparse
+import importlib
+import json
+import random
+import time
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from utilities import fh_getCatalogStore, jsonBackend
+
+def fh_bestOf(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def fh_realisticTrainerData(seed: int = 0) -> dict:
+    """
+    Build a trainer.json the size of a long running account.
+
+    Args:
+        seed (int): Seed of the random values.
+
+    Returns:
+        dict: The trainer data.
+    """
+    rng = random.Random(seed)
+    store = fh_getCatalogStore()
+    species = store.f_getCatalog('species')
+    timestamp = 1718000000000
+
+    dexData = {}
+    for speciesID in species.values():
+        dexData[str(speciesID)] = {
+            'seenAttr': rng.choice([0, 33, 161, 255, 2**40 + 255]),
+            'caughtAttr': rng.choice([0, 33, 161, 255, 2**40 + 255]),
+            'natureAttr': rng.randrange(2**26),
+            'seenCount': rng.randrange(500),
+            'caughtCount': rng.randrange(100),
+            'hatchedCount': rng.randrange(20),
+            'ivs': [rng.randrange(32) for _ in range(6)],
+        }
+
+    starterData = {}
+    for name in store.f_getCatalog('starter'):
+        starterData[str(species[name])] = {
+            'moveset': [rng.randrange(900) for _ in range(4)] if rng.random() < 0.5 else None,
+            'eggMoves': rng.randrange(16),
+            'candyCount': rng.randrange(300),
+            'friendship': rng.randrange(300),
+            'abilityAttr': rng.choice([1, 3, 7]),
+            'passiveAttr': rng.randrange(4),
+            'valueReduction': rng.randrange(3),
+            'classicWinCount': rng.randrange(10),
+        }
+
+    achievements = store.f_getCatalog('achievements')
+    vouchers = store.f_getCatalog('vouchers')
+    eggs = [{
+        'id': rng.randrange(2**31),
+        'gachaType': rng.randrange(3),
+        'hatchWaves': rng.randrange(100),
+        'timestamp': timestamp - rng.randrange(10**9),
+        'tier': rng.randrange(4),
+        'sourceType': rng.randrange(3),
+        'variantTier': rng.randrange(3),
+        'isShiny': rng.random() < 0.1,
+        'species': rng.choice(list(species.values())),
+        'overrideHiddenAbility': False,
+        'eggMoveIndex': rng.randrange(4),
+    } for _ in range(99)]
+
+    return {
+        'trainerId': rng.randrange(65536),
+        'secretId': rng.randrange(65536),
+        'gender': 0,
+        'dexData': dexData,
+        'starterData': starterData,
+        # Keyed by species like the game stores them, a moveset or one moveset per form.
+        'starterMoveData': {key: [rng.randrange(900) for _ in range(4)] if rng.random() < 0.8 else {'0': [rng.randrange(900) for _ in range(4)]}
+                            for key in starterData if rng.random() < 0.2},
+        'starterEggMoveData': {key: rng.randrange(16) for key in starterData if rng.random() < 0.3},
+        'gameStats': {f'stat{index}': rng.randrange(10**6) for index in range(80)},
+        'unlocks': {str(index): rng.random() < 0.5 for index in range(3)},
+        'achvUnlocks': {name: timestamp - rng.randrange(10**9) for name in achievements if rng.random() < 0.7},
+        'voucherUnlocks': {name: timestamp - rng.randrange(10**9) for name in vouchers if rng.random() < 0.7},
+        'voucherCounts': {str(index): rng.randrange(300) for index in range(4)},
+        'eggs': eggs,
+        'gameVersion': '1.0.0',
+        'timestamp': timestamp,
+        'eggPity': [rng.randrange(50) for _ in range(4)],
+        'unlockPity': [rng.randrange(50) for _ in range(4)],
+    }
+
+def fh_installedBackends() -> dict:
+    backends = {}
+    for name in jsonBackend.BACKENDS:
+        try:
+            backends[name] = importlib.import_module(name)
+        except ImportError:
+            print(f'{name} is not installed, skipped.')
+    return backends
+
+def fh_rawFunctions(name: str, module) -> tuple:
+    # The plain library calls, without any of the checks of the facade.
+    if name == 'orjson':
+        return (module.loads,
+                lambda data: module.dumps(data, option=module.OPT_INDENT_2),
+                module.dumps)
+    return (module.loads,
+            lambda data: module.dumps(data, indent=4),
+            lambda data: module.dumps(data, separators=(',', ':')) if module is json else module.dumps(data))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare load and dump times of the JSON backends on a trainer.json.')
+    parser.add_argument('--repeat', type=int, default=10, help='Repetitions per measurement, the best run is reported.')
+    parser.add_argument('--trainer', help='Path of a trainer.json to use instead of a synthetic one.')
+    args = parser.parse_args()
+
+    if args.trainer:
+        with open(args.trainer, 'rb') as file:
+            document = json.loads(file.read())
+    else:
+        document = fh_realisticTrainerData()
+
+    indented = json.dumps(document, indent=4)
+    compact = json.dumps(document, separators=(',', ':'))
+    raw = indented.encode()
+    print(f'trainer.json: {len(raw) / 1024:.1f} KiB indented, {len(compact) / 1024:.1f} KiB compact')
+    print(f'{"Backend":<15} {"load ms":>8} {"dump indent ms":>15} {"dump compact ms":>16}')
+
+    for name, module in fh_installedBackends().items():
+        load, dumpIndented, dumpCompact = fh_rawFunctions(name, module)
+        times = [fh_bestOf(lambda: load(raw), args.repeat),
+                 fh_bestOf(lambda: dumpIndented(document), args.repeat),
+                 fh_bestOf(lambda: dumpCompact(document), args.repeat)]
+        print(f'{name:<15} {times[0] * 1000:>8.3f} {times[1] * 1000:>15.3f} {times[2] * 1000:>16.3f}')
+
+    # The facade with the active backend, see config.jsonBackend.
+    if jsonBackend.fh_loads(raw) != document:
+        raise SystemExit('The facade parsed different data than the standard library.')
+    if jsonBackend.fh_dumps(document, indent=4) != indented or jsonBackend.fh_dumps(document, compact=True) != compact:
+        raise SystemExit('The facade output differs from the standard library output.')
+    times = [fh_bestOf(lambda: jsonBackend.fh_loads(raw), args.repeat),
+             fh_bestOf(lambda: jsonBackend.fh_dumps(document, indent=4), args.repeat),
+             fh_bestOf(lambda: jsonBackend.fh_dumps(document, compact=True), args.repeat)]
+    label = f'{jsonBackend.BACKEND} facade'
+    print(f'{label:<15} {times[0] * 1000:>8.3f} {times[1] * 1000:>15.3f} {times[2] * 1000:>16.3f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Benchmark of the backup retention policy and its background compaction.
+
+The store receives --days days of backups, --per-day logins a day, each writing a backup of
+trainer.json and one of the slot file, plus the two base backups of the first login. The compaction
+then runs on its background thread, as after a login, while the main thread keeps writing backups
+the way the menu does. Reported are:
+- the backups kept by the policy and the disk usage before and after the pass
+- the duration of the pass and the slowest backup written while it ran
+- every kept backup is read back and compared with the SHA-256 of the text it was written from
+
+Objects are written without fsync by default; --fsync measures the writes as the tool does them.
+
+Usage Example:
+    cd src
+    python -m benchmarks.retentionBenchmark --days 120
+
+Output Example:
+    482 backups   disk:      2.3 MiB
+    30 kept, 452 removed, 25 rebased   disk:      0.8 MiB  (36.9 %)
+    Compaction       s:   23.570  (background, 2224 objects removed, 161 recompressed)
+    Write during pass ms:   60.658  (slowest of 25)
+    55 kept backups read back byte-identical
+"""
+
+import argparse
+import hashlib
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from modules import config
+from modules.data.backupStore import BackupStore
+from modules.data.backupRetention import BackupCompactor
+from utilities import fh_dumpJSON
+from benchmarks.jsonBenchmark import fh_realisticTrainerData
+from benchmarks.backupBenchmark import fh_realisticSlotData, fh_playBetweenLogins, fh_directorySize
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure the retention policy and the background compaction.')
+    parser.add_argument('--days', type=int, default=120, help='Days of backups to simulate.')
+    parser.add_argument('--per-day', type=int, default=2, help='Logins per day, each writes two backups.')
+    parser.add_argument('--writes', type=int, default=25, help='Backups written while the compaction runs.')
+    parser.add_argument('--fsync', action='store_true', help='Flush every written file to disk, as the tool does.')
+    args = parser.parse_args()
+    config.fsyncWrites = args.fsync
+
+    rng = random.Random(0)
+    trainerData = fh_realisticTrainerData()
+    expected = {}
+
+    def fh_backup(store: BackupStore, kind: str, moment: datetime, data: dict, series: str) -> None:
+        name = f'{kind}_{series}_{moment.strftime("%d.%m.%Y_%H.%M.%S")}'
+        expected[store.f_write(name, data)] = hashlib.sha256(fh_dumpJSON(data).encode('utf-8')).hexdigest()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = BackupStore(directory)
+        now = datetime.now().replace(microsecond=0)
+        first = now - timedelta(days=args.days)
+        for login in range(args.days * args.per_day):
+            moment = first + timedelta(days=login / args.per_day, minutes=rng.randrange(60))
+            fh_playBetweenLogins(rng, trainerData)
+            slotData = fh_realisticSlotData(rng, trainerData)
+            for kind in (['base'] if login == 0 else []) + ['backup']:
+                fh_backup(store, kind, moment, trainerData, 'gameData(2450)')
+                fh_backup(store, kind, moment, slotData, 'slotData(1_2450)')
+        before = fh_directorySize(directory)
+        print(f'{len(expected)} backups   disk: {before / 2**20:>8.1f} MiB')
+
+        # The compaction runs in the background while the menu keeps writing backups.
+        compactor = BackupCompactor(store)
+        start = time.perf_counter()
+        compactor.f_start(force=True)
+        slowest = 0.0
+        for number in range(args.writes):
+            fh_playBetweenLogins(rng, trainerData)
+            began = time.perf_counter()
+            fh_backup(store, 'backup', now + timedelta(seconds=number), trainerData, 'gameData(2450)')
+            slowest = max(slowest, time.perf_counter() - began)
+        compactor.thread.join()
+        seconds = time.perf_counter() - start
+        report = compactor.report
+        if report is None:
+            raise SystemExit('The compaction failed, see the log.')
+
+        after = fh_directorySize(directory)
+        print(f'{report.kept} kept, {report.deleted} removed, {report.rebased} rebased   '
+              f'disk: {after / 2**20:>8.1f} MiB  ({after / before * 100:.1f} %)')
+        print(f'{"Compaction":<16} s: {seconds:>8.3f}  (background, {report.objectsRemoved} objects removed, {report.recompressed} recompressed)')
+        print(f'{"Write during pass":<16} ms: {slowest * 1000:>8.3f}  (slowest of {args.writes})')
+
+        records = store.index.f_list()
+        for record in records:
+            if hashlib.sha256(store.f_read(record.filename).encode('utf-8')).hexdigest() != expected[record.filename]:
+                raise SystemExit(f'{record.filename} does not read back as written.')
+        print(f'{len(records)} kept backups read back byte-identical')
+
+if __name__ == '__main__':
+    main()
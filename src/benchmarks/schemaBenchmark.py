@@ -0,0 +1,99 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Benchmark of the save schema validation on a full-dex trainer.json.
+
+The validation runs before every write, so a whole trainer.json has to pass in a few milliseconds.
+Measured are:
+- compiling the schemas of trainer.json and the slot files, once per session
+- the whole document, as after fetching it from the server
+- only the dirty sections of a typical edit, as on save
+- a document with known mistakes, every one must be reported with its JSON Pointer
+
+Usage Example:
+    cd src
+    python -m benchmarks.schemaBenchmark --repeat 20
+
+Output Example:
+    trainer.json: 618.3 KiB, 1082 dexData entries
+    Compile          ms:   21.402
+    Whole document   ms:    7.913
+    Dirty sections   ms:    2.804  (dexData, voucherCounts)
+    /dexData/1/ivs/3: expected an integer from 0 to 31, got 32
+    ...
+"""
+
+import argparse
+import copy
+import os
+import tempfile
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from modules.data.saveSchema import SaveSchema, fh_getSaveSchema
+from modules.data.saveStore import SaveStore
+from modules.data.dataParser import SessionData, TrainerData
+from utilities import fh_writeJSONAtomic, fh_load
+from benchmarks.jsonBenchmark import fh_realisticTrainerData
+from benchmarks.diffBenchmark import fh_bestOf
+
+BUDGET_MS: float = 10.0
+
+def fh_breakTrainerData(trainerData: dict) -> int:
+    # One mistake of every kind the schema has to catch, returns how many there are.
+    first, second, third = list(trainerData['dexData'])[:3]
+    trainerData['dexData'][first]['ivs'][3] = 32
+    trainerData['dexData'][second]['ivs'] = [31] * 5
+    trainerData['dexData'][third]['caughtAttr'] = -1
+    trainerData['starterData'][first]['moveset'] = [1, 2, 3, 4, 5]
+    trainerData['voucherCounts']['0'] = '300'
+    return 5
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure the save schema validation of trainer.json.')
+    parser.add_argument('--repeat', type=int, default=10, help='Repetitions per measurement, the best run is reported.')
+    parser.add_argument('--trainer', help='Path of a trainer.json to use instead of a synthetic one.')
+    args = parser.parse_args()
+
+    trainerData = fh_load(args.trainer) if args.trainer else fh_realisticTrainerData()
+    schema = fh_getSaveSchema('trainer.json')
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'trainer.json')
+        fh_writeJSONAtomic(path, trainerData)
+        print(f'trainer.json: {os.path.getsize(path) / 1024:.1f} KiB, {len(trainerData["dexData"])} dexData entries')
+
+        seconds = fh_bestOf(lambda: (SaveSchema(TrainerData), SaveSchema(SessionData)), args.repeat)
+        print(f'{"Compile":<16} ms: {seconds * 1000:>8.3f}')
+
+        issues = schema.f_validate(trainerData)
+        if issues:
+            raise SystemExit(f'The unchanged data has {len(issues)} issues, first: {issues[0]}')
+        seconds = fh_bestOf(lambda: schema.f_validate(trainerData), args.repeat)
+        print(f'{"Whole document":<16} ms: {seconds * 1000:>8.3f}')
+        if seconds * 1000 > BUDGET_MS:
+            print(f'    over the budget of {BUDGET_MS} ms')
+
+        store = SaveStore(directory)
+        live = store.f_checkout('trainer.json', 'dexData', 'voucherCounts')
+        for key in list(live['dexData'])[:10]:
+            live['dexData'][key]['ivs'] = [31] * 6
+        live['voucherCounts'] = {key: 300 for key in live['voucherCounts']}
+        store.f_commit('trainer.json')
+        seconds = fh_bestOf(lambda: store.f_validate('trainer.json'), args.repeat)
+        print(f'{"Dirty sections":<16} ms: {seconds * 1000:>8.3f}  ({", ".join(sorted(store.f_dirtySections("trainer.json")))})')
+
+    broken = copy.deepcopy(trainerData)
+    expected = fh_breakTrainerData(broken)
+    issues = schema.f_validate(broken)
+    for issue in issues:
+        print(issue)
+    if len(issues) != expected:
+        raise SystemExit(f'Expected {expected} issues, found {len(issues)}.')
+
+if __name__ == '__main__':
+    main()
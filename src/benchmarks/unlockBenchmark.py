@@ -0,0 +1,199 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Benchmark of Rogue.f_unlockStarters on a full-dex trainer.json.
+
+Compares the former nested scan, which rebuilt the combined form list and ran `any(...)` plus a
+second linear search for every dex entry, against the precomputed speciesID -> caughtAttr mapping
+of dataParser.fh_getCaughtAttrBySpecies(). Both must resolve exactly the same caughtAttr values.
+
+It then compares the complete former per-entry unlock loop against the vectorized
+bulkUnlock.f_bulkUnlockStarters(), with all options enabled. Both edit the entries in place, every
+run gets a fresh copy of the trainer data. Apart from the random counts both must write the same values.
+
+Without --trainer a synthetic trainer.json with one dexData entry per species and one starterData
+entry per starter is used.
+
+Usage Example:
+    cd src
+    python -m benchmarks.unlockBenchmark --repeat 20
+    python -m benchmarks.unlockBenchmark --trainer ../trainer.json
+
+Output Example:
+    dexData entries: 1082
+    Nested scan      ms:    8.985
+    Mapping (cold)   ms:    0.289
+    Mapping (warm)   ms:    0.155
+    Speedup (warm):          58.0x
+    Per-entry unlock ms:    9.451
+    Bulk unlock      ms:    3.021
+"""
+
+import argparse
+import copy
+import json
+import random
+import time
+
+import numpy as np
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from modules.data import dataParser
+from modules.data.bulkUnlock import UnlockOptions, f_bulkUnlockStarters, RANDOM_COUNT_RANGE
+from utilities import fh_getCatalogStore
+
+def fh_bestOf(func, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def fh_bestOfInPlace(func, trainerData, repeat: int) -> float:
+    # For edits in place: every run gets a fresh copy, the copy is not measured.
+    best = float('inf')
+    for _ in range(repeat):
+        gameData = copy.deepcopy(trainerData)
+        start = time.perf_counter()
+        func(gameData)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def fh_buildCombinedIDs():
+    # What fh_getCombinedIDs did on every call before it was memoized.
+    combinedFormIds = []
+    for species in dataParser.fh_getSpeciesRegistry()[0]:
+        if species.isNormalForm:
+            for form in species.forms:
+                if form.name == "Combined":
+                    combinedFormIds.append({"speciesID": species.dex, "caughtAttr": form.variant3})
+    return combinedFormIds
+
+def f_resolveNestedScan(dexData, defaultCaughtAttr=253):
+    combinedFormIDs = fh_buildCombinedIDs()
+    resolved = {}
+    for entry in dexData.keys():
+        caughtAttr = defaultCaughtAttr
+        if any(int(entry) == form["speciesID"] for form in combinedFormIDs):
+            for form in combinedFormIDs:
+                if int(entry) == form["speciesID"]:
+                    caughtAttr = form["caughtAttr"]
+                    break
+        resolved[entry] = caughtAttr
+    return resolved
+
+def f_resolveMapping(dexData, defaultCaughtAttr=253):
+    caughtAttrBySpecies = dataParser.fh_getCaughtAttrBySpecies(includeStarter=True, onlyNormalForms=True)
+    return {entry: caughtAttrBySpecies.get(entry, defaultCaughtAttr) for entry in dexData.keys()}
+
+def f_legacyUnlock(gameData, natureUnlockValue, noPassives):
+    # The loop f_unlockStarters ran before the bulk unlock engine, with every option enabled.
+    caughtAttrBySpecies = dataParser.fh_getCaughtAttrBySpecies(includeStarter=True, onlyNormalForms=True)
+    defaultDexData = {"seenAttr": 0, "caughtAttr": 0, "natureAttr": 0, "seenCount": 0, "caughtCount": 0, "hatchedCount": 0, "ivs": [0, 0, 0, 0, 0, 0]}
+    for entry in gameData["dexData"].keys():
+        dexDataToUpdate = {
+            "seenAttr": random.randint(100, 300),
+            "caughtAttr": caughtAttrBySpecies.get(entry, 255),
+            "seenCount": random.randint(100, 300),
+            "caughtCount": random.randint(100, 300),
+            "hatchedCount": random.randint(100, 300),
+            "ivs": [31, 31, 31, 31, 31, 31],
+            "natureAttr": natureUnlockValue,
+        }
+        fullDexData = {**defaultDexData, **dexDataToUpdate}
+        gameData["dexData"][entry].update({key: value for key, value in fullDexData.items() if value is not None})
+
+    defaultStarterData = {"moveset": None, "eggMoves": 0, "candyCount": 0, "friendship": 0, "abilityAttr": 1, "passiveAttr": 0, "valueReduction": 0, "classicWinCount": 0}
+    for entry in gameData["starterData"].keys():
+        starterDataToUpdate = {
+            "friendship": random.randint(100, 300),
+            "candyCount": random.randint(100, 300),
+            "abilityAttr": 7,
+            "eggMoves": 15,
+            "classicWinCount": 1,
+            "passiveAttr": 0 if str(entry) in noPassives else 3,
+            "valueReduction": 2,
+        }
+        fullStarterData = {**defaultStarterData, **starterDataToUpdate}
+        gameData["starterData"][entry].update({key: value for key, value in fullStarterData.items() if value is not None})
+    return gameData
+
+def fh_withoutRandomCounts(trainerData):
+    randomKeys = {"seenAttr", "seenCount", "caughtCount", "hatchedCount", "friendship", "candyCount"}
+    low, high = RANDOM_COUNT_RANGE
+    stripped = {}
+    for section in ("dexData", "starterData"):
+        stripped[section] = {}
+        for key, entry in trainerData[section].items():
+            if any(not low <= entry[name] <= high for name in randomKeys & entry.keys()):
+                raise SystemExit(f'Random count out of range in {section}[{key}].')
+            stripped[section][key] = {name: value for name, value in entry.items() if name not in randomKeys}
+    return stripped
+
+def fh_syntheticDexData():
+    entry = {"seenAttr": 0, "caughtAttr": 0, "natureAttr": 0, "seenCount": 0, "caughtCount": 0, "hatchedCount": 0, "ivs": [0] * 6}
+    return {str(speciesID): dict(entry) for speciesID in fh_getCatalogStore().f_getCatalog('species').values()}
+
+def fh_syntheticStarterData():
+    entry = {"moveset": None, "eggMoves": 0, "candyCount": 0, "friendship": 0, "abilityAttr": 1, "passiveAttr": 0, "valueReduction": 0, "classicWinCount": 0}
+    species = fh_getCatalogStore().f_getCatalog('species')
+    return {str(species[name]): dict(entry) for name in fh_getCatalogStore().f_getCatalog('starter')}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare the nested caughtAttr scan of f_unlockStarters against the precomputed mapping.')
+    parser.add_argument('--repeat', type=int, default=10, help='Repetitions per measurement, the best run is reported.')
+    parser.add_argument('--trainer', help='Path of a trainer.json to use instead of a synthetic full dex.')
+    args = parser.parse_args()
+
+    if args.trainer:
+        with open(args.trainer, 'r') as file:
+            trainerData = json.load(file)
+    else:
+        trainerData = {"dexData": fh_syntheticDexData(), "starterData": fh_syntheticStarterData()}
+    dexData = trainerData["dexData"]
+
+    # The species registry is shared by both variants, build it outside of the measurements.
+    dataParser.fh_getSpeciesRegistry()
+
+    dataParser.fh_getCaughtAttrBySpecies.cache_clear()
+    start = time.perf_counter()
+    mapped = f_resolveMapping(dexData)
+    cold = time.perf_counter() - start
+
+    if f_resolveNestedScan(dexData) != mapped:
+        raise SystemExit('Nested scan and mapping resolved different caughtAttr values.')
+
+    nested = fh_bestOf(lambda: f_resolveNestedScan(dexData), args.repeat)
+    warm = fh_bestOf(lambda: f_resolveMapping(dexData), args.repeat)
+
+    print(f'dexData entries: {len(dexData)}')
+    print(f'Nested scan      ms: {nested * 1000:>8.3f}')
+    print(f'Mapping (cold)   ms: {cold * 1000:>8.3f}')
+    print(f'Mapping (warm)   ms: {warm * 1000:>8.3f}')
+    print(f'Speedup (warm):      {nested / warm:>8.1f}x')
+
+    natureUnlockValue = dataParser.fh_getCatalogData('natures')['UNLOCK_ALL']
+    noPassives = set(dataParser.fh_getCatalogData('noPassive').keys())
+    options = UnlockOptions(allForms=True, shiny=True, perfectIVs=True, allNatures=True, passive=True, ribbon=True, costReduction=2, allAbilities=True)
+    rng = np.random.default_rng()
+
+    legacyResult = f_legacyUnlock(copy.deepcopy(trainerData), natureUnlockValue, noPassives)
+    bulkResult = f_bulkUnlockStarters(copy.deepcopy(trainerData), options, rng=rng, noPassiveIDs=noPassives, natureUnlockValue=natureUnlockValue)
+    if fh_withoutRandomCounts(legacyResult) != fh_withoutRandomCounts(bulkResult):
+        raise SystemExit('Per-entry unlock and bulk unlock wrote different values.')
+
+    # Both edit the entries in place.
+    legacy = fh_bestOfInPlace(lambda gameData: f_legacyUnlock(gameData, natureUnlockValue, noPassives), trainerData, args.repeat)
+    bulk = fh_bestOfInPlace(lambda gameData: f_bulkUnlockStarters(gameData, options, rng=rng, noPassiveIDs=noPassives, natureUnlockValue=natureUnlockValue), trainerData, args.repeat)
+
+    print(f'Per-entry unlock ms: {legacy * 1000:>8.3f}')
+    print(f'Bulk unlock      ms: {bulk * 1000:>8.3f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Benchmark of verify-backups on a directory of backups written as the tool does.
+
+The store receives --logins logins of a full-dex trainer, each a backup of trainer.json and one of the
+slot file, most of them deltas. The check runs once in this process and once with the process pool,
+then one section is truncated and one manifest removed behind the back of the index; both must be
+reported. Measured are the backups checked per second, which include reassembling every backup,
+comparing its checksum, validating it against the save schema and comparing it with the index.
+
+Objects are written without fsync by default; --fsync measures the writes as the tool does them.
+
+Usage Example:
+    cd src
+    python -m benchmarks.verifyBenchmark --logins 250
+
+Output Example:
+    500 backups, 1 CPUs
+    1 process        s:    4.123  (121.3 backups/s)
+    2 processes      s:    8.730  (57.3 backups/s)
+    Damaged: 21 corrupt, 10 orphaned
+"""
+
+import argparse
+import glob
+import os
+import random
+import tempfile
+import time
+
+import modules  # noqa: F401 # Initializes config before utilities, see modules/__init__.py
+from modules import config
+from modules.data.backupStore import BackupStore
+from modules.data.backupVerifier import f_verifyBackups, CORRUPT, ORPHANED
+from benchmarks.jsonBenchmark import fh_realisticTrainerData
+from benchmarks.backupBenchmark import fh_realisticSlotData, fh_playBetweenLogins
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure verify-backups on a directory of backups.')
+    parser.add_argument('--logins', type=int, default=250, help='Logins to simulate, each writes two backups.')
+    parser.add_argument('--processes', type=int, help='Worker processes, defaults to the number of CPUs.')
+    parser.add_argument('--fsync', action='store_true', help='Flush every written file to disk, as the tool does.')
+    args = parser.parse_args()
+    config.fsyncWrites = args.fsync
+    processes = args.processes or os.cpu_count() or 1
+
+    rng = random.Random(0)
+    trainerData = fh_realisticTrainerData()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = BackupStore(directory)
+        for login in range(args.logins):
+            fh_playBetweenLogins(rng, trainerData)
+            timestamp = f'{1 + login // 3600:02d}.06.2024_{login // 60 % 60:02d}.{login % 60:02d}.00'
+            store.f_write(f'backup_gameData(2450)_{timestamp}', trainerData)
+            store.f_write(f'backup_slotData(1_2450)_{timestamp}', fh_realisticSlotData(rng, trainerData))
+        print(f'{2 * args.logins} backups, {os.cpu_count()} CPUs')
+
+        for label, count in (('1 process', 1), (f'{processes} processes', processes)):
+            start = time.perf_counter()
+            report = f_verifyBackups(BackupStore(directory), count, quiet=True)
+            seconds = time.perf_counter() - start
+            if report.problems:
+                raise SystemExit(f'{len(report.problems)} problems in intact backups, first: {report.problems[0]}')
+            print(f'{label:<16} s: {seconds:>8.3f}  ({report.checked / seconds:.1f} backups/s)')
+
+        # A truncated section breaks every backup that shares it, a removed manifest leaves its index entry behind.
+        section = max(glob.glob(os.path.join(directory, 'objects', '*', '*.zst')), key=os.path.getsize)
+        with open(section, 'r+b') as file:
+            file.truncate(os.path.getsize(section) // 2)
+        os.remove(os.path.join(directory, f'backup_slotData(1_2450)_{timestamp}.manifest.json'))
+        report = f_verifyBackups(BackupStore(directory), processes, quiet=True)
+        corrupt = sum(problem.kind == CORRUPT for problem in report.problems)
+        orphaned = sum(problem.kind == ORPHANED for problem in report.problems)
+        if not corrupt or not orphaned:
+            raise SystemExit('The damage was not reported.')
+        print(f'Damaged: {corrupt} corrupt, {orphaned} orphaned')
+
+if __name__ == '__main__':
+    main()
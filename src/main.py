@@ -14,6 +14,8 @@ Features:
 - User login through requests or Selenium.
 - Various account and game data actions through a menu-driven interface.
 - Custom logging and colored console output.
+- `--profile-startup` prints the wall time and allocations of every startup phase and writes them as JSON into the logs directory.
+- `--verify-backups` checks every backup without logging in, `--repair` also rebuilds the backup index and removes orphaned sections.
 
 Modules:
 - getpass: For securely obtaining the password from the user.
@@ -26,26 +28,32 @@ Modules:
 - Color: Enumeration defining color codes for cFormatter.
 - CustomLogger: Custom logging functionality.
 - config: Custom module for configuration and update checking.
-- datetime, timedelta: For date and time operations.
+- profiler: Startup profiling, enabled with the `--profile-startup` switch.
+- backupVerifier: The backup check of `--verify-backups`.
 - colorama: For terminal text color formatting.
 """
 
 import getpass
+
+# Imported first so `--profile-startup` can also time the imports of requests and selenium.
+from modules import requestsLogic, Rogue, SeleniumLogic, config, profiler
 import requests
 import brotli  # noqa: F401
-
-from modules import requestsLogic, Rogue, SeleniumLogic, config
 from modules.handler import OperationSuccessful, dec_handleOperationExceptions, OperationCancel, OperationSoftCancel
 from colorama import Fore, Style, init
 from utilities import cFormatter, Color, CustomLogger
-from datetime import datetime, timedelta
 from utilities import fh_printMessageBuffer
-from sys import exit
+from modules.data.backupVerifier import f_verifyBackups
+from sys import exit, argv
+from multiprocessing import freeze_support
 init()
 logger = CustomLogger()
 
-if not config.debug:
-    config.f_checkForUpdates(requests, datetime, timedelta, Style)
+# Not in the worker processes of --verify-backups, they import this script on Windows and macOS.
+if not config.debug and __name__ == '__main__':
+    # Runs in the background, the result shows up in the message buffer of the main menu.
+    with profiler.fh_profilePhase('config.f_startUpdateCheck'):
+        config.f_startUpdateCheck()
 
 
 @dec_handleOperationExceptions
@@ -68,6 +76,11 @@ def m_mainMenu(rogue, editOffline: bool = False):
         ('Account Actions', 'category'),
         ((f'{Fore.YELLOW}Create a backup', reworked), rogue.f_createBackup),
         ((f'{Fore.YELLOW}Recover your backup', reworked), rogue.f_restoreBackup),
+        ((f'{Fore.YELLOW}Save changes to local files', reworked), rogue.f_saveChanges),
+        ((f'{Fore.YELLOW}Show changes', reworked), rogue.f_showChanges),
+        ((f'{Fore.YELLOW}Verify backups', ''), rogue.f_verifyBackups),
+        ((f'{Fore.YELLOW}Undo last edit', reworked), rogue.f_undo),
+        ((f'{Fore.YELLOW}Redo last undone edit', reworked), rogue.f_redo),
         (('Load Game-Data from server', reworked), rogue.f_getGameData),
         (('Change save-slot to edit', reworked), rogue.f_changeSaveSlot),
         (('Edit account stats', reworked), rogue.f_editAccountStats),
@@ -112,7 +125,7 @@ def m_mainMenu(rogue, editOffline: bool = False):
         term = [entry for entry in term if entry[1] != rogue.f_updateAllToServer]
         term = [entry for entry in term if entry[1] != rogue.f_getGameData]
         term = [entry for entry in term if entry[1] != rogue.f_logout]
-        replaceEntry = ('Offline-Edits are directly applied', 'helper')
+        replaceEntry = ('Offline-Edits are saved with "Save changes" or on exit', 'helper')
         term = [replaceEntry if entry == ('You can always edit your JSON manually as well!', 'helper') else entry for entry in term]
 
     try:
@@ -125,6 +138,8 @@ def m_mainMenu(rogue, editOffline: bool = False):
                 raise KeyboardInterrupt
             if userInput == 'lb':
                 rogue.f_lb()
+            if userInput == 'verify-backups':
+                rogue.f_verifyBackups()
 
             if userInput.isdigit() and int(userInput) <= len(validChoices):
                 choiceIndex = int(userInput)
@@ -140,6 +155,7 @@ def m_mainMenu(rogue, editOffline: bool = False):
 def main():
     if config.debug:
         rogue = Rogue(requests.session(), 'Invalid Auth Token', config.debug)
+        profiler.f_reportStartup()
         m_mainMenu(rogue)
     else:
         while True:
@@ -198,9 +214,15 @@ def main():
                 exit()
         if loginChoice != 4:
             del username, password
+        profiler.f_reportStartup()
         m_mainMenu(rogue, editOffline=(loginChoice == 4))
 
 if __name__ == '__main__':
+    # The frozen builds start the worker processes of verify-backups from this executable.
+    freeze_support()
+    if '--verify-backups' in argv:
+        report = f_verifyBackups(repair='--repair' in argv)
+        exit(1 if report.problems else 0)
     while True:
         try:
             main()
@@ -1,3 +1,4 @@
+from . import profiler
 from . import config
 from .requestsLogic import requestsLogic, HeaderGenerator, fh_handleErrorResponse
 from .mainLogic import Rogue
@@ -9,7 +10,7 @@ from .handler import fh_getChoiceInput, fh_getCompleterInput, fh_getIntegerInput
 from .data import dataParser
 
 __all__ = [
-    'config', 
+    'profiler', 'config', 
     'requestsLogic', 'HeaderGenerator', 'fh_handleErrorResponse',
     'Rogue', 'SeleniumLogic',
     'ModifierEditor',
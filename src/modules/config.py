@@ -17,18 +17,27 @@ Modules:
 - timedelta: Represents a duration, the difference between two dates or times.
 - utilities.cFormatter: Custom formatter for printing colored console output.
 - os: Provides functions for interacting with the operating system, such as creating directories.
+- multiprocessing: Tells the worker processes of verify-backups apart, they skip the initialization.
+- threading: Runs the update check and the certificate revalidation in the background.
 
 Workflow:
 1. Initialize necessary directories (logs, backups, data) if they do not exist.
-2. Check for updates on the GitHub repository using `check_for_updates` function.
-3. Print initialization messages and helpful information using `initialize_text` and `print_help` functions.
+2. Make sure a certificate bundle exists. Once the cached one is older than its TTL it is revalidated
+   on a background thread, the stale bundle is used until then.
+3. Check for updates on the GitHub repository on a background thread, the result is posted to the message buffer.
+4. Print initialization messages and helpful information using `initialize_text` and `print_help` functions.
 """
 
+import multiprocessing
 import os
+import threading
 from datetime import datetime, timedelta
+from email.utils import formatdate
+from typing import List, Optional, Tuple, Union
 import requests
 # need to manually do it to avoid circular imports
 from colorama import Fore, Style, init
+from modules.profiler import fh_profilePhase
 
 init(autoreset=True)
 
@@ -36,15 +45,23 @@ logsDirectory: str = os.path.join(os.getcwd(), 'logs')
 backupDirectory: str = os.path.join(os.getcwd(), 'backups')
 dataDirectory: str = os.path.join(os.getcwd(), 'data')
 timestampFile: str = os.path.join(dataDirectory, 'extra.json')
+catalogManifestFile: str = os.path.join(dataDirectory, 'manifest.json')
+catalogStoreFile: str = os.path.join(dataDirectory, 'catalog.db')
+# Append-only edit journals per trainer and slot, created on the first edit.
+journalDirectory: str = os.path.join(dataDirectory, 'journal')
 
-if not os.path.exists(logsDirectory):
+# True in the worker processes of verify-backups. With the spawn start method (Windows, macOS and the
+# frozen builds) they import this module again; they never connect anywhere or create anything.
+workerProcess: bool = multiprocessing.current_process().name != 'MainProcess'
+
+if not workerProcess and not os.path.exists(logsDirectory):
     os.makedirs(logsDirectory)
     print(f'{Fore.GREEN}Created logs directory: {logsDirectory}')
 # Create the backups directory if it doesn't exist
-if not os.path.exists(backupDirectory):
+if not workerProcess and not os.path.exists(backupDirectory):
     os.makedirs(backupDirectory)
     print(f'{Fore.GREEN}Created backup directory: {backupDirectory}')
-if not os.path.exists(dataDirectory):
+if not workerProcess and not os.path.exists(dataDirectory):
     os.makedirs(dataDirectory)
     print(f'{Fore.GREEN}Created data directory: {dataDirectory}')
 
@@ -54,23 +71,146 @@ debug: bool = False
 debugDeactivateBackup: bool = False if debug else False
 debugEnableTraceback: bool = True if debug else False
 
-cacertURL = 'https://curl.se/ca/cacert.pem'
-cacertPath = f'{dataDirectory}/cacert.pem'
-if not os.path.exists(cacertPath):
-    print(f'{Fore.RED}\ncacert.pem not found. This is needed for SSL Connections. \n Fetching from {cacertURL}...{Style.RESET_ALL}')
-    print(f'{Fore.RED}\nIf it is your first time starting up that is normal.{Style.RESET_ALL}')
-    # Fetch the file using requests library
-    response = requests.get(cacertURL)
-    
-    # Check if the request was successful
-    if response.status_code == 200:
-        # Save the content to local file
-        with open(cacertPath, 'wb') as f:
-            f.write(response.content)
-        print(f'{Fore.GREEN}Successfully fetched {cacertURL} and saved as {cacertPath}.{Style.RESET_ALL}')
+cacertURL: str = 'https://curl.se/ca/cacert.pem'
+cacertPath: str = f'{dataDirectory}/cacert.pem'
+# The bundle is only revalidated against cacertURL once it is older than this.
+cacertTTL: timedelta = timedelta(days=7)
+# Timeout in seconds for the certificate download and the background update check.
+networkTimeout: float = 5.0
+
+# Write trainer.json and the slot files without indentation. Several times faster for large saves,
+# but harder to edit by hand. Backups are always written indented.
+compactWorkingCopies: bool = False
+# Flush every written file to disk before it replaces the old one. Slower, but survives power loss.
+fsyncWrites: bool = True
+# zstd level of the backup sections. Every section is only compressed once, when it first changes.
+backupCompressionLevel: int = 10
+# Later backups are stored as a patch against the last full backup; after this many the next one is full again.
+backupKeyframeInterval: int = 20
+# Retention of older backups: all of the last backupKeepAll, then the newest of each of the last days, weeks
+# and months. Base backups are always kept. The compaction runs in the background at most once per interval
+# and compresses the remaining backups again with the archive level.
+backupRetention: bool = True
+backupKeepAll: timedelta = timedelta(days=1)
+backupKeepDaily: int = 7
+backupKeepWeekly: int = 4
+backupKeepMonthly: int = 12
+backupCompactionInterval: timedelta = timedelta(days=1)
+backupArchiveCompressionLevel: int = 19
+# Size at which a journal file of the edit history is rotated. Each trainer and slot keeps the current file and
+# the one before it, the previous session's file is rotated when the first edit of a session is recorded.
+journalMaxBytes: int = 8 * 1024 * 1024
+# Backups are written on a background thread; submitting waits only when this many are still queued.
+backupQueueSize: int = 8
+# JSON library used for reading and writing: 'auto' picks orjson, then ujson, then the standard library.
+# Set to 'json' to force the standard library, e.g. when debugging a serialization issue.
+jsonBackend: str = 'auto'
+
+def f_fetchCaCert(url: str = cacertURL, path: str = cacertPath, ttl: timedelta = cacertTTL,
+                  timeout: float = networkTimeout) -> Union[str, bool]:
+    """
+    Make sure a usable cacert.pem exists, downloading it only when missing or stale.
+
+    A bundle younger than `ttl` is used without any network access. A stale bundle is revalidated
+    with a conditional request (If-Modified-Since), a 304 response only refreshes its timestamp.
+    If revalidation fails the stale bundle is kept. New content is written to a temporary file
+    and moved into place, so an interrupted download never leaves a truncated bundle behind.
+
+    Args:
+        url (str): The URL of the certificate bundle.
+        path (str): The local path of the certificate bundle.
+        ttl (timedelta): The age after which the bundle is revalidated.
+        timeout (float): Timeout in seconds for the request.
+
+    Returns:
+        Union[str, bool]: The path of the bundle, or False if no bundle is available.
+
+    Usage Example:
+        >>> f_fetchCaCert('http://127.0.0.1:8000/cacert.pem', '/tmp/cacert.pem', timedelta(seconds=0))
+        '/tmp/cacert.pem'
+
+    Modules/Librarys used and for what purpose exactly in each function:
+    - requests: Downloads or revalidates the certificate bundle.
+    - email.utils: Formats the If-Modified-Since header.
+    - os: Checks the age of the bundle and replaces it atomically.
+    """
+    headers = {}
+    if os.path.exists(path):
+        modifiedAt = os.path.getmtime(path)
+        if datetime.now().timestamp() - modifiedAt < ttl.total_seconds():
+            return path
+        headers['If-Modified-Since'] = formatdate(modifiedAt, usegmt=True)
     else:
-        print(f'Failed to fetch {cacertURL}. \n Status code: {response.status_code}. \n Cannot use SSL but the program might work.')
-        cacertPath = False
+        print(f'{Fore.RED}\ncacert.pem not found. This is needed for SSL Connections. \n Fetching from {url}...{Style.RESET_ALL}')
+        print(f'{Fore.RED}\nIf it is your first time starting up that is normal.{Style.RESET_ALL}')
+
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        response = None
+        error = e
+
+    if response is not None and response.status_code == 304:
+        os.utime(path)
+        return path
+
+    if response is not None and response.status_code == 200:
+        tmpPath = f'{path}.tmp'
+        with open(tmpPath, 'wb') as f:
+            f.write(response.content)
+        os.replace(tmpPath, path)
+        if not headers:
+            print(f'{Fore.GREEN}Successfully fetched {url} and saved as {path}.{Style.RESET_ALL}')
+        return path
+
+    reason = f'Status code: {response.status_code}' if response is not None else error
+    if headers:
+        # Keep using the stale bundle, it is retried on the next start.
+        return path
+    print(f'Failed to fetch {url}. \n {reason}. \n Cannot use SSL but the program might work.')
+    return False
+
+def f_startCaCertRevalidation(url: str = cacertURL, path: str = cacertPath, ttl: timedelta = cacertTTL,
+                              timeout: float = networkTimeout) -> Optional[threading.Thread]:
+    """
+    Revalidate a stale cacert.pem on a background thread, see f_fetchCaCert().
+
+    The stale bundle is used until the thread finished. It is replaced atomically, so a connection
+    made meanwhile reads either the old or the new bundle. A slow or offline network never delays
+    startup, the thread is a daemon and the request is bounded by `timeout`.
+
+    Args:
+        url (str): The URL of the certificate bundle.
+        path (str): The local path of the certificate bundle.
+        ttl (timedelta): The age after which the bundle is revalidated.
+        timeout (float): Timeout in seconds for the request.
+
+    Returns:
+        Optional[threading.Thread]: The started thread, None if the bundle is missing or still fresh.
+
+    Usage Example:
+        >>> thread = f_startCaCertRevalidation('http://127.0.0.1:8000/cacert.pem', '/tmp/cacert.pem', timedelta(seconds=0))
+        >>> thread.join()
+
+    Modules/Librarys used and for what purpose exactly in each function:
+    - threading: Runs the revalidation without blocking the caller.
+    - os: Checks the age of the bundle.
+    """
+    if not os.path.exists(path) or datetime.now().timestamp() - os.path.getmtime(path) < ttl.total_seconds():
+        return None
+    thread = threading.Thread(target=f_fetchCaCert, args=(url, path, ttl, timeout), name='cacertRevalidation', daemon=True)
+    thread.start()
+    return thread
+
+# The thread revalidating a stale bundle, None if the bundle was fresh or just downloaded.
+cacertRevalidation: Optional[threading.Thread] = None
+if not workerProcess:
+    with fh_profilePhase('config cacert'):
+        if os.path.exists(cacertPath):
+            cacertRevalidation = f_startCaCertRevalidation()
+        else:
+            # Nothing to fall back on, the first start waits for the download.
+            cacertPath = f_fetchCaCert()
 
 useCaCert = False if debug else cacertPath
 version: str = 'v0.4.8p'
@@ -78,82 +218,77 @@ title: str = f'<(^.^(< pyRogue {version} >)^.^)>'
 owner: str = 'rogueEdit'
 repo: str = 'onlineRogueEditor'
 repoURL: str = f'https://github.com/{owner}/{repo}/'
+githubAPIURL: str = 'https://api.github.com'
 releaseDate: str = '19.07.2024 23:00' # releaed 20:00 roughly but setting ahead in case some stuff pops up
 
 
-def f_checkForUpdates(requests: requests, datetime: datetime, timedelta: timedelta, Style: object) -> None:
+def fh_convertToISOFormat(date_string: str) -> str:
     """
-    Check for updates on the GitHub repository since a specified release date.
+    Convert a date string to ISO 8601 format in UTC timezone.
 
     Args:
-        requests (requests): HTTP library for sending requests to GitHub's API.
-        datetime (datetime): Module for date and time manipulation.
-        timedelta (timedelta): Represents a duration, the difference between two dates or times.
-        Style (object): Object representing a formatting style (not used in this function).
+        date_string (str): Date string in format 'dd.mm.yyyy HH:MM'.
 
-    Usage Example:
-        >>> check_for_updates(requests, datetime, timedelta, Style)
+    Returns:
+        str: ISO 8601 formatted date string in UTC timezone.
 
-    Output Example:
-        - Prints commit details if updates are found.
-        - Provides a URL to view the latest code.
-        - Advises updating the source code if updates are found.
+    Raises:
+        ValueError: If the input date format is incorrect.
+
+    Usage Example:
+        >>> fh_convertToISOFormat('20.06.2024 6:00')
 
     Modules/Librarys used and for what purpose exactly in each function:
-    - requests: Sends HTTP GET requests to retrieve commit history from GitHub repository.
-    - datetime: Converts release date to ISO 8601 format for GitHub API query.
-    - timedelta: Calculates local timezone offset for converting release date to UTC.
-    - utilities.cFormatter: Prints colored console output for displaying update details.
+    - datetime: Parses and formats the input date string.
     """
-    def f_convertToISOFormat(date_string: str, timedelta: timedelta) -> str:
-        """
-        Convert a date string to ISO 8601 format in UTC timezone.
-
-        Args:
-            date_string (str): Date string in format 'dd.mm.yyyy HH:MM'.
-            timedelta (timedelta): Represents a duration, the difference between two dates or times.
+    # Parse the input date string
+    dateFormat = '%d.%m.%Y %H:%M'
+    try:
+        dt = datetime.strptime(date_string, dateFormat)
+    except ValueError as e:
+        raise ValueError("Incorrect date format, should be 'dd.mm.yyyy HH:MM'") from e
 
-        Returns:
-            str: ISO 8601 formatted date string in UTC timezone.
+    # Determine local timezone offset for Central European Time (CET)
+    isDST = datetime.now().timetuple().tm_isdst
+    timezoneOffset = timedelta(hours=2) if isDST else timedelta(hours=1)
 
-        Raises:
-            ValueError: If the input date format is incorrect.
+    # Apply local timezone offset to convert to UTC
+    utcDT = dt - timezoneOffset
 
-        Usage Example:
-            >>> convert_to_iso_format('20.06.2024 6:00', timedelta)
+    # Format datetime object to ISO 8601 format with UTC timezone 'Z' (Zulu time)
+    isoFormat = utcDT.strftime('%Y-%m-%dT%H:%M:%SZ')
 
-        Modules/Librarys used and for what purpose exactly in each function:
-        - datetime: Parses and formats the input date string.
-        """
-        # Parse the input date string
-        dateFormat = '%d.%m.%Y %H:%M'
-        try:
-            dt = datetime.strptime(date_string, dateFormat)
-        except ValueError as e:
-            raise ValueError("Incorrect date format, should be 'dd.mm.yyyy HH:MM'") from e
+    return isoFormat
 
-        # Determine local timezone offset for Central European Time (CET)
-        isDST = datetime.now().timetuple().tm_isdst
-        timezoneOffset = timedelta(hours=2) if isDST else timedelta(hours=1)
+def fh_getUpdateMessages(apiURL: str = githubAPIURL, timeout: float = networkTimeout) -> List[Tuple[str, str]]:
+    """
+    Query the GitHub API for commits since the release date and describe the result.
 
-        # Apply local timezone offset to convert to UTC
-        utcDT = dt - timezoneOffset
+    Args:
+        apiURL (str): Base URL of the GitHub API, can point to a local stand-in server.
+        timeout (float): Timeout in seconds for the request.
 
-        # Format datetime object to ISO 8601 format with UTC timezone 'Z' (Zulu time)
-        isoFormat = utcDT.strftime('%Y-%m-%dT%H:%M:%SZ')
+    Returns:
+        List[Tuple[str, str]]: (colorName, text) pairs, colorName is a member name of utilities.Color.
 
-        return isoFormat
+    Usage Example:
+        >>> fh_getUpdateMessages('http://127.0.0.1:8000', timeout=1)
+        [('GREEN', 'No updates found.')]
 
+    Modules/Librarys used and for what purpose exactly in each function:
+    - requests: Sends HTTP GET requests to retrieve commit history from GitHub repository.
+    - datetime: Converts release date to ISO 8601 format for GitHub API query.
+    """
     try:
         # Convert release date to ISO 8601 format
-        check_date = datetime.fromisoformat(f_convertToISOFormat(releaseDate, timedelta))
+        check_date = datetime.fromisoformat(fh_convertToISOFormat(releaseDate))
 
         # Construct GitHub API URL and parameters
-        url = f'https://api.github.com/repos/{owner}/{repo}/commits'
+        url = f'{apiURL}/repos/{owner}/{repo}/commits'
         params = {'since': check_date.isoformat()}
 
         # Send GET request to GitHub API
-        response = requests.get(url, params=params)
+        response = requests.get(url, params=params, timeout=timeout)
         response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
 
         commits = response.json()  # Parse JSON response
@@ -161,23 +296,74 @@ def f_checkForUpdates(requests: requests, datetime: datetime, timedelta: timedel
         # Extract commit titles and SHAs
         commitList = [{'sha': commit["sha"], 'message': commit["commit"]["message"]} for commit in commits]
 
-        if commitList:
-            print(f'{Fore.YELLOW}********* Outdated source code found. New commits: *********{Style.RESET_ALL}')
-            for commit in commitList:
-                print(f'{Fore.YELLOW}---- Commit Name: ({commit["message"]}{Style.RESET_ALL})')
-                print(f'{Fore.BLUE}------> with SHA ({commit["sha"]}{Style.RESET_ALL})')
-            print(f'{Fore.YELLOW}You can view the latest code here: {repoURL}{Style.RESET_ALL}')
-            print(f'{Fore.YELLOW}It is highly recommended to update the source code. Some things might not be working as expected.{Style.RESET_ALL}')
-            print(f'{Fore.YELLOW}------------------------------------------------------------{Style.RESET_ALL}')
-        else:
-            print(f'{Fore.GREEN}No updates found.')
+        if not commitList:
+            return [('GREEN', 'No updates found.')]
+
+        messages = [('YELLOW', '********* Outdated source code found. New commits: *********')]
+        for commit in commitList:
+            messages.append(('YELLOW', f'---- Commit Name: ({commit["message"]})'))
+            messages.append(('BLUE', f'------> with SHA ({commit["sha"]})'))
+        messages.append(('YELLOW', f'You can view the latest code here: {repoURL}'))
+        messages.append(('YELLOW', 'It is highly recommended to update the source code. Some things might not be working as expected.'))
+        messages.append(('YELLOW', '------------------------------------------------------------'))
+        return messages
 
     except ValueError as ve:
-        print(f'{Fore.RED}Couldnt resolve check_for_updates() - ValueError occurred: {ve}')
+        return [('RED', f'Couldnt resolve check_for_updates() - ValueError occurred: {ve}')]
     except requests.exceptions.RequestException as re:
-        print(f'{Fore.RED}Couldnt resolve check_for_updates() - RequestException occurred: {re}')
+        return [('RED', f'Couldnt resolve check_for_updates() - RequestException occurred: {re}')]
     except Exception as e:
-        print(f'{Fore.RED}Couldnt resolve check_for_updates() - An unexpected error occurred: {e}')
+        return [('RED', f'Couldnt resolve check_for_updates() - An unexpected error occurred: {e}')]
+
+def f_checkForUpdates() -> None:
+    """
+    Check for updates on the GitHub repository since a specified release date and print the result.
+
+    This call blocks until GitHub answered. main.py uses f_startUpdateCheck() instead.
+
+    Usage Example:
+        >>> f_checkForUpdates()
+
+    Output Example:
+        - Prints commit details if updates are found.
+        - Provides a URL to view the latest code.
+        - Advises updating the source code if updates are found.
+    """
+    for colorName, text in fh_getUpdateMessages():
+        print(f'{getattr(Fore, colorName)}{text}{Style.RESET_ALL}')
+
+def f_startUpdateCheck(apiURL: str = githubAPIURL, timeout: float = networkTimeout) -> threading.Thread:
+    """
+    Run the update check on a background thread and post the result to the message buffer.
+
+    The request is bounded by `timeout` and the thread is a daemon, so a slow or offline network
+    never delays startup or exit. The result is shown with the next menu refresh.
+
+    Args:
+        apiURL (str): Base URL of the GitHub API, can point to a local stand-in server.
+        timeout (float): Timeout in seconds for the request.
+
+    Returns:
+        threading.Thread: The started thread, join() it to wait for the result.
+
+    Usage Example:
+        >>> thread = f_startUpdateCheck('http://127.0.0.1:8000', timeout=1)
+        >>> thread.join()
+
+    Modules/Librarys used and for what purpose exactly in each function:
+    - threading: Runs the check without blocking the caller.
+    - utilities.propagateMessage: Receives the result for the next menu refresh.
+    """
+    def fh_run() -> None:
+        messages = fh_getUpdateMessages(apiURL, timeout)
+        # Imported here to avoid circular imports, utilities depends on this module.
+        from utilities import Color, fh_appendMessageBuffer
+        for colorName, text in messages:
+            fh_appendMessageBuffer(Color[colorName], text)
+
+    thread = threading.Thread(target=fh_run, name='updateCheck', daemon=True)
+    thread.start()
+    return thread
 
 def f_printWelcomeText() -> None:
     """
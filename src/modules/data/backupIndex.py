@@ -0,0 +1,412 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides the SQLite index of the backup directory.
+
+Listing the backups of a trainer used to scan the whole directory, match every name with a regular
+expression and parse the timestamp of every match to sort them. The index keeps one row per backup
+with the values encoded in its name, the size and SHA-256 of its content and the keyframe of delta
+backups, so listing, filtering, finding the base backup and the keyframe of a new backup are single
+indexed queries.
+
+The index is derived data and can always be rebuilt from the directory. It is rebuilt when it is
+missing, unreadable or from another schema version, and when the backup directory was changed
+behind its back: the modification time of the directory is stored with every change the index makes
+itself, one os.stat() per query tells whether files were added or removed by hand. Writers call
+f_refresh() before they change the directory and f_add() / f_remove() right after, so their own
+changes never look like foreign ones.
+
+Modules:
+- sqlite3: Stores the index.
+- datetime: Parses the timestamps in the backup names.
+- hashlib: Hashes full copies when the index is rebuilt.
+- os: Provides the directory scan and its modification time.
+- re: Parses the backup names.
+- threading: Guards the connection, backups can be written from another thread.
+- typing: Provides type hints and the NamedTuple used for the backup records.
+- utilities.jsonBackend: Reads the size and hash of a backup from its manifest.
+
+Workflow:
+1. BackupStore.f_write() calls f_refresh() before and f_add() after storing a backup.
+2. f_list() returns the backups of a trainer, base backups first, then by timestamp.
+3. f_hasBase() tells f_createBackup() whether the base backup already exists.
+4. f_keyframe() tells BackupStore.f_write() which full backup a delta is stored against.
+5. f_rebuild() scans the directory, automatically whenever the index is outdated.
+
+Usage Example:
+    >>> index = BackupIndex(config.backupDirectory)
+    >>> [record.filename for record in index.f_list(2450, 'gameData')]
+    ['base_gameData(2450)_27.06.2024_06.09.27.manifest.json', 'backup_gameData(2450)_28.06.2024_10.00.00.manifest.json']
+"""
+
+import sqlite3
+# Stores the index.
+
+from datetime import datetime
+# Parses the timestamps in the backup names.
+
+import hashlib
+# Hashes full copies when the index is rebuilt.
+
+import os
+# Provides the directory scan and its modification time.
+
+import re
+# Parses the backup names.
+
+import threading
+# Guards the connection, backups can be written from another thread.
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+# Provides type hints and the NamedTuple used for the backup records.
+
+from utilities.jsonBackend import fh_loads
+# Reads the size and hash of a backup from its manifest.
+
+# Bump whenever the table layout changes; outdated indexes are rebuilt.
+SCHEMA_VERSION: int = 2
+
+INDEX_FILENAME: str = 'index.db'
+
+# e.g. base_gameData(2450)_27.06.2024_06.09.27.json or backup_slotData(1_2450)_27.06.2024_06.09.27.manifest.json
+BACKUP_NAME = re.compile(r'(base|backup)_(gameData|slotData)\((?:(\d+)_)?(\d+)\)_'
+                         r'(\d{2})\.(\d{2})\.(\d{4})_(\d{2})\.(\d{2})\.(\d{2})(\.manifest)?\.json')
+
+class BackupRecord(NamedTuple):
+    """
+    One backup as listed in the index, in the column order of the table.
+
+    Attributes:
+        filename (str): The file in the backup directory.
+        trainerId (int): The trainer the backup belongs to.
+        slot (Optional[int]): The slot of slot data backups, None for game data.
+        type (str): 'gameData' or 'slotData'.
+        base (bool): Whether it is the base backup created on the first login.
+        timestamp (int): When it was created, seconds since the epoch in local time.
+        size (int): Length of the backup text.
+        sha256 (str): SHA-256 of the backup text.
+        keyframe (Optional[str]): The full backup a delta backup is stored against, None for full backups.
+    """
+    filename: str
+    trainerId: int
+    slot: Optional[int]
+    type: str
+    base: bool
+    timestamp: int
+    size: int
+    sha256: str
+    keyframe: Optional[str] = None
+
+    @property
+    def isManifest(self) -> bool:
+        return self.filename.endswith('.manifest.json')
+
+def fh_parseBackupName(filename: str) -> Optional[Tuple[int, Optional[int], str, bool, int]]:
+    """
+    Read the values encoded in the name of a backup.
+
+    Args:
+        filename (str): The backup file name.
+
+    Returns:
+        Optional[Tuple[int, Optional[int], str, bool, int]]: trainerId, slot, type, base and timestamp,
+        None if the name is not one of a backup.
+    """
+    match = BACKUP_NAME.fullmatch(filename)
+    if not match:
+        return None
+    kind, dataType, slot, trainerId, day, month, year, hour, minute, second, _ = match.groups()
+    try:
+        timestamp = int(datetime(int(year), int(month), int(day), int(hour), int(minute), int(second)).timestamp())
+    except ValueError:
+        return None
+    return int(trainerId), None if slot is None else int(slot), dataType, kind == 'base', timestamp
+
+class BackupIndex:
+    """
+    SQLite index of one backup directory.
+
+    Attributes:
+        directory (str): The backup directory.
+        path (str): The index database, inside the backup directory.
+    """
+    def __init__(self, directory: str, path: Optional[str] = None) -> None:
+        """
+        Initialize the BackupIndex. The database is opened, and rebuilt if needed, on first access.
+
+        Args:
+            directory (str): The backup directory, see config.backupDirectory.
+            path (Optional[str]): The index database, defaults to index.db in the backup directory.
+        """
+        self.directory: str = directory
+        self.path: str = os.path.join(directory, INDEX_FILENAME) if path is None else path
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__lock = threading.RLock()
+
+    def __fh_directoryStamp(self) -> int:
+        return os.stat(self.directory).st_mtime_ns
+
+    def __fh_connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        # No journal file is created next to the index, it would change the directory stamp on every
+        # commit. The index can always be rebuilt, a crash may lose it but never the backups.
+        connection.execute('PRAGMA journal_mode = MEMORY')
+        connection.execute('PRAGMA synchronous = OFF')
+        return connection
+
+    def __fh_open(self) -> sqlite3.Connection:
+        # Opens the database, a broken or outdated one is deleted and rebuilt from the directory.
+        if self.__connection is not None:
+            return self.__connection
+        connection = None
+        try:
+            connection = self.__fh_connect()
+            if connection.execute('PRAGMA user_version').fetchone()[0] == SCHEMA_VERSION:
+                self.__connection = connection
+                return connection
+        except sqlite3.DatabaseError:
+            pass
+        if connection is not None:
+            connection.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        connection = self.__fh_connect()
+        connection.execute('CREATE TABLE backups (filename TEXT PRIMARY KEY, trainerId INTEGER NOT NULL, slot INTEGER, '
+                           'type TEXT NOT NULL, base INTEGER NOT NULL, timestamp INTEGER NOT NULL, '
+                           'size INTEGER NOT NULL, sha256 TEXT NOT NULL, keyframe TEXT)')
+        connection.execute('CREATE INDEX backupsByTrainer ON backups (trainerId, type, base DESC, timestamp)')
+        connection.execute('CREATE INDEX backupsByKeyframe ON backups (keyframe)')
+        connection.execute('CREATE TABLE meta (key TEXT PRIMARY KEY, value)')
+        connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        connection.commit()
+        self.__connection = connection
+        self.__fh_rebuild(connection)
+        return connection
+
+    def __fh_connection(self) -> sqlite3.Connection:
+        # The open database, rebuilt first if files were added or removed behind its back.
+        connection = self.__fh_open()
+        row = connection.execute("SELECT value FROM meta WHERE key = 'directoryStamp'").fetchone()
+        if row is None or row[0] != self.__fh_directoryStamp():
+            self.__fh_rebuild(connection)
+        return connection
+
+    def __fh_commit(self, connection: sqlite3.Connection) -> None:
+        # Every change of the index is followed by the directory stamp it corresponds to.
+        connection.execute("INSERT OR REPLACE INTO meta VALUES ('directoryStamp', ?)", (self.__fh_directoryStamp(),))
+        connection.commit()
+
+    def __fh_describe(self, filename: str) -> Optional[Tuple[int, str, Optional[str]]]:
+        # Size, hash and keyframe of a backup: manifests carry them, full copies are hashed.
+        path = os.path.join(self.directory, filename)
+        try:
+            if filename.endswith('.manifest.json'):
+                with open(path, 'rb') as file:
+                    manifest = fh_loads(file.read())
+                return manifest['size'], manifest['sha256'], manifest.get('keyframe')
+            with open(path, 'r', encoding='utf-8') as file:
+                content = file.read().encode('utf-8')
+            return len(content), hashlib.sha256(content).hexdigest(), None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def __fh_rows(self, filenames: Iterable[str]) -> Iterable[Tuple]:
+        for filename in filenames:
+            values = fh_parseBackupName(filename)
+            description = self.__fh_describe(filename) if values else None
+            if description:
+                yield (filename, *values, *description)
+
+    def __fh_rebuild(self, connection: sqlite3.Connection) -> None:
+        connection.execute('DELETE FROM backups')
+        connection.executemany('INSERT OR REPLACE INTO backups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                               self.__fh_rows(sorted(os.listdir(self.directory))))
+        self.__fh_commit(connection)
+
+    def f_refresh(self) -> None:
+        """
+        Rebuild the index if the directory was changed behind its back. Call it before changing the
+        directory and f_add() / f_remove() afterwards.
+        """
+        with self.__lock:
+            self.__fh_connection()
+
+    def f_rebuild(self) -> int:
+        """
+        Rebuild the index from the files in the backup directory.
+
+        Returns:
+            int: The number of backups found.
+        """
+        with self.__lock:
+            connection = self.__fh_open()
+            self.__fh_rebuild(connection)
+            return connection.execute('SELECT COUNT(*) FROM backups').fetchone()[0]
+
+    def f_add(self, filename: str, size: int, sha256: str, keyframe: Optional[str] = None) -> Optional[BackupRecord]:
+        """
+        Add a backup that was just written to the directory, see f_refresh().
+
+        Args:
+            filename (str): The backup file name.
+            size (int): Length of the backup text.
+            sha256 (str): SHA-256 of the backup text.
+            keyframe (Optional[str]): The full backup a delta backup is stored against.
+
+        Returns:
+            Optional[BackupRecord]: The record, None if the name is not one of a backup.
+        """
+        values = fh_parseBackupName(filename)
+        if values is None:
+            return None
+        with self.__lock:
+            connection = self.__fh_open()
+            connection.execute('INSERT OR REPLACE INTO backups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                               (filename, *values, size, sha256, keyframe))
+            self.__fh_commit(connection)
+        return BackupRecord(filename, *values, size, sha256, keyframe)
+
+    def f_remove(self, filenames: Iterable[str]) -> None:
+        """
+        Drop backups that were just removed from the directory, see f_refresh().
+
+        Args:
+            filenames (Iterable[str]): The removed backup file names.
+        """
+        with self.__lock:
+            connection = self.__fh_open()
+            connection.executemany('DELETE FROM backups WHERE filename = ?', ((filename,) for filename in filenames))
+            self.__fh_commit(connection)
+
+    def f_list(self, trainerId: object = None, dataType: Optional[str] = None, slot: Optional[int] = None) -> List[BackupRecord]:
+        """
+        List the backups of a trainer, base backups first, then oldest to newest.
+
+        Args:
+            trainerId (object): The trainer ID, None lists the backups of every trainer.
+            dataType (Optional[str]): 'gameData' or 'slotData', None lists both.
+            slot (Optional[int]): Only slot data backups of this slot.
+
+        Returns:
+            List[BackupRecord]: The matching backups.
+        """
+        query = 'SELECT filename, trainerId, slot, type, base, timestamp, size, sha256, keyframe FROM backups WHERE 1'
+        parameters: list = []
+        if trainerId is not None:
+            query += ' AND trainerId = ?'
+            parameters.append(int(trainerId))
+        if dataType is not None:
+            query += ' AND type = ?'
+            parameters.append(dataType)
+        if slot is not None:
+            query += ' AND slot = ?'
+            parameters.append(slot)
+        query += ' ORDER BY base DESC, timestamp'
+        with self.__lock:
+            rows = self.__fh_connection().execute(query, parameters).fetchall()
+        return list(map(BackupRecord._make, rows))
+
+    def f_hasBase(self, trainerId: object, dataType: str) -> bool:
+        """
+        Check whether the base backup of a trainer exists.
+
+        Args:
+            trainerId (object): The trainer ID.
+            dataType (str): 'gameData' or 'slotData'.
+
+        Returns:
+            bool: True if there is a base backup.
+        """
+        with self.__lock:
+            return self.__fh_connection().execute('SELECT 1 FROM backups WHERE trainerId = ? AND type = ? AND base = 1 LIMIT 1',
+                                                  (int(trainerId), dataType)).fetchone() is not None
+
+    def f_keyframe(self, trainerId: object, dataType: str, slot: Optional[int] = None) -> Optional[Tuple[str, int]]:
+        """
+        Find the newest full backup of a series that a new backup can be stored against.
+
+        Only manifests qualify, full copies of older versions are never keyframes.
+
+        Args:
+            trainerId (object): The trainer ID.
+            dataType (str): 'gameData' or 'slotData'.
+            slot (Optional[int]): The slot of slot data backups, None for game data.
+
+        Returns:
+            Optional[Tuple[str, int]]: The keyframe and the number of deltas stored against it, None if
+            the series has no full backup yet.
+        """
+        with self.__lock:
+            connection = self.__fh_connection()
+            row = connection.execute("SELECT filename FROM backups WHERE trainerId = ? AND type = ? AND slot IS ? "
+                                     "AND keyframe IS NULL AND filename LIKE '%.manifest.json' "
+                                     "ORDER BY timestamp DESC LIMIT 1", (int(trainerId), dataType, slot)).fetchone()
+            if row is None:
+                return None
+            return row[0], connection.execute('SELECT COUNT(*) FROM backups WHERE keyframe = ?', row).fetchone()[0]
+
+    def f_entries(self) -> Dict[str, BackupRecord]:
+        """
+        Return every indexed backup as the index holds it, without rebuilding an outdated index first.
+        Compared with the directory, it shows entries whose files were removed or changed by hand.
+
+        Returns:
+            Dict[str, BackupRecord]: The records by file name.
+        """
+        with self.__lock:
+            rows = self.__fh_open().execute('SELECT filename, trainerId, slot, type, base, timestamp, size, sha256, keyframe FROM backups').fetchall()
+        return {row[0]: BackupRecord._make(row) for row in rows}
+
+    def f_dependents(self, keyframe: str) -> List[BackupRecord]:
+        """
+        List the delta backups stored against a keyframe, oldest to newest.
+
+        Args:
+            keyframe (str): The keyframe manifest.
+
+        Returns:
+            List[BackupRecord]: The delta backups.
+        """
+        with self.__lock:
+            rows = self.__fh_connection().execute('SELECT filename, trainerId, slot, type, base, timestamp, size, sha256, keyframe '
+                                                  'FROM backups WHERE keyframe = ? ORDER BY timestamp', (keyframe,)).fetchall()
+        return list(map(BackupRecord._make, rows))
+
+    def f_getValue(self, key: str, default: object = None) -> object:
+        """
+        Read a value stored with the index, e.g. when the backups were last compacted.
+
+        Args:
+            key (str): The name of the value.
+            default (object): Returned if the value is not stored, e.g. after the index was rebuilt.
+
+        Returns:
+            object: The value.
+        """
+        with self.__lock:
+            row = self.__fh_open().execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def f_setValue(self, key: str, value: object) -> None:
+        """
+        Store a value with the index. It is lost when the index is rebuilt.
+
+        Args:
+            key (str): The name of the value.
+            value (object): An int, float or str.
+        """
+        with self.__lock:
+            connection = self.__fh_open()
+            connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, value))
+            connection.commit()
+
+    def f_close(self) -> None:
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
@@ -0,0 +1,344 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides the retention policy of the backup directory and its background compaction.
+
+Every login writes two backups and nothing ever removed them. The retention policy keeps a
+grandfather-father-son set per series, that is per trainer and data type and slot:
+- every base backup
+- every backup of the last config.backupKeepAll
+- the newest backup of each of the last config.backupKeepDaily days that have one
+- the newest backup of each of the last config.backupKeepWeekly ISO weeks that have one
+- the newest backup of each of the last config.backupKeepMonthly months that have one
+
+A compaction pass removes the other backups. Expired deltas are simply deleted. An expired keyframe
+is merged into the backups stored against it: the oldest surviving one is rewritten in full and the
+others become deltas against it, only then is the keyframe deleted. Surviving full copies of older
+versions are migrated into the store, sections no manifest refers to anymore are removed and the
+objects written since the last pass are compressed again with config.backupArchiveCompressionLevel.
+
+The pass runs on a daemon thread with the lowest CPU and I/O priority the system offers, at most
+once per config.backupCompactionInterval. It takes the lock of the store only for each single
+change, so a backup written from the menu waits for one file at most, and it stops between two
+changes when the tool exits. The result is reported through the message buffer.
+
+Modules:
+- ctypes: Lowers the I/O priority of the compaction thread where os does not offer it.
+- logging: Records failed passes.
+- os: Lowers the CPU priority of the compaction thread.
+- platform: Selects the ioprio_set system call number on Linux.
+- sys: Tells the operating systems apart.
+- threading: Runs the compaction in the background.
+- time: Provides the current time and measures the pass.
+- collections.defaultdict: Groups the backups by series.
+- datetime: Assigns the backups to days, weeks and months.
+- typing: Provides type hints and the NamedTuple of the compaction report.
+- modules.config: Provides the retention settings.
+- modules.data.backupIndex: Provides the backup records.
+- modules.data.backupStore: Deletes, rebases and recompresses the backups.
+- utilities: Reports the result through the message buffer.
+
+Workflow:
+1. Rogue creates a BackupCompactor for its backup store and calls f_start() after login.
+2. f_start() returns at once if compaction is disabled or the last pass is recent enough.
+3. Otherwise the thread lowers its priority and runs f_compact().
+4. f_compact() selects the retained backups with fh_selectRetained() and removes the rest.
+
+Usage Example:
+    >>> compactor = BackupCompactor(BackupStore(config.backupDirectory))
+    >>> compactor.f_compact()
+    CompactionReport(kept=57, deleted=443, rebased=12, migrated=0, objectsRemoved=1380, bytesFreed=9123456, ...)
+"""
+
+import ctypes
+# Lowers the I/O priority of the compaction thread where os does not offer it.
+
+import logging
+# Records failed passes.
+
+import os
+# Lowers the CPU priority of the compaction thread.
+
+import platform
+# Selects the ioprio_set system call number on Linux.
+
+import sys
+# Tells the operating systems apart.
+
+import threading
+# Runs the compaction in the background.
+
+import time
+# Provides the current time and measures the pass.
+
+from collections import defaultdict
+# Groups the backups by series.
+
+from datetime import datetime, timedelta
+# Assigns the backups to days, weeks and months.
+
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+# Provides type hints and the NamedTuple of the compaction report.
+
+from modules import config
+# Provides the retention settings.
+
+from modules.data.backupIndex import BackupRecord
+# Provides the backup records.
+
+from modules.data.backupStore import BackupStore
+# Deletes, rebases and recompresses the backups.
+
+from utilities import Color, fh_appendMessageBuffer
+# Reports the result through the message buffer.
+
+# Names of the values the compactor keeps in the backup index.
+LAST_COMPACTION: str = 'lastCompaction'
+COMPACTED_UNTIL: str = 'compactedUntil'
+
+# ioprio_set system call numbers, IOPRIO_CLASS_IDLE and IOPRIO_WHO_PROCESS (a thread ID on Linux).
+IOPRIO_SET: Dict[str, int] = {'x86_64': 251, 'amd64': 251, 'aarch64': 30, 'arm64': 30, 'i386': 289, 'i686': 289, 'armv7l': 314}
+IOPRIO_CLASS_IDLE: int = 3
+IOPRIO_CLASS_SHIFT: int = 13
+IOPRIO_WHO_PROCESS: int = 1
+# SetThreadPriority mode that also lowers the I/O and memory priority of the thread.
+THREAD_MODE_BACKGROUND_BEGIN: int = 0x00010000
+# setiopolicy_np: IOPOL_TYPE_DISK, IOPOL_SCOPE_THREAD, IOPOL_THROTTLE.
+IOPOL_TYPE_DISK, IOPOL_SCOPE_THREAD, IOPOL_THROTTLE = 0, 1, 3
+
+class CompactionReport(NamedTuple):
+    """
+    The result of a compaction pass.
+
+    Attributes:
+        kept (int): Backups retained by the policy.
+        deleted (int): Backups removed.
+        rebased (int): Retained backups rewritten because their keyframe expired.
+        migrated (int): Full copies of older versions moved into the store.
+        objectsRemoved (int): Sections and patches no manifest referred to anymore.
+        bytesFreed (int): Bytes of the removed objects.
+        recompressed (int): Objects compressed again with the archive level.
+        bytesSaved (int): Bytes saved by the recompression.
+        seconds (float): Duration of the pass.
+    """
+    kept: int
+    deleted: int
+    rebased: int
+    migrated: int
+    objectsRemoved: int
+    bytesFreed: int
+    recompressed: int
+    bytesSaved: int
+    seconds: float
+
+def fh_selectRetained(records: Iterable[BackupRecord], now: float, keepAll: timedelta = timedelta(days=1),
+                      daily: int = 7, weekly: int = 4, monthly: int = 12) -> Set[str]:
+    """
+    Apply the grandfather-father-son policy to every series of backups.
+
+    Args:
+        records (Iterable[BackupRecord]): The backups, e.g. BackupIndex.f_list().
+        now (float): The current time, seconds since the epoch.
+        keepAll (timedelta): Every backup younger than this is kept.
+        daily (int): Days, newest first, of which the newest backup is kept.
+        weekly (int): ISO weeks, newest first, of which the newest backup is kept.
+        monthly (int): Months, newest first, of which the newest backup is kept.
+
+    Returns:
+        Set[str]: The file names of the backups to keep.
+
+    Example:
+        >>> fh_selectRetained(index.f_list(2450), time.time(), daily=3, weekly=0, monthly=0)
+        {'base_gameData(2450)_...', 'backup_gameData(2450)_...', ...}
+    """
+    rules: List[Tuple[Callable[[datetime], object], int]] = [
+        (lambda moment: moment.date(), daily),
+        (lambda moment: moment.isocalendar()[:2], weekly),
+        (lambda moment: (moment.year, moment.month), monthly),
+    ]
+    series: Dict[Tuple, List[BackupRecord]] = defaultdict(list)
+    for record in records:
+        series[(record.trainerId, record.type, record.slot)].append(record)
+
+    retained: Set[str] = set()
+    cutoff = now - keepAll.total_seconds()
+    for backups in series.values():
+        buckets: List[Set[object]] = [set() for _ in rules]
+        for record in sorted(backups, key=lambda record: record.timestamp, reverse=True):
+            if record.base or record.timestamp >= cutoff:
+                retained.add(record.filename)
+            moment = datetime.fromtimestamp(record.timestamp)
+            for (bucketOf, limit), seen in zip(rules, buckets):
+                bucket = bucketOf(moment)
+                if bucket not in seen and len(seen) < limit:
+                    seen.add(bucket)
+                    retained.add(record.filename)
+    return retained
+
+def fh_lowerThreadPriority() -> bool:
+    """
+    Give the calling thread the lowest CPU and I/O priority, as far as the system allows.
+
+    Returns:
+        bool: True if the I/O priority was lowered, the CPU priority is lowered where possible in any case.
+    """
+    try:
+        if sys.platform.startswith('linux'):
+            threadId = threading.get_native_id()
+            # Linux applies nice values and I/O classes per thread.
+            os.setpriority(os.PRIO_PROCESS, threadId, 19)
+            number = IOPRIO_SET.get(platform.machine().lower())
+            if number is None:
+                return False
+            libc = ctypes.CDLL(None, use_errno=True)
+            return libc.syscall(number, IOPRIO_WHO_PROCESS, threadId, IOPRIO_CLASS_IDLE << IOPRIO_CLASS_SHIFT) == 0
+        if sys.platform == 'win32':
+            kernel32 = ctypes.windll.kernel32
+            return bool(kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_MODE_BACKGROUND_BEGIN))
+        if sys.platform == 'darwin':
+            libc = ctypes.CDLL('/usr/lib/libSystem.dylib')
+            return libc.setiopolicy_np(IOPOL_TYPE_DISK, IOPOL_SCOPE_THREAD, IOPOL_THROTTLE) == 0
+    except (AttributeError, OSError):
+        pass
+    return False
+
+class BackupCompactor:
+    """
+    Applies the retention policy to a backup store, in the background.
+
+    Attributes:
+        store (BackupStore): The store to compact.
+        keepAll (timedelta): Every backup younger than this is kept.
+        daily (int): Days of which the newest backup is kept.
+        weekly (int): ISO weeks of which the newest backup is kept.
+        monthly (int): Months of which the newest backup is kept.
+        interval (timedelta): Minimum time between two passes started by f_start().
+        archiveLevel (int): zstd level the retained objects are compressed with again.
+        thread (Optional[threading.Thread]): The thread of the running or last pass.
+        report (Optional[CompactionReport]): The result of the last pass.
+    """
+
+    def __init__(self, store: BackupStore, keepAll: Optional[timedelta] = None, daily: Optional[int] = None,
+                 weekly: Optional[int] = None, monthly: Optional[int] = None, interval: Optional[timedelta] = None,
+                 archiveLevel: Optional[int] = None) -> None:
+        self.store = store
+        self.keepAll = config.backupKeepAll if keepAll is None else keepAll
+        self.daily = config.backupKeepDaily if daily is None else daily
+        self.weekly = config.backupKeepWeekly if weekly is None else weekly
+        self.monthly = config.backupKeepMonthly if monthly is None else monthly
+        self.interval = config.backupCompactionInterval if interval is None else interval
+        self.archiveLevel = config.backupArchiveCompressionLevel if archiveLevel is None else archiveLevel
+        self.thread: Optional[threading.Thread] = None
+        self.report: Optional[CompactionReport] = None
+        self.__stop = threading.Event()
+
+    def f_isDue(self, now: Optional[float] = None) -> bool:
+        """
+        Tell whether the last pass is older than the interval.
+
+        Args:
+            now (Optional[float]): The current time, seconds since the epoch.
+
+        Returns:
+            bool: True if a pass should run.
+        """
+        now = time.time() if now is None else now
+        return now - float(self.store.index.f_getValue(LAST_COMPACTION, 0.0)) >= self.interval.total_seconds()
+
+    def f_start(self, force: bool = False) -> bool:
+        """
+        Start a pass on a low priority daemon thread and return at once.
+
+        Args:
+            force (bool): Run even if the last pass is recent or retention is disabled in config.
+
+        Returns:
+            bool: True if a pass was started.
+        """
+        if self.thread is not None and self.thread.is_alive():
+            return False
+        if not force and (not config.backupRetention or not self.f_isDue()):
+            return False
+        self.__stop.clear()
+        self.thread = threading.Thread(target=self.__fh_run, name='backupCompaction', daemon=True)
+        self.thread.start()
+        return True
+
+    def f_stop(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Ask a running pass to stop after its current change and wait for it.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, None waits until it stopped.
+        """
+        self.__stop.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def __fh_run(self) -> None:
+        fh_lowerThreadPriority()
+        try:
+            report = self.f_compact()
+        except Exception as e:
+            logging.exception('Backup compaction failed')
+            fh_appendMessageBuffer(Color.WARNING, f'Backup compaction failed: {e}')
+            return
+        if report.deleted or report.migrated or report.bytesSaved:
+            fh_appendMessageBuffer(Color.INFO, f'Backups compacted: {report.deleted} expired removed, {report.kept} kept, '
+                                               f'{(report.bytesFreed + report.bytesSaved) / 2**20:.1f} MiB freed.')
+
+    def f_compact(self, now: Optional[float] = None) -> CompactionReport:
+        """
+        Remove the expired backups and compress the retained ones again. Stops early, without leaving
+        a backup unreadable, when f_stop() is called.
+
+        Args:
+            now (Optional[float]): The current time, seconds since the epoch.
+
+        Returns:
+            CompactionReport: What the pass did.
+        """
+        start = time.perf_counter()
+        # Objects written from now on, by the rebases below or by the BackupWriter meanwhile, are
+        # recompressed by this pass if they are found and by the next one otherwise.
+        until = time.time()
+        now = until if now is None else now
+        index = self.store.index
+        index.f_refresh()
+        records = index.f_list()
+        retained = fh_selectRetained(records, now, self.keepAll, self.daily, self.weekly, self.monthly)
+        expired = [record for record in records if record.filename not in retained]
+        deleted = rebased = migrated = 0
+
+        # Deltas first, then an expired keyframe only has retained backups left to rebase.
+        for record in sorted(expired, key=lambda record: (record.keyframe is None, record.timestamp)):
+            if self.__stop.is_set():
+                break
+            with self.store.lock:
+                if record.isManifest and record.keyframe is None:
+                    rebased += len(self.store.f_rebase(record.filename))
+                self.store.f_delete(record.filename)
+            deleted += 1
+
+        legacy = [record.filename for record in records if record.filename in retained and not record.isManifest]
+        for filename in legacy:
+            if self.__stop.is_set():
+                break
+            migrated += len(self.store.f_migrate([filename])[0])
+
+        objectsRemoved = bytesFreed = recompressed = bytesSaved = 0
+        if not self.__stop.is_set():
+            objectsRemoved, bytesFreed = self.store.f_collectGarbage()
+            recompressed, bytesSaved = self.store.f_recompress(self.archiveLevel, float(index.f_getValue(COMPACTED_UNTIL, 0.0)), self.__stop)
+            if not self.__stop.is_set():
+                index.f_setValue(COMPACTED_UNTIL, until)
+                index.f_setValue(LAST_COMPACTION, now)
+
+        self.report = CompactionReport(len(records) - deleted, deleted, rebased, migrated, objectsRemoved, bytesFreed,
+                                       recompressed, bytesSaved, time.perf_counter() - start)
+        return self.report
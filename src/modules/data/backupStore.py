@@ -0,0 +1,611 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides the content-addressed, deduplicated backup store.
+
+A backup used to be a full indented copy of trainer.json or a slot file, written on every login.
+Most of it never changes between two backups. The store splits a backup into its top level
+sections, exactly as they appear in the indented file, and names every section after the SHA-256
+of its text. Each unique section is compressed with zstd and stored once; a backup is a small
+manifest listing its sections:
+
+    backups/backup_gameData(2450)_27.06.2024_06.09.27.manifest.json
+        {"format":1,"indent":4,"size":633145,"sha256":"...","sections":[["trainerId","9f2c..."],...]}
+    backups/objects/9f/9f2c....zst
+
+Most logins only change a few values, yet a changed value makes its whole section a new object.
+Later backups of a trainer or slot are therefore stored as a JSON Patch (RFC 6902) against the
+nearest full backup of the same series, the keyframe. The patch is stored as an object like a
+section and the manifest names the keyframe instead of listing sections:
+
+    backups/backup_gameData(2450)_28.06.2024_10.00.00.manifest.json
+        {"format":1,"indent":4,"size":633190,"sha256":"...","keyframe":"base_gameData(2450)_...","delta":"41ab..."}
+
+Base backups are always keyframes. After config.backupKeyframeInterval deltas against the same
+keyframe, or when a patch would not be much smaller than the backup, the next backup is full again.
+Deltas always refer to a full backup, never to another delta, so restoring one reads two manifests.
+
+Reading a backup reassembles the sections with the separators of the indented layout; for a delta
+only the sections the patch touches are parsed and serialized again. The result is the text the old
+full copy would have had, character for character. A delta is only written if it rebuilds the backup
+exactly, and the SHA-256 of the whole text is kept in the manifest and checked on every read. Full copies written by older versions stay readable
+and can be migrated into the store. Every backup is listed in the SQLite index of the directory, see
+modules.data.backupIndex.
+
+Modules:
+- hashlib: Names the sections after their content.
+- collections.OrderedDict: Keeps recently read sections when a cache size is given.
+- os: Provides the manifest and object paths.
+- threading: Serializes writes with the compaction running in the background.
+- typing: Provides type hints for better code clarity and type checking.
+- zstandard: Compresses the stored sections.
+- modules.config: Provides the compression level.
+- utilities.atomicWriter: Writes manifests and objects atomically.
+- utilities.jsonBackend: Serializes the sections and parses reassembled backups.
+- modules.data.backupIndex: Lists the backups without scanning the directory and finds the keyframes.
+- modules.data.saveDiff: Computes and applies the patches of delta backups.
+
+Workflow:
+1. f_write() splits the data into sections and stores a delta against the keyframe, or the missing
+   sections of a full backup. The manifest is written and indexed.
+2. f_read() / f_load() reassemble a backup, or read a full copy of an older version.
+3. f_migrate() replaces full copies by manifests, each only after it was reassembled identically.
+4. f_delete() / f_rebase() / f_collectGarbage() / f_recompress() let the compaction drop expired
+   backups, see modules.data.backupRetention.
+5. f_diskUsage() reports the space taken by manifests, objects and remaining full copies.
+
+Usage Example:
+    >>> store = BackupStore(config.backupDirectory)
+    >>> store.f_write('backup_gameData(2450)_27.06.2024_06.09.27', trainerData)
+    'backup_gameData(2450)_27.06.2024_06.09.27.manifest.json'
+    >>> store.f_load('backup_gameData(2450)_27.06.2024_06.09.27.manifest.json') == trainerData
+    True
+"""
+
+import hashlib
+# Names the sections after their content.
+
+import os
+# Provides the manifest and object paths.
+
+from collections import OrderedDict
+# Keeps recently read sections when a cache size is given.
+
+import threading
+# Serializes writes with the compaction running in the background.
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+# Provides type hints for better code clarity and type checking.
+
+import zstandard
+# Compresses the stored sections.
+
+from modules import config
+# Provides the compression level.
+
+from utilities.atomicWriter import fh_writeAtomic
+# Writes manifests and objects atomically.
+
+from utilities.jsonBackend import fh_dumps, fh_loads
+# Serializes the sections and parses reassembled backups.
+
+from modules.data.backupIndex import BackupIndex, fh_parseBackupName
+# Lists the backups without scanning the directory and finds the keyframes.
+
+from modules.data.saveDiff import Patch, fh_applyPatch, fh_diff, fh_escapePointer, fh_splitPointer
+# Computes and applies the patches of delta backups.
+
+MANIFEST_SUFFIX: str = '.manifest.json'
+OBJECT_DIRECTORY: str = 'objects'
+MANIFEST_FORMAT: int = 1
+# A delta is only stored if its patch is at most this fraction of the backup text.
+DELTA_MAX_RATIO: float = 0.5
+
+def fh_splitSections(data: Dict[str, Any], indent: Optional[int] = 4) -> List[Tuple[str, str]]:
+    """
+    Serialize every top level member of a document on its own, as it appears in the whole document.
+
+    Nested lines are indented one level deeper than in a document of their own. JSON strings never
+    contain a raw line break, so every line break in the text is one the layout added.
+
+    Args:
+        data (Dict[str, Any]): The document.
+        indent (Optional[int]): Indentation of the layout, None for the compact layout.
+
+    Returns:
+        List[Tuple[str, str]]: The key and the text of every member, e.g. ('money', '    "money": 1000').
+    """
+    if indent is None:
+        return [(key, f'{fh_dumps(key)}:{fh_dumps(value, compact=True)}') for key, value in data.items()]
+    padding = ' ' * indent
+    return [(key, f'{padding}{fh_dumps(key)}: {fh_dumps(value, indent=indent)}'.replace('\n', '\n' + padding))
+            for key, value in data.items()]
+
+def fh_joinSections(members: List[str], indent: Optional[int] = 4) -> str:
+    """
+    Reassemble a document from its member texts, the reverse of fh_splitSections().
+
+    Args:
+        members (List[str]): The texts of the top level members, in document order.
+        indent (Optional[int]): Indentation of the layout, None for the compact layout.
+
+    Returns:
+        str: The document, identical to serializing it as a whole.
+    """
+    if not members:
+        return '{}'
+    if indent is None:
+        return '{' + ','.join(members) + '}'
+    return '{\n' + ',\n'.join(members) + '\n}'
+
+def fh_parseSection(key: str, member: str) -> Any:
+    """
+    Parse the value of a member text of fh_splitSections().
+
+    Args:
+        key (str): The key of the member.
+        member (str): The member text, e.g. '    "money": 1000'.
+
+    Returns:
+        Any: The value, e.g. 1000.
+    """
+    return fh_loads('{' + member + '}')[key]
+
+def fh_patchSections(members: List[Tuple[str, str]], patch: Patch, indent: Optional[int] = 4,
+                     parsed: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    Apply a JSON Patch to a document given as member texts. Only the members the patch touches are
+    parsed and serialized again, the others are kept as they are.
+
+    Args:
+        members (List[Tuple[str, str]]): Key and text of every member, see fh_splitSections().
+        patch (Patch): The operations, their paths relative to the whole document.
+        indent (Optional[int]): Indentation of the layout, None for the compact layout.
+        parsed (Optional[Dict[str, Any]]): Already parsed values of touched members, they are changed in place.
+
+    Returns:
+        List[str]: The member texts of the patched document, new members at the end.
+
+    Raises:
+        ValueError: If an operation does not apply.
+    """
+    touched = {fh_splitPointer(operation['path'])[0] for operation in patch}
+    parsed = {} if parsed is None else parsed
+    document = {key: parsed[key] if key in parsed else fh_parseSection(key, text)
+                for key, text in members if key in touched}
+    document = fh_applyPatch(document, patch)
+    if type(document) is not dict:
+        raise ValueError('A backup must be an object.')
+    result = [text if key not in touched else fh_splitSections({key: document.pop(key)}, indent)[0][1]
+              for key, text in members if key not in touched or key in document]
+    result.extend(text for _, text in fh_splitSections(document, indent))
+    return result
+
+class BackupStore:
+    """
+    Backups of one backup directory, stored as manifests of deduplicated, compressed sections.
+
+    Attributes:
+        directory (str): The backup directory, the manifests live next to older full copies.
+        objectDirectory (str): Where the compressed sections are stored.
+        level (int): The zstd compression level.
+        keyframeInterval (int): Deltas against one keyframe before the next backup is full again.
+        index (BackupIndex): The index of the backups in the directory.
+        lock (threading.RLock): Held while the directory is changed, by writes and by the compaction.
+        cacheSize (int): Number of decompressed sections kept in memory, 0 disables the cache.
+    """
+    def __init__(self, directory: str, level: Optional[int] = None, keyframeInterval: Optional[int] = None, cacheSize: int = 0) -> None:
+        """
+        Initialize the BackupStore.
+
+        Args:
+            directory (str): The backup directory, see config.backupDirectory.
+            level (Optional[int]): The zstd compression level, defaults to config.backupCompressionLevel.
+            keyframeInterval (Optional[int]): Deltas per keyframe, defaults to config.backupKeyframeInterval.
+                0 writes every backup in full.
+            cacheSize (int): Decompressed sections to keep, for reading many backups of the same keyframe.
+                Single-threaded use only.
+        """
+        self.directory: str = directory
+        self.objectDirectory: str = os.path.join(directory, OBJECT_DIRECTORY)
+        self.level: int = config.backupCompressionLevel if level is None else level
+        self.keyframeInterval: int = config.backupKeyframeInterval if keyframeInterval is None else keyframeInterval
+        self.index: BackupIndex = BackupIndex(directory)
+        self.lock = threading.RLock()
+        self.cacheSize: int = cacheSize
+        self.__cache: 'OrderedDict[str, str]' = OrderedDict()
+        self.__compressor = zstandard.ZstdCompressor(level=self.level)
+        self.__decompressor = zstandard.ZstdDecompressor()
+
+    def __fh_path(self, filename: str) -> str:
+        return filename if os.path.isabs(filename) or os.path.dirname(filename) else os.path.join(self.directory, filename)
+
+    def __fh_objectPath(self, digest: str) -> str:
+        # Objects are spread over 256 subdirectories, no directory grows too large to list.
+        return os.path.join(self.objectDirectory, digest[:2], f'{digest}.zst')
+
+    def __fh_storeObject(self, text: str, digest: Optional[str] = None) -> Tuple[str, bool]:
+        # Returns the digest and whether the object was new.
+        content = text.encode('utf-8')
+        digest = hashlib.sha256(content).hexdigest() if digest is None else digest
+        path = self.__fh_objectPath(digest)
+        if os.path.exists(path):
+            return digest, False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fh_writeAtomic(path, self.__compressor.compress(content))
+        return digest, True
+
+    def __fh_readObject(self, digest: str) -> str:
+        text = self.__cache.get(digest)
+        if text is not None:
+            self.__cache.move_to_end(digest)
+            return text
+        with open(self.__fh_objectPath(digest), 'rb') as file:
+            content = self.__decompressor.decompress(file.read())
+        if hashlib.sha256(content).hexdigest() != digest:
+            raise ValueError(f'Backup object {digest} is corrupted.')
+        text = content.decode('utf-8')
+        if self.cacheSize:
+            self.__cache[digest] = text
+            if len(self.__cache) > self.cacheSize:
+                self.__cache.popitem(last=False)
+        return text
+
+    def f_readObject(self, digest: str) -> str:
+        """
+        Read a stored section or patch.
+
+        Args:
+            digest (str): Its SHA-256, as listed in a manifest.
+
+        Returns:
+            str: The text.
+
+        Raises:
+            ValueError: If it does not match its hash.
+            FileNotFoundError: If it is missing.
+        """
+        return self.__fh_readObject(digest)
+
+    def __fh_keyframeMembers(self, manifest: Dict[str, Any]) -> List[Tuple[str, str]]:
+        return [(key, self.__fh_readObject(digest)) for key, digest in manifest['sections']]
+
+    def __fh_delta(self, filename: str, data: Dict[str, Any], members: List[Tuple[str, str]],
+                   digests: List[str], text: str, indent: Optional[int], keyframe: Optional[str]) -> Optional[Tuple[str, str]]:
+        # The keyframe and the patch text of a delta backup, None if the backup has to be full.
+        if keyframe is None:
+            values = fh_parseBackupName(filename)
+            if values is None or values[3] or self.keyframeInterval <= 0:
+                return None
+            trainerId, slot, dataType = values[:3]
+            found = self.index.f_keyframe(trainerId, dataType, slot)
+            if found is None or found[1] >= self.keyframeInterval:
+                return None
+            keyframe = found[0]
+        if keyframe == filename:
+            return None
+        try:
+            manifest = self.f_readManifest(keyframe)
+        except (OSError, ValueError):
+            return None
+        if 'sections' not in manifest or manifest['indent'] != indent:
+            return None
+
+        # Sections with the same digest are equal, only the others are read from the keyframe and compared.
+        newDigests = {key: digest for (key, _), digest in zip(members, digests)}
+        keyframeDigests = dict(manifest['sections'])
+        changed = [key for key, _ in members if keyframeDigests.get(key) != newDigests[key]]
+        newTexts = dict(members)
+        try:
+            keyframeMembers = [(key, newTexts[key] if digest == newDigests.get(key) else self.__fh_readObject(digest))
+                               for key, digest in keyframeDigests.items()]
+        except (OSError, ValueError):
+            return None
+        keyframeTexts = dict(keyframeMembers)
+        parsed = {key: fh_parseSection(key, keyframeTexts[key]) for key in changed if key in keyframeTexts}
+        patch = fh_diff(parsed, data, sections=changed)
+        patch.extend({'op': 'remove', 'path': f'/{fh_escapePointer(key)}'} for key in keyframeDigests if key not in newDigests)
+        patchText = fh_dumps(patch, compact=True)
+        if len(patchText) > len(text) * DELTA_MAX_RATIO:
+            return None
+
+        # A patch does not carry the order of keys, the delta is only kept if it rebuilds the backup exactly.
+        if fh_joinSections(fh_patchSections(keyframeMembers, patch, indent, parsed), indent) != text:
+            return None
+        return keyframe, patchText
+
+    def f_write(self, name: str, data: Dict[str, Any], indent: Optional[int] = 4,
+                full: bool = False, keyframe: Optional[str] = None) -> str:
+        """
+        Store a backup, as a delta against the keyframe of its series if possible. Only sections and
+        patches that are not stored yet are compressed and written.
+
+        A backup of the same name is replaced. If other backups are stored against it, they are
+        rebased first.
+
+        Args:
+            name (str): Name of the backup without extension, e.g. 'backup_gameData(2450)_27.06.2024_06.09.27'.
+            data (Dict[str, Any]): The trainer or slot data.
+            indent (Optional[int]): Layout of the reassembled file, None for compact.
+            full (bool): Store the backup in full, it becomes a keyframe.
+            keyframe (Optional[str]): Store the delta against this full backup instead of the newest one
+                of the series, regardless of the keyframe interval.
+
+        Returns:
+            str: The file name of the manifest.
+        """
+        with self.lock:
+            return self.__fh_write(name, data, indent, full, keyframe)
+
+    def __fh_write(self, name: str, data: Dict[str, Any], indent: Optional[int], full: bool, keyframe: Optional[str]) -> str:
+        self.index.f_refresh()
+        filename = name + MANIFEST_SUFFIX
+        if self.index.f_dependents(filename):
+            self.f_rebase(filename)
+        members = fh_splitSections(data, indent)
+        digests = [hashlib.sha256(member.encode('utf-8')).hexdigest() for _, member in members]
+        text = fh_joinSections([member for _, member in members], indent)
+        content = text.encode('utf-8')
+        manifest = {'format': MANIFEST_FORMAT, 'indent': indent, 'size': len(content),
+                    'sha256': hashlib.sha256(content).hexdigest()}
+
+        delta = None if full else self.__fh_delta(filename, data, members, digests, text, indent, keyframe)
+        if delta is not None:
+            manifest['keyframe'], manifest['delta'] = delta[0], self.__fh_storeObject(delta[1])[0]
+        else:
+            manifest['sections'] = [(key, self.__fh_storeObject(member, digest)[0]) for (key, member), digest in zip(members, digests)]
+        fh_writeAtomic(os.path.join(self.directory, filename), fh_dumps(manifest, compact=True))
+        self.index.f_add(filename, manifest['size'], manifest['sha256'], manifest.get('keyframe'))
+        return filename
+
+    def f_readManifest(self, filename: str) -> Dict[str, Any]:
+        """
+        Read the manifest of a backup.
+
+        Args:
+            filename (str): The manifest, a file name in the backup directory or a path.
+
+        Returns:
+            Dict[str, Any]: The manifest, see the module docstring.
+        """
+        with open(self.__fh_path(filename), 'rb') as file:
+            return fh_loads(file.read())
+
+    def f_read(self, filename: str) -> str:
+        """
+        Read a backup as text.
+
+        Args:
+            filename (str): A manifest or a full copy, a file name in the backup directory or a path.
+
+        Returns:
+            str: The text of the backup, identical to the full copy it replaces.
+
+        Raises:
+            ValueError: If a stored section or the reassembled backup does not match its hash.
+            FileNotFoundError: If the backup or one of its sections is missing.
+        """
+        if not filename.endswith(MANIFEST_SUFFIX):
+            with open(self.__fh_path(filename), 'r', encoding='utf-8') as file:
+                return file.read()
+        manifest, members = self.f_readSections(filename)
+        text = fh_joinSections(members, manifest['indent'])
+        if hashlib.sha256(text.encode('utf-8')).hexdigest() != manifest['sha256']:
+            raise ValueError(f'Backup {os.path.basename(filename)} does not match its checksum.')
+        return text
+
+    def f_readSections(self, filename: str) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Read the manifest of a backup and its sections, delta backups are applied to their keyframe.
+        The checksum of the whole backup is not checked, see f_read().
+
+        Args:
+            filename (str): A manifest, a file name in the backup directory or a path.
+
+        Returns:
+            Tuple[Dict[str, Any], List[str]]: The manifest and the sections as they appear in the backup,
+                joined by fh_joinSections().
+
+        Raises:
+            ValueError: If a stored section does not match its hash or the keyframe is not a full backup.
+            FileNotFoundError: If the manifest, its keyframe or one of the sections is missing.
+        """
+        manifest = self.f_readManifest(filename)
+        if 'delta' in manifest:
+            keyframe = self.f_readManifest(manifest['keyframe'])
+            if 'sections' not in keyframe:
+                raise ValueError(f'Keyframe {manifest["keyframe"]} of {os.path.basename(filename)} is not a full backup.')
+            patch = fh_loads(self.__fh_readObject(manifest['delta']))
+            return manifest, fh_patchSections(self.__fh_keyframeMembers(keyframe), patch, manifest['indent'])
+        return manifest, [member for _, member in self.__fh_keyframeMembers(manifest)]
+
+    def f_load(self, filename: str) -> Dict[str, Any]:
+        """
+        Read and parse a backup.
+
+        Args:
+            filename (str): A manifest or a full copy, a file name in the backup directory or a path.
+
+        Returns:
+            Dict[str, Any]: The backed up data.
+        """
+        return fh_loads(self.f_read(filename))
+
+    def f_migrate(self, filenames: Optional[List[str]] = None) -> Tuple[List[str], List[str]]:
+        """
+        Replace full copies by manifests. A copy is only removed after its manifest was read back and
+        matched the copy character for character; copies in another layout are kept.
+
+        Args:
+            filenames (Optional[List[str]]): Full copies in the backup directory, None migrates all of them.
+
+        Returns:
+            Tuple[List[str], List[str]]: The migrated copies and the copies that were kept.
+        """
+        if filenames is None:
+            filenames = sorted(f for f in os.listdir(self.directory)
+                               if f.endswith('.json') and not f.endswith(MANIFEST_SUFFIX) and f.startswith(('backup_', 'base_')))
+        migrated, kept = [], []
+        for filename in filenames:
+            if self.__fh_migrate(filename):
+                migrated.append(filename)
+            else:
+                kept.append(filename)
+        return migrated, kept
+
+    def __fh_migrate(self, filename: str) -> bool:
+        with self.lock:
+            self.index.f_refresh()
+            try:
+                text = self.f_read(filename)
+                manifest = self.f_write(filename[:-len('.json')], fh_loads(text))
+            except (OSError, ValueError):
+                return False
+            if self.f_read(manifest) != text:
+                os.remove(os.path.join(self.directory, manifest))
+                self.index.f_remove([manifest])
+                return False
+            os.remove(os.path.join(self.directory, filename))
+            self.index.f_remove([filename])
+            return True
+
+    def f_delete(self, filename: str) -> None:
+        """
+        Remove a backup. Its sections stay until f_collectGarbage().
+
+        Args:
+            filename (str): The manifest or full copy in the backup directory.
+
+        Raises:
+            ValueError: If other backups are stored against it, rebase them first.
+        """
+        with self.lock:
+            self.index.f_refresh()
+            if self.index.f_dependents(filename):
+                raise ValueError(f'Backups are stored against {filename}, rebase them first.')
+            try:
+                os.remove(os.path.join(self.directory, filename))
+            except FileNotFoundError:
+                pass
+            self.index.f_remove([filename])
+
+    def f_rebase(self, keyframe: str) -> List[str]:
+        """
+        Rewrite the backups stored against a keyframe so it can be deleted or replaced. The oldest of
+        them becomes the new keyframe, the others are stored against it.
+
+        Args:
+            keyframe (str): The keyframe manifest.
+
+        Returns:
+            List[str]: The rewritten backups.
+        """
+        with self.lock:
+            dependents = [record.filename for record in self.index.f_dependents(keyframe)]
+            # Everything is read before the first backup is rewritten, they all still need the old keyframe.
+            contents = [(filename, self.f_readManifest(filename)['indent'], self.f_load(filename)) for filename in dependents]
+            newKeyframe = None
+            for filename, indent, data in contents:
+                newKeyframe = self.__fh_write(filename[:-len(MANIFEST_SUFFIX)], data, indent, newKeyframe is None, newKeyframe)
+            return dependents
+
+    def f_collectGarbage(self) -> Tuple[int, int]:
+        """
+        Remove the stored sections and patches no manifest refers to anymore.
+
+        Returns:
+            Tuple[int, int]: The number of removed objects and the bytes freed.
+
+        Raises:
+            ValueError: If a manifest cannot be read, nothing is removed then.
+        """
+        with self.lock:
+            referenced: Set[str] = set()
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and entry.name.endswith(MANIFEST_SUFFIX):
+                    try:
+                        manifest = self.f_readManifest(entry.path)
+                    except (OSError, ValueError) as e:
+                        raise ValueError(f'Manifest {entry.name} cannot be read, no sections are removed: {e}') from e
+                    referenced.update(digest for _, digest in manifest.get('sections', ()))
+                    if 'delta' in manifest:
+                        referenced.add(manifest['delta'])
+            removed = freed = 0
+            for root, _, files in os.walk(self.objectDirectory):
+                for name in files:
+                    if name.endswith('.zst') and name[:-len('.zst')] not in referenced:
+                        path = os.path.join(root, name)
+                        freed += os.path.getsize(path)
+                        os.remove(path)
+                        removed += 1
+            return removed, freed
+
+    def f_recompress(self, level: int, since: float = 0.0, stop: Optional[threading.Event] = None) -> Tuple[int, int]:
+        """
+        Compress stored objects again with a higher level. An object is only replaced if it got smaller;
+        it keeps its modification time, so the next pass can skip it.
+
+        Readers see either the old or the new file, both hold the same content, so this runs without
+        the lock.
+
+        Args:
+            level (int): The zstd compression level.
+            since (float): Only objects modified at or after this time, seconds since the epoch.
+            stop (Optional[threading.Event]): Returns early once set.
+
+        Returns:
+            Tuple[int, int]: The number of replaced objects and the bytes saved.
+        """
+        compressor = zstandard.ZstdCompressor(level=level)
+        replaced = saved = 0
+        for root, _, files in os.walk(self.objectDirectory):
+            for name in files:
+                if stop is not None and stop.is_set():
+                    return replaced, saved
+                path = os.path.join(root, name)
+                if not name.endswith('.zst'):
+                    continue
+                try:
+                    stat = os.stat(path)
+                    if stat.st_mtime < since:
+                        continue
+                    with open(path, 'rb') as file:
+                        compressed = file.read()
+                    recompressed = compressor.compress(self.__decompressor.decompress(compressed))
+                    if len(recompressed) >= len(compressed):
+                        continue
+                    fh_writeAtomic(path, recompressed)
+                    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                except (OSError, zstandard.ZstdError):
+                    # Removed by the garbage collection or written concurrently, the next pass retries.
+                    continue
+                replaced += 1
+                saved += len(compressed) - len(recompressed)
+        return replaced, saved
+
+    def f_diskUsage(self) -> Dict[str, int]:
+        """
+        Space taken by the backups.
+
+        Returns:
+            Dict[str, int]: Bytes of 'manifests', 'objects' and 'fullCopies', and the counts
+            'manifestCount', 'objectCount' and 'fullCopyCount'.
+        """
+        usage = dict.fromkeys(('manifests', 'objects', 'fullCopies', 'manifestCount', 'objectCount', 'fullCopyCount'), 0)
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or not entry.name.endswith('.json'):
+                continue
+            isManifest = entry.name.endswith(MANIFEST_SUFFIX)
+            usage['manifests' if isManifest else 'fullCopies'] += entry.stat().st_size
+            usage['manifestCount' if isManifest else 'fullCopyCount'] += 1
+        for root, _, files in os.walk(self.objectDirectory):
+            for name in files:
+                if name.endswith('.zst'):
+                    usage['objects'] += os.path.getsize(os.path.join(root, name))
+                    usage['objectCount'] += 1
+        return usage
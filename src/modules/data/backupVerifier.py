@@ -0,0 +1,444 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides the integrity check of the backup directory, `verify-backups`.
+
+Every backup in config.backupDirectory is read completely: manifests are reassembled from their
+sections, delta backups applied to their keyframe, and the SHA-256 of the result is compared with
+the manifest. Full copies of older versions are parsed as they are. Each backup is then validated
+against the save schema of its kind and its size and checksum are compared with the backup index.
+
+The backups are checked by a process pool. The parent only lists the file names, sorted so the
+backups of one series and keyframe arrive at the same worker together, and streams them to the
+workers; the results come back as soon as they are ready and are reported while the check runs.
+A worker keeps the sections it read, parsed and validated by their SHA-256: most sections are
+shared by many backups and are decompressed, parsed and validated once per worker instead of once
+per backup. A delta backup usually changes a few entries of a few sections; only those entries are
+copied from the parsed keyframe, patched and validated, the rest keeps the issues of the keyframe.
+The patched sections are serialized again, the checksum always covers the whole backup.
+
+Problems found:
+- corrupt: the backup, a section or its patch cannot be read or parsed, e.g. truncated, or does not
+  match its checksum
+- missing: a section or the keyframe of a delta backup does not exist
+- invalid: the content does not match the save schema
+- index: the backup is not indexed, or the index holds another size or checksum
+- orphaned: an index entry without a file, or a stored section no manifest refers to
+
+With repair the index is rebuilt from the directory and the orphaned sections are removed. Corrupt
+backups are only reported, never removed.
+
+Modules:
+- copy: Copies the entries a delta backup changes.
+- hashlib: Checksums backups and sections.
+- multiprocessing: Spreads the checks over a process pool of spawned workers.
+- os: Lists the backup directory and the stored sections.
+- time: Measures the check and paces the progress output.
+- collections.OrderedDict: Keeps the parsed sections of the recent keyframes.
+- typing: Provides type hints and the NamedTuples of the results.
+- zstandard: Recognizes damaged sections.
+- modules.config: Provides the backup directory.
+- modules.data.backupIndex: Tells the kind of a backup from its name.
+- modules.data.backupStore: Reads and reassembles the backups.
+- modules.data.saveDiff: Applies the patches of delta backups.
+- modules.data.saveSchema: Validates the content of the backups.
+- utilities: Parses the backups and prints the report.
+
+Workflow:
+1. f_verifyBackups() lists the backup directory and the raw entries of the index.
+2. Workers run fh_checkBackup() for every file and return its checksum and the sections it refers to.
+3. The parent compares the checksums with the index and prints problems and progress as they come in.
+4. Index entries and sections nothing refers to are reported as orphaned.
+5. With repair=True the index is rebuilt and the orphaned sections are removed.
+
+Usage Example:
+    >>> f_verifyBackups(BackupStore(config.backupDirectory))
+    12034 backups checked in 4.1 s, 2 problems
+    VerificationReport(checked=12034, problems=[...], seconds=4.1)
+
+    # From the command line, without logging in:
+    python main.py --verify-backups [--repair]
+"""
+
+import copy
+# Copies the entries a delta backup changes.
+
+import hashlib
+# Checksums backups and sections.
+
+import multiprocessing
+# Spreads the checks over a process pool.
+
+import os
+# Lists the backup directory and the stored sections.
+
+import time
+# Measures the check and paces the progress output.
+
+from collections import OrderedDict
+# Keeps the parsed sections of the recent keyframes.
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+# Provides type hints and the NamedTuples of the results.
+
+import zstandard
+# Recognizes damaged sections.
+
+from modules import config
+# Provides the backup directory.
+
+from modules.data.backupIndex import fh_parseBackupName
+# Tells the kind of a backup from its name.
+
+from modules.data.backupStore import BackupStore, MANIFEST_SUFFIX, fh_joinSections, fh_splitSections
+# Reads and reassembles the backups.
+
+from modules.data.saveDiff import fh_applyPatch, fh_splitPointer
+# Applies the patches of delta backups.
+
+from modules.data.saveSchema import ValidationIssue, fh_getSaveSchema
+# Validates the content of the backups.
+
+from utilities import Color, JSONDecodeError, cFormatter, fh_loads
+# Parses the backups and prints the report.
+
+CORRUPT: str = 'corrupt'
+MISSING: str = 'missing'
+INVALID: str = 'invalid'
+INDEX: str = 'index'
+ORPHANED: str = 'orphaned'
+
+# Backups per task of a worker, consecutive names share their keyframe and most sections.
+CHUNK_SIZE: int = 32
+# Decompressed and parsed sections a worker keeps, a few keyframes of trainer.json and the slots.
+SECTION_CACHE_SIZE: int = 512
+PARSED_CACHE_SIZE: int = 128
+# Schema issues listed per backup, the rest is counted.
+ISSUE_LIMIT: int = 5
+SCHEMA_FILES: Dict[str, str] = {'gameData': 'trainer.json', 'slotData': 'slot_1.json'}
+
+class BackupCheck(NamedTuple):
+    """
+    The result of checking one backup file.
+
+    Attributes:
+        filename (str): The manifest or full copy.
+        problem (Optional[str]): CORRUPT, MISSING or INVALID, None if the backup is fine.
+        message (str): What is wrong.
+        size (Optional[int]): Size of the backup as the index records it, None if it could not be read.
+        sha256 (Optional[str]): Checksum of the backup as the index records it.
+        sections (Tuple[str, ...]): The stored sections and patches the manifest refers to.
+    """
+    filename: str
+    problem: Optional[str]
+    message: str
+    size: Optional[int]
+    sha256: Optional[str]
+    sections: Tuple[str, ...]
+
+class BackupProblem(NamedTuple):
+    """
+    A problem found by f_verifyBackups().
+
+    Attributes:
+        kind (str): CORRUPT, MISSING, INVALID, INDEX or ORPHANED.
+        name (str): The backup file, index entry or stored section.
+        message (str): What is wrong.
+    """
+    kind: str
+    name: str
+    message: str
+
+class VerificationReport(NamedTuple):
+    """
+    The result of f_verifyBackups().
+
+    Attributes:
+        checked (int): Backup files checked.
+        problems (List[BackupProblem]): Everything found, empty if the directory is fine.
+        repaired (bool): Whether the index was rebuilt and the orphaned sections removed.
+        seconds (float): Duration of the check.
+    """
+    checked: int
+    problems: List[BackupProblem]
+    repaired: bool
+    seconds: float
+
+def fh_entryOf(path: str) -> Optional[str]:
+    # The entry of a top level section a JSON Pointer points into, e.g. '25' for '/dexData/25/ivs'.
+    segments = fh_splitPointer(path)
+    return segments[1] if len(segments) > 1 else None
+
+class _Checker:
+    # The state of one worker: a store with a section cache, the parsed sections and their schema issues.
+    def __init__(self, directory: str) -> None:
+        self.store = BackupStore(directory, cacheSize=SECTION_CACHE_SIZE)
+        self.parsed: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.issues: Dict[Tuple[Optional[str], str], List[ValidationIssue]] = {}
+
+    def f_parse(self, digest: str) -> Dict[str, Any]:
+        # A stored section as {key: value}, parsed once while it is in use. Never changed in place.
+        section = self.parsed.get(digest)
+        if section is not None:
+            self.parsed.move_to_end(digest)
+            return section
+        section = self.parsed[digest] = fh_loads('{' + self.store.f_readObject(digest) + '}')
+        if len(self.parsed) > PARSED_CACHE_SIZE:
+            self.parsed.popitem(last=False)
+        return section
+
+    def f_sectionIssues(self, schemaFile: Optional[str], digest: str) -> List[ValidationIssue]:
+        # Sections are shared by many backups, each is validated once.
+        key = (schemaFile, digest)
+        issues = self.issues.get(key)
+        if issues is None:
+            schema = fh_getSaveSchema(schemaFile) if schemaFile else None
+            section = self.f_parse(digest)
+            issues = self.issues[key] = schema.f_validate(section, section) if schema else []
+        return issues
+
+    def f_readFull(self, manifest: Dict[str, Any], schemaFile: Optional[str]) -> Tuple[List[str], List[str], List[ValidationIssue]]:
+        # Keys, texts and issues of the sections.
+        members, issues = [], []
+        for _, digest in manifest['sections']:
+            members.append(self.store.f_readObject(digest))
+            issues.extend(self.f_sectionIssues(schemaFile, digest))
+        return [key for key, _ in manifest['sections']], members, issues
+
+    def f_readDelta(self, filename: str, manifest: Dict[str, Any], schemaFile: Optional[str]) -> Tuple[List[str], List[str], List[ValidationIssue]]:
+        # Keys, texts and issues of the sections of a delta backup. Usually the patch changes a few
+        # entries of a few object sections. Those sections are copied shallowly from the parsed
+        # keyframe, only the changed entries are copied deeply, patched and validated; the other
+        # entries keep the issues of the keyframe. Other changed sections are parsed and validated whole.
+        keyframe = self.store.f_readManifest(manifest['keyframe'])
+        if 'sections' not in keyframe:
+            raise ValueError(f'Keyframe {manifest["keyframe"]} is not a full backup.')
+        patch = fh_loads(self.store.f_readObject(manifest['delta']))
+        digests = dict(keyframe['sections'])
+        schema = fh_getSaveSchema(schemaFile) if schemaFile else None
+        operations: Dict[str, List[Tuple[List[str], Dict[str, Any]]]] = {}
+        for operation in patch:
+            segments = fh_splitPointer(operation['path'])
+            if not segments or segments[0] not in digests:
+                # The whole document replaced or sections added: reassembled as the store does.
+                _, members = self.store.f_readSections(filename)
+                sections = [fh_loads('{' + member + '}') for member in members]
+                issues = [issue for section in sections for issue in (schema.f_validate(section, section) if schema else [])]
+                return [next(iter(section)) for section in sections], members, issues
+            operations.setdefault(segments[0], []).append((segments, operation))
+
+        keys, members, issues = [], [], []
+        for key, digest in keyframe['sections']:
+            changes = operations.get(key)
+            if changes is None:
+                keys.append(key)
+                members.append(self.store.f_readObject(digest))
+                issues.extend(self.f_sectionIssues(schemaFile, digest))
+                continue
+            patchOfKey = [operation for _, operation in changes]
+            value = self.f_parse(digest)[key]
+            if type(value) is dict and all(len(segments) > 1 for segments, _ in changes):
+                value = dict(value)
+                touched = {segments[1] for segments, _ in changes}
+                for entry in touched:
+                    if entry in value:
+                        value[entry] = copy.deepcopy(value[entry])
+                fh_applyPatch({key: value}, patchOfKey)
+                issues.extend(issue for issue in self.f_sectionIssues(schemaFile, digest) if fh_entryOf(issue.path) not in touched)
+                if schema:
+                    issues.extend(schema.f_validate({key: {entry: value[entry] for entry in touched if entry in value}}, [key]))
+            else:
+                section = fh_applyPatch(fh_loads('{' + self.store.f_readObject(digest) + '}'), patchOfKey)
+                if key not in section:
+                    continue
+                value = section[key]
+                if schema:
+                    issues.extend(schema.f_validate(section, [key]))
+            keys.append(key)
+            members.append(fh_splitSections({key: value}, manifest['indent'])[0][1])
+        return keys, members, issues
+
+    def f_check(self, filename: str) -> BackupCheck:
+        values = fh_parseBackupName(filename)
+        schemaFile = SCHEMA_FILES.get(values[2]) if values else None
+        schema = fh_getSaveSchema(schemaFile) if schemaFile else None
+        referenced: Tuple[str, ...] = ()
+        try:
+            if filename.endswith(MANIFEST_SUFFIX):
+                # Read first, the sections of a damaged backup are not orphaned.
+                manifest = self.store.f_readManifest(filename)
+                referenced = tuple(digest for _, digest in manifest.get('sections', ())) + tuple(filter(None, [manifest.get('delta')]))
+                if 'delta' in manifest:
+                    keys, members, issues = self.f_readDelta(filename, manifest, schemaFile)
+                else:
+                    keys, members, issues = self.f_readFull(manifest, schemaFile)
+                text = fh_joinSections(members, manifest['indent'])
+                size, sha256 = manifest['size'], manifest['sha256']
+                if hashlib.sha256(text.encode('utf-8')).hexdigest() != sha256:
+                    return BackupCheck(filename, CORRUPT, 'does not match its checksum', size, sha256, referenced)
+                if schema:
+                    # Sections the backup lacks, the schema decides whether they are required.
+                    issues.extend(schema.f_validate({}, [key for key in schema.sections if key not in keys]))
+            else:
+                with open(os.path.join(self.store.directory, filename), 'r', encoding='utf-8') as file:
+                    content = file.read()
+                encoded = content.encode('utf-8')
+                size, sha256 = len(encoded), hashlib.sha256(encoded).hexdigest()
+                data = fh_loads(content)
+                issues = schema.f_validate(data) if schema else []
+        except FileNotFoundError as e:
+            return BackupCheck(filename, MISSING, f'{os.path.basename(e.filename or "")} does not exist', None, None, referenced)
+        except JSONDecodeError as e:
+            return BackupCheck(filename, CORRUPT, f'cannot be parsed, truncated? {e}', None, None, referenced)
+        except (OSError, ValueError, KeyError, TypeError, IndexError, UnicodeDecodeError, zstandard.ZstdError) as e:
+            return BackupCheck(filename, CORRUPT, f'cannot be read: {e}', None, None, referenced)
+        if issues:
+            more = f' (and {len(issues) - ISSUE_LIMIT} more)' if len(issues) > ISSUE_LIMIT else ''
+            return BackupCheck(filename, INVALID, '; '.join(map(str, issues[:ISSUE_LIMIT])) + more, size, sha256, referenced)
+        return BackupCheck(filename, None, '', size, sha256, referenced)
+
+_checker: Optional[_Checker] = None
+
+def fh_initializeWorker(directory: str) -> None:
+    # Runs once in every worker process.
+    global _checker
+    _checker = _Checker(directory)
+
+def fh_checkBackup(filename: str) -> BackupCheck:
+    """
+    Check one backup file in a worker, see fh_initializeWorker().
+
+    Args:
+        filename (str): A manifest or full copy in the backup directory.
+
+    Returns:
+        BackupCheck: The result.
+    """
+    return _checker.f_check(filename)
+
+def fh_listBackups(directory: str) -> List[str]:
+    """
+    List the backup files of a directory, grouped by series. Only the names are read.
+
+    Args:
+        directory (str): The backup directory.
+
+    Returns:
+        List[str]: The manifests and full copies.
+    """
+    with os.scandir(directory) as entries:
+        names = [entry.name for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+    # Names start with the series, sorting keeps the backups of one keyframe in the same chunks.
+    return sorted(names)
+
+def fh_listObjects(objectDirectory: str) -> Iterator[str]:
+    # The digests of the stored sections and patches.
+    for root, _, files in os.walk(objectDirectory):
+        for name in files:
+            if name.endswith('.zst'):
+                yield name[:-len('.zst')]
+
+def f_verifyBackups(store: Optional[BackupStore] = None, processes: Optional[int] = None, repair: bool = False,
+                    quiet: bool = False) -> VerificationReport:
+    """
+    Check every backup in the directory, printing problems and progress while the check runs. The
+    lock of the store is held, backups written meanwhile wait in the queue of the BackupWriter.
+
+    Args:
+        store (Optional[BackupStore]): The store to check, defaults to the one of config.backupDirectory.
+        processes (Optional[int]): Worker processes, defaults to the number of CPUs. 1 checks in this process.
+        repair (bool): Rebuild the index and remove orphaned sections afterwards.
+        quiet (bool): Print nothing, only return the report.
+
+    Returns:
+        VerificationReport: What was found.
+
+    Usage Example:
+        >>> report = f_verifyBackups(repair=True)
+        >>> [problem for problem in report.problems if problem.kind == CORRUPT]
+        [BackupProblem(kind='corrupt', name='backup_gameData(2450)_...', message='cannot be parsed, truncated? ...')]
+    """
+    store = BackupStore(config.backupDirectory) if store is None else store
+    with store.lock:
+        return __fh_verify(store, processes or os.cpu_count() or 1, repair, quiet)
+
+def __fh_verify(store: BackupStore, processes: int, repair: bool, quiet: bool) -> VerificationReport:
+    directory = store.directory
+    start = time.perf_counter()
+    entries = store.index.f_entries()
+    filenames = fh_listBackups(directory)
+    problems: List[BackupProblem] = []
+    referenced: Set[str] = set()
+    lastProgress = 0.0
+    progressShown = False
+
+    def fh_report(problem: BackupProblem) -> None:
+        nonlocal progressShown
+        problems.append(problem)
+        if not quiet:
+            if progressShown:
+                # The progress line is repeated below the problem.
+                print()
+                progressShown = False
+            cFormatter.print(Color.WARNING, f'{problem.kind:<9} {problem.name}: {problem.message}')
+
+    if processes > 1 and len(filenames) > CHUNK_SIZE:
+        # Spawned, not forked: the store lock is held and the writer and compactor threads are alive,
+        # a forked worker would inherit their locks in whatever state they are.
+        pool = multiprocessing.get_context('spawn').Pool(min(processes, -(-len(filenames) // CHUNK_SIZE)), fh_initializeWorker, (directory,))
+        results = pool.imap_unordered(fh_checkBackup, filenames, CHUNK_SIZE)
+    else:
+        pool = None
+        fh_initializeWorker(directory)
+        results = map(fh_checkBackup, filenames)
+    try:
+        for number, check in enumerate(results, 1):
+            referenced.update(check.sections)
+            if check.problem:
+                fh_report(BackupProblem(check.problem, check.filename, check.message))
+            if check.size is not None:
+                entry = entries.get(check.filename)
+                if entry is None:
+                    if fh_parseBackupName(check.filename):
+                        fh_report(BackupProblem(INDEX, check.filename, 'is not indexed'))
+                elif (entry.size, entry.sha256) != (check.size, check.sha256):
+                    fh_report(BackupProblem(INDEX, check.filename, 'size or checksum differs from the index'))
+            now = time.perf_counter()
+            if not quiet and (now - lastProgress > 0.2 or number == len(filenames)):
+                lastProgress = now
+                progressShown = True
+                print(f'\r{number}/{len(filenames)} backups checked, {len(problems)} problems', end='', flush=True)
+    finally:
+        if pool is not None:
+            pool.terminate()
+    if progressShown:
+        print()
+
+    present = set(filenames)
+    for filename in sorted(set(entries) - present):
+        fh_report(BackupProblem(ORPHANED, filename, 'is indexed but the file does not exist'))
+    for digest in fh_listObjects(store.objectDirectory):
+        if digest not in referenced:
+            fh_report(BackupProblem(ORPHANED, digest, 'section is not referenced by any backup'))
+
+    if repair:
+        store.index.f_rebuild()
+        try:
+            removed, freed = store.f_collectGarbage()
+        except ValueError as e:
+            if not quiet:
+                cFormatter.print(Color.WARNING, f'Index rebuilt. {e}')
+        else:
+            if not quiet:
+                cFormatter.print(Color.GREEN, f'Index rebuilt, {removed} orphaned sections removed ({freed / 2**10:.1f} KiB).')
+
+    report = VerificationReport(len(filenames), problems, repair, time.perf_counter() - start)
+    if not quiet:
+        color = Color.GREEN if not problems else Color.WARNING
+        cFormatter.print(color, f'{report.checked} backups checked in {report.seconds:.1f} s, {len(problems)} problems')
+    return report
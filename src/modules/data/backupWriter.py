@@ -0,0 +1,192 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides the background writer of the backup store.
+
+Every login writes a backup of trainer.json and one of the slot file before the menu appears, and
+writing a backup splits, hashes, diffs and compresses the whole document. The writer moves that work
+to a thread: f_submit() only takes a snapshot of the data and puts it into a bounded queue, the
+thread stores the backups in the order they were submitted.
+
+The snapshot is the compact JSON text of the data, taken before f_submit() returns. It is immutable,
+so edits made in the menu while the backup waits in the queue never end up in it, and serializing is
+much faster than the deep copy it replaces. The thread parses it again before storing it, the stored
+backup is identical to one written directly.
+
+Backups are never dropped. When the queue is full, f_submit() waits for a free place. f_close()
+writes everything still queued; Rogue calls it from its atexit handler, which also runs when the
+tool is left with Ctrl+C.
+
+Modules:
+- logging: Records failed backups.
+- queue: Provides the bounded queue of pending backups.
+- threading: Runs the writer and guards the names of pending backups.
+- typing: Provides type hints and the NamedTuple of the queued backups.
+- modules.config: Provides the size of the queue.
+- modules.data.backupStore: Stores the backups.
+- utilities: Takes and parses the snapshots and reports written backups through the message buffer.
+
+Workflow:
+1. Rogue creates a BackupWriter for its backup store.
+2. f_createBackup() names the backup and calls f_submit(), which returns once the snapshot is queued.
+3. The thread stores each backup with BackupStore.f_write() and reports it in the message buffer.
+4. f_flush() waits until the queue is empty, e.g. before the backups are listed for a restore.
+5. f_close() writes the remaining backups and stops the thread on exit.
+
+Usage Example:
+    >>> writer = BackupWriter(BackupStore(config.backupDirectory))
+    >>> writer.f_submit('backup_gameData(2450)_27.06.2024_06.09.27', trainerData)
+    >>> writer.f_flush()
+    True
+"""
+
+import logging
+# Records failed backups.
+
+import queue
+# Provides the bounded queue of pending backups.
+
+import threading
+# Runs the writer and guards the names of pending backups.
+
+from typing import Any, Dict, List, NamedTuple, Optional
+# Provides type hints and the NamedTuple of the queued backups.
+
+from modules import config
+# Provides the size of the queue.
+
+from modules.data.backupStore import BackupStore
+# Stores the backups.
+
+from utilities import Color, fh_appendMessageBuffer, fh_dumps, fh_loads
+# Takes and parses the snapshots and reports written backups through the message buffer.
+
+class PendingBackup(NamedTuple):
+    """
+    A backup waiting in the queue.
+
+    Attributes:
+        name (str): Name of the backup without extension, see BackupStore.f_write().
+        snapshot (str): The data as compact JSON text, taken when the backup was submitted.
+        indent (Optional[int]): Layout of the stored backup.
+    """
+    name: str
+    snapshot: str
+    indent: Optional[int]
+
+class BackupWriter:
+    """
+    Writes backups to a backup store on a background thread.
+
+    Attributes:
+        store (BackupStore): The store the backups are written to.
+        written (List[str]): Manifest file names of the backups written so far.
+        failed (List[str]): Names of the backups that could not be written.
+    """
+
+    def __init__(self, store: BackupStore, maxPending: Optional[int] = None) -> None:
+        self.store = store
+        self.written: List[str] = []
+        self.failed: List[str] = []
+        self.__queue: 'queue.Queue[Optional[PendingBackup]]' = queue.Queue(config.backupQueueSize if maxPending is None else maxPending)
+        self.__pending: Dict[str, int] = {}
+        self.__lock = threading.Lock()
+        self.__thread: Optional[threading.Thread] = None
+        self.__closed = False
+
+    def __fh_run(self) -> None:
+        while True:
+            backup = self.__queue.get()
+            try:
+                if backup is None:
+                    return
+                try:
+                    filename = self.store.f_write(backup.name, fh_loads(backup.snapshot), backup.indent)
+                except Exception as e:
+                    logging.exception(f'Could not write backup {backup.name}')
+                    self.failed.append(backup.name)
+                    fh_appendMessageBuffer(Color.CRITICAL, f'Error in function f_createBackup(): {e}')
+                else:
+                    self.written.append(filename)
+                    fh_appendMessageBuffer(Color.GREEN, f'Backup created: {filename}')
+                finally:
+                    with self.__lock:
+                        self.__pending[backup.name] -= 1
+                        if not self.__pending[backup.name]:
+                            del self.__pending[backup.name]
+            finally:
+                self.__queue.task_done()
+
+    def f_submit(self, name: str, data: Dict[str, Any], indent: Optional[int] = 4) -> None:
+        """
+        Queue a backup. Returns as soon as the snapshot is taken, unless the queue is full.
+
+        Args:
+            name (str): Name of the backup without extension, e.g. 'backup_gameData(2450)_27.06.2024_06.09.27'.
+            data (Dict[str, Any]): The trainer or slot data, it may be changed right after the call.
+            indent (Optional[int]): Layout of the stored backup, None for compact.
+
+        Raises:
+            RuntimeError: If the writer was closed.
+        """
+        backup = PendingBackup(name, fh_dumps(data, compact=True), indent)
+        with self.__lock:
+            if self.__closed:
+                raise RuntimeError('The backup writer was closed.')
+            self.__pending[name] = self.__pending.get(name, 0) + 1
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__fh_run, name='backupWriter', daemon=True)
+                self.__thread.start()
+        # Outside the lock, the thread needs it to make room in a full queue.
+        self.__queue.put(backup)
+
+    def f_isPending(self, prefix: str) -> bool:
+        """
+        Tell whether a backup whose name starts with the prefix is still queued, e.g. the base backup.
+
+        Args:
+            prefix (str): Start of the backup name, e.g. 'base_gameData(2450)_'.
+
+        Returns:
+            bool: True if such a backup was submitted but not written yet.
+        """
+        with self.__lock:
+            return any(name.startswith(prefix) for name in self.__pending)
+
+    def f_flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every submitted backup was written.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait at most, None waits until the queue is empty.
+
+        Returns:
+            bool: True if the queue is empty.
+        """
+        with self.__queue.all_tasks_done:
+            if timeout is None:
+                while self.__queue.unfinished_tasks:
+                    self.__queue.all_tasks_done.wait()
+            else:
+                self.__queue.all_tasks_done.wait_for(lambda: not self.__queue.unfinished_tasks, timeout)
+            return not self.__queue.unfinished_tasks
+
+    def f_close(self) -> List[str]:
+        """
+        Write the remaining backups and stop the thread. Later submissions raise a RuntimeError.
+
+        Returns:
+            List[str]: Names of the backups that could not be written during the whole session.
+        """
+        with self.__lock:
+            self.__closed = True
+            thread = self.__thread
+        if thread is not None and thread.is_alive():
+            self.__queue.put(None)
+            thread.join()
+        return self.failed
@@ -0,0 +1,133 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides the non-interactive bulk unlock behind Rogue.f_unlockStarters.
+
+All options are applied column-wise on a TrainerArrays view of the trainer data and all random
+counts are drawn in one batch. The columns are then written into the live entries in one pass per
+section, instead of merging dictionaries entry by entry.
+
+The result matches what f_unlockStarters always wrote:
+- dexData: random seenAttr/seenCount/caughtCount/hatchedCount between 100 and 300, caughtAttr of all
+  forms (or 255/253), perfect IVs and all natures if chosen, otherwise IVs and natureAttr are reset.
+- starterData: random candyCount/friendship between 100 and 300, abilities and egg moves, passives
+  (never for species in the noPassive catalog), win-ribbons and the cost reduction.
+
+Modules:
+- numpy: Draws the random counts in one batch and builds the row masks.
+- dataclasses: Provides the options container.
+- typing: Provides type hints for better code clarity and type checking.
+- modules.data.trainerArrays: Provides the columnar view of dexData and starterData.
+- modules.data.dataParser: Provides the caughtAttr mapping and the noPassive and nature catalogs.
+
+Usage Example:
+    >>> from modules.data.bulkUnlock import UnlockOptions, f_bulkUnlockStarters
+    >>> f_bulkUnlockStarters(trainerData, UnlockOptions(allForms=True, shiny=True, perfectIVs=True))
+"""
+
+from dataclasses import dataclass
+# Provides the options container.
+
+from typing import Any, Dict, Iterable, Optional
+# Provides type hints for better code clarity and type checking.
+
+import numpy as np
+# Draws the random counts in one batch and builds the row masks.
+
+from modules.data.trainerArrays import TrainerArrays, IV_COUNT
+# Provides the columnar view of dexData and starterData.
+
+from modules.data import dataParser
+# Provides the caughtAttr mapping and the noPassive and nature catalogs.
+
+RANDOM_COUNT_RANGE = (100, 300)
+
+@dataclass(frozen=True)
+class UnlockOptions:
+    """
+    The choices of the unlock all starters menu.
+
+    Attributes:
+        allForms (bool): Unlock all forms (Tier 3 shinies) where the species has forms.
+        shiny (bool): Tier 3 shinies instead of non-shinies for species without forms.
+        perfectIVs (bool): Set all IVs to 31, otherwise they are reset to 0.
+        allNatures (bool): Unlock all natures, otherwise natureAttr is reset to 0.
+        passive (bool): Unlock the passive ability.
+        ribbon (bool): Unlock the win-ribbon.
+        costReduction (int): Cost reduction, 0 for none.
+        allAbilities (bool): Unlock all abilities including egg moves.
+    """
+    allForms: bool = False
+    shiny: bool = False
+    perfectIVs: bool = False
+    allNatures: bool = False
+    passive: bool = False
+    ribbon: bool = False
+    costReduction: int = 0
+    allAbilities: bool = False
+
+def f_bulkUnlockStarters(trainerData: Dict[str, Any], options: UnlockOptions,
+                         rng: Optional[np.random.Generator] = None,
+                         noPassiveIDs: Optional[Iterable[str]] = None,
+                         natureUnlockValue: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Apply the unlock all starters options to every dexData and starterData entry in place.
+
+    Args:
+        trainerData (Dict[str, Any]): The parsed trainer.json, its entries are edited in place.
+        options (UnlockOptions): The chosen options.
+        rng (Optional[np.random.Generator]): Source of the random counts. Defaults to a fresh generator.
+        noPassiveIDs (Optional[Iterable[str]]): Species IDs that never get a passive. Defaults to the noPassive catalog.
+        natureUnlockValue (Optional[int]): natureAttr unlocking all natures. Defaults to UNLOCK_ALL of the natures catalog.
+
+    Returns:
+        Dict[str, Any]: trainerData.
+
+    Usage Example:
+        >>> f_bulkUnlockStarters(gameData, UnlockOptions(perfectIVs=True, passive=True), rng=np.random.default_rng(1))
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    if noPassiveIDs is None:
+        noPassiveIDs = dataParser.fh_getCatalogData('noPassive').keys()
+    if natureUnlockValue is None:
+        natureUnlockValue = dataParser.fh_getCatalogData('natures')['UNLOCK_ALL']
+
+    arrays = TrainerArrays(trainerData)
+    dex = arrays.dex
+    starters = arrays.starters
+    low, high = RANDOM_COUNT_RANGE
+
+    # dexData
+    defaultCaughtAttr = 255 if options.shiny else 253
+    if options.allForms:
+        caughtAttrBySpecies = dataParser.fh_getCaughtAttrBySpecies(includeStarter=True, onlyNormalForms=True)
+        dex.f_setColumn('caughtAttr', [caughtAttrBySpecies.get(key, defaultCaughtAttr) for key in dex.keys])
+    else:
+        dex.f_setColumn('caughtAttr', defaultCaughtAttr)
+
+    dexCounts = rng.integers(low, high, size=(4, len(dex)), endpoint=True)
+    for column, counts in zip(('seenAttr', 'seenCount', 'caughtCount', 'hatchedCount'), dexCounts):
+        dex.f_setColumn(column, counts)
+    dex.f_setColumn('ivs', np.full(IV_COUNT, 31 if options.perfectIVs else 0))
+    dex.f_setColumn('natureAttr', natureUnlockValue if options.allNatures else 0)
+
+    # starterData
+    starterCounts = rng.integers(low, high, size=(2, len(starters)), endpoint=True)
+    starters.f_setColumn('friendship', starterCounts[0])
+    starters.f_setColumn('candyCount', starterCounts[1])
+    starters.f_setColumn('abilityAttr', 7 if options.allAbilities else 1)
+    starters.f_setColumn('eggMoves', 15 if options.allAbilities else 0)
+    starters.f_setColumn('classicWinCount', 1 if options.ribbon else 0)
+    starters.f_setColumn('valueReduction', max(options.costReduction, 0))
+
+    starters.f_setColumn('passiveAttr', 0)
+    if options.passive:
+        noPassiveMask = np.isin(starters.keys, np.array(list(noPassiveIDs), dtype=str))
+        starters.f_setColumn('passiveAttr', 3, rows=~noPassiveMask)
+
+    return arrays.f_applyToTrainerData()
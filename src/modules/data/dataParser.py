@@ -7,34 +7,22 @@
 
 # Unlike the other code, reusing this in your own project is forbidden.
 
-import json
 from enum import Enum
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Any, Dict, Union
-from modules.config import dataDirectory
+from dataclasses import dataclass, asdict
+from typing import List, Optional, Any, Dict, Union, Tuple, Callable, Iterator
+from collections.abc import MutableMapping, MutableSequence
+from functools import lru_cache
+from utilities.catalogStore import fh_getCatalogStore
+from utilities.catalog import Catalog
 from colorama import Fore, Style
 
-def __createEnum(name, values):
-    return Enum(name, values)
-
 def __modifiySpeciesName(name):
-    return name.replace('_', ' ').title()
-
-with open(f'{dataDirectory}/hasForms.json') as f:
-    hasForms = json.load(f)["hasForms"]
-
-with open(f'{dataDirectory}/species.json') as f:
-    dexEnum = json.load(f)["dex"]
+    # Interned display name from the shared species index, e.g. 'mr_mime' -> 'Mr Mime'
+    return Catalog.displayName(name)
 
-with open(f'{dataDirectory}/noPassive.json') as f:
-    noPassive = json.load(f)["noPassive"]
-
-with open(f'{dataDirectory}/starter.json') as f:
-    startersList = json.load(f)["dex"]
-
-Dex = __createEnum('Dex', {name.capitalize(): id_ for name, id_ in dexEnum.items()})
-noPassiveSet = {int(id_) for id_ in noPassive.keys()}
-startersSet = {dexEnum[name] for name in startersList}
+def fh_getCatalogData(catalogName):
+    # All catalogs come from the shared catalog store, opened once and also used by EnumLoader and eggLogic.
+    return fh_getCatalogStore().f_getCatalog(catalogName)
 
 class DexAttr(Enum):
     NON_SHINY = 1
@@ -46,56 +34,242 @@ class DexAttr(Enum):
     VARIANT_3 = 64
     DEFAULT_FORM = 128
 
-@dataclass
-class Modifier:
-    args: List[Optional[Union[int, bool]]]
+# The save data classes below are views, not copies. A view holds a reference to the parsed JSON
+# object and every attribute reads from and writes to that object, so wrapping a slot or trainer.json
+# costs nothing and toDict() returns the very same dictionary, ready to be saved.
+# Nested objects are wrapped on access; lists and dictionaries of objects are wrapped by
+# ListView/DictView, which create item views only for the items actually accessed.
+_MISSING = object()
+
+def fh_unwrapView(value: Any) -> Any:
+    # Views stored into a view store their underlying JSON data, never the view itself.
+    if isinstance(value, (DataView, ListView, DictView)):
+        return value.toDict()
+    if isinstance(value, list) and any(isinstance(item, DataView) for item in value):
+        return [fh_unwrapView(item) for item in value]
+    return value
+
+class ViewField:
+    # Maps an attribute of a DataView to a key of the underlying dictionary. Missing keys read as the
+    # default without being inserted; a value from factory is inserted on first access, so edits of
+    # the returned list or dict are kept. `view` wraps nested objects, `container` (list or dict)
+    # marks a collection of them.
+    __slots__ = ('key', 'default', 'factory', 'view', 'container', 'name')
+
+    def __init__(self, default: Any = None, factory: Optional[Callable[[], Any]] = None, view: Optional[type] = None,
+                 container: Optional[type] = None, key: Optional[str] = None) -> None:
+        self.key = key
+        self.default = default
+        self.factory = factory
+        self.view = view
+        self.container = container
+        self.name = key
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        if self.key is None:
+            self.key = name
+
+    def __get__(self, instance: Optional['DataView'], owner: type) -> Any:
+        if instance is None:
+            return self
+        value = instance._data.get(self.key, _MISSING)
+        if value is _MISSING:
+            if self.factory is None:
+                return self.default
+            value = instance._data.setdefault(self.key, self.factory())
+        if self.view is None or value is None:
+            return value
+        if self.container is list:
+            return ListView(value, self.view)
+        if self.container is dict:
+            return DictView(value, self.view)
+        return self.view(value)
+
+    def __set__(self, instance: 'DataView', value: Any) -> None:
+        instance._data[self.key] = fh_unwrapView(value)
+
+    def __delete__(self, instance: 'DataView') -> None:
+        instance._data.pop(self.key, None)
+
+def viewField(default: Any = None, *, factory: Optional[Callable[[], Any]] = None, view: Optional[type] = None,
+              container: Optional[type] = None, key: Optional[str] = None) -> Any:
+    # The counterpart of dataclasses.field, e.g. moveset: List[Move] = viewField(view=Move, container=list)
+    return ViewField(default, factory, view, container, key)
+
+class DataView:
+    """
+    Typed view over a parsed JSON object. Every annotated class attribute becomes a ViewField, a plain
+    value is its default. Subclasses declare `__slots__ = ()`, a view only holds its dictionary.
+
+    Usage Example:
+        >>> session = SessionData(slotData)
+        >>> session.money = 1000           # writes slotData['money']
+        >>> session.party[0].moveset[0].moveId
+        33
+        >>> session.toDict() is slotData
+        True
+    """
+    __slots__ = ('_data',)
+    _viewFields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        names = list(cls._viewFields)
+        for name in cls.__dict__.get('__annotations__', {}):
+            attribute = cls.__dict__.get(name)
+            if not isinstance(attribute, ViewField):
+                attribute = ViewField(attribute)
+                attribute.__set_name__(cls, name)
+                setattr(cls, name, attribute)
+            if name not in names:
+                names.append(name)
+        cls._viewFields = tuple(names)
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, **values: Any) -> None:
+        # Wraps data without copying it, or a new dict; values set fields, e.g. Move(moveId=33).
+        if data is None:
+            data = {}
+        elif not isinstance(data, dict):
+            raise TypeError(f'{type(self).__name__} wraps a dict, got {type(data).__name__}')
+        self._data = data
+        for name, value in values.items():
+            if name not in self._viewFields:
+                raise TypeError(f'{type(self).__name__} has no field {name!r}')
+            setattr(self, name, value)
+
+    @classmethod
+    def fields(cls) -> Tuple[ViewField, ...]:
+        # The field descriptors in declaration order, including inherited ones.
+        return tuple(getattr(cls, name) for name in cls._viewFields)
+
+    def toDict(self) -> Dict[str, Any]:
+        # The wrapped dictionary itself, edits through the view are already in it.
+        return self._data
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._data == other._data
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._data!r})'
+
+class ListView(MutableSequence):
+    # Zero-copy list of DataViews over a JSON array, items are wrapped on access.
+    __slots__ = ('_items', '_view')
+
+    def __init__(self, items: List[Any], view: type) -> None:
+        self._items = items
+        self._view = view
+
+    def __fh_wrap(self, item: Any) -> Any:
+        return self._view(item) if isinstance(item, dict) else item
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self.__fh_wrap(item) for item in self._items[index]]
+        return self.__fh_wrap(self._items[index])
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        self._items[index] = fh_unwrapView(value)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def insert(self, index: int, value: Any) -> None:
+        self._items.insert(index, fh_unwrapView(value))
+
+    def toDict(self) -> List[Any]:
+        # Named like DataView.toDict, returns the wrapped list itself.
+        return self._items
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ListView):
+            return self._items == other._items
+        return self._items == other if isinstance(other, list) else NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'ListView[{self._view.__name__}]({self._items!r})'
+
+class DictView(MutableMapping):
+    # Zero-copy mapping of DataViews over a JSON object, e.g. dexData. Integer keys are converted to str.
+    __slots__ = ('_items', '_view')
+
+    def __init__(self, items: Dict[str, Any], view: type) -> None:
+        self._items = items
+        self._view = view
+
+    def __getitem__(self, key: Union[str, int]) -> Any:
+        item = self._items[str(key)]
+        return self._view(item) if isinstance(item, dict) else item
+
+    def __setitem__(self, key: Union[str, int], value: Any) -> None:
+        self._items[str(key)] = fh_unwrapView(value)
+
+    def __delitem__(self, key: Union[str, int]) -> None:
+        del self._items[str(key)]
+
+    def __contains__(self, key: object) -> bool:
+        return str(key) in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def toDict(self) -> Dict[str, Any]:
+        # Returns the wrapped dictionary itself.
+        return self._items
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DictView):
+            return self._items == other._items
+        return self._items == other if isinstance(other, dict) else NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'DictView[{self._view.__name__}]({self._items!r})'
+
+class Modifier(DataView):
+    __slots__ = ()
+    args: Optional[List[Optional[Union[int, bool]]]]
     className: Optional[str]
     player: Optional[bool]
     stackCount: Optional[int]
     typeId: Optional[str]
     typePregenArgs: Optional[List[Optional[int]]]
 
-    def toDict(self):
-        return asdict(self)
-
-@dataclass
-class ModifierEnemyData:
-    modifiers: List[Optional[Modifier]]
-
-    def toDict(self):
-        return asdict(self)
-
-@dataclass
-class ModifierPlayerData:
-    modifiers: List[Optional[Modifier]]
-
-@dataclass
-class Move:
+class Move(DataView):
+    __slots__ = ()
     moveId: Optional[int] = None
     ppUp: Optional[int] = None
     ppUsed: Optional[int] = None
     virtual: Optional[bool] = None
 
-    def toDict(self):
-        return asdict(self)
-
-@dataclass
-class PartySummonData:
+class PartySummonData(DataView):
+    __slots__ = ()
     abilitiesApplied: Optional[Any] = None
     ability: Optional[int] = None
     abilitySuppressed: Optional[bool] = None
-    battleStats: List[Optional[int]] = field(default_factory=lambda: [None, None, None, None, None, None, None])
+    battleStats: List[Optional[int]] = viewField(factory=lambda: [None, None, None, None, None, None, None])
     disabledMove: Optional[int] = None
     disabledTurns: Optional[int] = None
     moveQueue: Optional[Any] = None
     tags: Optional[Any] = None
     types: Optional[Any] = None
 
-    def toDict(self):
-        return asdict(self)
-
-@dataclass
-class PartyDetails:
+class PartyDetails(DataView):
+    __slots__ = ()
     abilityIndex: Optional[int] = None
     boss: Optional[bool] = None
     exp: Optional[int] = None
@@ -103,19 +277,19 @@ class PartyDetails:
     friendship: Optional[int] = None
     fusionFormIndex: Optional[int] = None
     fusionLuck: Optional[int] = None
-    fusionShiny: Optional[int] = None
+    fusionShiny: Optional[Union[bool, int]] = None
     fusionSpecies: Optional[int] = None
     fusionVariant: Optional[int] = None
     gender: Optional[int] = None
     hp: Optional[int] = None
     id: Optional[int] = None
-    ivs: List[Optional[int]] = field(default_factory=lambda: [None, None, None, None, None, None])
+    ivs: List[Optional[int]] = viewField(factory=lambda: [None, None, None, None, None, None])
     level: Optional[int] = None
     levelExp: Optional[int] = None
     luck: Optional[int] = None
     metBiome: Optional[int] = None
     metLevel: Optional[int] = None
-    moveset: List[Move] = field(default_factory=lambda: [Move(), Move(), Move(), Move()])
+    moveset: List[Move] = viewField(factory=list, view=Move, container=list)
     nature: Optional[int] = None
     natureOverride: Optional[int] = None
     passive: Optional[bool] = None
@@ -125,45 +299,23 @@ class PartyDetails:
     pokerus: Optional[bool] = None
     shiny: Optional[bool] = None
     species: Optional[int] = None
-    stats: List[Optional[int]] = field(default_factory=lambda: [None, None, None, None, None, None])
-    summonData: PartySummonData = field(default_factory=PartySummonData)
+    stats: List[Optional[int]] = viewField(factory=lambda: [None, None, None, None, None, None])
+    summonData: Optional[PartySummonData] = viewField(view=PartySummonData)
     variant: Optional[int] = None
 
-    def toDict(self):
-        return asdict(self)
-
-@dataclass
-class PartyPlayer:
-    partyInfo: Optional[PartyDetails] = field(default_factory=PartyDetails)
-    partyData: Optional[PartySummonData] = field(default_factory=PartySummonData)
-
-    def toDict(self):
-        return asdict(self)
-
-@dataclass
-class PartyEnemy:
-    partyInfo: Optional[PartyDetails] = field(default_factory=PartyDetails)
-    partyData: Optional[PartySummonData] = field(default_factory=PartySummonData)
-
-    def toDict(self):
-        return asdict(self)
-
-@dataclass
-class SpeciesDexData:
+class SpeciesDexData(DataView):
+    __slots__ = ()
     seenAttr: int = 0
     caughtAttr: int = 0
     natureAttr: int = 0
     seenCount: int = 0
     caughtCount: int = 0
     hatchedCount: int = 0
-    ivs: List[int] = field(default_factory=lambda: [0, 0, 0, 0, 0, 0])
+    ivs: List[int] = viewField(factory=lambda: [0, 0, 0, 0, 0, 0])
 
-    def toDict(self):
-        return asdict(self)
-
-@dataclass
-class SpeciesStarterData:
-    moveset: Optional[List[int]] = field(default_factory=lambda: [])
+class SpeciesStarterData(DataView):
+    __slots__ = ()
+    moveset: Optional[List[int]] = None
     eggMoves: Optional[int] = None
     candyCount: Optional[int] = 0
     friendship: Optional[int] = 0
@@ -172,9 +324,6 @@ class SpeciesStarterData:
     valueReduction: Optional[int] = 0
     classicWinCount: Optional[int] = 0
 
-    def toDict(self):
-        return asdict(self)
-
 @dataclass
 class SpeciesForm:
     name: str
@@ -253,79 +402,130 @@ def computeVariant(speciesData, variantFlag, defaultFlag, variantAdjustment):
 
     return caughtAttr
 
-variant1CaughtAttr = computeVariant(hasForms, DexAttr.VARIANT_1.value, DexAttr.DEFAULT_FORM.value, 224)
-variant2CaughtAttr = computeVariant(hasForms, DexAttr.VARIANT_2.value, DexAttr.DEFAULT_FORM.value, 192)
-variant3CaughtAttr = computeVariant(hasForms, DexAttr.VARIANT_3.value, DexAttr.DEFAULT_FORM.value, 128)
-nonShinyCaughtAttr = computeVariant(hasForms, DexAttr.NON_SHINY.value, DexAttr.DEFAULT_FORM.value, 255)
-
-specieses = []
-speciesDict = {}
-
-for speciesName, speciesId in dexEnum.items():
-    modifiedName = __modifiySpeciesName(speciesName)
-    hasPassive = int(speciesId) not in noPassiveSet
-    isStarter = speciesId in startersSet
-    speciesIdString = str(speciesId)
-
-    forms = []
-    isNormalForm = False
-    if speciesIdString in hasForms:
-        formNames = hasForms[speciesIdString].get(modifiedName, [])
-        isNormalForm = hasForms[speciesIdString].get("isNormalForm", False)
-        combinedCaughtAttr = {
-            "variant1": 31,
-            "variant2": 63,
-            "variant3": 127,
-            "nonShiny": 255
-        }
-        for index, formName in enumerate(formNames):
-            form = SpeciesForm(
-                name=formName,
-                variant1=variant1CaughtAttr[speciesIdString][modifiedName][formName],
-                variant2=variant2CaughtAttr[speciesIdString][modifiedName][formName],
-                variant3=variant3CaughtAttr[speciesIdString][modifiedName][formName],
-                nonShiny=nonShinyCaughtAttr[speciesIdString][modifiedName][formName],
-                index=index
-            )
-            forms.append(form)
-            combinedCaughtAttr["variant1"] |= form.variant1
-            combinedCaughtAttr["variant2"] |= form.variant2
-            combinedCaughtAttr["variant3"] |= form.variant3
-            combinedCaughtAttr["nonShiny"] |= form.nonShiny
-
-        # Add the imaginary "Combined" form with proper variant values
-        forms.append(SpeciesForm(
-            name="Combined",
-            variant1=combinedCaughtAttr["variant1"] + 128,
-            variant2=combinedCaughtAttr["variant2"] + 128,
-            variant3=combinedCaughtAttr["variant3"] + 128,
-            nonShiny=combinedCaughtAttr["nonShiny"] + 128,
-            index=len(forms)
-        ))
-
-    species = Species(
-        name=modifiedName,
-        dex=int(speciesId),
-        forms=forms,
-        hasPassive=hasPassive,
-        isStarter=isStarter,
-        isNormalForm=isNormalForm
-    )
-    specieses.append(species)
-    speciesDict[speciesName] = species
-    speciesDict[speciesId] = species
-
-@dataclass
-class SessionData:
+# Variant name -> (variant flag, adjustment) used to compute the caughtAttr tables.
+CAUGHT_ATTR_VARIANTS = {
+    "variant1": (DexAttr.VARIANT_1.value, 224),
+    "variant2": (DexAttr.VARIANT_2.value, 192),
+    "variant3": (DexAttr.VARIANT_3.value, 128),
+    "nonShiny": (DexAttr.NON_SHINY.value, 255)
+}
+
+def fh_computeCaughtAttrTables(hasFormsData):
+    """
+    Compute the caughtAttr tables of every form, keyed by species ID.
+
+    Called by utilities.catalogStore when the catalog database is compiled, so the result is
+    persisted and later launches never run computeVariant.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: speciesID -> {variant: {speciesName: {formName: caughtAttr}, "Combined": {...}}}
+    """
+    computed = {
+        variant: computeVariant(hasFormsData, variantFlag, DexAttr.DEFAULT_FORM.value, variantAdjustment)
+        for variant, (variantFlag, variantAdjustment) in CAUGHT_ATTR_VARIANTS.items()
+    }
+    return {speciesID: {variant: computed[variant][speciesID] for variant in CAUGHT_ATTR_VARIANTS} for speciesID in hasFormsData}
+
+@lru_cache(maxsize=None)
+def fh_getCaughtAttrTables():
+    """
+    Get the caughtAttr tables in the layout of computeVariant, one table per variant.
+
+    Read from the catalog store where they were persisted at build time.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: variant -> speciesID -> {speciesName: {formName: caughtAttr}, "Combined": {...}}
+    """
+    persisted = fh_getCatalogStore().f_getCatalog('caughtAttr')
+    return {variant: {speciesID: tables[variant] for speciesID, tables in persisted.items()} for variant in CAUGHT_ATTR_VARIANTS}
+
+@lru_cache(maxsize=None)
+def fh_getSpeciesRegistry() -> Tuple[List[Species], Dict[Union[str, int], Species]]:
+    """
+    Build the Species registry on first use.
+
+    Most menu actions never touch forms, so the registry is only built when speciesDict,
+    specieses or fh_getCombinedIDs are accessed and then memoized.
+
+    Returns:
+        Tuple[List[Species], Dict[Union[str, int], Species]]: The species list and the lookup by name and by dex ID.
+    """
+    hasForms = fh_getCatalogData('hasForms')
+    dexEnum = fh_getCatalogData('species')
+    noPassiveSet = {int(id_) for id_ in fh_getCatalogData('noPassive').keys()}
+    startersSet = {dexEnum[name] for name in fh_getCatalogData('starter')}
+    caughtAttrTables = fh_getCaughtAttrTables()
+
+    specieses = []
+    speciesDict = {}
+
+    for speciesName, speciesId in dexEnum.items():
+        modifiedName = __modifiySpeciesName(speciesName)
+        hasPassive = int(speciesId) not in noPassiveSet
+        isStarter = speciesId in startersSet
+        speciesIdString = str(speciesId)
+
+        forms = []
+        isNormalForm = False
+        if speciesIdString in hasForms:
+            formNames = hasForms[speciesIdString].get(modifiedName, [])
+            isNormalForm = hasForms[speciesIdString].get("isNormalForm", False)
+            combinedCaughtAttr = {
+                "variant1": 31,
+                "variant2": 63,
+                "variant3": 127,
+                "nonShiny": 255
+            }
+            for index, formName in enumerate(formNames):
+                form = SpeciesForm(
+                    name=formName,
+                    variant1=caughtAttrTables['variant1'][speciesIdString][modifiedName][formName],
+                    variant2=caughtAttrTables['variant2'][speciesIdString][modifiedName][formName],
+                    variant3=caughtAttrTables['variant3'][speciesIdString][modifiedName][formName],
+                    nonShiny=caughtAttrTables['nonShiny'][speciesIdString][modifiedName][formName],
+                    index=index
+                )
+                forms.append(form)
+                combinedCaughtAttr["variant1"] |= form.variant1
+                combinedCaughtAttr["variant2"] |= form.variant2
+                combinedCaughtAttr["variant3"] |= form.variant3
+                combinedCaughtAttr["nonShiny"] |= form.nonShiny
+
+            # Add the imaginary "Combined" form with proper variant values
+            forms.append(SpeciesForm(
+                name="Combined",
+                variant1=combinedCaughtAttr["variant1"] + 128,
+                variant2=combinedCaughtAttr["variant2"] + 128,
+                variant3=combinedCaughtAttr["variant3"] + 128,
+                nonShiny=combinedCaughtAttr["nonShiny"] + 128,
+                index=len(forms)
+            ))
+
+        species = Species(
+            name=modifiedName,
+            dex=int(speciesId),
+            forms=forms,
+            hasPassive=hasPassive,
+            isStarter=isStarter,
+            isNormalForm=isNormalForm
+        )
+        specieses.append(species)
+        speciesDict[speciesName] = species
+        speciesDict[speciesId] = species
+
+    return specieses, speciesDict
+
+class SessionData(DataView):
+    __slots__ = ()
     seed: Optional[str] = None
     playTime: Optional[int] = 0
     gameMode: Optional[int] = 0
-    party: Optional[PartyPlayer] = field(default_factory=PartyPlayer)
-    enemyParty: Optional[PartyEnemy] = field(default_factory=PartyEnemy)
-    playerModifier: Optional[ModifierPlayerData] = field(default_factory=ModifierPlayerData)
-    enemyModifier: Optional[ModifierEnemyData] = field(default_factory=ModifierEnemyData)
-    arena: Optional[Dict[str, Union[int, None]]] = field(default_factory=lambda: {"biome": 0, "tags": None})
-    pokeballCounts: Optional[Dict[str, Optional[int]]] = field(default_factory=lambda: {"0": 5, "1": 0, "2": 0, "3": 0, "4": 0})
+    party: List[PartyDetails] = viewField(factory=list, view=PartyDetails, container=list)
+    enemyParty: List[PartyDetails] = viewField(factory=list, view=PartyDetails, container=list)
+    modifiers: List[Modifier] = viewField(factory=list, view=Modifier, container=list)
+    enemyModifiers: Optional[List[Modifier]] = viewField(factory=list, view=Modifier, container=list)
+    arena: Optional[Dict[str, Any]] = viewField(factory=lambda: {"biome": 0, "tags": None})
+    pokeballCounts: Optional[Dict[str, Optional[int]]] = viewField(factory=lambda: {"0": 5, "1": 0, "2": 0, "3": 0, "4": 0})
     money: Optional[int] = None
     score: Optional[int] = None
     victoryCount: Optional[int] = None
@@ -333,42 +533,35 @@ class SessionData:
     reviveCount: Optional[int] = None
     waveIndex: Optional[int] = None
     battleType: Optional[int] = None
-    trainer: Optional[int] = None
+    trainer: Optional[Any] = None
     gameVersion: Optional[str] = None
     timestamp: Optional[int] = None
-    challenges: Optional[Dict[str, None]] = None
-
-    def toDict(self):
-        return asdict(self)
-
+    challenges: Optional[List[Any]] = None
 
-@dataclass
-class TrainerData:
+class TrainerData(DataView):
+    __slots__ = ()
     trainerId: Optional[int] = None
     secretId: Optional[int] = None
     gender: Optional[int] = None
-    dexData: Optional[SpeciesDexData] = field(default_factory=SpeciesDexData)
-    starterData: Optional[SpeciesStarterData] = field(default_factory=SpeciesStarterData)
-    starterMoveData: Optional[List[int]] = field(default_factory=lambda: [])
-    starterEggMoveData: Optional[List[int]] = field(default_factory=lambda: [])
+    dexData: Dict[str, SpeciesDexData] = viewField(factory=dict, view=SpeciesDexData, container=dict)
+    starterData: Dict[str, SpeciesStarterData] = viewField(factory=dict, view=SpeciesStarterData, container=dict)
+    starterMoveData: Optional[Dict[str, Any]] = viewField(factory=dict)
+    starterEggMoveData: Optional[Dict[str, Any]] = viewField(factory=dict)
     gameStats: Optional[Dict[str, Optional[int]]] = None
     unlocks: Optional[Dict[str, Optional[bool]]] = None
     achvUnlocks: Optional[Dict[str, Optional[int]]] = None
     voucherUnlocks: Optional[Dict[str, Optional[int]]] = None
     voucherCounts: Optional[Dict[str, Optional[int]]] = None
-    eggs: Optional[Dict[str, None]] = None
-    eggPity: Optional[List[int]] = field(default_factory=lambda: [0, 0, 0, 0])
-    unlockPity: Optional[List[int]] = field(default_factory=lambda: [0, 0, 0, 0])
-    gameVersion: Optional[int] = None
+    eggs: Optional[List[Dict[str, Any]]] = None
+    eggPity: Optional[List[int]] = viewField(factory=lambda: [0, 0, 0, 0])
+    unlockPity: Optional[List[int]] = viewField(factory=lambda: [0, 0, 0, 0])
+    gameVersion: Optional[str] = None
     timestamp: Optional[int] = None
 
-    def toDict(self):
-        return asdict(self)
-
-
-
-def fh_getCombinedIDs(includeStarter=True, onlyNormalForms=True):
+@lru_cache(maxsize=None)
+def __fh_getCombinedIDs(includeStarter, onlyNormalForms):
     combinedFormIds = []
+    specieses, _ = fh_getSpeciesRegistry()
 
     for species in specieses:
         if (includeStarter or not species.isStarter) and (not onlyNormalForms or species.isNormalForm):
@@ -382,11 +575,40 @@ def fh_getCombinedIDs(includeStarter=True, onlyNormalForms=True):
                         "formIndex": form.index
                     })
 
-    return combinedFormIds
+    return tuple(combinedFormIds)
+
+def fh_getCombinedIDs(includeStarter=True, onlyNormalForms=True):
+    # The list is built once per argument combination, callers get their own copy of the list.
+    return list(__fh_getCombinedIDs(includeStarter, onlyNormalForms))
+
+@lru_cache(maxsize=None)
+def fh_getCaughtAttrBySpecies(includeStarter=True, onlyNormalForms=True):
+    """
+    Get the caughtAttr that unlocks all forms (the variant 3 "Combined" form), keyed by species ID.
+
+    Replaces scanning the list of fh_getCombinedIDs for every dex entry. Built once per session
+    and shared, the returned dictionary must not be modified.
+
+    Args:
+        includeStarter (bool): Include starter species.
+        onlyNormalForms (bool): Only include species flagged as isNormalForm.
+
+    Returns:
+        Dict[str, int]: str(speciesID) -> caughtAttr, the keys match the dexData keys of trainer.json.
+
+    Usage Example:
+        >>> fh_getCaughtAttrBySpecies().get('25', 253)
+    """
+    caughtAttrBySpecies = {}
+    for form in __fh_getCombinedIDs(includeStarter, onlyNormalForms):
+        # Keep the first match, like the linear scan this replaces.
+        caughtAttrBySpecies.setdefault(str(form["speciesID"]), form["caughtAttr"])
+    return caughtAttrBySpecies
 
 @staticmethod
 def data_iterateParty(slotData, speciesNameByIDHelper, moveNamesByIDHelper, natureNamesByIDHelper):
     currentParty = []
+    _, speciesDict = fh_getSpeciesRegistry()
     pokeballList = {
         0: "Pokeball",
         1: "Great Ball",
@@ -482,4 +704,31 @@ def data_iterateParty(slotData, speciesNameByIDHelper, moveNamesByIDHelper, natu
 
         currentParty.append(speciesInfo)
 
-    return currentParty
\ No newline at end of file
+    return currentParty
+
+# Module level data that used to be computed at import time. Each entry is built on first access,
+# so importing dataParser does not touch the catalogs at all.
+__lazyAttributes = {
+    'hasForms': lambda: fh_getCatalogData('hasForms'),
+    'dexEnum': lambda: fh_getCatalogData('species'),
+    'noPassive': lambda: fh_getCatalogData('noPassive'),
+    'startersList': lambda: fh_getCatalogData('starter'),
+    # The shared species index (id <-> name) replaces the separate Dex Enum.
+    'Dex': lambda: fh_getCatalogStore().f_getIndex('species'),
+    'noPassiveSet': lambda: {int(id_) for id_ in fh_getCatalogData('noPassive').keys()},
+    'startersSet': lambda: {fh_getCatalogData('species')[name] for name in fh_getCatalogData('starter')},
+    'variant1CaughtAttr': lambda: fh_getCaughtAttrTables()['variant1'],
+    'variant2CaughtAttr': lambda: fh_getCaughtAttrTables()['variant2'],
+    'variant3CaughtAttr': lambda: fh_getCaughtAttrTables()['variant3'],
+    'nonShinyCaughtAttr': lambda: fh_getCaughtAttrTables()['nonShiny'],
+    'specieses': lambda: fh_getSpeciesRegistry()[0],
+    'speciesDict': lambda: fh_getSpeciesRegistry()[1],
+}
+
+def __getattr__(name):
+    # Module level data is computed on first access and then cached as a regular global.
+    if name not in __lazyAttributes:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = __lazyAttributes[name]()
+    globals()[name] = value
+    return value
@@ -0,0 +1,235 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides the edit journal behind undo and redo.
+
+Every committed edit is recorded as a pair of JSON Patches (RFC 6902): one that redoes the edit and
+one that reverts it. Both only contain the changed values, so undoing an edit costs as much as the
+edit itself, no matter how large the save file is. The patches are kept as compact JSON text; they
+are parsed again on every undo or redo, so later edits of the live data can never change them.
+
+The journal keeps one linear history for the session. Undo takes back the last edit, whichever file
+it changed. A new edit drops everything that was undone. If a file is replaced from outside (fetched
+from the server, restored from a backup) its history ends, older patches no longer match the data.
+
+Every action is also appended to a journal file per trainer and slot, one JSON object per line:
+    {"action": "edit", "id": 3, "file": "trainer.json", "time": "...", "redo": [...], "undo": [...]}
+    {"action": "undo", "id": 3, "file": "trainer.json", "time": "..."}
+    {"action": "reset", "file": "trainer.json", "time": "...", "reason": "fetched from the server"}
+
+A single unlock can record tens of thousands of operations, so the files are rotated: the first
+record of a session and every record that would grow the file beyond config.journalMaxBytes move
+the current file to '<name>.1', replacing the one before. Each trainer and slot keeps at most two
+files.
+
+Modules:
+- dataclasses: Defines the journal entries.
+- datetime: Timestamps the journal records.
+- os: Provides the journal file paths.
+- re: Maps slot files to their journal files.
+- typing: Provides type hints for better code clarity and type checking.
+- modules.config: Provides the size at which the journal files are rotated.
+- utilities.jsonBackend: Serializes the patches.
+- modules.data.saveDiff: Summarizes the patches.
+
+Workflow:
+1. SaveStore.f_commit() computes both patches of an edit and calls f_record().
+2. SaveStore.f_undo() / f_redo() take an entry with f_undo() / f_redo() and apply its patch.
+3. SaveStore.f_adopt() / f_discard() end the history of a replaced file with f_reset().
+
+Usage Example:
+    >>> journal = EditJournal(config.journalDirectory, trainerId=2450)
+    >>> journal.f_record('slot_1.json', redoPatch, undoPatch, ('money',))
+    >>> journal.f_undo().undoPatch
+    '[{"op":"replace","path":"/money","value":1000}]'
+"""
+
+from dataclasses import dataclass, field
+# Defines the journal entries.
+
+from datetime import datetime
+# Timestamps the journal records.
+
+import os
+# Provides the journal file paths.
+
+import re
+# Maps slot files to their journal files.
+
+from typing import List, Optional, Set, Tuple
+# Provides type hints for better code clarity and type checking.
+
+from modules import config
+# Provides the size at which the journal files are rotated.
+
+from utilities.jsonBackend import fh_dumps
+# Serializes the patches.
+
+from modules.data.saveDiff import Patch, fh_summarizePatch
+# Summarizes the patches.
+
+@dataclass
+class JournalEntry:
+    """
+    One committed edit.
+
+    Attributes:
+        id (int): Number of the edit in this session.
+        filename (str): The save file that was edited, e.g. 'trainer.json'.
+        redoPatch (str): JSON Patch repeating the edit, as compact JSON text.
+        undoPatch (str): JSON Patch reverting the edit, as compact JSON text.
+        sections (Tuple[str, ...]): The top level keys the edit changed.
+        summary (List[str]): Summary of the edit, e.g. ['voucherCounts: 4 entries changed'].
+    """
+    id: int
+    filename: str
+    redoPatch: str
+    undoPatch: str
+    sections: Tuple[str, ...]
+    summary: List[str] = field(default_factory=list)
+
+def fh_journalFilename(filename: str, trainerId: object) -> str:
+    """
+    Name of the journal file of a save file, named like the backups.
+
+    Args:
+        filename (str): 'trainer.json' or 'slot_{slot}.json'.
+        trainerId (object): The trainer ID.
+
+    Returns:
+        str: e.g. 'journal_gameData(2450).jsonl' or 'journal_slotData(1_2450).jsonl'.
+    """
+    match = re.fullmatch(r'slot_(\d+)\.json', filename)
+    if match:
+        return f'journal_slotData({match.group(1)}_{trainerId}).jsonl'
+    if filename == 'trainer.json':
+        return f'journal_gameData({trainerId}).jsonl'
+    return f'journal_{os.path.splitext(filename)[0]}({trainerId}).jsonl'
+
+class EditJournal:
+    """
+    Undo and redo history of the session, recorded to an append-only file per trainer and slot.
+
+    Attributes:
+        directory (Optional[str]): Directory of the journal files, None keeps the journal in memory only.
+        trainerId (object): Trainer ID used in the journal file names.
+        maxBytes (int): Size at which a journal file is rotated.
+    """
+    def __init__(self, directory: Optional[str] = None, trainerId: object = None, maxBytes: Optional[int] = None) -> None:
+        """
+        Initialize the EditJournal.
+
+        Args:
+            directory (Optional[str]): Directory of the journal files, see config.journalDirectory.
+            trainerId (object): Trainer ID used in the journal file names, can be set later.
+            maxBytes (Optional[int]): Size at which a journal file is rotated, defaults to config.journalMaxBytes.
+        """
+        self.directory: Optional[str] = directory
+        self.trainerId: object = trainerId
+        self.maxBytes: int = config.journalMaxBytes if maxBytes is None else maxBytes
+        self.__written: Set[str] = set()
+        self.__undoStack: List[JournalEntry] = []
+        self.__redoStack: List[JournalEntry] = []
+        self.__nextId: int = 1
+
+    def __fh_append(self, filename: str, record: dict, patches: str = '') -> None:
+        # The patches are already JSON text and are spliced into the record instead of serialized again.
+        if self.directory is None:
+            return
+        record = {'action': record.pop('action'), 'file': filename,
+                  'time': datetime.now().isoformat(timespec='seconds'), **record}
+        line = fh_dumps(record, compact=True)
+        if patches:
+            line = f'{line[:-1]},{patches}}}'
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, fh_journalFilename(filename, self.trainerId))
+        self.__fh_rotate(path, len(line.encode('utf-8')) + 1)
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write(line + '\n')
+
+    def __fh_rotate(self, path: str, size: int) -> None:
+        # The file of an earlier session, or one that would grow beyond maxBytes, becomes '<name>.1'.
+        try:
+            current = os.path.getsize(path)
+        except OSError:
+            current = 0
+        if current and (path not in self.__written or current + size > self.maxBytes):
+            os.replace(path, f'{path}.1')
+        self.__written.add(path)
+
+    def f_record(self, filename: str, redoPatch: Patch, undoPatch: Patch, sections: Tuple[str, ...]) -> Optional[JournalEntry]:
+        """
+        Record an edit. Everything that was undone before can no longer be redone.
+
+        Args:
+            filename (str): The save file that was edited.
+            redoPatch (Patch): The operations repeating the edit.
+            undoPatch (Patch): The operations reverting the edit.
+            sections (Tuple[str, ...]): The top level keys the edit changed.
+
+        Returns:
+            Optional[JournalEntry]: The new entry, None if the edit changed nothing.
+        """
+        if not redoPatch:
+            return None
+        entry = JournalEntry(self.__nextId, filename, fh_dumps(redoPatch, compact=True),
+                             fh_dumps(undoPatch, compact=True), sections, fh_summarizePatch(redoPatch))
+        self.__nextId += 1
+        self.__undoStack.append(entry)
+        self.__redoStack.clear()
+        self.__fh_append(filename, {'action': 'edit', 'id': entry.id},
+                         f'"redo":{entry.redoPatch},"undo":{entry.undoPatch}')
+        return entry
+
+    def f_undo(self) -> Optional[JournalEntry]:
+        """
+        Take the last edit from the history, it can be redone afterwards.
+
+        Returns:
+            Optional[JournalEntry]: The edit to revert with its undoPatch, None if there is none.
+        """
+        if not self.__undoStack:
+            return None
+        entry = self.__undoStack.pop()
+        self.__redoStack.append(entry)
+        self.__fh_append(entry.filename, {'action': 'undo', 'id': entry.id})
+        return entry
+
+    def f_redo(self) -> Optional[JournalEntry]:
+        """
+        Take the last undone edit back into the history.
+
+        Returns:
+            Optional[JournalEntry]: The edit to repeat with its redoPatch, None if there is none.
+        """
+        if not self.__redoStack:
+            return None
+        entry = self.__redoStack.pop()
+        self.__undoStack.append(entry)
+        self.__fh_append(entry.filename, {'action': 'redo', 'id': entry.id})
+        return entry
+
+    def f_reset(self, filename: str, reason: str) -> None:
+        """
+        End the history of a file, e.g. because it was replaced. Other files keep their history.
+
+        Args:
+            filename (str): The save file.
+            reason (str): Why the history ended, written to the journal file.
+        """
+        undoCount, redoCount = len(self.__undoStack), len(self.__redoStack)
+        self.__undoStack[:] = [entry for entry in self.__undoStack if entry.filename != filename]
+        self.__redoStack[:] = [entry for entry in self.__redoStack if entry.filename != filename]
+        if undoCount != len(self.__undoStack) or redoCount != len(self.__redoStack):
+            self.__fh_append(filename, {'action': 'reset', 'reason': reason})
+
+    def f_canUndo(self) -> bool:
+        return bool(self.__undoStack)
+
+    def f_canRedo(self) -> bool:
+        return bool(self.__redoStack)
@@ -0,0 +1,341 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script computes structural diffs between two versions of a save file as RFC 6902 JSON Patch.
+
+The diff walks both documents side by side and only descends into subtrees that differ:
+- Objects are compared per key. Unchanged entries are skipped with an identity check, or with the C
+  level equality of Python containers followed by a walk comparing the value types, so a dexData with
+  1000+ entries of which a handful changed costs about a millisecond.
+- Arrays are trimmed of their common head and tail. If the remaining parts differ in length, the
+  elements are aligned by a hash of their content, so removing one egg from the middle of the egg
+  list is one "remove" instead of a "replace" for every following egg.
+- JSON distinguishes true from 1 and 1 from 1.0, Python does not. Every value is compared including
+  its type, also inside objects and arrays that Python considers equal.
+
+Only "add", "remove" and "replace" operations are produced. The operations reference the values of
+the new document, they are not copied.
+
+Modules:
+- difflib: Aligns array elements whose content hashes match.
+- typing: Provides type hints for better code clarity and type checking.
+- utilities.jsonBackend: Serializes array elements for their content hash.
+
+Usage Example:
+    >>> from modules.data.saveDiff import fh_diff, fh_applyPatch
+    >>> fh_diff({'money': 5, 'eggs': [1, 2, 3]}, {'money': 7, 'eggs': [1, 3]})
+    [{'op': 'replace', 'path': '/money', 'value': 7}, {'op': 'remove', 'path': '/eggs/1'}]
+"""
+
+from difflib import SequenceMatcher
+# Aligns array elements whose content hashes match.
+
+from typing import Any, Dict, List, Sequence, Set, Tuple
+# Provides type hints for better code clarity and type checking.
+
+from utilities.jsonBackend import fh_dumps
+# Serializes array elements for their content hash.
+
+Patch = List[Dict[str, Any]]
+
+# Sections holding one entry per species, game stat or unlock; summaries count changed entries.
+ENTRY_SECTIONS = ('dexData', 'starterData', 'gameStats', 'unlocks', 'achvUnlocks', 'voucherUnlocks',
+                  'voucherCounts', 'pokeballCounts')
+
+def fh_escapePointer(key: Any) -> str:
+    """
+    Escape a key for use as JSON Pointer segment (RFC 6901).
+
+    Args:
+        key (Any): The object key or array index.
+
+    Returns:
+        str: The escaped segment, '~' becomes '~0' and '/' becomes '~1'.
+    """
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+def fh_splitPointer(path: str) -> List[str]:
+    """
+    Split a JSON Pointer into its unescaped segments.
+
+    Args:
+        path (str): The pointer, e.g. '/dexData/25/ivs/0'. '' is the whole document.
+
+    Returns:
+        List[str]: The segments, e.g. ['dexData', '25', 'ivs', '0'].
+
+    Raises:
+        ValueError: If the pointer does not start with '/'.
+    """
+    if path == '':
+        return []
+    if not path.startswith('/'):
+        raise ValueError(f'Invalid JSON Pointer {path!r}')
+    if '~' not in path:
+        return path[1:].split('/')
+    return [segment.replace('~1', '/').replace('~0', '~') for segment in path[1:].split('/')]
+
+def fh_isSameValue(old: Any, new: Any) -> bool:
+    """
+    Compare two JSON values including the type of every value inside, true is not 1 and 1 is not 1.0.
+
+    Args:
+        old (Any): The first value.
+        new (Any): The second value.
+
+    Returns:
+        bool: True if both values serialize to the same JSON.
+    """
+    # Identity first, it is the common case for untouched subtrees of the live data. Python's equality
+    # then rules out most differences at C level, only equal containers are walked for their types.
+    if old is new:
+        return True
+    if type(old) is not type(new) or old != new:
+        return False
+    return __fh_hasSameTypes(old, new)
+
+def __fh_hasSameTypes(old: Any, new: Any) -> bool:
+    # For values known to be equal: True if every value inside has the same type on both sides.
+    if type(old) is dict:
+        pairs = ((value, new[key]) for key, value in old.items())
+    elif type(old) is list:
+        pairs = zip(old, new)
+    else:
+        return True
+    for oldValue, newValue in pairs:
+        if oldValue is newValue:
+            continue
+        valueType = type(oldValue)
+        if valueType is not type(newValue):
+            return False
+        if (valueType is dict or valueType is list) and not __fh_hasSameTypes(oldValue, newValue):
+            return False
+    return True
+
+def __fh_elementKey(value: Any) -> Any:
+    # Hashable content key of an array element, scalars are their own key.
+    if isinstance(value, (dict, list)):
+        return hash(fh_dumps(value, compact=True))
+    return (type(value).__name__, value)
+
+def __fh_escape(key: str) -> str:
+    # fh_escapePointer for object keys, which almost never need escaping.
+    return key if '~' not in key and '/' not in key else key.replace('~', '~0').replace('/', '~1')
+
+def __fh_diffInto(old: Any, new: Any, path: str, patch: Patch) -> None:
+    if fh_isSameValue(old, new):
+        return
+    if type(old) is dict and type(new) is dict:
+        __fh_diffObject(old, new, path, patch)
+    elif type(old) is list and type(new) is list:
+        __fh_diffArray(old, new, path, patch)
+    else:
+        patch.append({'op': 'replace', 'path': path, 'value': new})
+
+def __fh_diffValue(oldValue: Any, newValue: Any, pointer: str, patch: Patch) -> None:
+    # Called for values that are not identical; containers are only descended into if they differ.
+    valueType = type(oldValue)
+    if valueType is type(newValue):
+        if valueType is dict:
+            if not fh_isSameValue(oldValue, newValue):
+                __fh_diffObject(oldValue, newValue, pointer, patch)
+            return
+        if valueType is list:
+            if not fh_isSameValue(oldValue, newValue):
+                __fh_diffArray(oldValue, newValue, pointer, patch)
+            return
+        if oldValue == newValue:
+            return
+    patch.append({'op': 'replace', 'path': pointer, 'value': newValue})
+
+def __fh_diffObject(old: Dict[str, Any], new: Dict[str, Any], path: str, patch: Patch) -> None:
+    for key, oldValue in old.items():
+        newValue = new.get(key, old)
+        if newValue is oldValue:
+            continue
+        if newValue is old:
+            # The object itself marks a missing key, it can never be one of its own values.
+            patch.append({'op': 'remove', 'path': f'{path}/{__fh_escape(key)}'})
+            continue
+        # Unchanged scalars are the common case, skip them before building the pointer.
+        valueType = type(oldValue)
+        if valueType is type(newValue) and valueType is not dict and valueType is not list and oldValue == newValue:
+            continue
+        __fh_diffValue(oldValue, newValue, f'{path}/{__fh_escape(key)}', patch)
+    for key, newValue in new.items():
+        if key not in old:
+            patch.append({'op': 'add', 'path': f'{path}/{__fh_escape(key)}', 'value': newValue})
+
+def __fh_diffArray(old: List[Any], new: List[Any], path: str, patch: Patch) -> None:
+    if len(old) == len(new):
+        # Same length, e.g. IVs or a moveset: compare position by position.
+        for index, (oldValue, newValue) in enumerate(zip(old, new)):
+            if oldValue is not newValue:
+                __fh_diffValue(oldValue, newValue, f'{path}/{index}', patch)
+        return
+
+    # Common head and tail are skipped, only the middle part is compared.
+    start = 0
+    end = min(len(old), len(new))
+    while start < end and fh_isSameValue(old[start], new[start]):
+        start += 1
+    oldEnd, newEnd = len(old), len(new)
+    while oldEnd > start and newEnd > start and fh_isSameValue(old[oldEnd - 1], new[newEnd - 1]):
+        oldEnd -= 1
+        newEnd -= 1
+
+    matcher = SequenceMatcher(None, [__fh_elementKey(value) for value in old[start:oldEnd]],
+                              [__fh_elementKey(value) for value in new[start:newEnd]], autojunk=False)
+    blocks = [(tag, i1 + start, i2 + start, j1 + start, j2 + start) for tag, i1, i2, j1, j2 in matcher.get_opcodes()]
+
+    # Applied from the end, indices in front of a block are not shifted by the block's operations.
+    for tag, i1, i2, j1, j2 in reversed(blocks):
+        if tag == 'equal':
+            continue
+        common = min(i2 - i1, j2 - j1)
+        for offset in range(common):
+            __fh_diffInto(old[i1 + offset], new[j1 + offset], f'{path}/{i1 + offset}', patch)
+        for _ in range(i2 - i1 - common):
+            patch.append({'op': 'remove', 'path': f'{path}/{i1 + common}'})
+        for offset in range(common, j2 - j1):
+            patch.append({'op': 'add', 'path': f'{path}/{i1 + offset}', 'value': new[j1 + offset]})
+
+def fh_diff(old: Any, new: Any, sections: Sequence[str] = (), path: str = '') -> Patch:
+    """
+    Compute the JSON Patch turning `old` into `new`.
+
+    Args:
+        old (Any): The original document, e.g. the last saved trainer.json.
+        new (Any): The changed document.
+        sections (Sequence[str]): Only compare these top level keys, the others are known to be equal.
+            Compares everything if empty.
+        path (str): JSON Pointer of `old` and `new` inside a larger document, prefixed to every
+            operation, e.g. '/dexData/25' when diffing a single entry.
+
+    Returns:
+        Patch: The operations, applying them to `old` in order yields `new`.
+
+    Usage Example:
+        >>> fh_diff(savedData, liveData, sections=['dexData'])
+        [{'op': 'replace', 'path': '/dexData/25/caughtAttr', 'value': 255}]
+    """
+    patch: Patch = []
+    if sections and type(old) is dict and type(new) is dict:
+        for section in sections:
+            oldValue, newValue = old.get(section, old), new.get(section, new)
+            pointer = f'{path}/{fh_escapePointer(section)}'
+            if newValue is new and oldValue is not old:
+                patch.append({'op': 'remove', 'path': pointer})
+            elif oldValue is old and newValue is not new:
+                patch.append({'op': 'add', 'path': pointer, 'value': newValue})
+            elif oldValue is not old:
+                __fh_diffInto(oldValue, newValue, pointer, patch)
+    else:
+        __fh_diffInto(old, new, path, patch)
+    return patch
+
+def fh_applyPatch(document: Any, patch: Patch) -> Any:
+    """
+    Apply a JSON Patch in place.
+
+    Args:
+        document (Any): The document to change.
+        patch (Patch): Operations as produced by fh_diff ('add', 'remove', 'replace').
+
+    Returns:
+        Any: The changed document. The same object unless the whole document was replaced.
+
+    Raises:
+        ValueError: If an operation is unknown or its path does not exist.
+    """
+    for operation in patch:
+        op, segments = operation['op'], fh_splitPointer(operation['path'])
+        if not segments:
+            if op not in ('add', 'replace'):
+                raise ValueError(f'Cannot {op} the whole document')
+            document = operation['value']
+            continue
+
+        parent = document
+        try:
+            for segment in segments[:-1]:
+                parent = parent[int(segment)] if type(parent) is list else parent[segment]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise ValueError(f'Path {operation["path"]!r} does not exist') from None
+        key = segments[-1]
+
+        try:
+            if type(parent) is list:
+                index = len(parent) if key == '-' else int(key)
+                if op == 'add':
+                    if not 0 <= index <= len(parent):
+                        raise IndexError(index)
+                    parent.insert(index, operation['value'])
+                elif op == 'remove':
+                    del parent[index]
+                elif op == 'replace':
+                    parent[index] = operation['value']
+                else:
+                    raise ValueError(f'Unsupported operation {op!r}')
+            elif type(parent) is dict:
+                if op == 'add':
+                    parent[key] = operation['value']
+                elif op == 'remove':
+                    del parent[key]
+                elif op == 'replace':
+                    if key not in parent:
+                        raise KeyError(key)
+                    parent[key] = operation['value']
+                else:
+                    raise ValueError(f'Unsupported operation {op!r}')
+            else:
+                raise TypeError(type(parent).__name__)
+        except (KeyError, IndexError, TypeError):
+            raise ValueError(f'Path {operation["path"]!r} does not exist') from None
+    return document
+
+def fh_summarizePatch(patch: Patch) -> List[str]:
+    """
+    Summarize a patch per top level section, in the order the sections first appear.
+
+    Args:
+        patch (Patch): The operations.
+
+    Returns:
+        List[str]: One line per section, e.g. 'dexData: 12 entries changed', 'money: 1000'.
+    """
+    # Per section: number of operations, changed entries and the first operation. Only the first two
+    # path segments are looked at, the rest of a path is not split.
+    grouped: Dict[str, Tuple[List[int], Set[str], Dict[str, Any]]] = {}
+    for operation in patch:
+        segments = operation['path'].split('/', 3)
+        section = segments[1] if len(segments) > 1 else '(document)'
+        group = grouped.get(section)
+        if group is None:
+            group = grouped[section] = ([0], set(), operation)
+        group[0][0] += 1
+        if len(segments) > 2:
+            group[1].add(segments[2])
+
+    lines: List[str] = []
+    for section, (count, entries, operation) in grouped.items():
+        if '~' in section:
+            section = fh_splitPointer(f'/{section}')[0]
+        if count[0] == 1 and not entries:
+            value = operation.get('value')
+            if operation['op'] == 'remove':
+                lines.append(f'{section}: removed')
+            elif isinstance(value, (dict, list)):
+                lines.append(f'{section}: {"added" if operation["op"] == "add" else "replaced"}')
+            else:
+                lines.append(f'{section}: {value}')
+        elif section in ENTRY_SECTIONS:
+            lines.append(f'{section}: {len(entries)} {"entry" if len(entries) == 1 else "entries"} changed')
+        else:
+            lines.append(f'{section}: {count[0]} {"change" if count[0] == 1 else "changes"}')
+    return lines
@@ -0,0 +1,390 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script validates trainer.json and the slot files before they are written.
+
+The schema is not written down a second time, it is compiled from the views in dataParser:
+TrainerData describes trainer.json, SessionData a slot file. Every annotated field becomes a check of
+its JSON type (Optional allows null, List and Dict check their items, nested views their fields).
+FIELD_CONSTRAINTS adds what the annotations cannot express, like the range of IVs or of caughtAttr.
+
+The checks are compiled to Python once per session: every view becomes one function with the checks
+of all its fields inlined, lists and dictionaries become loops, scalar checks plain conditions. A
+full trainer.json is validated in a few milliseconds. The checks are lenient where
+the game is: unknown keys are allowed and missing keys are only reported if they are required.
+An integer field accepts integers only; true and false are no integers.
+
+Every issue has the JSON Pointer (RFC 6901) of the offending value, e.g. '/dexData/25/ivs/3'.
+
+Modules:
+- dataclasses: Defines the validation issues.
+- functools: Compiles every schema only once per session.
+- re: Maps the save files to their schema.
+- typing: Inspects the annotations of the views.
+- modules.data.dataParser: Provides the views the schema is compiled from.
+- modules.data.saveDiff: Escapes the keys of the reported paths.
+
+Workflow:
+1. fh_getSaveSchema() compiles the schema of a save file on first use.
+2. SaveSchema.f_validate() checks the whole document or only some top level sections.
+3. SaveStore.f_flush() validates the dirty sections and refuses to write a file with issues.
+
+Usage Example:
+    >>> schema = fh_getSaveSchema('trainer.json')
+    >>> schema.f_validate(trainerData, sections=['dexData'])
+    [ValidationIssue(path='/dexData/25/ivs/3', message='expected an integer from 0 to 31, got 32')]
+"""
+
+from dataclasses import dataclass
+# Defines the validation issues.
+
+from functools import lru_cache
+# Compiles every schema only once per session.
+
+import re
+# Maps the save files to their schema.
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union, get_args, get_origin
+# Inspects the annotations of the views.
+
+from modules.data.dataParser import (DataView, Modifier, Move, PartyDetails, SessionData, SpeciesDexData,
+                                     SpeciesStarterData, TrainerData)
+# Provides the views the schema is compiled from.
+
+from modules.data.saveDiff import fh_escapePointer
+# Escapes the keys of the reported paths.
+
+# Largest integer the game stores exactly, its numbers are JavaScript doubles.
+MAX_SAFE_INTEGER: int = 2**53 - 1
+
+# Limits the annotations cannot express, per view and field. For lists and dictionaries minimum and
+# maximum apply to the items; length is the exact and maxLength the largest number of items.
+FIELD_CONSTRAINTS: Dict[Tuple[type, str], Dict[str, Any]] = {
+    (SpeciesDexData, 'seenAttr'): {'minimum': 0, 'maximum': MAX_SAFE_INTEGER},
+    (SpeciesDexData, 'caughtAttr'): {'minimum': 0, 'maximum': MAX_SAFE_INTEGER},
+    (SpeciesDexData, 'natureAttr'): {'minimum': 0, 'maximum': 2**26 - 1},
+    (SpeciesDexData, 'seenCount'): {'minimum': 0},
+    (SpeciesDexData, 'caughtCount'): {'minimum': 0},
+    (SpeciesDexData, 'hatchedCount'): {'minimum': 0},
+    (SpeciesDexData, 'ivs'): {'required': True, 'length': 6, 'minimum': 0, 'maximum': 31},
+    (SpeciesStarterData, 'moveset'): {'maxLength': 4, 'minimum': 0},
+    (SpeciesStarterData, 'eggMoves'): {'minimum': 0, 'maximum': 15},
+    (SpeciesStarterData, 'candyCount'): {'minimum': 0},
+    (SpeciesStarterData, 'friendship'): {'minimum': 0},
+    (SpeciesStarterData, 'abilityAttr'): {'minimum': 0, 'maximum': 7},
+    (SpeciesStarterData, 'passiveAttr'): {'minimum': 0, 'maximum': 3},
+    (SpeciesStarterData, 'valueReduction'): {'minimum': 0},
+    (SpeciesStarterData, 'classicWinCount'): {'minimum': 0},
+    (PartyDetails, 'species'): {'required': True, 'minimum': 1},
+    (PartyDetails, 'abilityIndex'): {'minimum': 0, 'maximum': 2},
+    (PartyDetails, 'friendship'): {'minimum': 0, 'maximum': 255},
+    (PartyDetails, 'hp'): {'minimum': 0},
+    (PartyDetails, 'ivs'): {'required': True, 'length': 6, 'minimum': 0, 'maximum': 31},
+    (PartyDetails, 'level'): {'minimum': 1},
+    (PartyDetails, 'moveset'): {'required': True, 'maxLength': 4},
+    (PartyDetails, 'nature'): {'minimum': 0, 'maximum': 24},
+    (PartyDetails, 'natureOverride'): {'minimum': -1, 'maximum': 24},
+    (PartyDetails, 'stats'): {'length': 6, 'minimum': 0},
+    (PartyDetails, 'variant'): {'minimum': 0, 'maximum': 2},
+    (Move, 'moveId'): {'required': True, 'minimum': 0},
+    (Move, 'ppUp'): {'minimum': 0, 'maximum': 3},
+    (Move, 'ppUsed'): {'minimum': 0},
+    (Modifier, 'stackCount'): {'minimum': 0},
+    (SessionData, 'money'): {'minimum': 0},
+    (SessionData, 'pokeballCounts'): {'minimum': 0},
+    (SessionData, 'waveIndex'): {'minimum': 0},
+    (TrainerData, 'voucherCounts'): {'minimum': 0},
+    (TrainerData, 'eggPity'): {'minimum': 0},
+    (TrainerData, 'unlockPity'): {'minimum': 0},
+}
+
+# The view describing each save file.
+SCHEMA_ROOTS: Tuple[Tuple[str, type], ...] = (
+    (r'trainer\.json', TrainerData),
+    (r'slot_\d+\.json', SessionData),
+)
+
+_MISSING = object()
+
+# A node checks one value and appends its issues: node(value, path, issues).
+Node = Callable[[Any, str, List['ValidationIssue']], None]
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    """
+    One value that does not match the schema.
+
+    Attributes:
+        path (str): JSON Pointer of the value, e.g. '/dexData/25/ivs/3'.
+        message (str): What is wrong, e.g. 'expected an integer from 0 to 31, got 32'.
+    """
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f'{self.path or "/"}: {self.message}'
+
+class SaveValidationError(ValueError):
+    """
+    Raised instead of writing a save file that does not match the schema.
+
+    Attributes:
+        filename (str): The save file.
+        issues (List[ValidationIssue]): Everything that is wrong.
+    """
+    def __init__(self, filename: str, issues: List[ValidationIssue]) -> None:
+        self.filename = filename
+        self.issues = issues
+        super().__init__(f'{filename} has {len(issues)} invalid {"value" if len(issues) == 1 else "values"}, first: {issues[0]}')
+
+def fh_describeValue(value: Any) -> str:
+    # Short description of a wrong value for the issue message.
+    if isinstance(value, dict):
+        return 'an object'
+    if isinstance(value, list):
+        return f'a list of {len(value)} items'
+    text = 'null' if value is None else 'true' if value is True else 'false' if value is False else repr(value)
+    return text if len(text) <= 40 else f'{text[:37]}...'
+
+class _SchemaCompiler:
+    # Generates the Python source of the checks and compiles it once. Scalar checks become inline
+    # conditions, lists, dictionaries and views become functions calling each other by name.
+    # Paths are only built for values that fail a check.
+
+    def __init__(self) -> None:
+        self.namespace: Dict[str, Any] = {
+            '_MISSING': _MISSING, 'ValidationIssue': ValidationIssue, 'fh_describeValue': fh_describeValue,
+            'fh_escapePointer': fh_escapePointer,
+        }
+        self.sources: List[str] = []
+        self.views: Dict[type, str] = {}
+        self.containers: Dict[Tuple[Any, ...], Tuple[str, str]] = {}
+
+    def __fh_name(self, prefix: str) -> str:
+        return f'_{prefix}{len(self.sources)}'
+
+    def f_scalar(self, annotation: Any, constraint: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        # Condition (with {0} for the value) and description of a scalar type, None for other types.
+        if annotation is bool:
+            return '({0} is True or {0} is False)', 'true or false'
+        if annotation is str:
+            return 'type({0}) is str', 'a string'
+        if annotation is float:
+            return '(type({0}) is float or type({0}) is int)', 'a number'
+        if annotation is int:
+            minimum, maximum = constraint.get('minimum'), constraint.get('maximum')
+            if minimum is not None and maximum is not None:
+                return f'(type({{0}}) is int and {minimum} <= {{0}} <= {maximum})', f'an integer from {minimum} to {maximum}'
+            if minimum is not None:
+                return f'(type({{0}}) is int and {{0}} >= {minimum})', f'an integer of at least {minimum}'
+            if maximum is not None:
+                return f'(type({{0}}) is int and {{0}} <= {maximum})', f'an integer of at most {maximum}'
+            return 'type({0}) is int', 'an integer'
+        if get_origin(annotation) is Union:
+            # Union of scalars, e.g. Union[int, bool] in Modifier.args.
+            members = [self.f_scalar(member, constraint) for member in get_args(annotation) if member is not type(None)]
+            if not members or any(member is None for member in members):
+                return None
+            if type(None) in get_args(annotation):
+                members.append(('{0} is None', 'null'))
+            return f'({" or ".join(condition for condition, _ in members)})', ' or '.join(description for _, description in members)
+        return None
+
+    def f_check(self, annotation: Any, constraint: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], bool, str]:
+        # (condition, node, nullable, expected): a condition for scalars, the name of a node function
+        # for containers and views, neither if every value is accepted.
+        nullable = False
+        if get_origin(annotation) is Union and type(None) in get_args(annotation):
+            members = [member for member in get_args(annotation) if member is not type(None)]
+            nullable = True
+            annotation = members[0] if len(members) == 1 else Union[tuple(members)]
+        if annotation is Any:
+            return None, None, nullable, 'anything'
+
+        scalar = self.f_scalar(annotation, constraint)
+        if scalar is not None:
+            condition, expected = scalar
+            if nullable:
+                return f'({{0}} is None or {condition})', None, False, f'{expected} or null'
+            return condition, None, False, expected
+
+        origin = get_origin(annotation)
+        arguments = get_args(annotation)
+        if isinstance(annotation, type) and issubclass(annotation, DataView):
+            node, expected = self.f_view(annotation), 'an object'
+        elif origin is list:
+            node, expected = self.f_container(list, arguments[0] if arguments else Any, constraint)
+        elif origin is dict:
+            node, expected = self.f_container(dict, arguments[1] if arguments else Any, constraint)
+        else:
+            return None, None, nullable, 'anything'
+        return None, node, nullable, f'{expected} or null' if nullable else expected
+
+    def f_container(self, container: type, itemType: Any, constraint: Dict[str, Any]) -> Tuple[str, str]:
+        # Node of a list or dictionary. Items share the item limits of the field, not its length limits.
+        cacheKey = (container, itemType, tuple(sorted(constraint.items())))
+        if cacheKey in self.containers:
+            return self.containers[cacheKey]
+        itemConstraint = {key: constraint[key] for key in ('minimum', 'maximum') if key in constraint}
+        condition, itemNode, nullable, itemExpected = self.f_check(itemType, itemConstraint)
+        name = self.__fh_name('container')
+
+        if container is list:
+            length, maxLength = constraint.get('length'), constraint.get('maxLength')
+            expected = (f'a list of {length} items' if length is not None else
+                        f'a list of at most {maxLength} items' if maxLength is not None else 'a list')
+            lines = [f'def {name}(value, path, issues):',
+                     '    if type(value) is not list:',
+                     f'        issues.append(ValidationIssue(path, {f"expected {expected}, got "!r} + fh_describeValue(value)))',
+                     '        return']
+            if length is not None or maxLength is not None:
+                tooLong = f'len(value) != {length}' if length is not None else f'len(value) > {maxLength}'
+                lines += [f'    if {tooLong}:',
+                          f'        issues.append(ValidationIssue(path, {f"expected {expected}, got "!r} + str(len(value))))']
+            loop, itemPath = '    for key, item in enumerate(value):', "f'{path}/{key}'"
+        else:
+            expected = 'an object'
+            lines = [f'def {name}(value, path, issues):',
+                     '    if type(value) is not dict:',
+                     "        issues.append(ValidationIssue(path, 'expected an object, got ' + fh_describeValue(value)))",
+                     '        return']
+            loop, itemPath = '    for key, item in value.items():', "path + '/' + fh_escapePointer(key)"
+
+        if condition is not None:
+            lines += [loop,
+                      f'        if not {condition.format("item")}:',
+                      f'            issues.append(ValidationIssue({itemPath}, {f"expected {itemExpected}, got "!r} + fh_describeValue(item)))']
+        elif itemNode is not None and nullable:
+            lines += [loop,
+                      '        if item is not None:',
+                      f'            {itemNode}(item, {itemPath}, issues)']
+        elif itemNode is not None:
+            lines += [loop,
+                      f'        {itemNode}(item, {itemPath}, issues)']
+        self.f_define('\n'.join(lines))
+        self.containers[cacheKey] = name, expected
+        return name, expected
+
+    def f_fieldBlock(self, view: type, field: Any, indent: str) -> List[str]:
+        # Source checking one field of the dictionary bound to `get`, empty if every value is accepted.
+        annotation = view.__annotations__.get(field.name, Any)
+        constraint = FIELD_CONSTRAINTS.get((view, field.name), {})
+        condition, node, nullable, expected = self.f_check(annotation, constraint)
+        required = constraint.get('required', False)
+        if condition is None and node is None and not required:
+            return []
+
+        pointer = f'/{fh_escapePointer(field.key)}'
+        lines = [f'{indent}item = get({field.key!r}, _MISSING)']
+        if required:
+            lines += [f'{indent}if item is _MISSING:',
+                      f'{indent}    issues.append(ValidationIssue(path + {pointer!r}, {f"missing, expected {expected}"!r}))']
+            present, otherwise = f'{indent}elif ', f'{indent}else:'
+        else:
+            present, otherwise = f'{indent}if item is not _MISSING and ', f'{indent}if item is not _MISSING:'
+        if condition is not None:
+            lines += [f'{present}not {condition.format("item")}:',
+                      f'{indent}    issues.append(ValidationIssue(path + {pointer!r}, {f"expected {expected}, got "!r} + fh_describeValue(item)))']
+        elif node is not None:
+            lines += [f'{present}item is not None:' if nullable else otherwise,
+                      f'{indent}    {node}(item, path + {pointer!r}, issues)']
+        return lines
+
+    def f_view(self, view: type) -> str:
+        # Node of a view: the checks of all its fields, inlined into one function.
+        name = self.views.get(view)
+        if name is not None:
+            return name
+        name = self.views[view] = f'_view{view.__name__}'
+        lines = [f'def {name}(value, path, issues):',
+                 '    if type(value) is not dict:',
+                 "        issues.append(ValidationIssue(path, 'expected an object, got ' + fh_describeValue(value)))",
+                 '        return',
+                 '    get = value.get']
+        for field in view.fields():
+            lines += self.f_fieldBlock(view, field, '    ')
+        self.f_define('\n'.join(lines))
+        return name
+
+    def f_sections(self, view: type) -> Dict[str, str]:
+        # One function per top level key of the document, for validating dirty sections on their own.
+        sections = {}
+        for field in view.fields():
+            block = self.f_fieldBlock(view, field, '    ')
+            if block:
+                name = self.__fh_name('section')
+                self.f_define('\n'.join([f'def {name}(value, path, issues):', '    get = value.get', *block]))
+                sections[field.key] = name
+        return sections
+
+    def f_define(self, source: str) -> None:
+        self.sources.append(source)
+        exec(compile(source, f'<saveSchema {source.split("(", 1)[0][4:]}>', 'exec'), self.namespace)
+
+class SaveSchema:
+    """
+    Compiled schema of one kind of save file.
+
+    Attributes:
+        view (type): The dataParser view the schema was compiled from, e.g. TrainerData.
+        sections (Tuple[str, ...]): The top level keys the schema checks.
+        source (str): The generated source of the checks, for debugging.
+    """
+    def __init__(self, view: type) -> None:
+        """
+        Compile the schema of a view.
+
+        Args:
+            view (type): A DataView subclass, e.g. TrainerData or SessionData.
+        """
+        compiler = _SchemaCompiler()
+        self.view: type = view
+        self.__sections: Dict[str, Node] = {key: compiler.namespace[name] for key, name in compiler.f_sections(view).items()}
+        self.sections: Tuple[str, ...] = tuple(self.__sections)
+        self.source: str = '\n\n'.join(compiler.sources)
+
+    def f_validate(self, document: Any, sections: Optional[Iterable[str]] = None) -> List[ValidationIssue]:
+        """
+        Validate a save file.
+
+        Args:
+            document (Any): The parsed save file.
+            sections (Optional[Iterable[str]]): Only validate these top level keys, None validates everything.
+
+        Returns:
+            List[ValidationIssue]: Everything that does not match, empty if the document is valid.
+
+        Usage Example:
+            >>> fh_getSaveSchema('slot_1.json').f_validate(slotData, sections=['money'])
+            [ValidationIssue(path='/money', message='expected an integer of at least 0, got -5')]
+        """
+        issues: List[ValidationIssue] = []
+        if type(document) is not dict:
+            issues.append(ValidationIssue('', f'expected an object, got {fh_describeValue(document)}'))
+            return issues
+        for section in (self.sections if sections is None else sections):
+            check = self.__sections.get(section)
+            if check is not None:
+                check(document, '', issues)
+        return issues
+
+@lru_cache(maxsize=None)
+def fh_getSaveSchema(filename: str) -> Optional[SaveSchema]:
+    """
+    Get the compiled schema of a save file, it is compiled on first use.
+
+    Args:
+        filename (str): e.g. 'trainer.json' or 'slot_1.json'.
+
+    Returns:
+        Optional[SaveSchema]: The schema, None for files without one.
+    """
+    for pattern, view in SCHEMA_ROOTS:
+        if re.fullmatch(pattern, filename):
+            return SaveSchema(view)
+    return None
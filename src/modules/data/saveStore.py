@@ -0,0 +1,519 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides a session scoped, in-memory store for trainer.json and the slot files.
+
+Every file is parsed once per session. Operations get the live parsed object, edit it in place and
+commit the top level sections they changed. Nothing is written until the store is flushed, which
+happens on an explicit save, before uploading to the server and on exit.
+
+Cancelled operations must not leave half applied edits behind. An operation therefore checks out
+the sections (or single entries) it is going to edit; the store keeps a copy of just those parts. A
+commit marks them dirty and drops the copy, anything not committed is rolled back before the data
+is handed out again.
+
+With a journal, every commit also records what it changed as a pair of JSON Patches. f_undo() and
+f_redo() apply them to the live data, see modules.data.editJournal. The copies of the checked out
+parts are the state before the edit, so an edit can only be undone if every section it changed was
+checked out, or replaced by passing new data (the old document must then be left untouched).
+
+Before a file is written its dirty sections are validated against the save schema, see
+modules.data.saveSchema. A flush with issues writes nothing and raises SaveValidationError. Issues
+the unmodified file on disk has as well are left out, the game wrote those values.
+
+Modules:
+- copy: Copies the checked out sections so uncommitted edits can be rolled back.
+- os: Provides the file paths.
+- threading: Guards the store, it can be flushed from an atexit handler.
+- typing: Provides type hints for better code clarity and type checking.
+- utilities.atomicWriter: Replaces the save files atomically.
+- utilities.jsonBackend: Parses the save files with the fastest installed JSON library.
+- modules.data.saveDiff: Computes the unsaved changes and the journal patches as JSON Patch.
+- modules.data.editJournal: Records the committed edits for undo and redo.
+- modules.data.saveSchema: Validates the dirty sections before they are written.
+
+Workflow:
+1. f_get() / f_checkout() parse a file on first use and return the live object.
+2. The operation edits the object in place.
+3. f_commit() marks the touched sections dirty; without a commit they are rolled back.
+4. f_undo() / f_redo() revert or repeat committed edits in memory.
+5. f_diff() shows what changed since the last flush, f_validate() checks the dirty sections.
+6. f_flush() validates and writes every dirty file once, f_writeAside() keeps invalid data out of it.
+
+Usage Example:
+    >>> store = SaveStore()
+    >>> slotData = store.f_checkout('slot_1.json', 'money')
+    >>> slotData['money'] = 1000
+    >>> store.f_commit('slot_1.json')
+    >>> store.f_flush()
+    ['slot_1.json']
+"""
+
+import copy
+# Copies the checked out sections so uncommitted edits can be rolled back.
+
+import os
+# Provides the file paths.
+
+import threading
+# Guards the store, it can be flushed from an atexit handler.
+
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+# Provides type hints for better code clarity and type checking.
+
+from utilities.atomicWriter import fh_writeJSONAtomic
+# Replaces the save files atomically.
+
+from utilities.jsonBackend import fh_load, fh_loads
+# Parses the save files with the fastest installed JSON library.
+
+from modules.data.saveDiff import Patch, fh_applyPatch, fh_diff, fh_escapePointer
+# Computes the unsaved changes and the journal patches as JSON Patch.
+
+from modules.data.editJournal import EditJournal, JournalEntry
+# Records the committed edits for undo and redo.
+
+from modules.data.saveSchema import SaveSchema, SaveValidationError, ValidationIssue, fh_getSaveSchema
+# Validates the dirty sections before they are written.
+
+# A section is a top level key ('dexData') or a path to a single entry (('dexData', '25')).
+SectionPath = Union[str, Tuple[str, ...]]
+
+# Marks a whole document as dirty, e.g. after it was replaced.
+WHOLE_DOCUMENT: str = '*'
+
+_MISSING = object()
+
+class SaveStore:
+    """
+    Parses the save files once and writes back only what changed.
+
+    Attributes:
+        directory (str): The directory containing trainer.json and the slot files.
+        compact (bool): Write the files without indentation.
+        parseCount (int): Number of files parsed this session.
+        writeCount (int): Number of files written this session.
+        journal (Optional[EditJournal]): Records the commits for undo and redo, None disables undo.
+    """
+    def __init__(self, directory: str = '.', compact: bool = False, journal: Optional[EditJournal] = None) -> None:
+        """
+        Initialize the SaveStore.
+
+        Args:
+            directory (str): The directory containing trainer.json and the slot files.
+            compact (bool): Write the files without indentation, see config.compactWorkingCopies.
+            journal (Optional[EditJournal]): Records the commits for undo and redo.
+        """
+        self.directory: str = directory
+        self.compact: bool = compact
+        self.parseCount: int = 0
+        self.writeCount: int = 0
+        self.journal: Optional[EditJournal] = journal
+        self.__documents: Dict[str, Dict[str, Any]] = {}
+        self.__dirty: Dict[str, Set[str]] = {}
+        self.__checkouts: Dict[str, List[Tuple[Tuple[str, ...], Any]]] = {}
+        self.__lock = threading.RLock()
+
+    def __fh_path(self, filename: str) -> str:
+        return os.path.join(self.directory, filename)
+
+    @staticmethod
+    def __fh_normalizePath(section: SectionPath) -> Tuple[str, ...]:
+        return (section,) if isinstance(section, str) else tuple(section)
+
+    @staticmethod
+    def __fh_resolve(document: Dict[str, Any], path: Tuple[str, ...]) -> Tuple[Any, str]:
+        # Returns the container holding the last path element, None if an intermediate key is missing.
+        container: Any = document
+        for key in path[:-1]:
+            container = container.get(key) if isinstance(container, dict) else None
+        return (container if isinstance(container, dict) else None), path[-1]
+
+    def __fh_load(self, filename: str) -> Dict[str, Any]:
+        document = self.__documents.get(filename)
+        if document is None:
+            document = fh_load(self.__fh_path(filename))
+            self.parseCount += 1
+            self.__documents[filename] = document
+        return document
+
+    def f_get(self, filename: str) -> Dict[str, Any]:
+        """
+        Get the live data of a save file, parsing it on first use.
+
+        Uncommitted edits of a previous operation are rolled back first.
+
+        Args:
+            filename (str): The save file, e.g. 'trainer.json'.
+
+        Returns:
+            Dict[str, Any]: The live parsed data, shared by all callers.
+
+        Raises:
+            OSError: If the file cannot be read.
+            json.JSONDecodeError: If the file is no valid JSON.
+        """
+        with self.__lock:
+            self.f_rollback(filename)
+            return self.__fh_load(filename)
+
+    def f_checkout(self, filename: str, *sections: SectionPath) -> Dict[str, Any]:
+        """
+        Get the live data of a save file and remember the given sections so they can be rolled back.
+
+        Args:
+            filename (str): The save file, e.g. 'trainer.json'.
+            *sections (SectionPath): Top level keys or paths to single entries the caller is going to edit.
+
+        Returns:
+            Dict[str, Any]: The live parsed data.
+
+        Usage Example:
+            >>> gameData = store.f_checkout('trainer.json', ('starterData', '25'))
+        """
+        with self.__lock:
+            document = self.f_get(filename)
+            checkouts = self.__checkouts.setdefault(filename, [])
+            for section in sections:
+                path = self.__fh_normalizePath(section)
+                container, key = self.__fh_resolve(document, path)
+                value = container.get(key, _MISSING) if container is not None else _MISSING
+                checkouts.append((path, _MISSING if value is _MISSING else copy.deepcopy(value)))
+            return document
+
+    def f_commit(self, filename: str, data: Optional[Dict[str, Any]] = None, *sections: SectionPath) -> None:
+        """
+        Mark the checked out and the given sections as dirty and keep the edits.
+
+        Args:
+            filename (str): The save file.
+            data (Optional[Dict[str, Any]]): New data replacing the document, None if the live object was edited.
+            *sections (SectionPath): Additional sections that were changed.
+        """
+        with self.__lock:
+            dirty = self.__dirty.setdefault(filename, set())
+            previous = self.__documents.get(filename)
+            replaced = data is not None and data is not previous
+            if replaced:
+                self.__documents[filename] = data
+                if not sections:
+                    dirty.add(WHOLE_DOCUMENT)
+            checkouts = self.__checkouts.pop(filename, [])
+            for path, _ in checkouts:
+                dirty.add(path[0])
+            for section in sections:
+                dirty.add(self.__fh_normalizePath(section)[0])
+            if self.journal is not None:
+                self.__fh_journalCommit(filename, previous if replaced else None, checkouts, sections)
+            if not dirty:
+                del self.__dirty[filename]
+
+    def __fh_journalCommit(self, filename: str, previous: Optional[Dict[str, Any]],
+                           checkouts: List[Tuple[Tuple[str, ...], Any]], sections: Tuple[SectionPath, ...]) -> None:
+        # Diffs the state before the edit (the checked out copies, or the sections of a replaced
+        # document) against the live data, in both directions.
+        document = self.__documents[filename]
+        if previous is not None and not sections:
+            self.journal.f_reset(filename, 'the whole document was replaced')
+            return
+
+        before: Dict[Tuple[str, ...], Any] = {}
+        for path, value in checkouts:
+            # The first copy of a path is the oldest one.
+            before.setdefault(path, value)
+        for section in sections:
+            path = self.__fh_normalizePath(section)
+            if not any(checkedOut[0] == path[0] for checkedOut in before):
+                if previous is None:
+                    self.journal.f_reset(filename, f'{path[0]} was changed without a checkout')
+                    return
+                before[(path[0],)] = previous.get(path[0], _MISSING)
+
+        redoPatch: Patch = []
+        undoPatch: Patch = []
+        changedSections: Dict[str, None] = {}
+        for path, oldValue in before.items():
+            # Parts of a checked out section are covered by the section itself.
+            if any(path[:length] in before for length in range(1, len(path))):
+                continue
+            container, key = self.__fh_resolve(document, path)
+            newValue = container.get(key, _MISSING) if container is not None else _MISSING
+            pointer = ''.join(f'/{fh_escapePointer(key)}' for key in path)
+            if oldValue is _MISSING and newValue is _MISSING:
+                continue
+            operationCount = len(redoPatch)
+            if oldValue is _MISSING:
+                redoPatch.append({'op': 'add', 'path': pointer, 'value': newValue})
+                undoPatch.append({'op': 'remove', 'path': pointer})
+            elif newValue is _MISSING:
+                redoPatch.append({'op': 'remove', 'path': pointer})
+                undoPatch.append({'op': 'add', 'path': pointer, 'value': oldValue})
+            else:
+                redoPatch.extend(fh_diff(oldValue, newValue, path=pointer))
+                undoPatch.extend(fh_diff(newValue, oldValue, path=pointer))
+            if len(redoPatch) > operationCount:
+                changedSections[path[0]] = None
+        self.journal.f_record(filename, redoPatch, undoPatch, tuple(changedSections))
+
+    def __fh_applyJournalEntry(self, entry: JournalEntry, patch: str) -> None:
+        self.f_rollback(entry.filename)
+        document = self.__documents.get(entry.filename)
+        if document is None:
+            raise ValueError(f'{entry.filename} is not loaded')
+        try:
+            fh_applyPatch(document, fh_loads(patch))
+        except ValueError:
+            self.journal.f_reset(entry.filename, 'a journal patch did not apply')
+            raise
+        finally:
+            self.__dirty.setdefault(entry.filename, set()).update(entry.sections)
+
+    def f_undo(self) -> Optional[JournalEntry]:
+        """
+        Revert the last committed edit in memory. Costs as much as the edit, not the whole file.
+
+        Returns:
+            Optional[JournalEntry]: The reverted edit, None if there is nothing to undo.
+
+        Raises:
+            ValueError: If the edit cannot be reverted, the history of its file is dropped.
+        """
+        with self.__lock:
+            entry = self.journal.f_undo() if self.journal is not None else None
+            if entry is not None:
+                self.__fh_applyJournalEntry(entry, entry.undoPatch)
+            return entry
+
+    def f_redo(self) -> Optional[JournalEntry]:
+        """
+        Repeat the last undone edit in memory.
+
+        Returns:
+            Optional[JournalEntry]: The repeated edit, None if there is nothing to redo.
+
+        Raises:
+            ValueError: If the edit cannot be repeated, the history of its file is dropped.
+        """
+        with self.__lock:
+            entry = self.journal.f_redo() if self.journal is not None else None
+            if entry is not None:
+                self.__fh_applyJournalEntry(entry, entry.redoPatch)
+            return entry
+
+    def f_rollback(self, filename: Optional[str] = None) -> None:
+        """
+        Undo uncommitted edits of checked out sections.
+
+        Args:
+            filename (Optional[str]): The save file, None rolls back every file.
+        """
+        with self.__lock:
+            filenames = list(self.__checkouts) if filename is None else [filename]
+            for name in filenames:
+                document = self.__documents.get(name)
+                # Restore in reverse order so the oldest copy of a section wins.
+                for path, value in reversed(self.__checkouts.pop(name, [])):
+                    container, key = self.__fh_resolve(document, path) if document is not None else (None, None)
+                    if container is None:
+                        continue
+                    if value is _MISSING:
+                        container.pop(key, None)
+                    else:
+                        container[key] = value
+
+    def f_adopt(self, filename: str, data: Dict[str, Any]) -> None:
+        """
+        Take over data that was just written to or fetched into the file, it is not dirty.
+
+        Args:
+            filename (str): The save file.
+            data (Dict[str, Any]): The data now stored in the file.
+        """
+        with self.__lock:
+            self.__checkouts.pop(filename, None)
+            self.__dirty.pop(filename, None)
+            self.__documents[filename] = data
+            if self.journal is not None:
+                self.journal.f_reset(filename, 'the file was replaced')
+
+    def f_discard(self, filename: str) -> None:
+        """
+        Forget a file including unsaved changes, it is parsed again on next use.
+
+        Args:
+            filename (str): The save file.
+        """
+        with self.__lock:
+            self.__checkouts.pop(filename, None)
+            self.__dirty.pop(filename, None)
+            self.__documents.pop(filename, None)
+            if self.journal is not None:
+                self.journal.f_reset(filename, 'the file was discarded')
+
+    def f_writeAside(self, filename: str, suffix: str = '.unsaved') -> Optional[str]:
+        """
+        Write the live data of a dirty file next to it instead, e.g. slot_1.unsaved.json. The file
+        itself is not touched and the changes stay unsaved, nothing is validated.
+
+        Args:
+            filename (str): The save file.
+            suffix (str): Inserted before the extension.
+
+        Returns:
+            Optional[str]: The path written, None if the file has no unsaved changes.
+        """
+        with self.__lock:
+            self.f_rollback(filename)
+            if filename not in self.__dirty:
+                return None
+            stem, extension = os.path.splitext(filename)
+            path = self.__fh_path(stem + suffix + extension)
+            fh_writeJSONAtomic(path, self.__documents[filename], compact=self.compact)
+            return path
+
+    def f_dirtySections(self, filename: str) -> FrozenSet[str]:
+        """
+        Get the top level sections changed since the last flush.
+
+        Args:
+            filename (str): The save file.
+
+        Returns:
+            FrozenSet[str]: The dirty sections, WHOLE_DOCUMENT if the document was replaced.
+        """
+        with self.__lock:
+            return frozenset(self.__dirty.get(filename, ()))
+
+    def f_isDirty(self, filename: Optional[str] = None) -> bool:
+        """
+        Check for unsaved changes.
+
+        Args:
+            filename (Optional[str]): The save file, None checks every file.
+
+        Returns:
+            bool: True if there are unsaved changes.
+        """
+        with self.__lock:
+            return bool(self.__dirty) if filename is None else filename in self.__dirty
+
+    def f_dirtyFiles(self) -> List[str]:
+        """
+        Get the files with unsaved changes.
+
+        Returns:
+            List[str]: The files, in the order they were first changed.
+        """
+        with self.__lock:
+            return list(self.__dirty)
+
+    def f_diff(self, filename: str, baseline: Optional[Dict[str, Any]] = None) -> Patch:
+        """
+        Compute the changes of the live data as JSON Patch (RFC 6902).
+
+        Without a baseline the live data is compared against the file on disk, which is always the
+        last flushed state. Only the dirty sections are compared, a clean file has no changes and is
+        not read at all. Uncommitted edits are rolled back first and never part of the diff.
+
+        Args:
+            filename (str): The save file.
+            baseline (Optional[Dict[str, Any]]): Data to compare against instead, e.g. a parsed backup.
+
+        Returns:
+            Patch: The operations turning the baseline into the live data.
+
+        Usage Example:
+            >>> store.f_diff('trainer.json')
+            [{'op': 'replace', 'path': '/voucherCounts/0', 'value': 300}]
+        """
+        with self.__lock:
+            self.f_rollback(filename)
+            if baseline is not None:
+                return fh_diff(baseline, self.__fh_load(filename))
+
+            dirty = self.__dirty.get(filename)
+            if not dirty:
+                return []
+            try:
+                baseline = fh_load(self.__fh_path(filename))
+            except FileNotFoundError:
+                baseline = {}
+            sections = () if WHOLE_DOCUMENT in dirty else sorted(dirty)
+            return fh_diff(baseline, self.__documents[filename], sections)
+
+    def f_validate(self, filename: str, full: bool = False) -> List[ValidationIssue]:
+        """
+        Validate the live data against the save schema of the file.
+
+        Only the dirty sections are checked, a clean file has no issues. Values that are just as
+        invalid in the file on disk are not reported, they come from the game and not from an edit.
+        Files without a schema always pass. Uncommitted edits are rolled back first.
+
+        Args:
+            filename (str): The save file.
+            full (bool): Check the whole document, dirty or not, including values the game wrote.
+
+        Returns:
+            List[ValidationIssue]: The issues with their JSON Pointer, empty if the data is valid.
+
+        Usage Example:
+            >>> store.f_validate('trainer.json')
+            [ValidationIssue(path='/dexData/25/ivs/3', message='expected an integer from 0 to 31, got 32')]
+        """
+        schema = fh_getSaveSchema(filename)
+        with self.__lock:
+            self.f_rollback(filename)
+            dirty = self.__dirty.get(filename)
+            if schema is None or not (dirty or full):
+                return []
+            sections = None if full or WHOLE_DOCUMENT in dirty else sorted(dirty)
+            issues = schema.f_validate(self.__fh_load(filename), sections)
+            if issues and not full:
+                issues = self.__fh_newIssues(filename, schema, sections, issues)
+            return issues
+
+    def __fh_newIssues(self, filename: str, schema: SaveSchema, sections: Optional[List[str]],
+                       issues: List[ValidationIssue]) -> List[ValidationIssue]:
+        # Values that are already invalid in the file on disk were written by the game, not by an
+        # edit: the annotation does not match the game's data there. They do not block a flush.
+        try:
+            unmodified = fh_load(self.__fh_path(filename))
+        except (OSError, ValueError):
+            return issues
+        known = {issue.path for issue in schema.f_validate(unmodified, sections)}
+        return [issue for issue in issues if issue.path not in known]
+
+    def f_flush(self, filename: Optional[str] = None, validate: bool = True) -> List[str]:
+        """
+        Write dirty files back to disk. Uncommitted edits are rolled back and never written.
+
+        Every file is validated before the first one is written, so a flush writes all files or none.
+
+        Args:
+            filename (Optional[str]): The save file, None flushes every dirty file.
+            validate (bool): Validate the dirty sections first, False writes invalid data as well.
+
+        Returns:
+            List[str]: The files written.
+
+        Raises:
+            SaveValidationError: If a file has issues, nothing was written.
+        """
+        with self.__lock:
+            self.f_rollback(filename)
+            filenames = list(self.__dirty) if filename is None else [filename] if filename in self.__dirty else []
+            if validate:
+                for name in filenames:
+                    issues = self.f_validate(name)
+                    if issues:
+                        raise SaveValidationError(name, issues)
+            for name in filenames:
+                fh_writeJSONAtomic(self.__fh_path(name), self.__documents[name], compact=self.compact)
+                self.writeCount += 1
+                del self.__dirty[name]
+            return filenames
@@ -0,0 +1,361 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides a columnar, NumPy backed view of the dexData and starterData sections of trainer.json.
+
+Every entry of a section becomes one row of a structured array, every attribute one column. Bulk edits
+like "set all IVs to 31" or "unlock all natures" are then a single array operation instead of a loop
+of dictionary merges.
+
+The round trip back to JSON is lossless:
+- Entry order, key order and every key that is not a column (e.g. moveset) are kept as they were.
+- A value is only taken into its column if it is a plain integer that fits into int64. Anything else
+  (missing keys, null, floats, huge numbers) stays untouched in the entry unless a column update
+  explicitly overwrites it. A per column presence mask tracks which cells hold real values.
+- A column is only read from the entries when it is first accessed. Columns that are overwritten as a
+  whole are never read at all.
+- Entries that are not objects are passed through unchanged and never updated.
+
+Modules:
+- numpy: Provides the structured arrays and the vectorized column updates.
+- utilities.jsonBackend: Parses and serializes trainer.json with the fastest installed JSON library.
+- itertools: Flattens the IV lists for the type check of the fast load path.
+- typing: Provides type hints for better code clarity and type checking.
+
+Usage Example:
+    >>> from modules.data.trainerArrays import TrainerArrays
+    >>> arrays = TrainerArrays(trainerData)
+    >>> arrays.dex.f_setColumn('ivs', 31)
+    >>> arrays.dex.f_setColumn('natureAttr', natureData.UNLOCK_ALL.value)
+    >>> trainerData = arrays.f_toTrainerData()       # New dictionaries
+    >>> arrays.f_applyToTrainerData()                   # Or: edit the loaded entries in place
+"""
+
+from itertools import chain
+# Flattens the IV lists for the type check of the fast load path.
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+# Provides type hints for better code clarity and type checking.
+
+import numpy as np
+# Provides the structured arrays and the vectorized column updates.
+
+from utilities.jsonBackend import fh_dumps, fh_loads
+# Parses and serializes trainer.json with the fastest installed JSON library.
+
+IV_COUNT: int = 6
+
+# Column name -> number of values per row (1 for scalars).
+DEX_COLUMNS: Dict[str, int] = {
+    'seenAttr': 1,
+    'caughtAttr': 1,
+    'natureAttr': 1,
+    'seenCount': 1,
+    'caughtCount': 1,
+    'hatchedCount': 1,
+    'ivs': IV_COUNT,
+}
+
+STARTER_COLUMNS: Dict[str, int] = {
+    'eggMoves': 1,
+    'candyCount': 1,
+    'friendship': 1,
+    'abilityAttr': 1,
+    'passiveAttr': 1,
+    'valueReduction': 1,
+    'classicWinCount': 1,
+}
+
+_INT64_MIN: int = int(np.iinfo(np.int64).min)
+_INT64_MAX: int = int(np.iinfo(np.int64).max)
+
+def fh_isColumnInt(value: Any) -> bool:
+    """
+    Check whether a JSON value can be stored in an int64 column without losing information.
+
+    Args:
+        value (Any): The JSON value.
+
+    Returns:
+        bool: True for plain integers (not bools) inside the int64 range.
+    """
+    return type(value) is int and _INT64_MIN <= value <= _INT64_MAX
+
+def fh_keyToID(key: str) -> int:
+    # Entry keys are species IDs, anything else gets -1 and can only be selected as part of all rows.
+    try:
+        return int(key)
+    except ValueError:
+        return -1
+
+class SectionArrays:
+    """
+    One section of trainer.json (dexData or starterData) as a structured array.
+
+    Attributes:
+        keys (List[str]): The entry keys in their original order, e.g. ['1', '2', ...].
+        ids (np.ndarray): The keys as int64, -1 for keys that are no integer.
+        data (np.ndarray): Structured array with one field per column, reads all columns not read yet.
+        present (np.ndarray): Structured bool array, True where `data` holds the entry's value.
+        isEntry (np.ndarray): False for rows whose entry is not an object.
+    """
+    def __init__(self, section: Dict[str, Any], columns: Dict[str, int]) -> None:
+        """
+        Prepare a section for column access. The columns are read from the entries on first access.
+
+        Args:
+            section (Dict[str, Any]): The section from trainer.json, key -> entry.
+            columns (Dict[str, int]): Column name -> number of values per row.
+        """
+        self.columns: Dict[str, int] = dict(columns)
+        self.keys: List[str] = list(section.keys())
+        self.__entries: List[Any] = list(section.values())
+        self.__changed: Dict[str, None] = {}
+
+        rowCount = len(self.keys)
+        self.ids: np.ndarray = np.array([fh_keyToID(key) for key in self.keys], dtype=np.int64)
+        self.isEntry: np.ndarray = np.array([isinstance(entry, dict) for entry in self.__entries], dtype=bool)
+
+        dataType = [(name, np.int64) if width == 1 else (name, np.int64, (width,)) for name, width in self.columns.items()]
+        self.__data: np.ndarray = np.zeros(rowCount, dtype=dataType)
+        self.__present: np.ndarray = np.zeros(rowCount, dtype=[(name, bool) for name in self.columns])
+        self.__loaded: Dict[str, None] = {}
+
+    @property
+    def data(self) -> np.ndarray:
+        for name in self.columns:
+            self.__fh_loadColumn(name)
+        return self.__data
+
+    @property
+    def present(self) -> np.ndarray:
+        for name in self.columns:
+            self.__fh_loadColumn(name)
+        return self.__present
+
+    def __fh_loadColumn(self, name: str) -> None:
+        if name in self.__loaded:
+            return
+        values, present = self.__fh_extractColumn(name, self.columns[name])
+        self.__data[name] = values
+        self.__present[name] = present
+        self.__loaded[name] = None
+
+    def __fh_extractColumn(self, name: str, width: int) -> Tuple[Any, Any]:
+        raw = [entry.get(name) if isinstance(entry, dict) else None for entry in self.__entries]
+
+        # Fast path: every cell is a plain integer (list), converted by numpy in one go.
+        if width == 1:
+            cells = raw
+        elif all(type(value) is list and len(value) == width for value in raw):
+            cells = list(chain.from_iterable(raw))
+        else:
+            cells = None
+        if cells is not None and all(type(cell) is int for cell in cells):
+            try:
+                return np.array(raw, dtype=np.int64).reshape((len(raw),) if width == 1 else (len(raw), width)), True
+            except OverflowError:
+                pass
+
+        empty = 0 if width == 1 else [0] * width
+        values: List[Any] = []
+        present: List[bool] = []
+        for value in raw:
+            if width == 1:
+                valid = fh_isColumnInt(value)
+            else:
+                valid = type(value) is list and len(value) == width and all(fh_isColumnInt(item) for item in value)
+            values.append(value if valid else empty)
+            present.append(valid)
+        return values, present
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def f_column(self, name: str) -> np.ndarray:
+        """
+        Get a column, read from the entries on first access. Cells whose `present` flag is False hold 0
+        and must not be interpreted.
+
+        Args:
+            name (str): The column name, e.g. 'caughtAttr'.
+
+        Returns:
+            np.ndarray: A view into the column, shape (rows,) or (rows, width).
+        """
+        if name not in self.columns:
+            raise KeyError(f'Unknown column {name!r}')
+        self.__fh_loadColumn(name)
+        return self.__data[name]
+
+    def f_rowMask(self, keys: Optional[Sequence[Union[str, int]]] = None) -> np.ndarray:
+        """
+        Get a boolean row mask for the given entry keys.
+
+        Args:
+            keys (Optional[Sequence[Union[str, int]]]): The keys to select, None selects every row.
+
+        Returns:
+            np.ndarray: Boolean mask over the rows.
+        """
+        if keys is None:
+            return self.isEntry.copy()
+        wanted = np.array([int(key) for key in keys], dtype=np.int64)
+        return np.isin(self.ids, wanted) & self.isEntry
+
+    def f_setColumn(self, name: str, value: Any, rows: Optional[np.ndarray] = None) -> None:
+        """
+        Set a column for all or the selected rows in one vectorized operation. If every entry is set
+        the old values are never read.
+
+        Args:
+            name (str): The column name.
+            value (Any): A scalar, or an array broadcastable to the selected cells.
+            rows (Optional[np.ndarray]): Boolean row mask, None updates every entry.
+
+        Raises:
+            KeyError: If the column does not exist.
+
+        Usage Example:
+            >>> arrays.dex.f_setColumn('ivs', 31)
+            >>> arrays.starters.f_setColumn('passiveAttr', 3, rows=~noPassiveMask)
+        """
+        if name not in self.columns:
+            raise KeyError(f'Unknown column {name!r}')
+        if rows is None:
+            rows = self.isEntry
+            self.__loaded[name] = None
+        else:
+            rows = np.asarray(rows, dtype=bool) & self.isEntry
+            self.__fh_loadColumn(name)
+        self.__data[name][rows] = value
+        self.__present[name][rows] = True
+        self.__changed[name] = None
+
+    def f_applyToEntries(self) -> None:
+        """
+        Write the columns changed by f_setColumn into the loaded entries in place.
+
+        Only the changed columns are written and only where a cell holds a value, unchanged columns and
+        keys that are no column are not touched. No dictionaries are rebuilt.
+        """
+        names = list(self.__changed)
+        if not names:
+            return
+        rowValues = zip(*(self.__data[name].tolist() for name in names))
+        complete = np.logical_and.reduce([self.__present[name] for name in names]).tolist()
+        presentRows = zip(*(self.__present[name].tolist() for name in names))
+        for entry, values, isComplete, present in zip(self.__entries, rowValues, complete, presentRows):
+            if not isinstance(entry, dict):
+                continue
+            if isComplete:
+                entry.update(zip(names, values))
+            else:
+                entry.update((name, value) for name, value, isPresent in zip(names, values, present) if isPresent)
+        self.__changed.clear()
+
+    def f_toSection(self) -> Dict[str, Any]:
+        """
+        Convert the rows back into the section layout of trainer.json.
+
+        Returns:
+            Dict[str, Any]: key -> entry, new dictionaries, the loaded section is not modified.
+        """
+        names = list(self.columns)
+        data, presentMask = self.data, self.present
+        rowValues = zip(*(data[name].tolist() for name in names))
+        presentRows = zip(*(presentMask[name].tolist() for name in names))
+        # Rows where every column holds a value take the fast path of a single update.
+        complete = np.logical_and.reduce([presentMask[name] for name in names]).tolist()
+
+        section: Dict[str, Any] = {}
+        for key, entry, values, isComplete, present in zip(self.keys, self.__entries, rowValues, complete, presentRows):
+            if not isinstance(entry, dict):
+                section[key] = entry
+                continue
+            rebuilt = dict(entry)
+            if isComplete:
+                rebuilt.update(zip(names, values))
+            else:
+                rebuilt.update((name, value) for name, value, isPresent in zip(names, values, present) if isPresent)
+            section[key] = rebuilt
+        return section
+
+class TrainerArrays:
+    """
+    Columnar view of the dexData and starterData sections of a trainer.json.
+
+    Attributes:
+        dex (SectionArrays): The dexData section.
+        starters (SectionArrays): The starterData section.
+    """
+    def __init__(self, trainerData: Dict[str, Any]) -> None:
+        """
+        Load the bulk sections of the trainer data into arrays.
+
+        Args:
+            trainerData (Dict[str, Any]): The parsed trainer.json.
+        """
+        self.__trainerData: Dict[str, Any] = trainerData
+        self.dex: SectionArrays = SectionArrays(trainerData.get('dexData') or {}, DEX_COLUMNS)
+        self.starters: SectionArrays = SectionArrays(trainerData.get('starterData') or {}, STARTER_COLUMNS)
+
+    @classmethod
+    def fh_fromJSON(cls, text: Union[str, bytes]) -> 'TrainerArrays':
+        """
+        Load from the JSON text of a trainer.json.
+
+        Args:
+            text (Union[str, bytes]): The JSON document.
+
+        Returns:
+            TrainerArrays: The loaded arrays.
+        """
+        return cls(fh_loads(text))
+
+    def f_toTrainerData(self) -> Dict[str, Any]:
+        """
+        Convert back into the trainer.json layout.
+
+        Sections that were absent or null in the loaded data stay as they were.
+
+        Returns:
+            Dict[str, Any]: A new dictionary, all other sections are shared with the loaded data.
+        """
+        trainerData = dict(self.__trainerData)
+        for sectionKey, section in (('dexData', self.dex), ('starterData', self.starters)):
+            if isinstance(trainerData.get(sectionKey), dict):
+                trainerData[sectionKey] = section.f_toSection()
+        return trainerData
+
+    def f_applyToTrainerData(self) -> Dict[str, Any]:
+        """
+        Write the changed columns back into the loaded trainer data in place.
+
+        Cheaper than f_toTrainerData() when the loaded data is the working copy anyway, see
+        SectionArrays.f_applyToEntries().
+
+        Returns:
+            Dict[str, Any]: The loaded trainer data.
+        """
+        self.dex.f_applyToEntries()
+        self.starters.f_applyToEntries()
+        return self.__trainerData
+
+    def f_toJSON(self, indent: Optional[int] = None, compact: bool = False) -> str:
+        """
+        Serialize back into JSON text, identical to json.dumps.
+
+        Args:
+            indent (Optional[int]): Indentation, e.g. 4 for the save files.
+            compact (bool): No spaces after separators. Ignored if indent is given.
+
+        Returns:
+            str: The JSON document.
+        """
+        return fh_dumps(self.f_toTrainerData(), indent=indent, compact=compact)
@@ -7,10 +7,95 @@
 
 from modules.handler import OperationCancel, OperationSoftCancel
 from enum import Enum
+from utilities.catalog import Catalog, CatalogMember
 from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter
+from prompt_toolkit.completion import Completer, Completion
 from utilities import cFormatter, Color
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
+from bisect import bisect_left
+from weakref import WeakKeyDictionary
+
+
+class PrefixCompleter(Completer):
+    """
+    Case-insensitive prefix completer over a sorted key list.
+
+    Unlike WordCompleter, which tests every word on every keystroke, the matching range is found
+    with a binary search, so completion stays fast with thousands of candidates.
+    """
+    def __init__(self, keys: List[str]) -> None:
+        self.keys: List[str] = sorted(keys)
+
+    def get_completions(self, document, complete_event) -> Iterator[Completion]:
+        typed = document.text_before_cursor.lstrip()
+        prefix = typed.lower()
+        position = bisect_left(self.keys, prefix)
+        while position < len(self.keys) and self.keys[position].startswith(prefix):
+            yield Completion(self.keys[position], start_position=-len(typed))
+            position += 1
+
+
+class CompletionIndex:
+    """
+    Prebuilt lookup and completer for one set of choices.
+
+    Attributes:
+        lookup (Dict[str, Any]): Lowercase key, name or ID -> choice value, for O(1) resolution.
+        completer (PrefixCompleter): The completer offering all keys.
+    """
+    def __init__(self, choices: Dict[str, Any], lookup: Optional[Dict[str, Any]] = None) -> None:
+        if lookup is None:
+            lookup = {}
+            for key, value in choices.items():
+                lookup.setdefault(str(key).lower(), value)
+            # Enum or Catalog members can also be typed by name or ID, even if the choices do not list them that way.
+            for value in choices.values():
+                if isinstance(value, (Enum, CatalogMember)):
+                    lookup.setdefault(value.name.lower(), value)
+                    lookup.setdefault(str(value.value), value)
+        self.choices: Dict[str, Any] = choices
+        self.lookup: Dict[str, Any] = lookup
+        self.completer: PrefixCompleter = PrefixCompleter([str(key).lower() for key in choices.keys()])
+
+    def fh_resolve(self, userInput: str) -> Optional[Any]:
+        """
+        Resolve typed input to a choice value in O(1).
+
+        Args:
+            userInput (str): The stripped user input.
+
+        Returns:
+            Optional[Any]: The matching value or None.
+        """
+        if userInput in self.choices:
+            return self.choices[userInput]
+        inputValue = userInput.lower()
+        if inputValue.isdigit():
+            # Accept IDs with leading zeros, e.g. '025'
+            inputValue = str(int(inputValue))
+        return self.lookup.get(inputValue)
+
+# One index per Catalog for the whole session, dropped together with the Catalog.
+__completionIndexes: 'WeakKeyDictionary[Catalog, CompletionIndex]' = WeakKeyDictionary()
+
+def fh_getCompletionIndex(choices: Union[Catalog, Dict[str, Any]]) -> CompletionIndex:
+    """
+    Get the completion index for a Catalog (cached for the session) or a plain dictionary (built on demand).
+
+    Args:
+        choices (Union[Catalog, Dict[str, Any]]): The choices.
+
+    Returns:
+        CompletionIndex: The index.
+    """
+    if isinstance(choices, Catalog):
+        index = __completionIndexes.get(choices)
+        if index is None:
+            # Catalog.choices already holds every lowercase name and ID, it doubles as the lookup.
+            index = CompletionIndex(choices.choices, lookup=choices.choices)
+            __completionIndexes[choices] = index
+        return index
+    return CompletionIndex(choices)
 
 
 @staticmethod
@@ -114,15 +199,18 @@ def fh_getIntegerInput(promptMessage: str, minBound: int, maxBound: int, zeroCan
         cFormatter.print(Color.INFO, f'Invalid input: "{userInput}" - must be between {minBound} - {maxBound}')
 
 @staticmethod
-def fh_getCompleterInput(promptMessage: str, choices: dict, zeroCancel: bool = False, softCancel: bool = False, allowSkip: bool = False) -> str:
+def fh_getCompleterInput(promptMessage: str, choices: Union[Catalog, dict], zeroCancel: bool = False, softCancel: bool = False, allowSkip: bool = False) -> str:
     """
     Args:
     - prompt_message (str): The prompt message to display.
-    - choices (dict): A dictionary mapping input choices to their corresponding values.
+    - choices (Union[Catalog, dict]): A Catalog, offering its members by lowercase name and ID,
+      or a dictionary mapping input choices to their corresponding values.
     - zeroCancel (bool): If True, allow raise cancellation with '0' interrupting the operation and save.
     - softCancel (bool): If True, allow soft cancellation with '0' interrupting the operation but allow saving.
 
     Helper method to get input from the user with auto-completion support.
+    The prefix index and completer of a Catalog are built once per session, completion runs off the
+    input thread and typed names or IDs are resolved in O(1).
 
     Raises:
     - OperationSoftCancel()
@@ -137,39 +225,24 @@ def fh_getCompleterInput(promptMessage: str, choices: dict, zeroCancel: bool = F
     if zeroCancel or softCancel:
         fullPrompt = f'{promptMessage} (0: Cancel): '
 
-    # Create a WordCompleter from the keys of choices dictionary
-    completer = WordCompleter(choices.keys(), ignore_case=True)
+    completionIndex = fh_getCompletionIndex(choices)
 
     while True:
-        try:
-            userInput = prompt(fullPrompt, completer=completer).strip()  # Ensure prompt is the correct callable
+        userInput = prompt(fullPrompt, completer=completionIndex.completer, complete_in_thread=True).strip()  # Ensure prompt is the correct callable
 
-            if userInput.lower() == 'exit' or userInput.lower() == 'cancel' or userInput == '':
+        if userInput.lower() == 'exit' or userInput.lower() == 'cancel' or userInput == '':
+            raise OperationCancel()
+        if userInput == '0':
+            if softCancel:
+                raise OperationSoftCancel()
+            if zeroCancel:
                 raise OperationCancel()
-            if userInput == '0':
-                if softCancel:
-                    raise OperationSoftCancel()
-                if zeroCancel:
-                    raise OperationCancel()
-            if allowSkip and userInput.lower() == 'skip':
-                return 'skip'
-            
-            ## Validate the input
-            if userInput in choices:
-                return choices[userInput]
-
-            # Ensure inputValue is a string
-            inputValue = str(userInput).strip().lower()
-            enumMember: Optional[Enum] = None
-            if inputValue.isdigit():
-                # Input is an ID
-                enumMember = next((member for member in choices.values() if isinstance(member, Enum) and member.value == int(inputValue)))
-            else:
-                # Input is a name
-                enumMember = next((member for member in choices.values() if isinstance(member, Enum) and member.name() == inputValue))
-
-            if enumMember is not None:
-                return enumMember
-        # only except that here, this indicates invalid input for choicecompleter
-        except StopIteration:
-            cFormatter.print(Color.INFO, 'Invalid input.')
+        if allowSkip and userInput.lower() == 'skip':
+            return 'skip'
+
+        ## Validate the input, by key, lowercase name or ID
+        enumMember = completionIndex.fh_resolve(userInput)
+        if enumMember is not None:
+            return enumMember
+
+        cFormatter.print(Color.INFO, 'Invalid input.')
@@ -8,8 +8,7 @@
 
 # Unlike the other code, reusing this in your own project is forbidden.
 
-import json
-from utilities import cFormatter, Color
+from utilities import cFormatter, Color, fh_writeJSONAtomic, fh_load
 from colorama import Fore, Style
 from enum import Enum
 from dataclasses import dataclass, field
@@ -182,11 +181,13 @@ class ModifierType(Enum):
     
 @dec_handleOperationExceptions
 class ModifierEditor:
-    def __init__(self, speciesNameByIDHelper, moveNamesByIDHelper, natureNamesByIDHelper, slot=1):
+    def __init__(self, speciesNameByIDHelper, moveNamesByIDHelper, natureNamesByIDHelper, slot=1, saveStore=None):
         self.menuItems = self.m_createItemMenu()
         self.notifyMessage = None
 
         self.slot = slot
+        # The session's SaveStore, slot files are then edited in memory and saved from the Main Menu.
+        self.saveStore = saveStore
 
         self.slotData = self.__fh_loadJSON(f'slot_{self.slot}.json')
         if self.slotData["gameMode"] == 3:
@@ -246,15 +247,18 @@ class ModifierEditor:
             chunk.append(((modifier.customName, f'{modifierDescription} - (Max. {modifier.maxStack})'), modType))
         return chunk
 
-    @staticmethod
-    def __fh_loadJSON(file_path):
-        with open(file_path, 'r') as file:
-            return json.load(file)
-
-    @staticmethod
-    def __fh_saveJSON(data, file_path):
-        with open(file_path, 'w') as file:
-            json.dump(data, file, indent=4)
+    def __fh_loadJSON(self, file_path):
+        if self.saveStore is not None:
+            return self.saveStore.f_checkout(file_path, 'modifiers')
+        return fh_load(file_path)
+
+    def __fh_saveJSON(self, data, file_path):
+        if self.saveStore is not None:
+            self.saveStore.f_commit(file_path, data, 'modifiers')
+            # Keep the following edits revertable as well.
+            self.saveStore.f_checkout(file_path, 'modifiers')
+            return
+        fh_writeJSONAtomic(file_path, data)
 
     @staticmethod
     def __fh_ensureModifiersBlock(data, typeId, typePregenArgs, pokeId):
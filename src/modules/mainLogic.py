@@ -15,16 +15,15 @@ Functionality:
 - Implements HTTP requests and Selenium WebDriver for API interactions.
 
 Modules:
-- json: Provides support for parsing JSON data.
+- json: Quotes the values of the generated XMLHttpRequest script.
+- utilities.jsonBackend: Parses and serializes save data with the fastest installed JSON library.
 - random: Generates random numbers, used for various utilities.
 - os: Provides functions for interacting with the operating system, used for file operations.
-- shutil: Offers high-level operations on files and directories, used for file management.
 - brotli: Compression library (unused in this script).
 - time: Provides time-related functions, used for timing operations.
 - typing: Supports type hints for Python code.
 - logging: Offers logging capabilities for tracking events and errors.
 - colorama.Style: Part of colorama library for terminal text styling.
-- re: Provides support for regular expressions, used for text matching.
 - datetime: Supports date and time manipulation.
 - requests: Simplifies making HTTP requests.
 - prompt_toolkit: Provides utilities for building interactive command line applications.
@@ -54,11 +53,9 @@ Modules/Librarys used and for what purpose exactly in each function:
 - json: Parsing and serializing JSON data for API responses.
 - random: Generating random numbers for various utilities.
 - os: Interfacing with the operating system for file and directory operations.
-- shutil: Managing file operations such as copying and deleting files.
 - time: Handling timing operations and delays in script execution.
 - logging: Logging events and errors during script execution.
 - colorama.Style: Styling terminal output for improved readability.
-- re: Utilizing regular expressions for text processing and matching.
 - datetime: Manipulating dates and times for timestamping and scheduling operations.
 - requests: Making HTTP requests to interact with the PokeRogue API.
 - prompt_toolkit: Building interactive command-line interfaces for user interactions.
@@ -68,16 +65,15 @@ Modules/Librarys used and for what purpose exactly in each function:
 import json
 import random
 import os
-import shutil
+import atexit
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from time import sleep
 import logging
 from datetime import datetime
 from requests.exceptions import SSLError, ConnectionError, Timeout
 import requests
 from sys import exit
-import re
 
 #import zstandard as zstd
 from colorama import Style, Fore
@@ -85,12 +81,24 @@ from modules.handler import dec_handleOperationExceptions, OperationError, Opera
 from modules.handler import dec_handleHTTPExceptions, HTTPEmptyResponse  # noqa: F401
 from modules.handler import fh_getIntegerInput, fh_getCompleterInput, fh_getChoiceInput
 from modules import fh_handleErrorResponse, HeaderGenerator, config
+from modules.profiler import fh_profilePhase, dec_profilePhase
 from utilities import EnumLoader, cFormatter, Color, Limiter, eggLogic, format, fh_appendMessageBuffer, fh_redundantMesage
-from utilities import Generator
+from utilities import Generator, fh_writeJSONAtomic, fh_loads, fh_dumps, JSONDecodeError
 generator = Generator()
-generator.generate()
+# The worker processes of verify-backups use the catalogs the main process generated.
+if not config.workerProcess:
+    with fh_profilePhase('Generator.generate'):
+        generator.generate()
 
 from modules.data import dataParser  # noqa: E402
+from modules.data.saveStore import SaveStore  # noqa: E402
+from modules.data.saveDiff import Patch, fh_summarizePatch  # noqa: E402
+from modules.data.editJournal import EditJournal  # noqa: E402
+from modules.data.saveSchema import SaveValidationError  # noqa: E402
+from modules.data.backupStore import BackupStore  # noqa: E402
+from modules.data.backupRetention import BackupCompactor  # noqa: E402
+from modules.data.backupWriter import BackupWriter  # noqa: E402
+from modules.data.backupVerifier import f_verifyBackups, INDEX, ORPHANED  # noqa: E402
 
 limiter = Limiter()
 logger = logging.getLogger(__name__)
@@ -117,6 +125,10 @@ class Rogue:
     UPDATE_ALL_URL = 'https://api.pokerogue.net/savedata/updateall'
     LOGOUT_URL = 'https://api.pokerogue.net/account/logout'
 
+    # The instance whose unsaved changes are saved on exit, see __fh_registerExitFlush().
+    __exitInstance: Optional['Rogue'] = None
+
+    @dec_profilePhase('Rogue.__init__')
     def __init__(self, session: requests.Session, authToken: str, clientSessionId: str = None, 
                  driver: dict = None, useScripts: Optional[bool] = None, editOffline: bool=False) -> None:
         """
@@ -160,16 +172,31 @@ class Rogue:
 
         self.backupDirectory = config.backupDirectory
         self.dataDirectory = config.dataDirectory
-
-        (self.starterNameById, self.biomeNamesById, self.moveNamesById, self.vouchersData, self.natureData, 
-            self.natureSlotData, self.achievementsData, self.speciesNameByID, self.noPassiveIDs, self.hasFormsIDs, self.eggTypesData) = self.appData.f_convertToEnums()
+        # Backups are stored as manifests of deduplicated, compressed sections.
+        self.backupStore = BackupStore(self.backupDirectory)
+        # Backups are written on a background thread, login does not wait for them.
+        self.backupWriter = BackupWriter(self.backupStore)
+
+        with fh_profilePhase('EnumLoader.f_convertToEnums'):
+            (self.starterNameById, self.biomeNamesById, self.moveNamesById, self.vouchersData, self.natureData, 
+                self.natureSlotData, self.achievementsData, self.speciesNameByID, self.noPassiveIDs, self.hasFormsIDs, self.eggTypesData) = self.appData.f_convertToEnums()
         self.editOffline = editOffline
 
-        self.speciesNameByIDHelper = {str(member.value): member.name for member in self.appData.speciesNameByID}
-        self.moveNamesByIDHelper = {str(member.value): member.name for member in self.moveNamesById}
-        self.natureNamesByIDHelper = {str(member.value): member.name for member in self.natureSlotData}
-          
+        # Shared id -> name maps of the catalog indexes, no per-instance copies.
+        self.speciesNameByIDHelper = self.speciesNameByID.nameByID
+        self.moveNamesByIDHelper = self.moveNamesById.nameByID
+        self.natureNamesByIDHelper = self.natureSlotData.nameByID
+
+        # trainer.json and the slot files are parsed once and only written on save, upload or exit.
+        self.saveStore = SaveStore(compact=config.compactWorkingCopies, journal=EditJournal(config.journalDirectory))
+        self.__fh_registerExitFlush()
+
         self.__fh_dumpDataOnEntry()
+        # Journal files are named after the trainer, known once the data was loaded.
+        self.saveStore.journal.trainerId = self.trainerId
+        # Expired backups are removed on a low priority thread, the menu does not wait for it.
+        self.backupCompactor = BackupCompactor(self.backupStore)
+        self.backupCompactor.f_start()
 
 
     
@@ -375,11 +402,12 @@ class Rogue:
                         # but they reverted it, lets keep it so we know already
                         # decompressed_data = self.__decompress_zstd(response)
                         # data = json.loads(decompressed_data)
-                        data = json.loads(response)
-                        self.__fh_writeJSONData(data, 'trainer.json', False)
+                        data = fh_loads(response)
+                        self.__fh_writeJSONData(data, 'trainer.json', False, compact=config.compactWorkingCopies)
+                        self.saveStore.f_adopt('trainer.json', data)
                         cFormatter.print(Color.GREEN, 'Successfully fetched trainer data.')
                         return data
-                    except json.JSONDecodeError as e:
+                    except JSONDecodeError as e:
                         cFormatter.print(Color.WARNING, f'Error decoding JSON: {e}', isLogging=True)
                         cFormatter.print(Color.WARNING, f'Unexpected response format: {response}', isLogging=True)
                 else:
@@ -392,10 +420,11 @@ class Rogue:
                 response.raise_for_status()
                 if response.content:  # Check if the response content is not empty
                     cFormatter.print(Color.GREEN, 'Successfully fetched trainer data.')
-                    data = response.json()
+                    data = fh_loads(response.content)
                     self.trainerId = data.get('trainerId')
                     self.secretId = data.get('secretId')
-                    self.__fh_writeJSONData(data, 'trainer.json', False)
+                    self.__fh_writeJSONData(data, 'trainer.json', False, compact=config.compactWorkingCopies)
+                    self.saveStore.f_adopt('trainer.json', data)
                     return data
                 else:
                     return fh_handleErrorResponse(response)
@@ -440,12 +469,13 @@ class Rogue:
                         # but they reverted it, lets keep it so we know already
                         #decompressed_data = self.__decompress_zstd(response)
                         #data = json.loads(decompressed_data)
-                        data = json.loads(response)
-                        self.__fh_writeJSONData(data, f'slot_{slot}.json', False)
+                        data = fh_loads(response)
+                        self.__fh_writeJSONData(data, f'slot_{slot}.json', False, compact=config.compactWorkingCopies)
+                        self.saveStore.f_adopt(f'slot_{slot}.json', data)
                         self.slot = slot
                         cFormatter.print(Color.GREEN, f'Successfully fetched data for slot {self.slot}.')
                         return data
-                    except json.JSONDecodeError as e:
+                    except JSONDecodeError as e:
                         cFormatter.print(Color.WARNING, f'Error decoding JSON: {e}', isLogging=True)
                         cFormatter.print(Color.WARNING, f'Unexpected response format: {response}', isLogging=True)
             except Exception as e:
@@ -456,8 +486,9 @@ class Rogue:
                 response.raise_for_status()
                 if response.content:  # Check if the response content is not empty
                     cFormatter.print(Color.GREEN, f'Successfully fetched data for slot {self.slot}.')
-                    data = response.json()
-                    self.__fh_writeJSONData(data, f'slot_{slot}.json', False)
+                    data = fh_loads(response.content)
+                    self.__fh_writeJSONData(data, f'slot_{slot}.json', False, compact=config.compactWorkingCopies)
+                    self.saveStore.f_adopt(f'slot_{slot}.json', data)
                     self.slot = slot
                     return data
                 else:
@@ -511,6 +542,9 @@ class Rogue:
         What it does:
         - Creates a backup of gameData and/or slotData to `config.backupDirectory` if online.
         - Creates a backup of existing files (trainer.json and slot_{self.slot}.json) if offline.
+        - Stores the backups in the BackupStore: only sections that changed since any earlier backup are
+          compressed and written, the backup itself is a small manifest.
+        - Returns as soon as a snapshot of the data is queued, the BackupWriter stores it in the background.
         - Uses a timestamped naming convention for backup files:
         - gameData: Checks for a base file and then uses backup prefix if base exists.
         - slotData: Always uses the backup prefix.
@@ -523,13 +557,13 @@ class Rogue:
             instance.f_createBackup(gameData=data, slotData=slot, offline=False)
 
         Output Example: backup_slotData(1_2450)_27.06.2024_06.09.27
-            # Output: backup/backup_gameData({trainerId})_{timestamp}.json
-            # Output: backup/backup_slotData({slot}_{trainerId})_{timestamp}.json
+            # Output: backup/backup_gameData({trainerId})_{timestamp}.manifest.json
+            # Output: backup/backup_slotData({slot}_{trainerId})_{timestamp}.manifest.json
             # Backup created.
 
         Modules/Librarys used and for what purpose exactly in each function:
         - os: For directory creation and file handling operations.
-        - json: For loading JSON data from files.
+        - BackupWriter: For storing the backups deduplicated and compressed, in the background.
         - datetime: For generating timestamps for backup file names.
         """
 
@@ -540,17 +574,20 @@ class Rogue:
             timestamp = datetime.now().strftime('%d.%m.%Y_%H.%M.%S')
             
             if dataType == 'slotData':
-                backupFilename = f'backup_{dataType}({self.slot}_{self.trainerId})_{timestamp}.json'
+                backupName = f'backup_{dataType}({self.slot}_{self.trainerId})_{timestamp}'
             else:
                 baseFilename = f'base_{dataType}({self.trainerId})'
-                if any(f.startswith(baseFilename) for f in os.listdir(self.backupDirectory)):
-                    backupFilename = f'backup_{dataType}({self.trainerId})_{timestamp}.json'
+                # The base backup may still wait in the queue of the writer. It leaves the queue only
+                # once it is indexed, so the queue is checked first.
+                if self.backupWriter.f_isPending(baseFilename + '_') or self.backupStore.index.f_hasBase(self.trainerId, dataType):
+                    backupName = f'backup_{dataType}({self.trainerId})_{timestamp}'
                 else:
-                    backupFilename = baseFilename + f'_{timestamp}.json'
-                
-            backupFilepath = os.path.join(self.backupDirectory, backupFilename)
-            self.__fh_writeJSONData(data, backupFilepath, showSuccess=False)
-            fh_appendMessageBuffer(Color.GREEN, f'Backup created: {backupFilename}')
+                    backupName = baseFilename + f'_{timestamp}'
+
+            try:
+                self.backupWriter.f_submit(backupName, data)
+            except Exception as e:
+                cFormatter.print(Color.CRITICAL, f'Error in function f_createBackup(): {e}', isLogging=True)
 
         if gameData is None:
             gameData = self.__fh_loadDataFromJSON('trainer.json')
@@ -587,92 +624,88 @@ class Rogue:
             # Data restored and timestamp updated.
 
         Modules/Libraries used and for what purpose exactly in each function:
-        - os: For directory listing and file handling operations.
-        - re: For filtering and sorting backup files based on trainer ID patterns.
-        - shutil: For copying files from the backup directory to the target file.
+        - os: For building the path of the restored file.
+        - BackupIndex: For listing the backups of the trainer, base backups first.
+        - BackupStore: For reading the backup, stored as sections or as a full copy of an older version.
+        - utilities.fh_writeJSONAtomic: For atomically replacing the target file with the backup.
         - datetime: For generating timestamps and updating timestamps in the target file.
         """
-        backupDirectory = config.backupDirectory
-        files = os.listdir(backupDirectory)
+        selected = self.__fh_selectBackup('Do you want to restore game data or slot data?', 'What file do you want to restore?')
+        if selected is None:
+            return
+        chosenFilepath, outputFilename = selected
 
-        # Prompt the user to choose between restoring slot data or game data
-        choices = {
-            '1': 'Restore game data',
-            '2': 'Restore slot data'
-        }
-        userChoice = fh_getChoiceInput("Do you want to restore game data or slot data?", choices, renderMenu=True, zeroCancel=True)
-        
-        if userChoice == '1':
-            pattern = re.compile(rf'gameData\({self.trainerId}\)')
-        elif userChoice == '2':
-            pattern = re.compile(rf'slotData\(\d+_{self.trainerId}\)')
-
-        # Filter and sort base and backup files separately
-        baseFiles = sorted([f for f in files if f.startswith('base_') and pattern.search(f)])
-        backupFiles = sorted(
-            [f for f in files if f.startswith('backup_') and pattern.search(f)],
-            key=lambda f: datetime.strptime(re.search(r'\d{2}\.\d{2}\.\d{4}_\d{2}\.\d{2}\.\d{2}', f).group(), '%d.%m.%Y_%H.%M.%S')
-        )
+        # The backup directory lives next to the working files
+        parentDirectory = os.path.abspath(os.path.join(config.backupDirectory, os.pardir))
+        outputFilepath = os.path.join(parentDirectory, outputFilename)
 
-        # Combine base and backup files with base files on top
-        displayFiles = baseFiles + backupFiles
+        # Read the chosen backup, reassembled from its stored sections
+        data = self.backupStore.f_load(chosenFilepath)
 
-        if not displayFiles:
-            cFormatter.print(Color.WARNING, 'No backup files found for your trainer ID.')
-            return
+        # Update the timestamp
+        curTimestamp = int(datetime.now().timestamp() * 1000)
+        data["timestamp"] = curTimestamp
+        # Only trainer.json has gameStats, a slot file is restored as it is.
+        if outputFilename == 'trainer.json':
+            currentData = self.__fh_loadDataFromJSON('trainer.json')
+            currentPlaytime = currentData.get('gameStats', {}).get('playTime', 0)  # Default to 0 if playTime doesn't exist
+            data.setdefault("gameStats", {})["playTime"] = currentPlaytime
 
-        # Display sorted list with numbers
-        for idx, file in enumerate(displayFiles, 1):
-            sidenote = '        <- Created on first edit' if file.startswith('base_') else ''
-            print(f'{idx}: {file} {sidenote}')
+        # Replace the target in one step, a crash never leaves a half restored save behind
+        fh_writeJSONAtomic(outputFilepath, data, compact=config.compactWorkingCopies)
+        # The restored file replaces the in-memory copy, including unsaved changes.
+        self.saveStore.f_adopt(outputFilename, data)
 
-        # Getting user's choice
-        while True:
-            choice = int(fh_getIntegerInput(
-                'What file do you want to restore?', 1, len(displayFiles),
-                zeroCancel=True
-            ))
-            chosenFile = displayFiles[choice - 1]
-            chosenFilepath = os.path.join(backupDirectory, chosenFile)
-
-            # Determine the output filepath
-            parentDirectory = os.path.abspath(os.path.join(backupDirectory, os.pardir))
-
-            # Determine if the chosen file is for slot data or game data
-            if 'slotData' in chosenFile:
-                matchSlot = re.search(r'backup_slotData\((\d+)_', chosenFile)
-                if matchSlot:
-                    dynSlot = matchSlot.group(1)
-                    outputFilename = f'slot_{dynSlot}.json'
-                else:
-                    cFormatter.print(Color.CRITICAL, 'Error: Slot number not found in filename.', isLogging=True)
-                    return
-            else:
-                outputFilename = 'trainer.json'
+        cFormatter.print(Color.GREEN, 'Data restored and timestamp updated.')
 
-            outputFilepath = os.path.join(parentDirectory, outputFilename)
+    def __fh_selectBackup(self, typePrompt: str, filePrompt: str) -> Optional[Tuple[str, str]]:
+        """
+        Let the user pick a backup of the current trainer.
 
-            currentData = self.__fh_loadDataFromJSON('trainer.json')
-            currentPlaytime = currentData.get('gameStats', {}).get('playTime', 0)  # Default to 0 if playTime doesn't exist
+        Lists the base backups first, then all other backups sorted by their timestamp. The list comes
+        from the backup index, the directory is not scanned.
 
-            # Copy the chosen file to the output filepath
-            shutil.copyfile(chosenFilepath, outputFilepath)
+        Args:
+            typePrompt (str): The question choosing between game data and slot data backups.
+            filePrompt (str): The question choosing the backup file.
 
-            # Read the restored file
-            with open(outputFilepath, 'r') as file:
-                data = json.load(file)
+        Returns:
+            Optional[Tuple[str, str]]: The path of the backup and the working file it belongs to
+            ('trainer.json' or 'slot_{slot}.json'), None if there is no backup.
 
-            # Update the timestamp
-            curTimestamp = int(datetime.now().timestamp() * 1000)
-            data["timestamp"] = curTimestamp
-            data["gameStats"]["playTime"] = currentPlaytime
+        Raises:
+            OperationCancel: If the user cancels.
+        """
+        backupDirectory = config.backupDirectory
+
+        # Prompt the user to choose between game data and slot data
+        choices = {
+            '1': 'Game data',
+            '2': 'Slot data'
+        }
+        userChoice = fh_getChoiceInput(typePrompt, choices, renderMenu=True, zeroCancel=True)
 
-            # Write the updated data back to the file
-            with open(outputFilepath, 'w') as file:
-                json.dump(data, file, indent=4)
+        # Backups still queued are written first, so they can be chosen too.
+        self.backupWriter.f_flush()
+        # Base backups on top, then all other backups by their timestamp
+        records = self.backupStore.index.f_list(self.trainerId, 'gameData' if userChoice == '1' else 'slotData')
+
+        if not records:
+            cFormatter.print(Color.WARNING, 'No backup files found for your trainer ID.')
+            return None
+
+        # Display sorted list with numbers
+        for idx, record in enumerate(records, 1):
+            sidenote = '        <- Created on first edit' if record.base else ''
+            print(f'{idx}: {record.filename} {sidenote}')
 
-            cFormatter.print(Color.GREEN, 'Data restored and timestamp updated.')
-            break
+        choice = int(fh_getIntegerInput(filePrompt, 1, len(records), zeroCancel=True))
+        chosen = records[choice - 1]
+
+        # Determine if the chosen file is for slot data or game data
+        outputFilename = f'slot_{chosen.slot}.json' if chosen.type == 'slotData' else 'trainer.json'
+
+        return os.path.join(backupDirectory, chosen.filename), outputFilename
 
     # TODO IMPORTANT: Simplify
     @limiter.lockout
@@ -695,18 +728,26 @@ class Rogue:
 
         Modules/Librarys used and for what purpose exactly in each function:
         - os: For checking file existence and handling file operations.
-        - json: For loading JSON data from `trainer.json` and `slot_{slot}.json`.
+        - SaveStore: Saves unsaved changes and provides the data of `trainer.json` and `slot_{slot}.json`.
         - random: For generating random sleep intervals.
         - requests: For making HTTP requests to the provided URL.
         """
 
         url = self.UPDATE_ALL_URL
 
+        # Unsaved changes are written first, the upload always matches the local files.
+        self.__fh_printUnsavedChanges()
+        try:
+            self.saveStore.f_flush()
+        except SaveValidationError as e:
+            self.__fh_printValidationIssues(e)
+            cFormatter.print(Color.CRITICAL, 'Nothing was uploaded, fix the values above or undo the edit first.', isLogging=True)
+            return
+
         if "trainer.json" not in os.listdir():
             cFormatter.print(Color.INFO, 'trainer.json file not found!')
             return
-        with open('trainer.json', 'r') as f:
-            trainer_data = json.load(f)
+        trainer_data = self.saveStore.f_get('trainer.json')
 
         slot = self.slot
         if slot > 5 or slot < 1:
@@ -717,8 +758,7 @@ class Rogue:
             cFormatter.print(Color.INFO, f'{filename} not found')
             return
 
-        with open(filename, 'r') as f:
-            game_data = json.load(f)
+        game_data = self.saveStore.f_get(filename)
         try:
             cFormatter.print(Color.INFO, 'Trying to update...')
             sleep(random.randint(3, 5))
@@ -730,11 +770,12 @@ class Rogue:
             #raw_payload = {'clientSessionId': self.clientSessionId, 'session': game_data, "sessionSlotId": slot - 1, 'system': trainer_data}
             #payload = self.__compress_zstd(payload)
             if self.useScripts:
-                response = self.fh_makeRequest(url, method='POST', data=json.dumps(payload))
+                response = self.fh_makeRequest(url, method='POST', data=fh_dumps(payload, compact=True))
                 cFormatter.print(Color.INFO, 'With this login-method we cant tell if it worked or not.')
                 cFormatter.print(Color.INFO,'Load your game without cache or in a new private window.')
             else:
-                response = self.session.post(url=url, headers=self.headers, json=payload, verify=config.useCaCert)
+                # Sent in the compact layout of the game's own JSON.stringify, the headers declare it as JSON.
+                response = self.session.post(url=url, headers=self.headers, data=fh_dumps(payload, compact=True), verify=config.useCaCert)
                 response.raise_for_status()
                 fh_handleErrorResponse(response)
             self.f_logout()
@@ -769,7 +810,7 @@ class Rogue:
         :args: None
         :params: None
         """
-        gameData: dict = self.__fh_loadDataFromJSON('trainer.json')
+        gameData: dict = self.__fh_checkoutData('trainer.json', 'dexData', 'starterData')
 
         header = cFormatter.fh_centerText('Unlock All Starter', 55, '-')
         cFormatter.print(Color.DEBUG, header)
@@ -791,101 +832,24 @@ class Rogue:
         costReduce = int(fh_getIntegerInput('How much do you want to reduce the cost? (0 for none)', 0, 20))
         abilityAttr = fh_getChoiceInput('Do you want to unlock all abilities including egg-moves?', choices, zeroCancel=True) == '1'
 
-        noPassives = {member.name: member for member in self.appData.noPassiveIDs}
-        combinedFormIDs = dataParser.fh_getCombinedIDs(includeStarter=True, onlyNormalForms=True)
-
-        # Default template for dexData
-        defaultDexData = {
-            "seenAttr": 0,
-            "caughtAttr": 0,
-            "natureAttr": 0,
-            "seenCount": 0,
-            "caughtCount": 0,
-            "hatchedCount": 0,
-            "ivs": [0, 0, 0, 0, 0, 0]
-        }
-
-        for entry in gameData["dexData"].keys():
-            caughtAttr = 255 if shinyChoice else 253
-            
-            # Check if entry_int (dexId) is in combinedFormIDs
-            if (choice and any(int(entry) == form["speciesID"] for form in combinedFormIDs)):
-                for form in combinedFormIDs:
-                    if int(entry) == form["speciesID"]:
-                        caughtAttr = form["caughtAttr"]
-                        break  # Exit loop once matched
-
-            if not choice:
-                caughtAttr = 255 if shinyChoice else 253
-
-            dexDataToUpdate = {
-                "seenAttr": random.randint(100, 300),
-                "caughtAttr": caughtAttr,
-                "seenCount": random.randint(100, 300),
-                "caughtCount": random.randint(100, 300),
-                "hatchedCount": random.randint(100, 300),
-            }
-            if iv:
-                dexDataToUpdate["ivs"] = [31, 31, 31, 31, 31, 31] if iv else random.sample(range(20, 30), 6)
-            if nature:
-                dexDataToUpdate["natureAttr"] = self.natureData.UNLOCK_ALL.value
-
-            # Ensure full block for dexData
-            fullDexData = {**defaultDexData, **dexDataToUpdate}
-
-            if entry in gameData["dexData"]:
-                gameData["dexData"][entry].update({key: value for key, value in fullDexData.items() if value is not None})
-            else:
-                print(f'Key {entry} not found in gameData["dexData"]. Initializing.')
-                gameData["dexData"][entry] = fullDexData
-
-        # Default template for starterData
-        defaultStarterData = {
-            "moveset": None,
-            "eggMoves": 0,
-            "candyCount": 0,
-            "friendship": 0,
-            "abilityAttr": 1,
-            "passiveAttr": 0,
-            "valueReduction": 0,
-            "classicWinCount": 0
-        }
-        for entry in gameData["starterData"].keys():
-
-            starterDataToUpdate = {
-                "friendship": random.randint(100, 300),
-                "candyCount": random.randint(100, 300),
-            }
-            if abilityAttr:
-                starterDataToUpdate["abilityAttr"] = 7 
-                starterDataToUpdate["eggMoves"] = 15
-
-            if ribbon:
-                starterDataToUpdate["classicWinCount"] = 1 
-
-            if str(entry) in noPassives or not passive:
-                starterDataToUpdate["passiveAttr"] = 0
-    
-            elif passive:
-                starterDataToUpdate["passiveAttr"] = 3
-
-            if costReduce > 0:
-                starterDataToUpdate["valueReduction"] = costReduce
-
-            # Ensure full block for starterData
-            fullStarterData = {**defaultStarterData, **starterDataToUpdate}
+        # Imported here, numpy is only loaded once a bulk edit is actually made.
+        from modules.data.bulkUnlock import UnlockOptions, f_bulkUnlockStarters
 
-            if entry in gameData["starterData"]:
-                gameData["starterData"][entry].update({key: value for key, value in fullStarterData.items() if value is not None})
-            else:
-                cFormatter.print(Color.INFO, f'Key {entry} not found in gameData["starterData"]. Initializing.')
-                gameData["starterData"][entry] = fullStarterData
+        options = UnlockOptions(
+            allForms=choice, shiny=shinyChoice, perfectIVs=iv, allNatures=nature,
+            passive=passive, ribbon=ribbon, costReduction=costReduce, allAbilities=abilityAttr
+        )
+        f_bulkUnlockStarters(
+            gameData, options,
+            noPassiveIDs=[member.name for member in self.appData.noPassiveIDs],
+            natureUnlockValue=self.natureData.UNLOCK_ALL.value
+        )
 
-        # Save changes to JSON file
-        self.__fh_writeJSONData(gameData, 'trainer.json')
+        # Keep the changes, they are written on save, upload or exit
+        self.__fh_commitData(gameData, 'trainer.json', 'dexData', 'starterData')
 
         # Raise success message
-        raise OperationSuccessful('Written changes for all starters.')
+        raise OperationSuccessful('Changed all starters.')
         
     @dec_handleOperationExceptions
     def f_editStarter(self, dexId: Optional[str] = None) -> None:
@@ -923,8 +887,7 @@ class Rogue:
         if not dexId:
             inputValue = fh_getCompleterInput(
                 promptMessage='Write either the ID or the Name of the Species',
-                choices={**{member.name.lower(): member for member in self.appData.starterNameByID}, 
-                        **{str(member.value): member for member in self.appData.starterNameByID}},
+                choices=self.appData.starterNameByID,
                 softCancel=True
             )
             dexId = inputValue.value
@@ -933,6 +896,7 @@ class Rogue:
         if str(dexId) not in gameData["starterData"]:
             cFormatter.print(Color.INFO, f'No Species with ID: {dexId}')
             return
+        self.__fh_checkoutData('trainer.json', ('dexData', str(dexId)), ('starterData', str(dexId)))
 
         changed = False
         changedItems = []
@@ -964,7 +928,7 @@ class Rogue:
         menuDisplay = '\n'.join([f'{index}: {key}' for index, key in optionList.items()])
 
         noPassives = {member.name: member for member in self.appData.noPassiveIDs}
-        combinedFormIDs = dataParser.fh_getCombinedIDs(includeStarter=True, onlyNormalForms=True)
+        caughtAttrBySpecies = dataParser.fh_getCaughtAttrBySpecies(includeStarter=True, onlyNormalForms=True)
 
         self.fh_completerInfo()
         cFormatter.print(Color.INFO, f'Editing {dexName}')
@@ -989,11 +953,8 @@ class Rogue:
                     formChoice = fh_getChoiceInput('Do you want to unlock all forms of the Species? (All forms are Tier 3 shinies)', {'1': 'Yes', '2': 'No'}, zeroCancel=True) == '1'
                     shinyChoice = fh_getChoiceInput('Do you want Tier 3 shinies?', {'1': 'Yes', '2': 'No'}, zeroCancel=True) == '1'
 
-                    if formChoice and any(str(dexId) == str(form["speciesID"]) for form in combinedFormIDs):
-                        for form in combinedFormIDs:
-                            if str(dexId) == str(form["speciesID"]):
-                                caughtAttr = form["caughtAttr"]
-                                break
+                    if formChoice and str(dexId) in caughtAttrBySpecies:
+                        caughtAttr = caughtAttrBySpecies[str(dexId)]
                     else:
                         caughtAttr = 255 if shinyChoice else 253
 
@@ -1028,8 +989,7 @@ class Rogue:
                 elif action == 'Set nature':
                     nature = fh_getCompleterInput(
                         promptMessage='Write either the ID or the Name of the Nature',
-                        choices={**{member.name.lower(): member for member in self.appData.natureData}, 
-                                **{str(member.value): member for member in self.appData.natureData}},
+                        choices=self.appData.natureData,
                         softCancel=True
                     )
                     gameData["dexData"][str(dexId)]["natureAttr"] = nature.value
@@ -1087,11 +1047,11 @@ class Rogue:
                 break
 
         if changed:
-            self.__fh_writeJSONData(gameData, 'trainer.json')
-            cFormatter.print(Color.YELLOW, f'Changes saved for {dexName}:')
+            self.__fh_commitData(gameData, 'trainer.json', 'dexData', 'starterData')
+            cFormatter.print(Color.YELLOW, f'Pending changes for {dexName}:')
             for item in changedItems:
                 cFormatter.print(Color.INFO, item)
-            raise OperationSuccessful('Successfully written all Starter Stats.')
+            raise OperationSuccessful('Successfully changed all Starter Stats.')
         else:
             fh_appendMessageBuffer(Color.YELLOW, 'No changes made.')
 
@@ -1106,7 +1066,7 @@ class Rogue:
         Raises:
         - Exception: If any error occurs during the process due to the decorator.
         - OperationCancel(), OperationSoftCancel(), ValueError() depending on input due to the helper.
-        - OperationSuccessful('Successfully written voucher counts.')
+        - OperationSuccessful('Successfully changed voucher counts.')
             - and prints changed items.
 
         Modules Used:
@@ -1122,7 +1082,7 @@ class Rogue:
             >>> example_instance = ExampleClass()
             >>> example_instance.f_addTicket()
         """
-        gameData = self.__fh_loadDataFromJSON('trainer.json')
+        gameData = self.__fh_checkoutData('trainer.json', 'voucherCounts')
 
         header = cFormatter.fh_centerText('Edit Egg-Tickets', 55, '-')
         cFormatter.print(Color.DEBUG, header)
@@ -1160,11 +1120,11 @@ class Rogue:
             except OperationSoftCancel:
                 break
         if changed:
-            self.__fh_writeJSONData(gameData, 'trainer.json')
-            cFormatter.print(Color.YELLOW, 'Changes saved:')
+            self.__fh_commitData(gameData, 'trainer.json', 'voucherCounts')
+            cFormatter.print(Color.YELLOW, 'Pending changes:')
             for item in changedItems:
                 cFormatter.print(Color.YELLOW, item)
-            raise OperationSuccessful('Successfully written Vouchers.')
+            raise OperationSuccessful('Successfully changed Vouchers.')
         else:
             fh_appendMessageBuffer(Color.YELLOW, 'No changes made.')
 
@@ -1192,7 +1152,7 @@ class Rogue:
         """
         slot = self.slot
         filename = f'slot_{slot}.json'
-        slotData = self.__fh_loadDataFromJSON(filename)
+        slotData = self.__fh_checkoutData(filename, 'party')
 
         if slotData["gameMode"] == 3:
             cFormatter.print(Color.BRIGHT_YELLOW, 'Cannot edit this property on Daily Runs.')
@@ -1247,8 +1207,7 @@ class Rogue:
                     self.fh_completerInfo()
                     inputValue = fh_getCompleterInput(
                         promptMessage='Write either the ID or the Name of the Species',
-                        choices={**{member.name.lower(): member for member in self.appData.speciesNameByID},
-                                **{str(member.value): member for member in self.appData.speciesNameByID}},
+                        choices=self.appData.speciesNameByID,
                         softCancel=True
                     )
                     dexId = inputValue.value
@@ -1363,8 +1322,7 @@ class Rogue:
                     cFormatter.print(Color.GREEN, f'Editing {selectedSpecies["moves"][selectedMoveIndex]} in Slot({selectedMoveIndex+1}) on {selectedSpecies["name"]}') # how to print selected move name
                     newMove = fh_getCompleterInput(
                         promptMessage='Write either the ID or the Name of the Move.',
-                        choices={**{member.name.lower(): member for member in self.appData.movesByID}, 
-                                **{str(member.value): member for member in self.appData.movesByID}},
+                        choices=self.appData.movesByID,
                         softCancel=True
                     )
                     moveId = newMove.value
@@ -1381,8 +1339,7 @@ class Rogue:
                     cFormatter.print(Color.DEBUG, f'Current Nature: {selectedSpecies["nature"]}')
                     natureSlot = fh_getCompleterInput(
                         promptMessage='Write either the ID or the Name of the Nature.',
-                        choices={**{member.name.lower(): member for member in self.appData.natureDataSlots}, 
-                                **{str(member.value): member for member in self.appData.natureDataSlots}},
+                        choices=self.appData.natureDataSlots,
                         softCancel=True
                     )
 
@@ -1408,8 +1365,7 @@ class Rogue:
                     self.fh_completerInfo()
                     inputValue = fh_getCompleterInput(
                         promptMessage='Write either the ID or the Name of the Target Fusion',
-                        choices={**{member.name.lower(): member for member in self.appData.speciesNameByID},
-                                **{str(member.value): member for member in self.appData.speciesNameByID}},
+                        choices=self.appData.speciesNameByID,
                         softCancel=True
                     )
                     fusionID = inputValue.value
@@ -1492,7 +1448,7 @@ class Rogue:
         if changed:
             for item in changedItems:
                 cFormatter.print(Color.INFO, item)
-            self.__fh_writeJSONData(slotData, filename)
+            self.__fh_commitData(slotData, filename, 'party')
             raise OperationSuccessful('PartyEditor succesfully finished.')
         else:
             cFormatter.print(Color.INFO, 'No changes made.')
@@ -1519,7 +1475,7 @@ class Rogue:
             >>> example_instance.unlock_all_gamemodes()
 
         """
-        gameData = self.__fh_loadDataFromJSON('trainer.json')
+        gameData = self.__fh_checkoutData('trainer.json', 'unlocks')
 
         unlockedModes = gameData.get('unlocks', {})
         if not unlockedModes:
@@ -1535,7 +1491,7 @@ class Rogue:
 
 
         if changed:
-            self.__fh_writeJSONData(gameData, 'trainer.json')
+            self.__fh_commitData(gameData, 'trainer.json', 'unlocks')
             raise OperationSuccessful('Unlocked all gamemodes.')
         else:
             cFormatter.print(Color.INFO, 'You already had all gamemodes.')
@@ -1565,7 +1521,7 @@ class Rogue:
             >>> example_instance = ExampleClass()
             >>> example_instance.f_editAchievements()
         """
-        gameData = self.__fh_loadDataFromJSON('trainer.json')
+        gameData = self.__fh_checkoutData('trainer.json', 'achvUnlocks', 'voucherUnlocks')
         achievementsData = self.appData.achievementsData
         keysToUpdate = {member.name: member for member in achievementsData}
         currentAmount = gameData.get('achvUnlocks', {})
@@ -1610,8 +1566,7 @@ class Rogue:
                 try:
                     inputValue = fh_getCompleterInput(
                         promptMessage='What achievement would you like?',
-                        choices={**{member.name.lower(): member for member in achievementsData}, 
-                                **{str(member.value): member for member in achievementsData}},
+                        choices=achievementsData,
                         softCancel=True
                     )
 
@@ -1627,8 +1582,8 @@ class Rogue:
                     break
 
         if changed:
-            self.__fh_writeJSONData(gameData, 'trainer.json', showSuccess=False)
-            cFormatter.print(Color.YELLOW, 'Changes saved:')
+            self.__fh_commitData(gameData, 'trainer.json', 'achvUnlocks', 'voucherUnlocks')
+            cFormatter.print(Color.YELLOW, 'Pending changes:')
             for key, value in changedItems:
                 cFormatter.print(Color.INFO, f'Added {key} with timestamp {value}.')
             raise OperationSuccessful('Successfully updated achievements.')
@@ -1658,7 +1613,7 @@ class Rogue:
             >>> example_instance = ExampleClass()
             >>> example_instance.edit_vouchers()
         """
-        gameData = self.__fh_loadDataFromJSON('trainer.json')
+        gameData = self.__fh_checkoutData('trainer.json', 'voucherUnlocks')
         voucherData = self.appData.voucherData
         keysToUpdate = {member.name: member for member in voucherData}
         currentAmount = gameData.get('voucherUnlocks', {})
@@ -1704,8 +1659,7 @@ class Rogue:
                 try:
                     inputValue = fh_getCompleterInput(
                         promptMessage='What voucher would you like?',
-                        choices={**{member.name.lower(): member for member in voucherData}, 
-                                **{str(member.value): member for member in voucherData}},
+                        choices=voucherData,
                         softCancel=True
                     )
 
@@ -1721,8 +1675,8 @@ class Rogue:
                     break
 
         if changed:
-            self.__fh_writeJSONData(gameData, 'trainer.json', showSuccess=False)
-            cFormatter.print(Color.YELLOW, 'Changes saved:')
+            self.__fh_commitData(gameData, 'trainer.json', 'voucherUnlocks')
+            cFormatter.print(Color.YELLOW, 'Pending changes:')
             for key, value in changedItems:
                 cFormatter.print(Color.INFO, f'Added {key} with timestamp {value}.')
             raise OperationSuccessful('Successfully updated vouchers.  For more information scroll up.')
@@ -1756,7 +1710,7 @@ class Rogue:
             >>> example_instance.f_addCandies('pikachu')
         """
 
-        gameData = self.__fh_loadDataFromJSON('trainer.json')
+        gameData = self.__fh_checkoutData('trainer.json', 'starterData')
 
         header = cFormatter.fh_centerText('Add Candy', 55, '-')
         cFormatter.print(Color.DEBUG, header)
@@ -1770,8 +1724,7 @@ class Rogue:
                 while True:
                     inputValue = fh_getCompleterInput(
                         promptMessage='Write either the ID or the Name of the Species',
-                        choices={**{member.name.lower(): member for member in self.appData.starterNameByID}, 
-                                **{str(member.value): member for member in self.appData.starterNameByID}},
+                        choices=self.appData.starterNameByID,
                         softCancel=True
                     )
                     pokeName = inputValue.name.lower()
@@ -1801,8 +1754,8 @@ class Rogue:
                 break
 
         if changed:
-            self.__fh_writeJSONData(gameData, 'trainer.json')
-            fh_appendMessageBuffer(Color.YELLOW, 'Changes saved:')
+            self.__fh_commitData(gameData, 'trainer.json', 'starterData')
+            fh_appendMessageBuffer(Color.YELLOW, 'Pending changes:')
             for item in changedItems:
                 fh_appendMessageBuffer(Color.INFO, item)
             raise OperationSuccessful('Successfully added candies to Pokémon.')
@@ -1834,9 +1787,10 @@ class Rogue:
         """
 
         # Initialize EnumLoader and load enums
-        gameData = self.__fh_loadDataFromJSON(f'slot_{self.slot}.json')
+        gameData = self.__fh_checkoutData(f'slot_{self.slot}.json', 'arena')
         currentBiomeId = gameData["arena"]["biome"]
-        currentBiomeName = next((member.name for member in self.appData.biomesByID if member.value == currentBiomeId), "Unknown")
+        currentBiome = self.appData.biomesByID.byID(currentBiomeId)
+        currentBiomeName = currentBiome.name if currentBiome else "Unknown"
         biomeData = self.appData.biomesByID
 
         # Prompt user for biome input
@@ -1850,8 +1804,7 @@ class Rogue:
             try:
                 inputValue = fh_getCompleterInput(
                     promptMessage='Choose which Biome you like. You can either type the ID or Name',
-                    choices={**{member.name.lower(): member for member in biomeData}, 
-                            **{str(member.value): member for member in biomeData}},
+                    choices=biomeData,
                     zeroCancel=False
                 )
                 break
@@ -1860,8 +1813,8 @@ class Rogue:
 
 
         # Update game data with the chosen biome ID
-        gameData["arena"]["biome"] = inputValue.value
-        self.__fh_writeJSONData(gameData, f'slot_{self.slot}.json')
+        gameData["arena"]["biome"] = int(inputValue.value)
+        self.__fh_commitData(gameData, f'slot_{self.slot}.json', 'arena')
         raise OperationSuccessful(f'Biome updated from {currentBiomeName} to {inputValue.name}.')
             
     @dec_handleOperationExceptions
@@ -1872,7 +1825,7 @@ class Rogue:
         Raises:
         - Exception: If any error occurs during the process due to the decorator.
         - OperationCancel(), OperationSoftCancel(), ValueError() depending on input due to the helper.
-        - OperationSuccessful('Successfully written Pokeballs.')
+        - OperationSuccessful('Successfully changed Pokeballs.')
             - and prints changed items.
 
         Modules Used:
@@ -1887,7 +1840,7 @@ class Rogue:
             >>> example_instance = ExampleClass()
             >>> example_instance.f_editPokeballs()
         """
-        gameData = self.__fh_loadDataFromJSON(f'slot_{self.slot}.json')
+        gameData = self.__fh_checkoutData(f'slot_{self.slot}.json', 'pokeballCounts')
 
         if gameData.get("gameMode") == 3:
             cFormatter.print(Color.CRITICAL, 'Cannot edit this property on daily runs!')
@@ -1934,11 +1887,11 @@ class Rogue:
                 break
 
         if changed:
-            self.__fh_writeJSONData(gameData, f'slot_{self.slot}.json')
-            fh_appendMessageBuffer(Color.YELLOW, 'Changes saved:')
+            self.__fh_commitData(gameData, f'slot_{self.slot}.json', 'pokeballCounts')
+            fh_appendMessageBuffer(Color.YELLOW, 'Pending changes:')
             for item in changedItems:
                 fh_appendMessageBuffer(Color.INFO, item)
-            raise OperationSuccessful('Successfully written Pokeballs. For more information scroll up.')
+            raise OperationSuccessful('Successfully changed Pokeballs. For more information scroll up.')
         else:
             fh_appendMessageBuffer(Color.YELLOW, 'No changes made.')
 
@@ -1950,7 +1903,7 @@ class Rogue:
         Raises:
         - Exception: If any error occurs during the process due to the decorator.
         - OperationCancel(), OperationSoftCancel(), ValueError() depending on input due to the helper.
-        - OperationSuccessful(f'Written {choice} as money value to to local .json.')
+        - OperationSuccessful(f'Set money to {choice}.')
 
         Modules Used:
         - .cFormatter: For printing formatted messages to the console, including colorized output.
@@ -1964,7 +1917,7 @@ class Rogue:
             >>> example_instance = ExampleClass()
             >>> example_instance.f_editMoney()
         """
-        saveData = self.__fh_loadDataFromJSON(f'slot_{self.slot}.json')
+        saveData = self.__fh_checkoutData(f'slot_{self.slot}.json', 'money')
 
         if saveData["gameMode"] == 3:
             fh_appendMessageBuffer(Color.CRITICAL, 'Cannot edit this property on daily runs!')
@@ -1977,8 +1930,8 @@ class Rogue:
         promptMessage = 'How many Poke-Dollars do you want? '
         choice = fh_getIntegerInput(promptMessage, 0, self.__SAFE_BIG_NUMBER, zeroCancel=True)
         saveData["money"] = int(choice)
-        self.__fh_writeJSONData(saveData, f'slot_{self.slot}.json')
-        raise OperationSuccessful(f'Written {choice} as money value to to local .json.')
+        self.__fh_commitData(saveData, f'slot_{self.slot}.json', 'money')
+        raise OperationSuccessful(f'Set money to {choice}.')
 
     @dec_handleOperationExceptions
     def f_addEggsGenerator(self) -> None:
@@ -2006,7 +1959,7 @@ class Rogue:
             >>> example_instance = ExampleClass()
             >>> example_instance.f_addEggsGenerator()
         """
-        trainerData = self.__fh_loadDataFromJSON('trainer.json')
+        trainerData = self.__fh_checkoutData('trainer.json', 'eggs')
         if 'eggs' not in trainerData or not isinstance(trainerData["eggs"], list):
             trainerData["eggs"] = []
         currentEggs = trainerData.get('eggs', [])
@@ -2050,14 +2003,14 @@ class Rogue:
             variant: int = int(fh_getIntegerInput('Which shiny tier?', 0, 3))
             fh_appendMessageBuffer(Color.INFO, 'If some do not hatch in shiny as entered, they don\'t have those shiny variants as of now.')
 
-        eggDictionary = eggLogic.constructEggs(tier, gachaType, hatchWaves, count, self.appData.eggTypesData, isShiny, variant)
+        eggDictionary = eggLogic.constructEggs(tier, gachaType, hatchWaves, count, isShiny=isShiny, variantTier=variant)
 
         if userInput == '1':
             trainerData["eggs"] = eggDictionary
         elif userInput == '2':
             trainerData["eggs"].extend(eggDictionary)
 
-        self.__fh_writeJSONData(trainerData, 'trainer.json')
+        self.__fh_commitData(trainerData, 'trainer.json', 'eggs')
         raise OperationSuccessful(f'{count} eggs successfully generated.')
 
     @dec_handleOperationExceptions
@@ -2076,7 +2029,7 @@ class Rogue:
         Raises:
         - Exception: If any error occurs during the process due to the decorator.
         - OperationCancel(), OperationSoftCancel(), ValueError() depending on input due to the helper.
-        - OperationSuccessful('Successfully written Account Stats.')
+        - OperationSuccessful('Successfully changed Account Stats.')
             - and prints changed items.
 
         Modules Used:
@@ -2094,7 +2047,7 @@ class Rogue:
             >>> example_instance = ExampleClass()
             >>> example_instance.f_editAccountStats()
         """
-        gameData = self.__fh_loadDataFromJSON('trainer.json')
+        gameData = self.__fh_checkoutData('trainer.json', 'gameStats')
 
         header = cFormatter.fh_centerText(' Edit Account Stats ', 55, '-')
         cFormatter.print(Color.DEBUG, header)
@@ -2197,11 +2150,11 @@ class Rogue:
                     break
 
         if changed:
-            self.__fh_writeJSONData(gameData, 'trainer.json')
-            cFormatter.print(Color.YELLOW, 'Changes saved:')
+            self.__fh_commitData(gameData, 'trainer.json', 'gameStats')
+            cFormatter.print(Color.YELLOW, 'Pending changes:')
             for item in changedItems:
                 cFormatter.print(Color.INFO, item)
-            raise OperationSuccessful('Successfully written Account Stats. For more information scroll up.')
+            raise OperationSuccessful('Successfully changed Account Stats. For more information scroll up.')
         else:
             fh_appendMessageBuffer(Color.YELLOW, 'No changes made.')
 
@@ -2229,7 +2182,7 @@ class Rogue:
             >>> example_instance = ExampleClass()
             >>> example_instance.f_editHatchWaves()
         """
-        trainerData = self.__fh_loadDataFromJSON('trainer.json')
+        trainerData = self.__fh_checkoutData('trainer.json', 'eggs')
 
         header = cFormatter.fh_centerText(' Edit Hatch Durations ', 55, '-')
         cFormatter.print(Color.INFO, header)
@@ -2246,8 +2199,8 @@ class Rogue:
             for egg in trainerData["eggs"]:
                 egg["hatchWaves"] = int(hatchWaves)
 
-            # Write updated trainer_data to 'trainer.json'
-            self.__fh_writeJSONData(trainerData, 'trainer.json')
+            # Keep the updated trainer_data for trainer.json
+            self.__fh_commitData(trainerData, 'trainer.json', 'eggs')
             changed = True
         else:
             fh_appendMessageBuffer(Color.INFO, 'You have no eggs to hatch.')
@@ -2261,7 +2214,7 @@ class Rogue:
     @dec_handleOperationExceptions
     def f_submenuItemEditor(self):
         from modules import ModifierEditor
-        edit = ModifierEditor(self.speciesNameByIDHelper, self.moveNamesByIDHelper, self.natureNamesByIDHelper, int(self.slot))
+        edit = ModifierEditor(self.speciesNameByIDHelper, self.moveNamesByIDHelper, self.natureNamesByIDHelper, int(self.slot), saveStore=self.saveStore)
         edit.m_itemMenuPresent(int(self.slot))
 
     @dec_handleOperationExceptions
@@ -2328,14 +2281,15 @@ class Rogue:
             cFormatter.print(Color.DEBUG, 'You can type either the name or ID. 0 will cancel, but save done changes.')
         cFormatter.print(Color.DEBUG, 'Type `exit` or `cancel` or press STRG+C to cancel without saves.')
 
-    def __fh_writeJSONData(self, data: Dict[str, Any], filename: str, showSuccess: bool = False) -> None:
+    def __fh_writeJSONData(self, data: Dict[str, Any], filename: str, showSuccess: bool = False, compact: bool = False) -> None:
         """
-        Write data to a JSON file.
+        Write data to a JSON file. The file is replaced atomically, a crash never leaves a truncated file.
 
         Args:
             data (Dict[str, Any]): The data to write.
             filename (str): The name of the file.
             showSuccess (bool, optional): Flag to print success message. Defaults to True.
+            compact (bool, optional): Write without indentation. Defaults to False.
 
         Returns:
             None
@@ -2346,14 +2300,13 @@ class Rogue:
             # Written to local data. Do not forget to apply to server when done!
 
         Modules/Librarys used and for what purpose exactly in each function:
-            - json: Used for serializing data into JSON format and writing to a file.
+            - utilities.fh_writeJSONAtomic: Used for serializing data and atomically replacing the file.
             - cFormatter, Color: Used for formatting and printing colored output messages.
         """
         try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=4)
-                if showSuccess:
-                    cFormatter.print(Color.BRIGHT_GREEN, 'Written to local data. Do not forget to apply to server when done!')
+            fh_writeJSONAtomic(filename, data, compact=compact)
+            if showSuccess:
+                cFormatter.print(Color.BRIGHT_GREEN, 'Written to local data. Do not forget to apply to server when done!')
         except Exception as e:
             cFormatter.print(Color.CRITICAL, f'Error in function __write_data(): {e}', isLogging=True)
         
@@ -2361,6 +2314,9 @@ class Rogue:
         """
         Load data from a specified file path.
 
+        trainer.json and the slot files come from the session's SaveStore, they are only parsed once.
+        The returned data is live, edits must be committed with __fh_commitData().
+
         Args:
             file_path (str): Path to the file to be loaded.
 
@@ -2376,15 +2332,254 @@ class Rogue:
             Exception: If any error occurs during the process.
 
         Modules/Librarys used and for what purpose exactly in each function:
-            - json: Used for deserializing data from JSON format.
+            - SaveStore: Provides the parsed data of the session.
             - cFormatter, Color: Used for formatting and printing colored output messages.
         """
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            return self.saveStore.f_get(file_path)
         except Exception as e:
             cFormatter.print(Color.CRITICAL, f'Error in function __load_data(): {e}', isLogging=True)
 
+    def __fh_checkoutData(self, filename: str, *sections) -> Dict[str, Any]:
+        """
+        Load data like __fh_loadDataFromJSON() and remember the sections an operation is going to edit.
+
+        If the operation is cancelled before __fh_commitData(), the edits of these sections are rolled back.
+
+        Args:
+            filename (str): 'trainer.json' or 'slot_{slot}.json'.
+            *sections: Top level keys, or paths to single entries like ('starterData', '25').
+
+        Returns:
+            dict: The live data.
+
+        Example:
+            >>> gameData = self.__fh_checkoutData('trainer.json', 'voucherCounts')
+        """
+        try:
+            return self.saveStore.f_checkout(filename, *sections)
+        except Exception as e:
+            cFormatter.print(Color.CRITICAL, f'Error in function __fh_checkoutData(): {e}', isLogging=True)
+
+    def __fh_commitData(self, data: Dict[str, Any], filename: str, *sections) -> None:
+        """
+        Keep the edits of an operation. They are written on save, upload or exit.
+
+        Args:
+            data (Dict[str, Any]): The edited data.
+            filename (str): 'trainer.json' or 'slot_{slot}.json'.
+            *sections: The top level keys that were changed.
+        """
+        self.saveStore.f_commit(filename, data, *sections)
+        fh_appendMessageBuffer(Color.BRIGHT_GREEN, 'Changes are kept in memory. Save them or apply them to the server when done!')
+
+    @dec_handleOperationExceptions
+    def f_saveChanges(self) -> None:
+        """
+        Write all unsaved changes to trainer.json and the slot files.
+
+        The dirty sections are validated first. If values do not match the save schema they are
+        listed with their JSON Pointer and nothing is written unless the user saves anyway.
+
+        Raises:
+        - OperationSuccessful: With the files written.
+        - OperationCancel: If the data is invalid and the user does not save anyway.
+
+        Usage Example:
+            >>> rogue_instance.f_saveChanges()
+        """
+        self.__fh_printUnsavedChanges()
+        try:
+            written = self.saveStore.f_flush()
+        except SaveValidationError as e:
+            self.__fh_printValidationIssues(e)
+            if fh_getChoiceInput('Save anyway?', {'1': 'Yes', '2': 'No'}, zeroCancel=True) != '1':
+                raise OperationCancel()
+            written = self.saveStore.f_flush(validate=False)
+        if not written:
+            fh_appendMessageBuffer(Color.INFO, 'No unsaved changes.')
+            return
+        raise OperationSuccessful(f'Saved {", ".join(written)}. Do not forget to apply to server when done!')
+
+    @dec_handleOperationExceptions
+    def f_undo(self) -> None:
+        """
+        Revert the last edit in memory. Save or upload afterwards to keep the result.
+
+        Only the changed values are restored, no backup is needed. Fetching data from the server or
+        restoring a backup ends the history of the replaced file.
+
+        Raises:
+        - OperationSuccessful: With a summary of the reverted edit.
+        - OperationError: If the edit could not be reverted.
+
+        Usage Example:
+            >>> rogue_instance.f_undo()
+            # Undid edit in trainer.json: voucherCounts: 4 entries changed
+
+        Modules/Librarys used and for what purpose exactly in each function:
+        - SaveStore: Applies the inverse patch from the edit journal.
+        """
+        try:
+            entry = self.saveStore.f_undo()
+        except ValueError as e:
+            raise OperationError(f'Could not undo the last edit: {e}')
+        if entry is None:
+            fh_appendMessageBuffer(Color.INFO, 'Nothing to undo.')
+            return
+        raise OperationSuccessful(f'Undid edit in {entry.filename}: {"; ".join(entry.summary)}')
+
+    @dec_handleOperationExceptions
+    def f_redo(self) -> None:
+        """
+        Repeat the last undone edit in memory.
+
+        Raises:
+        - OperationSuccessful: With a summary of the repeated edit.
+        - OperationError: If the edit could not be repeated.
+
+        Usage Example:
+            >>> rogue_instance.f_redo()
+            # Redid edit in trainer.json: voucherCounts: 4 entries changed
+
+        Modules/Librarys used and for what purpose exactly in each function:
+        - SaveStore: Applies the patch from the edit journal.
+        """
+        try:
+            entry = self.saveStore.f_redo()
+        except ValueError as e:
+            raise OperationError(f'Could not redo the edit: {e}')
+        if entry is None:
+            fh_appendMessageBuffer(Color.INFO, 'Nothing to redo.')
+            return
+        raise OperationSuccessful(f'Redid edit in {entry.filename}: {"; ".join(entry.summary)}')
+
+    def __fh_printChanges(self, title: str, patch: Patch) -> None:
+        # One line per changed section, e.g. 'dexData: 12 entries changed'.
+        cFormatter.print(Color.INFO, f'{title}:')
+        for line in fh_summarizePatch(patch):
+            cFormatter.print(Color.INFO, f'    {line}')
+
+    def __fh_printValidationIssues(self, error: SaveValidationError, limit: int = 20) -> None:
+        # One line per invalid value with its JSON Pointer, e.g. '/dexData/25/ivs/3: expected ...'.
+        cFormatter.print(Color.CRITICAL, f'{error.filename} has invalid values:', isLogging=True)
+        for issue in error.issues[:limit]:
+            cFormatter.print(Color.CRITICAL, f'    {issue}', isLogging=True)
+        if len(error.issues) > limit:
+            cFormatter.print(Color.CRITICAL, f'    ... and {len(error.issues) - limit} more', isLogging=True)
+
+    def __fh_printUnsavedChanges(self) -> None:
+        # Shown before saving or uploading, only the dirty sections of dirty files are compared.
+        for filename in self.saveStore.f_dirtyFiles():
+            patch = self.saveStore.f_diff(filename)
+            if patch:
+                self.__fh_printChanges(f'Unsaved changes in {filename}', patch)
+
+    @dec_handleOperationExceptions
+    def f_showChanges(self) -> None:
+        """
+        Show what changed, compared to the last saved files or to a backup.
+
+        The changes are computed as JSON Patch (RFC 6902) and summarized per section.
+
+        Raises:
+        - OperationCancel: If the user cancels.
+
+        Usage Example:
+            >>> rogue_instance.f_showChanges()
+            # Unsaved changes in trainer.json:
+            #     dexData: 12 entries changed
+            #     voucherCounts: 4 entries changed
+
+        Modules/Librarys used and for what purpose exactly in each function:
+        - SaveStore: Computes the changes of the live data.
+        - modules.data.saveDiff: Summarizes the changes per section.
+        - BackupStore: Reads the chosen backup.
+        """
+        choices = {
+            '1': 'Unsaved changes',
+            '2': 'Changes since a backup'
+        }
+        userChoice = fh_getChoiceInput('What do you want to compare against?', choices, renderMenu=True, zeroCancel=True)
+
+        if userChoice == '1':
+            if not self.saveStore.f_isDirty():
+                fh_appendMessageBuffer(Color.INFO, 'No unsaved changes.')
+                return
+            self.__fh_printUnsavedChanges()
+            return
+
+        selected = self.__fh_selectBackup('Compare game data or slot data?', 'What backup do you want to compare against?')
+        if selected is None:
+            return
+        backupFilepath, filename = selected
+        patch = self.saveStore.f_diff(filename, self.backupStore.f_load(backupFilepath))
+        if not patch:
+            fh_appendMessageBuffer(Color.INFO, f'{filename} matches {os.path.basename(backupFilepath)}.')
+            return
+        self.__fh_printChanges(f'Changes in {filename} since {os.path.basename(backupFilepath)}', patch)
+
+    @dec_handleOperationExceptions
+    def f_verifyBackups(self) -> None:
+        """
+        Check every backup in the backup directory, also available as `verify-backups` in the menu and
+        as `python main.py --verify-backups` without logging in.
+
+        Every backup is reassembled, compared with its checksum, validated against the save schema and
+        compared with the backup index, spread over all CPUs. Problems are printed as they are found.
+        If the index is outdated or sections are orphaned, the user can rebuild the index and remove them.
+
+        Raises:
+        - OperationCancel: If the user cancels.
+
+        Usage Example:
+            >>> rogue_instance.f_verifyBackups()
+            # 1234/1234 backups checked, 0 problems
+            # 1234 backups checked in 0.9 s, 0 problems
+
+        Modules/Librarys used and for what purpose exactly in each function:
+        - modules.data.backupVerifier: Checks the backups in a process pool.
+        - BackupWriter: Backups still queued are written first.
+        """
+        self.backupWriter.f_flush()
+        report = f_verifyBackups(self.backupStore)
+        if not any(problem.kind in (INDEX, ORPHANED) for problem in report.problems):
+            return
+        if fh_getChoiceInput('Rebuild the backup index and remove orphaned sections?', {'1': 'Yes', '2': 'No'}, zeroCancel=True) != '1':
+            raise OperationCancel()
+        f_verifyBackups(self.backupStore, repair=True)
+
+    def __fh_registerExitFlush(self) -> None:
+        # Only the newest instance saves on exit. An instance replaced by a new login saves its changes
+        # now, on exit it would overwrite the files of the new instance with stale data.
+        previous = Rogue.__exitInstance
+        if previous is not None:
+            atexit.unregister(previous.__fh_flushOnExit)
+            previous.__fh_flushOnExit()
+        Rogue.__exitInstance = self
+        atexit.register(self.__fh_flushOnExit)
+
+    def __fh_flushOnExit(self) -> None:
+        # Registered with atexit, unsaved changes are never lost when the tool is closed.
+        # A file with invalid values is not changed, its edits are written next to it to be fixed later.
+        compactor = getattr(self, 'backupCompactor', None)
+        if compactor is not None:
+            compactor.f_stop()
+        failed = self.backupWriter.f_close()
+        if failed:
+            print(f'Could not write backups {", ".join(failed)}, see the log.')
+        for filename in self.saveStore.f_dirtyFiles():
+            try:
+                try:
+                    if self.saveStore.f_flush(filename):
+                        print(f'Saved unsaved changes to {filename}.')
+                except SaveValidationError as e:
+                    self.__fh_printValidationIssues(e)
+                    path = self.saveStore.f_writeAside(filename)
+                    print(f'{filename} was not changed, its unsaved changes were written to {path}.')
+            except Exception as e:
+                print(f'Could not save unsaved changes to {filename}: {e}')
+
     @dec_handleOperationExceptions
     def f_lb(self):
         gameData: dict = self.__fh_loadDataFromJSON('trainer.json')
@@ -2406,8 +2601,7 @@ class Rogue:
             while True:
                 inputValue = fh_getCompleterInput(
                     promptMessage='Write either the ID or the Name of the Species',
-                    choices={**{member.name.lower(): member for member in self.appData.speciesNameByID},
-                            **{str(member.value): member for member in self.appData.speciesNameByID}},
+                    choices=self.appData.speciesNameByID,
                     softCancel=True
                 )
                 dexId = inputValue.value
@@ -2432,19 +2626,21 @@ class Rogue:
                             if selectedFormName in formChoices:
                                 selectedForm = formChoices[selectedFormName]
                                 caughtAttr = selectedForm.variant3
+                                self.__fh_checkoutData('trainer.json', ('dexData', str(dexId)))
                                 gameData["dexData"][str(dexId)]["caughtAttr"] = caughtAttr
                                 message = f'Changed Species to {dexName.title()} with form {selectedForm.name.title()}.'
                         break
                     else:
                         cFormatter.print(Color.INFO, 'This species has no forms.')
 
-            self.__fh_writeJSONData(gameData, 'trainer.json', showSuccess=False)
+            self.__fh_commitData(gameData, 'trainer.json', 'dexData')
             fh_appendMessageBuffer(Color.INFO, message)
-            cFormatter.print(Color.INFO, 'Changes saved. Easter Egg completed.')
+            cFormatter.print(Color.INFO, 'Changes are pending. Easter Egg completed.')
 
         if action == 'enemyModifier':
+            self.__fh_checkoutData(f'slot_{self.slot}.json', 'enemyModifiers')
             slotData["enemyModifiers"] = None
-            self.__fh_writeJSONData(slotData, f'slot_{self.slot}.json', showSuccess=False)
-            cFormatter.print(Color.INFO, 'Changes saved. Easter Egg completed.')
+            self.__fh_commitData(slotData, f'slot_{self.slot}.json', 'enemyModifiers')
+            cFormatter.print(Color.INFO, 'Changes are pending. Easter Egg completed.')
             fh_appendMessageBuffer(Color.INFO, 'Removed enemy modifiers.')
 
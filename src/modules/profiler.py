@@ -0,0 +1,252 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+Startup and import-time profiling, enabled by starting main.py with `--profile-startup`.
+
+Every profiled phase records its wall time, the memory it allocated and kept (net) and the peak
+it allocated on top of what was in use when it started. Imports of the heavy modules are timed
+through an import hook, the remaining phases are wrapped with fh_profilePhase().
+
+When profiling is disabled fh_profilePhase() returns a no-op context manager, so the
+instrumentation costs nothing in normal runs.
+
+This module only depends on the standard library, it is imported before anything else in the
+modules package so the imports of config, requests and selenium can be measured as well.
+
+Modules:
+- sys: Reads the command line switch and installs the import hook.
+- time: Measures wall time of every phase.
+- tracemalloc: Measures the memory allocated by every phase.
+- contextlib: Provides the phase context manager and decorator.
+- json: Writes the machine-readable report.
+- atexit: Writes the report on exit if startup never finished.
+
+Usage Example:
+    >>> from modules.profiler import fh_profilePhase
+    >>> with fh_profilePhase('Generator.generate'):
+    ...     generator.generate()
+
+Output Example:
+    Phase                                 Kind      Wall ms   Net KiB  Peak KiB
+    import modules.data.dataParser        import     12.41     301.2     355.9
+    ...
+"""
+
+import sys
+import time
+import tracemalloc
+import contextlib
+import json
+import atexit
+import os
+import platform
+from dataclasses import dataclass, asdict, field
+from typing import List, Optional, Iterable
+
+PROFILE_FLAG: str = '--profile-startup'
+
+# Modules whose import time is reported on its own.
+PROFILED_IMPORTS: List[str] = [
+    'requests', 'selenium', 'selenium.webdriver',
+    'modules.config', 'utilities.generator', 'utilities.enumLoader', 'modules.data.dataParser',
+]
+
+enabled: bool = PROFILE_FLAG in sys.argv
+
+@dataclass
+class PhaseRecord:
+    name: str
+    kind: str
+    depth: int
+    seconds: float = 0.0
+    netBytes: int = 0
+    peakBytes: int = 0
+    _startCurrent: int = field(default=0, repr=False)
+    _peak: int = field(default=0, repr=False)
+
+    def toDict(self):
+        return {key: value for key, value in asdict(self).items() if not key.startswith('_')}
+
+class StartupProfiler:
+    """
+    Collects the phase records. Nested phases are allowed, the peak of an inner phase is
+    propagated to the enclosing phase before tracemalloc's peak is reset.
+    """
+    def __init__(self) -> None:
+        self.records: List[PhaseRecord] = []
+        self.reported: bool = False
+        self.__stack: List[PhaseRecord] = []
+
+    def fh_enter(self, name: str, kind: str) -> PhaseRecord:
+        current, peak = tracemalloc.get_traced_memory()
+        if self.__stack:
+            self.__stack[-1]._peak = max(self.__stack[-1]._peak, peak)
+        tracemalloc.reset_peak()
+
+        record = PhaseRecord(name=name, kind=kind, depth=len(self.__stack), _startCurrent=current, _peak=current)
+        record.seconds = time.perf_counter()
+        self.__stack.append(record)
+        self.records.append(record)
+        return record
+
+    def fh_exit(self, record: PhaseRecord) -> None:
+        record.seconds = time.perf_counter() - record.seconds
+        current, peak = tracemalloc.get_traced_memory()
+        record._peak = max(record._peak, peak)
+        record.netBytes = current - record._startCurrent
+        record.peakBytes = record._peak - record._startCurrent
+
+        self.__stack.remove(record)
+        if self.__stack:
+            self.__stack[-1]._peak = max(self.__stack[-1]._peak, record._peak)
+
+profiler = StartupProfiler()
+
+class _Phase(contextlib.ContextDecorator):
+    def __init__(self, name: str, kind: str) -> None:
+        self.name = name
+        self.kind = kind
+        self.__records: List[PhaseRecord] = []
+
+    def __enter__(self) -> '_Phase':
+        self.__records.append(profiler.fh_enter(self.name, self.kind))
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        profiler.fh_exit(self.__records.pop())
+        return False
+
+def fh_profilePhase(name: str, kind: str = 'phase'):
+    """
+    Profile a startup phase as a context manager. Use dec_profilePhase() for functions.
+
+    Args:
+        name (str): The name shown in the report.
+        kind (str): The category shown in the report, 'phase' or 'import'.
+
+    Returns:
+        A context manager recording the phase, or a no-op one if profiling is disabled.
+    """
+    if not enabled:
+        return contextlib.nullcontext()
+    return _Phase(name, kind)
+
+def dec_profilePhase(name: str):
+    """
+    Decorator profiling every call of the decorated function as a startup phase.
+
+    Returns the function unchanged when profiling is disabled.
+
+    Args:
+        name (str): The name shown in the report.
+
+    Usage Example:
+        >>> @dec_profilePhase('Rogue.__init__')
+        ... def __init__(self, ...): ...
+    """
+    def decorator(func):
+        return _Phase(name, 'phase')(func) if enabled else func
+    return decorator
+
+class _ImportTimer:
+    """
+    Meta path finder that times the execution of the listed modules.
+    """
+    def __init__(self, moduleNames: Iterable[str]) -> None:
+        self.moduleNames = set(moduleNames)
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in self.moduleNames:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        if loader is None or not hasattr(loader, 'exec_module'):
+            return spec
+
+        execModule = loader.exec_module
+        def timedExecModule(module):
+            with _Phase(f'import {fullname}', 'import'):
+                execModule(module)
+        loader.exec_module = timedExecModule
+        return spec
+
+def f_formatReport(records: Optional[List[PhaseRecord]] = None) -> List[str]:
+    """
+    Format the recorded phases as a table, sorted by wall time (slowest first).
+
+    Args:
+        records (Optional[List[PhaseRecord]]): The records to format. Defaults to all recorded phases.
+
+    Returns:
+        List[str]: The table lines.
+    """
+    records = profiler.records if records is None else records
+    lines = [f'{"Phase":<44} {"Kind":<7} {"Wall ms":>9} {"Net KiB":>10} {"Peak KiB":>10}']
+    for record in sorted(records, key=lambda record: record.seconds, reverse=True):
+        name = f'{"  " * record.depth}{record.name}'
+        lines.append(f'{name:<44} {record.kind:<7} {record.seconds * 1000:>9.2f} '
+                     f'{record.netBytes / 1024:>10.1f} {record.peakBytes / 1024:>10.1f}')
+    return lines
+
+def f_reportStartup() -> Optional[str]:
+    """
+    Print the startup report and write it as JSON into the logs directory. Only reports once.
+
+    Returns:
+        Optional[str]: The path of the JSON report, None if profiling is disabled or already reported.
+
+    Usage Example:
+        >>> f_reportStartup()
+    """
+    if not enabled or profiler.reported:
+        return None
+    profiler.reported = True
+
+    # Imported here, this module is loaded before config and utilities.
+    from modules import config
+    from utilities import cFormatter, Color
+
+    cFormatter.print(Color.INFO, 'Startup profile (sorted by wall time, nested phases are indented):')
+    for line in f_formatReport():
+        cFormatter.print(Color.INFO, line)
+
+    topLevel = [record for record in profiler.records if record.depth == 0]
+    report = {
+        'version': config.version,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'totalSeconds': sum(record.seconds for record in topLevel),
+        'phases': [record.toDict() for record in sorted(profiler.records, key=lambda record: record.seconds, reverse=True)]
+    }
+    reportPath = os.path.join(config.logsDirectory, f'startupProfile_{time.strftime("%Y%m%d_%H%M%S")}.json')
+    with open(reportPath, 'w') as file:
+        json.dump(report, file, indent=4)
+    cFormatter.print(Color.INFO, f'Startup profile written to {reportPath}')
+    return reportPath
+
+def __fh_reportAtExit() -> None:
+    # Startup never reached the main menu (e.g. interrupted at login), still report what we have.
+    try:
+        f_reportStartup()
+    except Exception as e:
+        print(f'Could not write startup profile: {e}')
+
+if enabled:
+    tracemalloc.start()
+    sys.meta_path.insert(0, _ImportTimer(PROFILED_IMPORTS))
+    atexit.register(__fh_reportAtExit)
@@ -1,15 +1,26 @@
 from .cFormatter import cFormatter, Color, format
 from .logger import CustomLogger, CustomFilter
+from .jsonBackend import fh_loads, fh_load, fh_dumps, JSONDecodeError
+from .atomicWriter import fh_writeAtomic, fh_writeJSONAtomic, fh_replaceAtomic, fh_dumpJSON
+from .catalogStore import CatalogStore, fh_getCatalogStore
 from .enumLoader import EnumLoader
-from .generator import Vouchers, Generator, Nature, NatureSlot, NoPassive
+from .generator import Generator
 from .limiter import Limiter
 from .propagateMessage import messageBuffer, fh_appendMessageBuffer, fh_clearMessageBuffer, fh_printMessageBuffer, fh_redundantMesage
 from . import eggLogic
+from . import catalogs
+
+
+def __getattr__(name):
+    # Catalogs are only imported when they are first accessed, see utilities.catalogs.
+    if name in ('Vouchers', 'Nature', 'NatureSlot', 'NoPassive'):
+        return getattr(catalogs, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 __all__ = [
     'cFormatter', 'Color', 'CustomLogger', 'CustomFilter', 'format',
     'Vouchers', 'Generator', 'Nature', 'NatureSlot', 'NoPassive',
-    'Limiter', 'EnumLoader', 'eggLogic',
+    'Limiter', 'fh_loads', 'fh_load', 'fh_dumps', 'JSONDecodeError', 'fh_writeAtomic', 'fh_writeJSONAtomic', 'fh_replaceAtomic', 'fh_dumpJSON', 'CatalogStore', 'fh_getCatalogStore', 'EnumLoader', 'eggLogic', 'catalogs',
     'messageBuffer', 'fh_appendMessageBuffer', 'fh_clearMessageBuffer', 'fh_printMessageBuffer', 'fh_redundantMesage'
 ]
\ No newline at end of file
@@ -0,0 +1,142 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides crash-safe file writes used for every save, backup and catalog file.
+
+The content is written to a temporary file next to the target, optionally flushed to disk and then
+renamed over the target. A crash or a full disk mid-write leaves the old file untouched instead of
+a truncated save.
+
+JSON is written indented by default. The compact mode drops all whitespace, which makes writing
+large working copies like trainer.json several times faster.
+
+Modules:
+- os: Provides the atomic rename and fsync.
+- utilities.jsonBackend: Serializes the data.
+- threading: Makes temporary file names unique per thread.
+- typing: Provides type hints for better code clarity and type checking.
+- modules.config: Provides the default for fsyncing writes.
+
+Usage Example:
+    >>> from utilities import fh_writeJSONAtomic
+    >>> fh_writeJSONAtomic('trainer.json', trainerData)
+    >>> fh_writeJSONAtomic('slot_1.json', slotData, compact=True)
+"""
+
+import os
+# Provides the atomic rename and fsync.
+
+import threading
+# Makes temporary file names unique per thread.
+
+from typing import Any, Optional, Union
+# Provides type hints for better code clarity and type checking.
+
+from modules import config
+# Provides the default for fsyncing writes.
+
+from utilities.jsonBackend import fh_dumps
+# Serializes the data with the fastest installed JSON library.
+
+def fh_dumpJSON(data: Any, compact: bool = False) -> str:
+    """
+    Serialize data the way every file of this tool is written.
+
+    Args:
+        data (Any): The data to serialize.
+        compact (bool): No indentation and no spaces after separators.
+
+    Returns:
+        str: The JSON text.
+    """
+    return fh_dumps(data, compact=True) if compact else fh_dumps(data, indent=4)
+
+def __fh_syncDirectory(directory: str) -> None:
+    # Persists the rename itself. Directories cannot be opened on Windows, the rename is durable there.
+    if os.name == 'nt':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def fh_writeAtomic(path: str, content: Union[str, bytes], fsync: Optional[bool] = None) -> None:
+    """
+    Replace a file atomically with the given content.
+
+    Args:
+        path (str): The target file.
+        content (Union[str, bytes]): Text is written in text mode like open(path, 'w'), bytes unchanged.
+        fsync (Optional[bool]): Flush to disk before renaming. Defaults to config.fsyncWrites.
+
+    Raises:
+        OSError: If the file cannot be written. The target is left unchanged and no temporary file remains.
+
+    Usage Example:
+        >>> fh_writeAtomic('data/cacert.pem', response.content)
+    """
+    fsync = config.fsyncWrites if fsync is None else fsync
+    directory = os.path.dirname(os.path.abspath(path))
+    tmpPath = os.path.join(directory, f'.{os.path.basename(path)}.{os.getpid()}.{threading.get_ident()}.tmp')
+
+    try:
+        with open(tmpPath, 'xb' if isinstance(content, bytes) else 'x') as file:
+            file.write(content)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmpPath, path)
+    except BaseException:
+        try:
+            os.remove(tmpPath)
+        except OSError:
+            pass
+        raise
+
+    if fsync:
+        __fh_syncDirectory(directory)
+
+def fh_replaceAtomic(tmpPath: str, path: str, fsync: Optional[bool] = None) -> None:
+    """
+    Move a finished temporary file over the target, for files written by other libraries like sqlite3.
+
+    Args:
+        tmpPath (str): The complete temporary file, in the directory of the target.
+        path (str): The target file.
+        fsync (Optional[bool]): Flush the temporary file to disk before renaming. Defaults to config.fsyncWrites.
+
+    Usage Example:
+        >>> fh_replaceAtomic('data/catalog.db.tmp', 'data/catalog.db')
+    """
+    fsync = config.fsyncWrites if fsync is None else fsync
+    if fsync:
+        # Opened for writing, Windows cannot flush a read-only handle.
+        fd = os.open(tmpPath, os.O_RDWR)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    os.replace(tmpPath, path)
+    if fsync:
+        __fh_syncDirectory(os.path.dirname(os.path.abspath(path)))
+
+def fh_writeJSONAtomic(path: str, data: Any, compact: bool = False, fsync: Optional[bool] = None) -> None:
+    """
+    Serialize data and replace a JSON file atomically.
+
+    Args:
+        path (str): The target file.
+        data (Any): The data to write.
+        compact (bool): No indentation, for working copies that are not edited by hand.
+        fsync (Optional[bool]): Flush to disk before renaming. Defaults to config.fsyncWrites.
+
+    Usage Example:
+        >>> fh_writeJSONAtomic('trainer.json', trainerData, compact=config.compactWorkingCopies)
+    """
+    fh_writeAtomic(path, fh_dumpJSON(data, compact), fsync)
@@ -0,0 +1,241 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+This script provides a lightweight, frozen lookup table replacing the Enum classes EnumLoader used to build at runtime.
+
+Building an Enum class with ~1000 members is slow and every member is a full object with its own
+__dict__. A Catalog keeps the names and values in parallel tuples, members are plain named tuples
+and name->member and value->member lookups are O(1) dictionaries.
+
+The public surface mirrors what the code used from the Enums:
+- iterating yields members with `.name` and `.value`, duplicate values are aliases and skipped like in an Enum
+- `catalog.NAME` and `catalog['NAME']` return a member by name
+- `catalog(value)` returns the member for a value
+- `len(catalog)` counts the members that iteration yields
+
+Every catalog is also the single bidirectional index for its data, shared by all modules through
+CatalogStore.f_getIndex(). Next to name -> member and value -> member it provides, built lazily on
+first use:
+- `nameByID`: str(value) -> name, the mapping the former *ByIDHelper dicts held
+- `byID()`: member by ID, accepting both int and str IDs
+- `byLowerName()`: case-insensitive lookup by name
+- `choices`: lowercase name and str(ID) -> member, the input for fh_getCompleterInput
+- `displayName()`: the human readable name, e.g. 'mr_mime' -> 'Mr Mime'
+Names are interned, so the catalogs and every dictionary built from them share one string object per name.
+
+Modules:
+- typing: Provides type hints and the NamedTuple used for members.
+- sys: Interns the member names.
+
+Usage Example:
+    >>> from utilities.catalog import Catalog
+    >>> moves = Catalog('MovesEnum', {'NONE': 0, 'POUND': 1})
+    >>> moves.POUND.value
+    1
+    >>> moves(1).name
+    'POUND'
+"""
+
+import sys
+from typing import Any, Dict, Iterator, Mapping, NamedTuple, Optional, Tuple, Union
+
+class CatalogMember(NamedTuple):
+    """
+    A single catalog entry, compatible with the `.name`/`.value` access of an Enum member.
+    """
+    name: str
+    value: Any
+
+class Catalog:
+    """
+    Frozen lookup table with O(1) access by name and by value.
+
+    Attributes:
+        names (Tuple[str, ...]): All names, including aliases, in definition order.
+        values (Tuple[Any, ...]): The values parallel to `names`.
+    """
+    __slots__ = ('_catalogName', 'names', 'values', '_members', '_byName', '_byValue',
+                 '_nameByID', '_byLowerName', '_choices', '__weakref__')
+
+    def __init__(self, catalogName: str, data: Mapping[str, Any]) -> None:
+        """
+        Initialize the Catalog.
+
+        Args:
+            catalogName (str): Name used in the repr, e.g. 'MovesEnum'.
+            data (Mapping[str, Any]): The entries, name -> value.
+        """
+        names = tuple(sys.intern(name) for name in data.keys())
+        values = tuple(data.values())
+        members = []
+        byName: Dict[str, CatalogMember] = {}
+        byValue: Dict[Any, CatalogMember] = {}
+
+        for name, value in zip(names, values):
+            member = CatalogMember(name, value)
+            try:
+                canonical = byValue.setdefault(value, member)
+            except TypeError:
+                # Unhashable values (e.g. the dicts in eggTypes) cannot be looked up by value.
+                canonical = member
+            if canonical is member:
+                members.append(member)
+            # Like Enum aliases, a duplicate value resolves to the first member with that value.
+            byName[name] = canonical
+
+        object.__setattr__(self, '_catalogName', catalogName)
+        object.__setattr__(self, 'names', names)
+        object.__setattr__(self, 'values', values)
+        object.__setattr__(self, '_members', tuple(members))
+        object.__setattr__(self, '_byName', byName)
+        object.__setattr__(self, '_byValue', byValue)
+        object.__setattr__(self, '_nameByID', None)
+        object.__setattr__(self, '_byLowerName', None)
+        object.__setattr__(self, '_choices', None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self._catalogName} is read-only')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{self._catalogName} is read-only')
+
+    def __getattr__(self, name: str) -> CatalogMember:
+        # Only called when no slot matched, i.e. for member names like UNLOCK_ALL.
+        if name.startswith('__'):
+            raise AttributeError(name)
+        try:
+            return object.__getattribute__(self, '_byName')[name]
+        except KeyError:
+            raise AttributeError(f'{object.__getattribute__(self, "_catalogName")} has no member {name!r}') from None
+
+    def __getitem__(self, name: str) -> CatalogMember:
+        return self._byName[name]
+
+    def __call__(self, value: Any) -> CatalogMember:
+        try:
+            return self._byValue[value]
+        except (KeyError, TypeError):
+            raise ValueError(f'{value!r} is not a valid {self._catalogName}') from None
+
+    def __iter__(self) -> Iterator[CatalogMember]:
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, item: Any) -> bool:
+        if isinstance(item, CatalogMember):
+            return self._byName.get(item.name) == item
+        return item in self._byName
+
+    def __repr__(self) -> str:
+        return f'<Catalog {self._catalogName!r} ({len(self._members)} members)>'
+
+    @property
+    def __members__(self) -> Mapping[str, CatalogMember]:
+        return self._byName
+
+    def byName(self, name: str, default: Optional[CatalogMember] = None) -> Optional[CatalogMember]:
+        """
+        Get a member by name.
+
+        Args:
+            name (str): The member name.
+            default (Optional[CatalogMember]): Returned if the name does not exist.
+
+        Returns:
+            Optional[CatalogMember]: The member or the default.
+        """
+        return self._byName.get(name, default)
+
+    def byValue(self, value: Any, default: Optional[CatalogMember] = None) -> Optional[CatalogMember]:
+        """
+        Get a member by value.
+
+        Args:
+            value (Any): The member value.
+            default (Optional[CatalogMember]): Returned if no member has this value.
+
+        Returns:
+            Optional[CatalogMember]: The member or the default.
+        """
+        try:
+            return self._byValue.get(value, default)
+        except TypeError:
+            return default
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over all (name, value) pairs, including aliases, in definition order.
+        """
+        return zip(self.names, self.values)
+
+    @property
+    def nameByID(self) -> Dict[str, str]:
+        """
+        str(value) -> name of every member, e.g. {'25': 'pikachu'}. Shared, must not be modified.
+        """
+        if self._nameByID is None:
+            object.__setattr__(self, '_nameByID', {str(member.value): member.name for member in self._members})
+        return self._nameByID
+
+    def byID(self, memberID: Union[int, str], default: Optional[CatalogMember] = None) -> Optional[CatalogMember]:
+        """
+        Get a member by its ID, no matter whether the ID is given as int or str.
+
+        Args:
+            memberID (Union[int, str]): The member ID, e.g. 25 or '25'.
+            default (Optional[CatalogMember]): Returned if no member has this ID.
+
+        Returns:
+            Optional[CatalogMember]: The member or the default.
+        """
+        name = self.nameByID.get(str(memberID))
+        return default if name is None else self._byName[name]
+
+    def byLowerName(self, name: str, default: Optional[CatalogMember] = None) -> Optional[CatalogMember]:
+        """
+        Get a member by name, ignoring case.
+
+        Args:
+            name (str): The member name in any case.
+            default (Optional[CatalogMember]): Returned if the name does not exist.
+
+        Returns:
+            Optional[CatalogMember]: The member or the default.
+        """
+        if self._byLowerName is None:
+            object.__setattr__(self, '_byLowerName', {member.name.lower(): member for member in self._members})
+        return self._byLowerName.get(name.lower(), default)
+
+    @property
+    def choices(self) -> Dict[str, CatalogMember]:
+        """
+        Lowercase name and str(ID) -> member, as expected by fh_getCompleterInput. Shared, must not be modified.
+        """
+        if self._choices is None:
+            choices = {member.name.lower(): member for member in self._members}
+            choices.update((str(member.value), member) for member in self._members)
+            object.__setattr__(self, '_choices', choices)
+        return self._choices
+
+    @staticmethod
+    def displayName(name: Union[str, CatalogMember]) -> str:
+        """
+        Get the human readable name of a member.
+
+        Args:
+            name (Union[str, CatalogMember]): The member or its name.
+
+        Returns:
+            str: The display name, e.g. 'Mr Mime' for 'mr_mime'.
+        """
+        if isinstance(name, CatalogMember):
+            name = name.name
+        return sys.intern(name.replace('_', ' ').title())
@@ -0,0 +1,322 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+This script provides a single compiled catalog store shared by every consumer of the game catalogs.
+
+The generated JSON catalogs are compiled once into one SQLite database inside the data directory.
+At runtime the database is opened read-only and memory-mapped. A catalog is pulled with one query
+the first time it is used and then kept, so EnumLoader, dataParser and eggLogic share one open
+instead of parsing the same JSON files again and again, and catalogs nobody asks for, like moves or
+eggTypes, are never decoded.
+
+Scalar values keep their native SQLite type (INTEGER or TEXT). Nested values such as the form lists
+in hasForms or the egg data in eggTypes are stored as JSON text and decoded when loaded.
+
+Besides the generated catalogs the store persists derived tables that are expensive to compute,
+currently the per form caughtAttr tables of dataParser (catalog 'caughtAttr').
+
+Modules:
+- sqlite3: Provides the compiled, read-only catalog database.
+- utilities.jsonBackend: Reads the generated catalogs and encodes nested values.
+- utilities.atomicWriter: Flushes the built database to disk before it replaces the old one.
+- os: Provides file operations for the temporary database.
+- pathlib: Builds the read-only URI used to open the database.
+- threading: Guards creation of the shared store instance and the loading of catalogs.
+- sys: Interns the catalog keys.
+- utilities.catalog: Provides the bidirectional index built for every catalog.
+- modules.config: Provides the data directory and the path of the catalog database.
+
+Workflow:
+1. Generator.generate() calls CatalogStore.fh_build() whenever a catalog changed or the database is missing or outdated.
+2. Consumers call fh_getCatalogStore() to get the shared, lazily opened store.
+3. The first access to a catalog loads it with one query and keeps it in memory.
+4. f_getIndex() returns the one shared Catalog index per catalog that all modules use for lookups.
+
+Usage Example:
+    >>> from utilities import fh_getCatalogStore
+    >>> store = fh_getCatalogStore()
+    >>> store.f_getCatalog('biomes')['TOWN']
+    '0'
+"""
+
+import sqlite3
+# Provides the compiled, read-only catalog database.
+
+import os
+# Provides file operations for the temporary database.
+
+import threading
+# Guards creation of the shared store instance and the loading of catalogs.
+
+import sys
+# Interns the catalog keys.
+
+from pathlib import Path
+# Builds the read-only URI used to open the database.
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+# Provides type hints for better code clarity and type checking.
+
+from utilities.catalog import Catalog
+# Provides the bidirectional index built for every catalog.
+
+from utilities.jsonBackend import fh_dumps, fh_load, fh_loads
+# Reads the generated catalogs and encodes nested values.
+
+from utilities.atomicWriter import fh_replaceAtomic
+# Flushes the built database to disk before it replaces the old one.
+
+from modules.config import dataDirectory, catalogStoreFile
+# Contains configuration settings, specifically for directory paths.
+
+# Bump whenever the table layout or the value encoding changes; outdated databases are rebuilt.
+SCHEMA_VERSION: int = 2
+
+# Catalog name -> (generated JSON file, top level key inside that file).
+CATALOG_FILES: Dict[str, Tuple[str, str]] = {
+    'starter': ('starter.json', 'dex'),
+    'biomes': ('biomes.json', 'biomes'),
+    'moves': ('moves.json', 'moves'),
+    'natures': ('natures.json', 'natures'),
+    'vouchers': ('vouchers.json', 'vouchers'),
+    'natureSlot': ('natureSlot.json', 'natureSlot'),
+    'achievements': ('achievements.json', 'achvUnlocks'),
+    'species': ('species.json', 'dex'),
+    'noPassive': ('noPassive.json', 'noPassive'),
+    'hasForms': ('hasForms.json', 'hasForms'),
+    'eggTypes': ('eggTypes.json', 'eggTypes'),
+}
+
+_KIND_SCALAR = 0
+_KIND_JSON = 1
+
+# 64 MiB is far above the size of the catalog, the whole file is mapped at once.
+_MMAP_SIZE = 64 * 1024 * 1024
+
+class CatalogStore:
+    """
+    Read-only access to the compiled catalog database.
+
+    Attributes:
+        path (str): The path of the catalog database.
+    """
+    def __init__(self, path: str = catalogStoreFile) -> None:
+        """
+        Initialize the CatalogStore. The database is opened on first access.
+
+        Args:
+            path (str): The path of the catalog database.
+        """
+        self.path: str = path
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__catalogs: Dict[str, Dict[str, Any]] = {}
+        self.__indexes: Dict[str, Catalog] = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def fh_needsRebuild(path: str = catalogStoreFile) -> bool:
+        """
+        Check whether the catalog database is missing or was built with another schema version.
+
+        Args:
+            path (str): The path of the catalog database.
+
+        Returns:
+            bool: True if the database has to be (re)built.
+        """
+        if not os.path.exists(path):
+            return True
+        try:
+            connection = sqlite3.connect(Path(path).resolve().as_uri() + '?mode=ro', uri=True)
+            try:
+                return connection.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return True
+
+    @staticmethod
+    def fh_loadGeneratedCatalogs(directory: str = dataDirectory) -> Dict[str, Dict[str, Any]]:
+        """
+        Read the generated JSON catalogs from the data directory.
+
+        Args:
+            directory (str): The directory containing the generated JSON files.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of catalog name to its key/value pairs.
+        """
+        loaded: Dict[str, Dict[str, Any]] = {}
+        for catalogName, (filename, topLevelKey) in CATALOG_FILES.items():
+            loaded[catalogName] = fh_load(os.path.join(directory, filename))[topLevelKey]
+        return loaded
+
+    @staticmethod
+    def __fh_encodeRows(catalogs: Dict[str, Dict[str, Any]]) -> Iterable[Tuple[str, int, str, Any, int]]:
+        for catalogName, entries in catalogs.items():
+            for position, (key, value) in enumerate(entries.items()):
+                if isinstance(value, (int, str)) and not isinstance(value, bool):
+                    yield catalogName, position, key, value, _KIND_SCALAR
+                else:
+                    yield catalogName, position, key, fh_dumps(value, compact=True), _KIND_JSON
+
+    @classmethod
+    def fh_build(cls, catalogs: Optional[Dict[str, Dict[str, Any]]] = None, path: str = catalogStoreFile) -> None:
+        """
+        Compile the catalogs into the database.
+
+        The database is written to a temporary file and moved into place, so readers never see a
+        partially written store.
+
+        Args:
+            catalogs (Optional[Dict[str, Dict[str, Any]]]): The catalogs to compile. Defaults to the generated JSON files.
+            path (str): The path of the catalog database.
+
+        Example:
+            CatalogStore.fh_build()
+        """
+        if catalogs is None:
+            catalogs = cls.fh_loadGeneratedCatalogs()
+        if 'caughtAttr' not in catalogs:
+            # Imported here, dataParser itself reads from this store.
+            from modules.data.dataParser import fh_computeCaughtAttrTables
+            catalogs = {**catalogs, 'caughtAttr': fh_computeCaughtAttrTables(catalogs['hasForms'])}
+
+        tmpPath = f'{path}.tmp'
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+
+        connection = sqlite3.connect(tmpPath)
+        try:
+            # The value column has no declared type so INTEGER and TEXT values keep their affinity.
+            connection.execute('CREATE TABLE entries (catalog TEXT NOT NULL, position INTEGER NOT NULL, '
+                               'key TEXT NOT NULL, value, kind INTEGER NOT NULL, PRIMARY KEY (catalog, key))')
+            connection.executemany('INSERT INTO entries VALUES (?, ?, ?, ?, ?)', cls.__fh_encodeRows(catalogs))
+            connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            connection.commit()
+        finally:
+            connection.close()
+
+        fh_replaceAtomic(tmpPath, path)
+
+    def __fh_connect(self) -> sqlite3.Connection:
+        if self.__connection is None:
+            self.__connection = sqlite3.connect(Path(self.path).resolve().as_uri() + '?mode=ro', uri=True, check_same_thread=False)
+            self.__connection.execute(f'PRAGMA mmap_size = {_MMAP_SIZE}')
+        return self.__connection
+
+    def __fh_load(self, catalogName: str) -> Dict[str, Any]:
+        catalog = self.__catalogs.get(catalogName)
+        if catalog is None:
+            with self.__lock:
+                catalog = self.__catalogs.get(catalogName)
+                if catalog is None:
+                    rows = self.__fh_connect().execute('SELECT key, value, kind FROM entries WHERE catalog = ? ORDER BY position', (catalogName,))
+                    # Interned keys are shared with the Catalog indexes and every dict built from them.
+                    catalog = {sys.intern(key): fh_loads(value) if kind == _KIND_JSON else value for key, value, kind in rows}
+                    if not catalog and catalogName not in CATALOG_FILES:
+                        raise KeyError(catalogName)
+                    self.__catalogs[catalogName] = catalog
+        return catalog
+
+    def f_getCatalog(self, catalogName: str) -> Dict[str, Any]:
+        """
+        Get all entries of a catalog, in the order they were generated.
+
+        The returned dictionary is shared between all consumers and must not be modified.
+
+        Args:
+            catalogName (str): One of the keys of CATALOG_FILES or 'caughtAttr', e.g. 'moves'.
+
+        Returns:
+            Dict[str, Any]: The catalog entries.
+
+        Raises:
+            KeyError: If the catalog does not exist.
+        """
+        return self.__fh_load(catalogName)
+
+    def f_getCatalogs(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all catalogs at once, loading every one that was not used yet.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Mapping of catalog name to its entries.
+        """
+        with self.__lock:
+            names = [row[0] for row in self.__fh_connect().execute('SELECT DISTINCT catalog FROM entries')]
+        return {catalogName: self.__fh_load(catalogName) for catalogName in dict.fromkeys([*CATALOG_FILES, *names])}
+
+    def f_getIndex(self, catalogName: str) -> Catalog:
+        """
+        Get the bidirectional index of a catalog (id <-> name, lowercase and display names).
+
+        There is exactly one index per catalog, every module uses the same instance instead of
+        building its own helper dictionaries.
+
+        Args:
+            catalogName (str): One of the keys of CATALOG_FILES, e.g. 'species'.
+
+        Returns:
+            Catalog: The shared index.
+
+        Example:
+            store.f_getIndex('biomes').byID(0).name  # 'TOWN'
+        """
+        index = self.__indexes.get(catalogName)
+        if index is None:
+            index = self.__indexes.setdefault(catalogName, Catalog(catalogName, self.f_getCatalog(catalogName)))
+        return index
+
+    def f_lookup(self, catalogName: str, key: str, default: Any = None) -> Any:
+        """
+        Look up a single entry.
+
+        Args:
+            catalogName (str): The catalog to search in.
+            key (str): The entry key.
+            default (Any): Returned if the key does not exist.
+
+        Returns:
+            Any: The entry value or the default.
+        """
+        try:
+            return self.__fh_load(catalogName).get(key, default)
+        except KeyError:
+            return default
+
+    def f_close(self) -> None:
+        """
+        Close the database connection. Loaded catalogs stay available.
+        """
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
+
+__sharedStore: Optional[CatalogStore] = None
+__sharedStoreLock = threading.Lock()
+
+def fh_getCatalogStore() -> CatalogStore:
+    """
+    Get the catalog store shared by all consumers, building the database first if needed.
+
+    Returns:
+        CatalogStore: The shared store.
+
+    Usage Example:
+        >>> fh_getCatalogStore().f_lookup('moves', 'TACKLE')
+        33
+    """
+    global __sharedStore
+    with __sharedStoreLock:
+        if __sharedStore is None:
+            if CatalogStore.fh_needsRebuild():
+                CatalogStore.fh_build()
+            __sharedStore = CatalogStore()
+        return __sharedStore
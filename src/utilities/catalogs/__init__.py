@@ -0,0 +1,99 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+Lazily loaded game catalogs.
+
+Every catalog lives in its own module so that only the catalogs a session actually touches get
+compiled and executed. Accessing a name on this package imports the owning module on first use
+and caches the result on the package.
+
+Usage Example:
+    >>> from utilities import catalogs
+    >>> catalogs.Biome.BIOMES_DICT.value['TOWN']
+    '0'
+
+Modules:
+- importlib: Imports the owning catalog module on first attribute access.
+- hashlib: Provides content hashes of catalog sources for the generator manifest.
+"""
+
+import importlib
+import importlib.util
+import hashlib
+from typing import Dict, List
+
+# Maps every public catalog name to the module it is defined in.
+catalogModules: Dict[str, str] = {
+    'StarterEnum': 'starters',
+    'SpeciesEnum': 'species',
+    'Nature': 'natures',
+    'NatureSlot': 'natures',
+    'NoPassive': 'noPassive',
+    'Biome': 'biomes',
+    'Vouchers': 'vouchers',
+    'AchievementEnum': 'achievements',
+    'MovesEnum': 'moves',
+    'hasFormsEnum': 'hasForms',
+    'eggTypesEnum': 'eggTypes',
+}
+
+def __getattr__(name: str) -> object:
+    """
+    Import the catalog module owning `name` and return the requested catalog.
+
+    Args:
+        name (str): The catalog name, e.g. 'MovesEnum'.
+
+    Returns:
+        object: The catalog Enum class.
+
+    Raises:
+        AttributeError: If `name` is not a known catalog.
+    """
+    moduleName = catalogModules.get(name)
+    if moduleName is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    module = importlib.import_module(f'{__name__}.{moduleName}')
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(list(globals().keys()) + list(catalogModules.keys()))
+
+def fh_getSourceHash(moduleName: str) -> str:
+    """
+    Compute the content hash of a catalog module without executing it.
+
+    The hash is taken over the module source on disk. In frozen builds, where no source file is
+    available, the module is imported and its catalog values are hashed instead.
+
+    Args:
+        moduleName (str): The catalog module name, e.g. 'moves'.
+
+    Returns:
+        str: Hex digest identifying the catalog content.
+
+    Usage Example:
+        >>> fh_getSourceHash('biomes')
+    """
+    spec = importlib.util.find_spec(f'{__name__}.{moduleName}')
+    if spec is not None and spec.origin:
+        try:
+            with open(spec.origin, 'rb') as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            pass
+
+    module = importlib.import_module(f'{__name__}.{moduleName}')
+    names = [name for name, owner in catalogModules.items() if owner == moduleName]
+    sourceData = [[(member.name, member.value) for member in getattr(module, name)] for name in names]
+    return hashlib.sha256(repr(sourceData).encode('utf-8')).hexdigest()
+
+__all__ = list(catalogModules.keys()) + ['catalogModules', 'fh_getSourceHash']
@@ -0,0 +1,87 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+Catalog of achievements mapped to their IDs.
+
+Loaded on first access through utilities.catalogs, see its module docstring.
+"""
+
+from enum import Enum
+
+
+class AchievementEnum(Enum):
+    ACHIEVEMENTS_DICT = {
+        '_10K_MONEY': 1,
+        '_100K_MONEY': 2,
+        '_1M_MONEY': 3,
+        '_10M_MONEY': 4,
+        '_250_DMG': 5,
+        '_1000_DMG': 6,
+        '_2500_DMG': 7,
+        '_10000_DMG': 8,
+        '_250_HEAL': 9,
+        '_1000_HEAL': 10,
+        '_2500_HEAL': 11,
+        '_10000_HEAL': 12,
+        'LV_100': 13,
+        'LV_250': 14,
+        'LV_1000': 15,
+        '_10_RIBBONS': 16,
+        '_25_RIBBONS': 17,
+        '_50_RIBBONS': 18,
+        '_75_RIBBONS': 19,
+        '_100_RIBBONS': 20,
+        'TRANSFER_MAX_BATTLE_STAT': 21,
+        'MAX_FRIENDSHIP': 22,
+        'MEGA_EVOLVE': 23,
+        'GIGANTAMAX': 24,
+        'TERASTALLIZE': 25,
+        'STELLAR_TERASTALLIZE': 26,
+        'SPLICE': 27,
+        'MINI_BLACK_HOLE': 28,
+        'CATCH_MYTHICAL': 29,
+        'CATCH_SUB_LEGENDARY': 30,
+        'CATCH_LEGENDARY': 31,
+        'SEE_SHINY': 32,
+        'SHINY_PARTY': 33,
+        'HATCH_MYTHICAL': 34,
+        'HATCH_SUB_LEGENDARY': 35,
+        'HATCH_LEGENDARY': 36,
+        'HATCH_SHINY': 37,
+        'HIDDEN_ABILITY': 38,
+        'PERFECT_IVS': 39,
+        'CLASSIC_VICTORY': 40,
+        'MONO_GEN_ONE_VICTORY': 41,
+        'MONO_GEN_TWO_VICTORY': 42,
+        'MONO_GEN_THREE_VICTORY': 43,
+        'MONO_GEN_FOUR_VICTORY': 44,
+        'MONO_GEN_FIVE_VICTORY': 45,
+        'MONO_GEN_SIX_VICTORY': 46,
+        'MONO_GEN_SEVEN_VICTORY': 47,
+        'MONO_GEN_EIGHT_VICTORY': 48,
+        'MONO_GEN_NINE_VICTORY': 49,
+        'MONO_NORMAL': 50,
+        'MONO_FIGHTING': 51,
+        'MONO_FLYING': 52,
+        'MONO_POISON': 53,
+        'MONO_GROUND': 54,
+        'MONO_ROCK': 55,
+        'MONO_BUG': 56,
+        'MONO_GHOST': 57,
+        'MONO_STEEL': 58,
+        'MONO_FIRE': 59,
+        'MONO_WATER': 60,
+        'MONO_GRASS': 61,
+        'MONO_ELECTRIC': 62,
+        'MONO_PSYCHIC': 63,
+        'MONO_ICE': 64,
+        'MONO_DRAGON': 65,
+        'MONO_DARK': 66,
+        'MONO_FAIRY': 67
+    }
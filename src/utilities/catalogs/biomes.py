@@ -0,0 +1,55 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+Catalog of biomes mapped to their IDs.
+
+Loaded on first access through utilities.catalogs, see its module docstring.
+"""
+
+from enum import Enum
+
+
+class Biome(Enum):
+    BIOMES_DICT = {
+        'TOWN': '0',
+        'PLAINS': '1',
+        'GRASS': '2',
+        'TALL_GRASS': '3',
+        'METROPOLIS': '4',
+        'FOREST': '5',
+        'SEA': '6',
+        'SWAMP': '7',
+        'BEACH': '8',
+        'LAKE': '9',
+        'SEABED': '10',
+        'MOUNTAIN': '11',
+        'BADLANDS': '12',
+        'CAVE': '13',
+        'DESERT': '14',
+        'ICE_CAVE': '15',
+        'MEADOW': '16',
+        'POWER_PLANT': '17',
+        'VOLCANO': '18',
+        'GRAVEYARD': '19',
+        'DOJO': '20',
+        'FACTORY': '21',
+        'RUINS': '22',
+        'WASTELAND': '23',
+        'ABYSS': '24',
+        'SPACE': '25',
+        'CONSTRUCTION_SITE': '26',
+        'JUNGLE': '27',
+        'FAIRY_CAVE': '28',
+        'TEMPLE': '29',
+        'SLUM': '30',
+        'SNOWY_FOREST': '31',
+        'ISLAND': '40',
+        'LABORATORY': '41',
+        'END': '50'
+    }
@@ -0,0 +1,1102 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+Catalog of species with their egg tier and hatch chance.
+
+Loaded on first access through utilities.catalogs, see its module docstring.
+"""
+
+from enum import Enum
+
+
+class eggTypesEnum(Enum):
+    EGGTYPES_DICT = {
+        '1': {'name': 'bulbasaur', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '2': {'name': 'ivysaur', 'isEgg': None},
+        '3': {'name': 'venusaur', 'isEgg': None},
+        '4': {'name': 'charmander', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '5': {'name': 'charmeleon', 'isEgg': None},
+        '6': {'name': 'charizard', 'isEgg': None},
+        '7': {'name': 'squirtle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '8': {'name': 'wartortle', 'isEgg': None},
+        '9': {'name': 'blastoise', 'isEgg': None},
+        '10': {'name': 'caterpie', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '11': {'name': 'metapod', 'isEgg': None},
+        '12': {'name': 'butterfree', 'isEgg': None},
+        '13': {'name': 'weedle', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '14': {'name': 'kakuna', 'isEgg': None},
+        '15': {'name': 'beedrill', 'isEgg': None},
+        '16': {'name': 'pidgey', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '17': {'name': 'pidgeotto', 'isEgg': None},
+        '18': {'name': 'pidgeot', 'isEgg': None},
+        '19': {'name': 'rattata', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '20': {'name': 'raticate', 'isEgg': None},
+        '21': {'name': 'spearow', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '22': {'name': 'fearow', 'isEgg': None},
+        '23': {'name': 'ekans', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '24': {'name': 'arbok', 'isEgg': None},
+        '25': {'name': 'pikachu', 'isEgg': None},
+        '26': {'name': 'raichu', 'isEgg': None},
+        '27': {'name': 'sandshrew', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '28': {'name': 'sandslash', 'isEgg': None},
+        '29': {'name': 'nidoran_f', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '30': {'name': 'nidorina', 'isEgg': None},
+        '31': {'name': 'nidoqueen', 'isEgg': None},
+        '32': {'name': 'nidoran_m', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '33': {'name': 'nidorino', 'isEgg': None},
+        '34': {'name': 'nidoking', 'isEgg': None},
+        '35': {'name': 'clefairy', 'isEgg': None},
+        '36': {'name': 'clefable', 'isEgg': None},
+        '37': {'name': 'vulpix', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '38': {'name': 'ninetales', 'isEgg': None},
+        '39': {'name': 'jigglypuff', 'isEgg': None},
+        '40': {'name': 'wigglytuff', 'isEgg': None},
+        '41': {'name': 'zubat', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '42': {'name': 'golbat', 'isEgg': None},
+        '43': {'name': 'oddish', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '44': {'name': 'gloom', 'isEgg': None},
+        '45': {'name': 'vileplume', 'isEgg': None},
+        '46': {'name': 'paras', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '47': {'name': 'parasect', 'isEgg': None},
+        '48': {'name': 'venonat', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '49': {'name': 'venomoth', 'isEgg': None},
+        '50': {'name': 'diglett', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '51': {'name': 'dugtrio', 'isEgg': None},
+        '52': {'name': 'meowth', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '53': {'name': 'persian', 'isEgg': None},
+        '54': {'name': 'psyduck', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '55': {'name': 'golduck', 'isEgg': None},
+        '56': {'name': 'mankey', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '57': {'name': 'primeape', 'isEgg': None},
+        '58': {'name': 'growlithe', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '59': {'name': 'arcanine', 'isEgg': None},
+        '60': {'name': 'poliwag', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '61': {'name': 'poliwhirl', 'isEgg': None},
+        '62': {'name': 'poliwrath', 'isEgg': None},
+        '63': {'name': 'abra', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '64': {'name': 'kadabra', 'isEgg': None},
+        '65': {'name': 'alakazam', 'isEgg': None},
+        '66': {'name': 'machop', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '67': {'name': 'machoke', 'isEgg': None},
+        '68': {'name': 'machamp', 'isEgg': None},
+        '69': {'name': 'bellsprout', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '70': {'name': 'weepinbell', 'isEgg': None},
+        '71': {'name': 'victreebel', 'isEgg': None},
+        '72': {'name': 'tentacool', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '73': {'name': 'tentacruel', 'isEgg': None},
+        '74': {'name': 'geodude', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '75': {'name': 'graveler', 'isEgg': None},
+        '76': {'name': 'golem', 'isEgg': None},
+        '77': {'name': 'ponyta', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '78': {'name': 'rapidash', 'isEgg': None},
+        '79': {'name': 'slowpoke', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '80': {'name': 'slowbro', 'isEgg': None},
+        '81': {'name': 'magnemite', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '82': {'name': 'magneton', 'isEgg': None},
+        '83': {'name': 'farfetchd', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '84': {'name': 'doduo', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '85': {'name': 'dodrio', 'isEgg': None},
+        '86': {'name': 'seel', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '87': {'name': 'dewgong', 'isEgg': None},
+        '88': {'name': 'grimer', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '89': {'name': 'muk', 'isEgg': None},
+        '90': {'name': 'shellder', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '91': {'name': 'cloyster', 'isEgg': None},
+        '92': {'name': 'gastly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '93': {'name': 'haunter', 'isEgg': None},
+        '94': {'name': 'gengar', 'isEgg': None},
+        '95': {'name': 'onix', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '96': {'name': 'drowzee', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '97': {'name': 'hypno', 'isEgg': None},
+        '98': {'name': 'krabby', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '99': {'name': 'kingler', 'isEgg': None},
+        '100': {'name': 'voltorb', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '101': {'name': 'electrode', 'isEgg': None},
+        '102': {'name': 'exeggcute', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '103': {'name': 'exeggutor', 'isEgg': None},
+        '104': {'name': 'cubone', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '105': {'name': 'marowak', 'isEgg': None},
+        '106': {'name': 'hitmonlee', 'isEgg': None},
+        '107': {'name': 'hitmonchan', 'isEgg': None},
+        '108': {'name': 'lickitung', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '109': {'name': 'koffing', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '110': {'name': 'weezing', 'isEgg': None},
+        '111': {'name': 'rhyhorn', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '112': {'name': 'rhydon', 'isEgg': None},
+        '113': {'name': 'chansey', 'isEgg': None},
+        '114': {'name': 'tangela', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '115': {'name': 'kangaskhan', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '116': {'name': 'horsea', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '117': {'name': 'seadra', 'isEgg': None},
+        '118': {'name': 'goldeen', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '119': {'name': 'seaking', 'isEgg': None},
+        '120': {'name': 'staryu', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '121': {'name': 'starmie', 'isEgg': None},
+        '122': {'name': 'mr_mime', 'isEgg': None},
+        '123': {'name': 'scyther', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '124': {'name': 'jynx', 'isEgg': None},
+        '125': {'name': 'electabuzz', 'isEgg': None},
+        '126': {'name': 'magmar', 'isEgg': None},
+        '127': {'name': 'pinsir', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '128': {'name': 'tauros', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '129': {'name': 'magikarp', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '130': {'name': 'gyarados', 'isEgg': None},
+        '131': {'name': 'lapras', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '132': {'name': 'ditto', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '133': {'name': 'eevee', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '134': {'name': 'vaporeon', 'isEgg': None},
+        '135': {'name': 'jolteon', 'isEgg': None},
+        '136': {'name': 'flareon', 'isEgg': None},
+        '137': {'name': 'porygon', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '138': {'name': 'omanyte', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '139': {'name': 'omastar', 'isEgg': None},
+        '140': {'name': 'kabuto', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '141': {'name': 'kabutops', 'isEgg': None},
+        '142': {'name': 'aerodactyl', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '143': {'name': 'snorlax', 'isEgg': None},
+        '144': {'name': 'articuno', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '145': {'name': 'zapdos', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '146': {'name': 'moltres', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '147': {'name': 'dratini', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '148': {'name': 'dragonair', 'isEgg': None},
+        '149': {'name': 'dragonite', 'isEgg': None},
+        '150': {'name': 'mewtwo', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '151': {'name': 'mew', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '152': {'name': 'chikorita', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '153': {'name': 'bayleef', 'isEgg': None},
+        '154': {'name': 'meganium', 'isEgg': None},
+        '155': {'name': 'cyndaquil', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '156': {'name': 'quilava', 'isEgg': None},
+        '157': {'name': 'typhlosion', 'isEgg': None},
+        '158': {'name': 'totodile', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '159': {'name': 'croconaw', 'isEgg': None},
+        '160': {'name': 'feraligatr', 'isEgg': None},
+        '161': {'name': 'sentret', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '162': {'name': 'furret', 'isEgg': None},
+        '163': {'name': 'hoothoot', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '164': {'name': 'noctowl', 'isEgg': None},
+        '165': {'name': 'ledyba', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '166': {'name': 'ledian', 'isEgg': None},
+        '167': {'name': 'spinarak', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '168': {'name': 'ariados', 'isEgg': None},
+        '169': {'name': 'crobat', 'isEgg': None},
+        '170': {'name': 'chinchou', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '171': {'name': 'lanturn', 'isEgg': None},
+        '172': {'name': 'pichu', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '173': {'name': 'cleffa', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '174': {'name': 'igglybuff', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '175': {'name': 'togepi', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '176': {'name': 'togetic', 'isEgg': None},
+        '177': {'name': 'natu', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '178': {'name': 'xatu', 'isEgg': None},
+        '179': {'name': 'mareep', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '180': {'name': 'flaaffy', 'isEgg': None},
+        '181': {'name': 'ampharos', 'isEgg': None},
+        '182': {'name': 'bellossom', 'isEgg': None},
+        '183': {'name': 'marill', 'isEgg': None},
+        '184': {'name': 'azumarill', 'isEgg': None},
+        '185': {'name': 'sudowoodo', 'isEgg': None},
+        '186': {'name': 'politoed', 'isEgg': None},
+        '187': {'name': 'hoppip', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '188': {'name': 'skiploom', 'isEgg': None},
+        '189': {'name': 'jumpluff', 'isEgg': None},
+        '190': {'name': 'aipom', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '191': {'name': 'sunkern', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '192': {'name': 'sunflora', 'isEgg': None},
+        '193': {'name': 'yanma', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '194': {'name': 'wooper', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '195': {'name': 'quagsire', 'isEgg': None},
+        '196': {'name': 'espeon', 'isEgg': None},
+        '197': {'name': 'umbreon', 'isEgg': None},
+        '198': {'name': 'murkrow', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '199': {'name': 'slowking', 'isEgg': None},
+        '200': {'name': 'misdreavus', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '201': {'name': 'unown', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '202': {'name': 'wobbuffet', 'isEgg': None},
+        '203': {'name': 'girafarig', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '204': {'name': 'pineco', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '205': {'name': 'forretress', 'isEgg': None},
+        '206': {'name': 'dunsparce', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '207': {'name': 'gligar', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '208': {'name': 'steelix', 'isEgg': None},
+        '209': {'name': 'snubbull', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '210': {'name': 'granbull', 'isEgg': None},
+        '211': {'name': 'qwilfish', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '212': {'name': 'scizor', 'isEgg': None},
+        '213': {'name': 'shuckle', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '214': {'name': 'heracross', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '215': {'name': 'sneasel', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '216': {'name': 'teddiursa', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '217': {'name': 'ursaring', 'isEgg': None},
+        '218': {'name': 'slugma', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '219': {'name': 'magcargo', 'isEgg': None},
+        '220': {'name': 'swinub', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '221': {'name': 'piloswine', 'isEgg': None},
+        '222': {'name': 'corsola', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '223': {'name': 'remoraid', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '224': {'name': 'octillery', 'isEgg': None},
+        '225': {'name': 'delibird', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '226': {'name': 'mantine', 'isEgg': None},
+        '227': {'name': 'skarmory', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '228': {'name': 'houndour', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '229': {'name': 'houndoom', 'isEgg': None},
+        '230': {'name': 'kingdra', 'isEgg': None},
+        '231': {'name': 'phanpy', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '232': {'name': 'donphan', 'isEgg': None},
+        '233': {'name': 'porygon2', 'isEgg': None},
+        '234': {'name': 'stantler', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '235': {'name': 'smeargle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '236': {'name': 'tyrogue', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '237': {'name': 'hitmontop', 'isEgg': None},
+        '238': {'name': 'smoochum', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '239': {'name': 'elekid', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '240': {'name': 'magby', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '241': {'name': 'miltank', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '242': {'name': 'blissey', 'isEgg': None},
+        '243': {'name': 'raikou', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '244': {'name': 'entei', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '245': {'name': 'suicune', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '246': {'name': 'larvitar', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '247': {'name': 'pupitar', 'isEgg': None},
+        '248': {'name': 'tyranitar', 'isEgg': None},
+        '249': {'name': 'lugia', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '250': {'name': 'ho_oh', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '251': {'name': 'celebi', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '252': {'name': 'treecko', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '253': {'name': 'grovyle', 'isEgg': None},
+        '254': {'name': 'sceptile', 'isEgg': None},
+        '255': {'name': 'torchic', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '256': {'name': 'combusken', 'isEgg': None},
+        '257': {'name': 'blaziken', 'isEgg': None},
+        '258': {'name': 'mudkip', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '259': {'name': 'marshtomp', 'isEgg': None},
+        '260': {'name': 'swampert', 'isEgg': None},
+        '261': {'name': 'poochyena', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '262': {'name': 'mightyena', 'isEgg': None},
+        '263': {'name': 'zigzagoon', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '264': {'name': 'linoone', 'isEgg': None},
+        '265': {'name': 'wurmple', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '266': {'name': 'silcoon', 'isEgg': None},
+        '267': {'name': 'beautifly', 'isEgg': None},
+        '268': {'name': 'cascoon', 'isEgg': None},
+        '269': {'name': 'dustox', 'isEgg': None},
+        '270': {'name': 'lotad', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '271': {'name': 'lombre', 'isEgg': None},
+        '272': {'name': 'ludicolo', 'isEgg': None},
+        '273': {'name': 'seedot', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '274': {'name': 'nuzleaf', 'isEgg': None},
+        '275': {'name': 'shiftry', 'isEgg': None},
+        '276': {'name': 'taillow', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '277': {'name': 'swellow', 'isEgg': None},
+        '278': {'name': 'wingull', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '279': {'name': 'pelipper', 'isEgg': None},
+        '280': {'name': 'ralts', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '281': {'name': 'kirlia', 'isEgg': None},
+        '282': {'name': 'gardevoir', 'isEgg': None},
+        '283': {'name': 'surskit', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '284': {'name': 'masquerain', 'isEgg': None},
+        '285': {'name': 'shroomish', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '286': {'name': 'breloom', 'isEgg': None},
+        '287': {'name': 'slakoth', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '288': {'name': 'vigoroth', 'isEgg': None},
+        '289': {'name': 'slaking', 'isEgg': None},
+        '290': {'name': 'nincada', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '291': {'name': 'ninjask', 'isEgg': None},
+        '292': {'name': 'shedinja', 'isEgg': None},
+        '293': {'name': 'whismur', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '294': {'name': 'loudred', 'isEgg': None},
+        '295': {'name': 'exploud', 'isEgg': None},
+        '296': {'name': 'makuhita', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '297': {'name': 'hariyama', 'isEgg': None},
+        '298': {'name': 'azurill', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '299': {'name': 'nosepass', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '300': {'name': 'skitty', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '301': {'name': 'delcatty', 'isEgg': None},
+        '302': {'name': 'sableye', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '303': {'name': 'mawile', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '304': {'name': 'aron', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '305': {'name': 'lairon', 'isEgg': None},
+        '306': {'name': 'aggron', 'isEgg': None},
+        '307': {'name': 'meditite', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '308': {'name': 'medicham', 'isEgg': None},
+        '309': {'name': 'electrike', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '310': {'name': 'manectric', 'isEgg': None},
+        '311': {'name': 'plusle', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '312': {'name': 'minun', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '313': {'name': 'volbeat', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '314': {'name': 'illumise', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '315': {'name': 'roselia', 'isEgg': None},
+        '316': {'name': 'gulpin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '317': {'name': 'swalot', 'isEgg': None},
+        '318': {'name': 'carvanha', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '319': {'name': 'sharpedo', 'isEgg': None},
+        '320': {'name': 'wailmer', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '321': {'name': 'wailord', 'isEgg': None},
+        '322': {'name': 'numel', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '323': {'name': 'camerupt', 'isEgg': None},
+        '324': {'name': 'torkoal', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '325': {'name': 'spoink', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '326': {'name': 'grumpig', 'isEgg': None},
+        '327': {'name': 'spinda', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '328': {'name': 'trapinch', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '329': {'name': 'vibrava', 'isEgg': None},
+        '330': {'name': 'flygon', 'isEgg': None},
+        '331': {'name': 'cacnea', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '332': {'name': 'cacturne', 'isEgg': None},
+        '333': {'name': 'swablu', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '334': {'name': 'altaria', 'isEgg': None},
+        '335': {'name': 'zangoose', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '336': {'name': 'seviper', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '337': {'name': 'lunatone', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '338': {'name': 'solrock', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '339': {'name': 'barboach', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '340': {'name': 'whiscash', 'isEgg': None},
+        '341': {'name': 'corphish', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '342': {'name': 'crawdaunt', 'isEgg': None},
+        '343': {'name': 'baltoy', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '344': {'name': 'claydol', 'isEgg': None},
+        '345': {'name': 'lileep', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '346': {'name': 'cradily', 'isEgg': None},
+        '347': {'name': 'anorith', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '348': {'name': 'armaldo', 'isEgg': None},
+        '349': {'name': 'feebas', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '350': {'name': 'milotic', 'isEgg': None},
+        '351': {'name': 'castform', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '352': {'name': 'kecleon', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '353': {'name': 'shuppet', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '354': {'name': 'banette', 'isEgg': None},
+        '355': {'name': 'duskull', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '356': {'name': 'dusclops', 'isEgg': None},
+        '357': {'name': 'tropius', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '358': {'name': 'chimecho', 'isEgg': None},
+        '359': {'name': 'absol', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '360': {'name': 'wynaut', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '361': {'name': 'snorunt', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '362': {'name': 'glalie', 'isEgg': None},
+        '363': {'name': 'spheal', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '364': {'name': 'sealeo', 'isEgg': None},
+        '365': {'name': 'walrein', 'isEgg': None},
+        '366': {'name': 'clamperl', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '367': {'name': 'huntail', 'isEgg': None},
+        '368': {'name': 'gorebyss', 'isEgg': None},
+        '369': {'name': 'relicanth', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '370': {'name': 'luvdisc', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '371': {'name': 'bagon', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '372': {'name': 'shelgon', 'isEgg': None},
+        '373': {'name': 'salamence', 'isEgg': None},
+        '374': {'name': 'beldum', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '375': {'name': 'metang', 'isEgg': None},
+        '376': {'name': 'metagross', 'isEgg': None},
+        '377': {'name': 'regirock', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '378': {'name': 'regice', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '379': {'name': 'registeel', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '380': {'name': 'latias', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '381': {'name': 'latios', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '382': {'name': 'kyogre', 'isEgg': {'eggType': 4, 'chance': 2.86}},
+        '383': {'name': 'groudon', 'isEgg': {'eggType': 4, 'chance': 2.86}},
+        '384': {'name': 'rayquaza', 'isEgg': {'eggType': 4, 'chance': 2.86}},
+        '385': {'name': 'jirachi', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '386': {'name': 'deoxys', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '387': {'name': 'turtwig', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '388': {'name': 'grotle', 'isEgg': None},
+        '389': {'name': 'torterra', 'isEgg': None},
+        '390': {'name': 'chimchar', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '391': {'name': 'monferno', 'isEgg': None},
+        '392': {'name': 'infernape', 'isEgg': None},
+        '393': {'name': 'piplup', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '394': {'name': 'prinplup', 'isEgg': None},
+        '395': {'name': 'empoleon', 'isEgg': None},
+        '396': {'name': 'starly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '397': {'name': 'staravia', 'isEgg': None},
+        '398': {'name': 'staraptor', 'isEgg': None},
+        '399': {'name': 'bidoof', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '400': {'name': 'bibarel', 'isEgg': None},
+        '401': {'name': 'kricketot', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '402': {'name': 'kricketune', 'isEgg': None},
+        '403': {'name': 'shinx', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '404': {'name': 'luxio', 'isEgg': None},
+        '405': {'name': 'luxray', 'isEgg': None},
+        '406': {'name': 'budew', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '407': {'name': 'roserade', 'isEgg': None},
+        '408': {'name': 'cranidos', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '409': {'name': 'rampardos', 'isEgg': None},
+        '410': {'name': 'shieldon', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '411': {'name': 'bastiodon', 'isEgg': None},
+        '412': {'name': 'burmy', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '413': {'name': 'wormadam', 'isEgg': None},
+        '414': {'name': 'mothim', 'isEgg': None},
+        '415': {'name': 'combee', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '416': {'name': 'vespiquen', 'isEgg': None},
+        '417': {'name': 'pachirisu', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '418': {'name': 'buizel', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '419': {'name': 'floatzel', 'isEgg': None},
+        '420': {'name': 'cherubi', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '421': {'name': 'cherrim', 'isEgg': None},
+        '422': {'name': 'shellos', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '423': {'name': 'gastrodon', 'isEgg': None},
+        '424': {'name': 'ambipom', 'isEgg': None},
+        '425': {'name': 'drifloon', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '426': {'name': 'drifblim', 'isEgg': None},
+        '427': {'name': 'buneary', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '428': {'name': 'lopunny', 'isEgg': None},
+        '429': {'name': 'mismagius', 'isEgg': None},
+        '430': {'name': 'honchkrow', 'isEgg': None},
+        '431': {'name': 'glameow', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '432': {'name': 'purugly', 'isEgg': None},
+        '433': {'name': 'chingling', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '434': {'name': 'stunky', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '435': {'name': 'skuntank', 'isEgg': None},
+        '436': {'name': 'bronzor', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '437': {'name': 'bronzong', 'isEgg': None},
+        '438': {'name': 'bonsly', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '439': {'name': 'mime_jr', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '440': {'name': 'happiny', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '441': {'name': 'chatot', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '442': {'name': 'spiritomb', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '443': {'name': 'gible', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '444': {'name': 'gabite', 'isEgg': None},
+        '445': {'name': 'garchomp', 'isEgg': None},
+        '446': {'name': 'munchlax', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '447': {'name': 'riolu', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '448': {'name': 'lucario', 'isEgg': None},
+        '449': {'name': 'hippopotas', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '450': {'name': 'hippowdon', 'isEgg': None},
+        '451': {'name': 'skorupi', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '452': {'name': 'drapion', 'isEgg': None},
+        '453': {'name': 'croagunk', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '454': {'name': 'toxicroak', 'isEgg': None},
+        '455': {'name': 'carnivine', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '456': {'name': 'finneon', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '457': {'name': 'lumineon', 'isEgg': None},
+        '458': {'name': 'mantyke', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '459': {'name': 'snover', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '460': {'name': 'abomasnow', 'isEgg': None},
+        '461': {'name': 'weavile', 'isEgg': None},
+        '462': {'name': 'magnezone', 'isEgg': None},
+        '463': {'name': 'lickilicky', 'isEgg': None},
+        '464': {'name': 'rhyperior', 'isEgg': None},
+        '465': {'name': 'tangrowth', 'isEgg': None},
+        '466': {'name': 'electivire', 'isEgg': None},
+        '467': {'name': 'magmortar', 'isEgg': None},
+        '468': {'name': 'togekiss', 'isEgg': None},
+        '469': {'name': 'yanmega', 'isEgg': None},
+        '470': {'name': 'leafeon', 'isEgg': None},
+        '471': {'name': 'glaceon', 'isEgg': None},
+        '472': {'name': 'gliscor', 'isEgg': None},
+        '473': {'name': 'mamoswine', 'isEgg': None},
+        '474': {'name': 'porygon_z', 'isEgg': None},
+        '475': {'name': 'gallade', 'isEgg': None},
+        '476': {'name': 'probopass', 'isEgg': None},
+        '477': {'name': 'dusknoir', 'isEgg': None},
+        '478': {'name': 'froslass', 'isEgg': None},
+        '479': {'name': 'rotom', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '480': {'name': 'uxie', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '481': {'name': 'mesprit', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '482': {'name': 'azelf', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '483': {'name': 'dialga', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '484': {'name': 'palkia', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '485': {'name': 'heatran', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '486': {'name': 'regigigas', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '487': {'name': 'giratina', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '488': {'name': 'cresselia', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '489': {'name': 'phione', 'isEgg': {'eggType': 5, 'chance': 0.25}},
+        '490': {'name': 'manaphy', 'isEgg': {'eggType': 5, 'chance': 0.75}},
+        '491': {'name': 'darkrai', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '492': {'name': 'shaymin', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '493': {'name': 'arceus', 'isEgg': {'eggType': 4, 'chance': 2.86}},
+        '494': {'name': 'victini', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '495': {'name': 'snivy', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '496': {'name': 'servine', 'isEgg': None},
+        '497': {'name': 'serperior', 'isEgg': None},
+        '498': {'name': 'tepig', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '499': {'name': 'pignite', 'isEgg': None},
+        '500': {'name': 'emboar', 'isEgg': None},
+        '501': {'name': 'oshawott', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '502': {'name': 'dewott', 'isEgg': None},
+        '503': {'name': 'samurott', 'isEgg': None},
+        '504': {'name': 'patrat', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '505': {'name': 'watchog', 'isEgg': None},
+        '506': {'name': 'lillipup', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '507': {'name': 'herdier', 'isEgg': None},
+        '508': {'name': 'stoutland', 'isEgg': None},
+        '509': {'name': 'purrloin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '510': {'name': 'liepard', 'isEgg': None},
+        '511': {'name': 'pansage', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '512': {'name': 'simisage', 'isEgg': None},
+        '513': {'name': 'pansear', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '514': {'name': 'simisear', 'isEgg': None},
+        '515': {'name': 'panpour', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '516': {'name': 'simipour', 'isEgg': None},
+        '517': {'name': 'munna', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '518': {'name': 'musharna', 'isEgg': None},
+        '519': {'name': 'pidove', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '520': {'name': 'tranquill', 'isEgg': None},
+        '521': {'name': 'unfezant', 'isEgg': None},
+        '522': {'name': 'blitzle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '523': {'name': 'zebstrika', 'isEgg': None},
+        '524': {'name': 'roggenrola', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '525': {'name': 'boldore', 'isEgg': None},
+        '526': {'name': 'gigalith', 'isEgg': None},
+        '527': {'name': 'woobat', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '528': {'name': 'swoobat', 'isEgg': None},
+        '529': {'name': 'drilbur', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '530': {'name': 'excadrill', 'isEgg': None},
+        '531': {'name': 'audino', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '532': {'name': 'timburr', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '533': {'name': 'gurdurr', 'isEgg': None},
+        '534': {'name': 'conkeldurr', 'isEgg': None},
+        '535': {'name': 'tympole', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '536': {'name': 'palpitoad', 'isEgg': None},
+        '537': {'name': 'seismitoad', 'isEgg': None},
+        '538': {'name': 'throh', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '539': {'name': 'sawk', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '540': {'name': 'sewaddle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '541': {'name': 'swadloon', 'isEgg': None},
+        '542': {'name': 'leavanny', 'isEgg': None},
+        '543': {'name': 'venipede', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '544': {'name': 'whirlipede', 'isEgg': None},
+        '545': {'name': 'scolipede', 'isEgg': None},
+        '546': {'name': 'cottonee', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '547': {'name': 'whimsicott', 'isEgg': None},
+        '548': {'name': 'petilil', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '549': {'name': 'lilligant', 'isEgg': None},
+        '550': {'name': 'basculin', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '551': {'name': 'sandile', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '552': {'name': 'krokorok', 'isEgg': None},
+        '553': {'name': 'krookodile', 'isEgg': None},
+        '554': {'name': 'darumaka', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '555': {'name': 'darmanitan', 'isEgg': None},
+        '556': {'name': 'maractus', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '557': {'name': 'dwebble', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '558': {'name': 'crustle', 'isEgg': None},
+        '559': {'name': 'scraggy', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '560': {'name': 'scrafty', 'isEgg': None},
+        '561': {'name': 'sigilyph', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '562': {'name': 'yamask', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '563': {'name': 'cofagrigus', 'isEgg': None},
+        '564': {'name': 'tirtouga', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '565': {'name': 'carracosta', 'isEgg': None},
+        '566': {'name': 'archen', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '567': {'name': 'archeops', 'isEgg': None},
+        '568': {'name': 'trubbish', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '569': {'name': 'garbodor', 'isEgg': None},
+        '570': {'name': 'zorua', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '571': {'name': 'zoroark', 'isEgg': None},
+        '572': {'name': 'minccino', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '573': {'name': 'cinccino', 'isEgg': None},
+        '574': {'name': 'gothita', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '575': {'name': 'gothorita', 'isEgg': None},
+        '576': {'name': 'gothitelle', 'isEgg': None},
+        '577': {'name': 'solosis', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '578': {'name': 'duosion', 'isEgg': None},
+        '579': {'name': 'reuniclus', 'isEgg': None},
+        '580': {'name': 'ducklett', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '581': {'name': 'swanna', 'isEgg': None},
+        '582': {'name': 'vanillite', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '583': {'name': 'vanillish', 'isEgg': None},
+        '584': {'name': 'vanilluxe', 'isEgg': None},
+        '585': {'name': 'deerling', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '586': {'name': 'sawsbuck', 'isEgg': None},
+        '587': {'name': 'emolga', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '588': {'name': 'karrablast', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '589': {'name': 'escavalier', 'isEgg': None},
+        '590': {'name': 'foongus', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '591': {'name': 'amoonguss', 'isEgg': None},
+        '592': {'name': 'frillish', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '593': {'name': 'jellicent', 'isEgg': None},
+        '594': {'name': 'alomomola', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '595': {'name': 'joltik', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '596': {'name': 'galvantula', 'isEgg': None},
+        '597': {'name': 'ferroseed', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '598': {'name': 'ferrothorn', 'isEgg': None},
+        '599': {'name': 'klink', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '600': {'name': 'klang', 'isEgg': None},
+        '601': {'name': 'klinklang', 'isEgg': None},
+        '602': {'name': 'tynamo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '603': {'name': 'eelektrik', 'isEgg': None},
+        '604': {'name': 'eelektross', 'isEgg': None},
+        '605': {'name': 'elgyem', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '606': {'name': 'beheeyem', 'isEgg': None},
+        '607': {'name': 'litwick', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '608': {'name': 'lampent', 'isEgg': None},
+        '609': {'name': 'chandelure', 'isEgg': None},
+        '610': {'name': 'axew', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '611': {'name': 'fraxure', 'isEgg': None},
+        '612': {'name': 'haxorus', 'isEgg': None},
+        '613': {'name': 'cubchoo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '614': {'name': 'beartic', 'isEgg': None},
+        '615': {'name': 'cryogonal', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '616': {'name': 'shelmet', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '617': {'name': 'accelgor', 'isEgg': None},
+        '618': {'name': 'stunfisk', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '619': {'name': 'mienfoo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '620': {'name': 'mienshao', 'isEgg': None},
+        '621': {'name': 'druddigon', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '622': {'name': 'golett', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '623': {'name': 'golurk', 'isEgg': None},
+        '624': {'name': 'pawniard', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '625': {'name': 'bisharp', 'isEgg': None},
+        '626': {'name': 'bouffalant', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '627': {'name': 'rufflet', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '628': {'name': 'braviary', 'isEgg': None},
+        '629': {'name': 'vullaby', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '630': {'name': 'mandibuzz', 'isEgg': None},
+        '631': {'name': 'heatmor', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '632': {'name': 'durant', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '633': {'name': 'deino', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '634': {'name': 'zweilous', 'isEgg': None},
+        '635': {'name': 'hydreigon', 'isEgg': None},
+        '636': {'name': 'larvesta', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '637': {'name': 'volcarona', 'isEgg': None},
+        '638': {'name': 'cobalion', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '639': {'name': 'terrakion', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '640': {'name': 'virizion', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '641': {'name': 'tornadus', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '642': {'name': 'thundurus', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '643': {'name': 'reshiram', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '644': {'name': 'zekrom', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '645': {'name': 'landorus', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '646': {'name': 'kyurem', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '647': {'name': 'keldeo', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '648': {'name': 'meloetta', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '649': {'name': 'genesect', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '650': {'name': 'chespin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '651': {'name': 'quilladin', 'isEgg': None},
+        '652': {'name': 'chesnaught', 'isEgg': None},
+        '653': {'name': 'fennekin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '654': {'name': 'braixen', 'isEgg': None},
+        '655': {'name': 'delphox', 'isEgg': None},
+        '656': {'name': 'froakie', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '657': {'name': 'frogadier', 'isEgg': None},
+        '658': {'name': 'greninja', 'isEgg': None},
+        '659': {'name': 'bunnelby', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '660': {'name': 'diggersby', 'isEgg': None},
+        '661': {'name': 'fletchling', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '662': {'name': 'fletchinder', 'isEgg': None},
+        '663': {'name': 'talonflame', 'isEgg': None},
+        '664': {'name': 'scatterbug', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '665': {'name': 'spewpa', 'isEgg': None},
+        '666': {'name': 'vivillon', 'isEgg': None},
+        '667': {'name': 'litleo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '668': {'name': 'pyroar', 'isEgg': None},
+        '669': {'name': 'flabebe', 'isEgg': None},
+        '670': {'name': 'floette', 'isEgg': None},
+        '671': {'name': 'florges', 'isEgg': None},
+        '672': {'name': 'skiddo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '673': {'name': 'gogoat', 'isEgg': None},
+        '674': {'name': 'pancham', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '675': {'name': 'pangoro', 'isEgg': None},
+        '676': {'name': 'furfrou', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '677': {'name': 'espurr', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '678': {'name': 'meowstic', 'isEgg': None},
+        '679': {'name': 'honedge', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '680': {'name': 'doublade', 'isEgg': None},
+        '681': {'name': 'aegislash', 'isEgg': None},
+        '682': {'name': 'spritzee', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '683': {'name': 'aromatisse', 'isEgg': None},
+        '684': {'name': 'swirlix', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '685': {'name': 'slurpuff', 'isEgg': None},
+        '686': {'name': 'inkay', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '687': {'name': 'malamar', 'isEgg': None},
+        '688': {'name': 'binacle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '689': {'name': 'barbaracle', 'isEgg': None},
+        '690': {'name': 'skrelp', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '691': {'name': 'dragalge', 'isEgg': None},
+        '692': {'name': 'clauncher', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '693': {'name': 'clawitzer', 'isEgg': None},
+        '694': {'name': 'helioptile', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '695': {'name': 'heliolisk', 'isEgg': None},
+        '696': {'name': 'tyrunt', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '697': {'name': 'tyrantrum', 'isEgg': None},
+        '698': {'name': 'amaura', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '699': {'name': 'aurorus', 'isEgg': None},
+        '700': {'name': 'sylveon', 'isEgg': None},
+        '701': {'name': 'hawlucha', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '702': {'name': 'dedenne', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '703': {'name': 'carbink', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '704': {'name': 'goomy', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '705': {'name': 'sliggoo', 'isEgg': None},
+        '706': {'name': 'goodra', 'isEgg': None},
+        '707': {'name': 'klefki', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '708': {'name': 'phantump', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '709': {'name': 'trevenant', 'isEgg': None},
+        '710': {'name': 'pumpkaboo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '711': {'name': 'gourgeist', 'isEgg': None},
+        '712': {'name': 'bergmite', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '713': {'name': 'avalugg', 'isEgg': None},
+        '714': {'name': 'noibat', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '715': {'name': 'noivern', 'isEgg': None},
+        '716': {'name': 'xerneas', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '717': {'name': 'yveltal', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '718': {'name': 'zygarde', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '719': {'name': 'diancie', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '720': {'name': 'hoopa', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '721': {'name': 'volcanion', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '722': {'name': 'rowlet', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '723': {'name': 'dartrix', 'isEgg': None},
+        '724': {'name': 'decidueye', 'isEgg': None},
+        '725': {'name': 'litten', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '726': {'name': 'torracat', 'isEgg': None},
+        '727': {'name': 'incineroar', 'isEgg': None},
+        '728': {'name': 'popplio', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '729': {'name': 'brionne', 'isEgg': None},
+        '730': {'name': 'primarina', 'isEgg': None},
+        '731': {'name': 'pikipek', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '732': {'name': 'trumbeak', 'isEgg': None},
+        '733': {'name': 'toucannon', 'isEgg': None},
+        '734': {'name': 'yungoos', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '735': {'name': 'gumshoos', 'isEgg': None},
+        '736': {'name': 'grubbin', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '737': {'name': 'charjabug', 'isEgg': None},
+        '738': {'name': 'vikavolt', 'isEgg': None},
+        '739': {'name': 'crabrawler', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '740': {'name': 'crabominable', 'isEgg': None},
+        '741': {'name': 'oricorio', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '742': {'name': 'cutiefly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '743': {'name': 'ribombee', 'isEgg': None},
+        '744': {'name': 'rockruff', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '745': {'name': 'lycanroc', 'isEgg': None},
+        '746': {'name': 'wishiwashi', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '747': {'name': 'mareanie', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '748': {'name': 'toxapex', 'isEgg': None},
+        '749': {'name': 'mudbray', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '750': {'name': 'mudsdale', 'isEgg': None},
+        '751': {'name': 'dewpider', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '752': {'name': 'araquanid', 'isEgg': None},
+        '753': {'name': 'fomantis', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '754': {'name': 'lurantis', 'isEgg': None},
+        '755': {'name': 'morelull', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '756': {'name': 'shiinotic', 'isEgg': None},
+        '757': {'name': 'salandit', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '758': {'name': 'salazzle', 'isEgg': None},
+        '759': {'name': 'stufful', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '760': {'name': 'bewear', 'isEgg': None},
+        '761': {'name': 'bounsweet', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '762': {'name': 'steenee', 'isEgg': None},
+        '763': {'name': 'tsareena', 'isEgg': None},
+        '764': {'name': 'comfey', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '765': {'name': 'oranguru', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '766': {'name': 'passimian', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '767': {'name': 'wimpod', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '768': {'name': 'golisopod', 'isEgg': None},
+        '769': {'name': 'sandygast', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '770': {'name': 'palossand', 'isEgg': None},
+        '771': {'name': 'pyukumuku', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '772': {'name': 'type_null', 'isEgg': None},
+        '773': {'name': 'silvally', 'isEgg': None},
+        '774': {'name': 'minior', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '775': {'name': 'komala', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '776': {'name': 'turtonator', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '777': {'name': 'togedemaru', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '778': {'name': 'mimikyu', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '779': {'name': 'bruxish', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '780': {'name': 'drampa', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '781': {'name': 'dhelmise', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '782': {'name': 'jangmo_o', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '783': {'name': 'hakamo_o', 'isEgg': None},
+        '784': {'name': 'kommo_o', 'isEgg': None},
+        '785': {'name': 'tapu_koko', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '786': {'name': 'tapu_lele', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '787': {'name': 'tapu_bulu', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '788': {'name': 'tapu_fini', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '789': {'name': 'cosmog', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '790': {'name': 'cosmoem', 'isEgg': None},
+        '791': {'name': 'solgaleo', 'isEgg': None},
+        '792': {'name': 'lunala', 'isEgg': None},
+        '793': {'name': 'nihilego', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '794': {'name': 'buzzwole', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '795': {'name': 'pheromosa', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '796': {'name': 'xurkitree', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '797': {'name': 'celesteela', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '798': {'name': 'kartana', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '799': {'name': 'guzzlord', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '800': {'name': 'necrozma', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '801': {'name': 'magearna', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '802': {'name': 'marshadow', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '803': {'name': 'poipole', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '804': {'name': 'naganadel', 'isEgg': None},
+        '805': {'name': 'stakataka', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '806': {'name': 'blacephalon', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '807': {'name': 'zeraora', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '808': {'name': 'meltan', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '809': {'name': 'melmetal', 'isEgg': None},
+        '810': {'name': 'grookey', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '811': {'name': 'thwackey', 'isEgg': None},
+        '812': {'name': 'rillaboom', 'isEgg': None},
+        '813': {'name': 'scorbunny', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '814': {'name': 'raboot', 'isEgg': None},
+        '815': {'name': 'cinderace', 'isEgg': None},
+        '816': {'name': 'sobble', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '817': {'name': 'drizzile', 'isEgg': None},
+        '818': {'name': 'inteleon', 'isEgg': None},
+        '819': {'name': 'skwovet', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '820': {'name': 'greedent', 'isEgg': None},
+        '821': {'name': 'rookidee', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '822': {'name': 'corvisquire', 'isEgg': None},
+        '823': {'name': 'corviknight', 'isEgg': None},
+        '824': {'name': 'blipbug', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '825': {'name': 'dottler', 'isEgg': None},
+        '826': {'name': 'orbeetle', 'isEgg': None},
+        '827': {'name': 'nickit', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '828': {'name': 'thievul', 'isEgg': None},
+        '829': {'name': 'gossifleur', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '830': {'name': 'eldegoss', 'isEgg': None},
+        '831': {'name': 'wooloo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '832': {'name': 'dubwool', 'isEgg': None},
+        '833': {'name': 'chewtle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '834': {'name': 'drednaw', 'isEgg': None},
+        '835': {'name': 'yamper', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '836': {'name': 'boltund', 'isEgg': None},
+        '837': {'name': 'rolycoly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '838': {'name': 'carkol', 'isEgg': None},
+        '839': {'name': 'coalossal', 'isEgg': None},
+        '840': {'name': 'applin', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '841': {'name': 'flapple', 'isEgg': None},
+        '842': {'name': 'appletun', 'isEgg': None},
+        '843': {'name': 'silicobra', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '844': {'name': 'sandaconda', 'isEgg': None},
+        '845': {'name': 'cramorant', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '846': {'name': 'arrokuda', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '847': {'name': 'barraskewda', 'isEgg': None},
+        '848': {'name': 'toxel', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '849': {'name': 'toxtricity', 'isEgg': None},
+        '850': {'name': 'sizzlipede', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '851': {'name': 'centiskorch', 'isEgg': None},
+        '852': {'name': 'clobbopus', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '853': {'name': 'grapploct', 'isEgg': None},
+        '854': {'name': 'sinistea', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '855': {'name': 'polteageist', 'isEgg': None},
+        '856': {'name': 'hatenna', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '857': {'name': 'hattrem', 'isEgg': None},
+        '858': {'name': 'hatterene', 'isEgg': None},
+        '859': {'name': 'impidimp', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '860': {'name': 'morgrem', 'isEgg': None},
+        '861': {'name': 'grimmsnarl', 'isEgg': None},
+        '862': {'name': 'obstagoon', 'isEgg': None},
+        '863': {'name': 'perrserker', 'isEgg': None},
+        '864': {'name': 'cursola', 'isEgg': None},
+        '865': {'name': 'sirfetchd', 'isEgg': None},
+        '866': {'name': 'mr_rime', 'isEgg': None},
+        '867': {'name': 'runerigus', 'isEgg': None},
+        '868': {'name': 'milcery', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '869': {'name': 'alcremie', 'isEgg': None},
+        '870': {'name': 'falinks', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '871': {'name': 'pincurchin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '872': {'name': 'snom', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '873': {'name': 'frosmoth', 'isEgg': None},
+        '874': {'name': 'stonjourner', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '875': {'name': 'eiscue', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '876': {'name': 'indeedee', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '877': {'name': 'morpeko', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '878': {'name': 'cufant', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '879': {'name': 'copperajah', 'isEgg': None},
+        '880': {'name': 'dracozolt', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '881': {'name': 'arctozolt', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '882': {'name': 'dracovish', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '883': {'name': 'arctovish', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '884': {'name': 'duraludon', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '885': {'name': 'dreepy', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '886': {'name': 'drakloak', 'isEgg': None},
+        '887': {'name': 'dragapult', 'isEgg': None},
+        '888': {'name': 'zacian', 'isEgg': {'eggType': 4, 'chance': 2.86}},
+        '889': {'name': 'zamazenta', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '890': {'name': 'eternatus', 'isEgg': None},
+        '891': {'name': 'kubfu', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '892': {'name': 'urshifu', 'isEgg': None},
+        '893': {'name': 'zarude', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '894': {'name': 'regieleki', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '895': {'name': 'regidrago', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '896': {'name': 'glastrier', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '897': {'name': 'spectrier', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '898': {'name': 'calyrex', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '899': {'name': 'wyrdeer', 'isEgg': None},
+        '900': {'name': 'kleavor', 'isEgg': None},
+        '901': {'name': 'ursaluna', 'isEgg': None},
+        '902': {'name': 'basculegion', 'isEgg': None},
+        '903': {'name': 'sneasler', 'isEgg': None},
+        '904': {'name': 'overqwil', 'isEgg': None},
+        '905': {'name': 'enamorus', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '906': {'name': 'sprigatito', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '907': {'name': 'floragato', 'isEgg': None},
+        '908': {'name': 'meowscarada', 'isEgg': None},
+        '909': {'name': 'fuecoco', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '910': {'name': 'crocalor', 'isEgg': None},
+        '911': {'name': 'skeledirge', 'isEgg': None},
+        '912': {'name': 'quaxly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '913': {'name': 'quaxwell', 'isEgg': None},
+        '914': {'name': 'quaquaval', 'isEgg': None},
+        '915': {'name': 'lechonk', 'isEgg': {'eggType': 1, 'chance': 0.46}},
+        '916': {'name': 'oinkologne', 'isEgg': None},
+        '917': {'name': 'tarountula', 'isEgg': {'eggType': 1, 'chance': 0.62}},
+        '918': {'name': 'spidops', 'isEgg': None},
+        '919': {'name': 'nymble', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '920': {'name': 'lokix', 'isEgg': None},
+        '921': {'name': 'pawmi', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '922': {'name': 'pawmo', 'isEgg': None},
+        '923': {'name': 'pawmot', 'isEgg': None},
+        '924': {'name': 'tandemaus', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '925': {'name': 'maushold', 'isEgg': None},
+        '926': {'name': 'fidough', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '927': {'name': 'dachsbun', 'isEgg': None},
+        '928': {'name': 'smoliv', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '929': {'name': 'dolliv', 'isEgg': None},
+        '930': {'name': 'arboliva', 'isEgg': None},
+        '931': {'name': 'squawkabilly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '932': {'name': 'nacli', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '933': {'name': 'naclstack', 'isEgg': None},
+        '934': {'name': 'garganacl', 'isEgg': None},
+        '935': {'name': 'charcadet', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '936': {'name': 'armarouge', 'isEgg': None},
+        '937': {'name': 'ceruledge', 'isEgg': None},
+        '938': {'name': 'tadbulb', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '939': {'name': 'bellibolt', 'isEgg': None},
+        '940': {'name': 'wattrel', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '941': {'name': 'kilowattrel', 'isEgg': None},
+        '942': {'name': 'maschiff', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '943': {'name': 'mabosstiff', 'isEgg': None},
+        '944': {'name': 'shroodle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '945': {'name': 'grafaiai', 'isEgg': None},
+        '946': {'name': 'bramblin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '947': {'name': 'brambleghast', 'isEgg': None},
+        '948': {'name': 'toedscool', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '949': {'name': 'toedscruel', 'isEgg': None},
+        '950': {'name': 'klawf', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '951': {'name': 'capsakid', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '952': {'name': 'scovillain', 'isEgg': None},
+        '953': {'name': 'rellor', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '954': {'name': 'rabsca', 'isEgg': None},
+        '955': {'name': 'flittle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '956': {'name': 'espathra', 'isEgg': None},
+        '957': {'name': 'tinkatink', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '958': {'name': 'tinkatuff', 'isEgg': None},
+        '959': {'name': 'tinkaton', 'isEgg': None},
+        '960': {'name': 'wiglett', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '961': {'name': 'wugtrio', 'isEgg': None},
+        '962': {'name': 'bombirdier', 'isEgg': {'eggType': 1, 'chance': 0.31}},
+        '963': {'name': 'finizen', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '964': {'name': 'palafin', 'isEgg': None},
+        '965': {'name': 'varoom', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '966': {'name': 'revavroom', 'isEgg': None},
+        '967': {'name': 'cyclizar', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '968': {'name': 'orthworm', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '969': {'name': 'glimmet', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '970': {'name': 'glimmora', 'isEgg': None},
+        '971': {'name': 'greavard', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '972': {'name': 'houndstone', 'isEgg': None},
+        '973': {'name': 'flamigo', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '974': {'name': 'cetoddle', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '975': {'name': 'cetitan', 'isEgg': None},
+        '976': {'name': 'veluza', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '977': {'name': 'dondozo', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '978': {'name': 'tatsugiri', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '979': {'name': 'annihilape', 'isEgg': None},
+        '980': {'name': 'clodsire', 'isEgg': None},
+        '981': {'name': 'farigiraf', 'isEgg': None},
+        '982': {'name': 'dudunsparce', 'isEgg': None},
+        '983': {'name': 'kingambit', 'isEgg': None},
+        '984': {'name': 'great_tusk', 'isEgg': None},
+        '985': {'name': 'scream_tail', 'isEgg': None},
+        '986': {'name': 'brute_bonnet', 'isEgg': None},
+        '987': {'name': 'flutter_mane', 'isEgg': None},
+        '988': {'name': 'slither_wing', 'isEgg': None},
+        '989': {'name': 'sandy_shocks', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '990': {'name': 'iron_treads', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '991': {'name': 'iron_bundle', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '992': {'name': 'iron_hands', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '993': {'name': 'iron_jugulis', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '994': {'name': 'iron_moth', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '995': {'name': 'iron_thorns', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '996': {'name': 'frigibax', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '997': {'name': 'arctibax', 'isEgg': None},
+        '998': {'name': 'baxcalibur', 'isEgg': None},
+        '999': {'name': 'gimmighoul', 'isEgg': {'eggType': 2, 'chance': 0.45}},
+        '1000': {'name': 'gholdengo', 'isEgg': None},
+        '1001': {'name': 'wo_chien', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '1002': {'name': 'chien_pao', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '1003': {'name': 'ting_lu', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '1004': {'name': 'chi_yu', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '1005': {'name': 'roaring_moon', 'isEgg': None},
+        '1006': {'name': 'iron_valiant', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '1007': {'name': 'koraidon', 'isEgg': {'eggType': 4, 'chance': 2.86}},
+        '1008': {'name': 'miraidon', 'isEgg': {'eggType': 4, 'chance': 2.86}},
+        '1009': {'name': 'walking_wake', 'isEgg': None},
+        '1010': {'name': 'iron_leaves', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '1011': {'name': 'dipplin', 'isEgg': None},
+        '1012': {'name': 'poltchageist', 'isEgg': {'eggType': 2, 'chance': 0.8}},
+        '1013': {'name': 'sinistcha', 'isEgg': None},
+        '1014': {'name': 'okidogi', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '1015': {'name': 'munkidori', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '1016': {'name': 'fezandipiti', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '1017': {'name': 'ogerpon', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '1018': {'name': 'archaludon', 'isEgg': None},
+        '1019': {'name': 'hydrapple', 'isEgg': None},
+        '1020': {'name': 'gouging_fire', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '1021': {'name': 'raging_bolt', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '1022': {'name': 'iron_boulder', 'isEgg': {'eggType': 3, 'chance': 0.69}},
+        '1023': {'name': 'iron_crown', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '1024': {'name': 'terapagos', 'isEgg': {'eggType': 4, 'chance': 5.0}},
+        '1025': {'name': 'pecharunt', 'isEgg': {'eggType': 3, 'chance': 1.2}},
+        '2019': {'name': 'alola_rattata', 'isEgg': {'eggType': 1, 'chance': 0.23}},
+        '2020': {'name': 'alola_raticate', 'isEgg': None},
+        '2026': {'name': 'alola_raichu', 'isEgg': None},
+        '2027': {'name': 'alola_sandshrew', 'isEgg': None},
+        '2028': {'name': 'alola_sandslash', 'isEgg': None},
+        '2037': {'name': 'alola_vulpix', 'isEgg': None},
+        '2038': {'name': 'alola_ninetales', 'isEgg': None},
+        '2050': {'name': 'alola_diglett', 'isEgg': {'eggType': 1, 'chance': 0.15}},
+        '2051': {'name': 'alola_dugtrio', 'isEgg': None},
+        '2052': {'name': 'alola_meowth', 'isEgg': None},
+        '2053': {'name': 'alola_persian', 'isEgg': None},
+        '2074': {'name': 'alola_geodude', 'isEgg': {'eggType': 1, 'chance': 0.15}},
+        '2075': {'name': 'alola_graveler', 'isEgg': None},
+        '2076': {'name': 'alola_golem', 'isEgg': None},
+        '2088': {'name': 'alola_grimer', 'isEgg': {'eggType': 1, 'chance': 0.15}},
+        '2089': {'name': 'alola_muk', 'isEgg': None},
+        '2103': {'name': 'alola_exeggutor', 'isEgg': None},
+        '2105': {'name': 'alola_marowak', 'isEgg': None},
+        '2670': {'name': 'eternal_floette', 'isEgg': None},
+        '4052': {'name': 'galar_meowth', 'isEgg': {'eggType': 2, 'chance': 0.4}},
+        '4077': {'name': 'galar_ponyta', 'isEgg': {'eggType': 2, 'chance': 0.4}},
+        '4078': {'name': 'galar_rapidash', 'isEgg': None},
+        '4079': {'name': 'galar_slowpoke', 'isEgg': {'eggType': 1, 'chance': 0.15}},
+        '4080': {'name': 'galar_slowbro', 'isEgg': None},
+        '4083': {'name': 'galar_farfetchd', 'isEgg': {'eggType': 2, 'chance': 0.23}},
+        '4110': {'name': 'galar_weezing', 'isEgg': None},
+        '4122': {'name': 'galar_mr_mime', 'isEgg': None},
+        '4144': {'name': 'galar_articuno', 'isEgg': {'eggType': 3, 'chance': 0.6}},
+        '4145': {'name': 'galar_zapdos', 'isEgg': {'eggType': 3, 'chance': 0.6}},
+        '4146': {'name': 'galar_moltres', 'isEgg': {'eggType': 3, 'chance': 0.6}},
+        '4199': {'name': 'galar_slowking', 'isEgg': None},
+        '4222': {'name': 'galar_corsola', 'isEgg': {'eggType': 2, 'chance': 0.4}},
+        '4263': {'name': 'galar_zigzagoon', 'isEgg': {'eggType': 1, 'chance': 0.15}},
+        '4264': {'name': 'galar_linoone', 'isEgg': None},
+        '4554': {'name': 'galar_darumaka', 'isEgg': {'eggType': 2, 'chance': 0.4}},
+        '4555': {'name': 'galar_darmanitan', 'isEgg': None},
+        '4562': {'name': 'galar_yamask', 'isEgg': {'eggType': 1, 'chance': 0.15}},
+        '4618': {'name': 'galar_stunfisk', 'isEgg': {'eggType': 2, 'chance': 0.4}},
+        '6058': {'name': 'hisui_growlithe', 'isEgg': {'eggType': 2, 'chance': 0.1}},
+        '6059': {'name': 'hisui_arcanine', 'isEgg': None},
+        '6100': {'name': 'hisui_voltorb', 'isEgg': {'eggType': 1, 'chance': 0.04}},
+        '6101': {'name': 'hisui_electrode', 'isEgg': None},
+        '6157': {'name': 'hisui_typhlosion', 'isEgg': None},
+        '6211': {'name': 'hisui_qwilfish', 'isEgg': {'eggType': 2, 'chance': 0.1}},
+        '6215': {'name': 'hisui_sneasel', 'isEgg': {'eggType': 2, 'chance': 0.1}},
+        '6503': {'name': 'hisui_samurott', 'isEgg': None},
+        '6549': {'name': 'hisui_lilligant', 'isEgg': None},
+        '6570': {'name': 'hisui_zorua', 'isEgg': {'eggType': 2, 'chance': 0.1}},
+        '6571': {'name': 'hisui_zoroark', 'isEgg': None},
+        '6628': {'name': 'hisui_braviary', 'isEgg': None},
+        '6705': {'name': 'hisui_sliggoo', 'isEgg': None},
+        '6706': {'name': 'hisui_goodra', 'isEgg': None},
+        '6713': {'name': 'hisui_avalugg', 'isEgg': None},
+        '6724': {'name': 'hisui_decidueye', 'isEgg': None},
+        '8128': {'name': 'paldea_tauros', 'isEgg': {'eggType': 2, 'chance': 0.23}},
+        '8194': {'name': 'paldea_wooper', 'isEgg': {'eggType': 1, 'chance': 0.15}},
+        '8901': {'name': 'bloodmoon_ursaluna', 'isEgg': {'eggType': 3, 'chance': 0.34}}
+    }
@@ -0,0 +1,174 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+Catalog of species with alternate forms and their form names.
+
+Loaded on first access through utilities.catalogs, see its module docstring.
+"""
+
+from enum import Enum
+
+
+class hasFormsEnum(Enum):
+    FORMID_DICT = {
+        '3': {'Venusaur': ['Normal', 'Mega', 'G-Max'], 'isNormalForm': False},
+        '6': {'Charizard': ['Normal', 'Mega-X', 'Mega-Y', 'G-Max'], 'isNormalForm': False},
+        '9': {'Blastoise': ['Normal', 'Mega', 'G-Max'], 'isNormalForm': False},
+        '12': {'Butterfree': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '18': {'Pidgeot': ['Normal', 'Mega'], 'isNormalForm': False},
+        '25': {'Pikachu': ['Normal', 'Partner', 'Cosplay', 'Cool Cosplay', 'Beauty Cosplay', 'Cute Cosplay', 'Smart Cosplay', 'Tough Cosplay', 'G-Max'], 'isNormalForm': True},
+        '52': {'Meowth': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '65': {'Alakazam': ['Normal', 'Mega'], 'isNormalForm': False},
+        '68': {'Machamp': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '80': {'Slowbro': ['Normal', 'Mega'], 'isNormalForm': False},
+        '94': {'Gengar': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '115': {'Kangaskhan': ['Normal', 'Mega'], 'isNormalForm': False},
+        '127': {'Pinsir': ['Normal', 'Mega'], 'isNormalForm': False},
+        '130': {'Gyarados': ['Normal', 'Mega'], 'isNormalForm': False},
+        '131': {'Lapras': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '133': {'Eevee': ['Normal', 'Partner', 'G-Max'], 'isNormalForm': True},
+        '142': {'Aerodactyl': ['Normal', 'Mega'], 'isNormalForm': False},
+        '143': {'Snorlax': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '150': {'Mewtwo': ['Normal', 'Mega-X', 'Mega-Y'], 'isNormalForm': False},
+        '172': {'Pichu': ['Normal', 'Spiky-Eared'], 'isNormalForm': False},
+        '181': {'Ampharos': ['Normal', 'Mega'], 'isNormalForm': False},
+        '201': {'Unown': ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', '!', '?'], 'isNormalForm': False},
+        '208': {'Steelix': ['Normal', 'Mega'], 'isNormalForm': False},
+        '212': {'Scizor': ['Normal', 'Mega'], 'isNormalForm': False},
+        '214': {'Heracross': ['Normal', 'Mega'], 'isNormalForm': False},
+        '229': {'Houndoom': ['Normal', 'Mega'], 'isNormalForm': False},
+        '248': {'Tyranitar': ['Normal', 'Mega'], 'isNormalForm': False},
+        '254': {'Sceptile': ['Normal', 'Mega'], 'isNormalForm': False},
+        '257': {'Blaziken': ['Normal', 'Mega'], 'isNormalForm': False},
+        '260': {'Swampert': ['Normal', 'Mega'], 'isNormalForm': False},
+        '282': {'Gardevoir': ['Normal', 'Mega'], 'isNormalForm': False},
+        '302': {'Sableye': ['Normal', 'Mega'], 'isNormalForm': False},
+        '303': {'Mawile': ['Normal', 'Mega'], 'isNormalForm': False},
+        '306': {'Aggron': ['Normal', 'Mega'], 'isNormalForm': False},
+        '308': {'Medicham': ['Normal', 'Mega'], 'isNormalForm': False},
+        '310': {'Manectric': ['Normal', 'Mega'], 'isNormalForm': False},
+        '319': {'Sharpedo': ['Normal', 'Mega'], 'isNormalForm': False},
+        '323': {'Camerupt': ['Normal', 'Mega'], 'isNormalForm': False},
+        '334': {'Altaria': ['Normal', 'Mega'], 'isNormalForm': False},
+        '351': {'Castform': ['Normal', 'Sunny', 'Rainy', 'Snowy'], 'isNormalForm': True},
+        '354': {'Banette': ['Normal', 'Mega'], 'isNormalForm': False},
+        '359': {'Absol': ['Normal', 'Mega'], 'isNormalForm': False},
+        '362': {'Glalie': ['Normal', 'Mega'], 'isNormalForm': False},
+        '373': {'Salamence': ['Normal', 'Mega'], 'isNormalForm': False},
+        '376': {'Metagross': ['Normal', 'Mega'], 'isNormalForm': False},
+        '380': {'Latias': ['Normal', 'Mega'], 'isNormalForm': False},
+        '381': {'Latios': ['Normal', 'Mega'], 'isNormalForm': False},
+        '382': {'Kyogre': ['Normal', 'Primal'], 'isNormalForm': False},
+        '383': {'Groudon': ['Normal', 'Primal'], 'isNormalForm': False},
+        '384': {'Rayquaza': ['Normal', 'Mega'], 'isNormalForm': False},
+        '386': {'Deoxys': ['Normal', 'Attack', 'Defense', 'Speed'], 'isNormalForm': False},
+        '412': {'Burmy': ['Plant', 'Sandy', 'Trash'], 'isNormalForm': True},
+        '413': {'Wormadam': ['Plant', 'Sandy', 'Trash'], 'isNormalForm': False},
+        '421': {'Cherrim': ['Overcast', 'Sunshine'], 'isNormalForm': False},
+        '422': {'Shellos': ['East Sea', 'West Sea'], 'isNormalForm': True},
+        '423': {'Gastrodon': ['East Sea', 'West Sea'], 'isNormalForm': False},
+        '428': {'Lopunny': ['Normal', 'Mega'], 'isNormalForm': False},
+        '445': {'Garchomp': ['Normal', 'Mega'], 'isNormalForm': False},
+        '448': {'Lucario': ['Normal', 'Mega'], 'isNormalForm': False},
+        '460': {'Abomasnow': ['Normal', 'Mega'], 'isNormalForm': False},
+        '475': {'Gallade': ['Normal', 'Mega'], 'isNormalForm': False},
+        '479': {'Rotom': ['Normal', 'Heat', 'Wash', 'Frost', 'Fan', 'Mow'], 'isNormalForm': True},
+        '483': {'Dialga': ['Normal', 'Origin'], 'isNormalForm': False},
+        '484': {'Palkia': ['Normal', 'Origin'], 'isNormalForm': False},
+        '487': {'Giratina': ['Normal', 'Origin'], 'isNormalForm': False},
+        '492': {'Shaymin': ['Land', 'Sky'], 'isNormalForm': False},
+        '493': {'Arceus': ['Normal', 'Fighting', 'Flying', 'Poison', 'Ground', 'rock', 'Bug', 'Ghost', 'Steel', 'Fire', 'Water', 'Grass', 'Electric', 'Psychic', 'Ice', 'Dragon', 'Dark', 'Fairy', '???'], 'isNormalForm': False},
+        '531': {'Audino': ['Normal', 'Mega'], 'isNormalForm': False},
+        '550': {'Basculin': ['Red-Striped', 'Blue-Striped', 'White-Striped'], 'isNormalForm': True},
+        '555': {'Darmanitan': ['Standart', 'Zen'], 'isNormalForm': False},
+        '569': {'Garbodor': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '585': {'Deerling': ['Spring', 'Summer', 'Autumn', 'Winter'], 'isNormalForm': True},
+        '586': {'Sawsbuck': ['Spring', 'Summer', 'Autumn', 'Winter'], 'isNormalForm': False},
+        '641': {'Tornadus': ['Incarnate', 'Therian'], 'isNormalForm': False},
+        '642': {'Thundurus': ['Incarnate', 'Therian'], 'isNormalForm': False},
+        '645': {'Landorus': ['Incarnate', 'Therian'], 'isNormalForm': False},
+        '646': {'Kyurem': ['Normal', 'Black', 'White'], 'isNormalForm': False},
+        '647': {'Keldeo': ['Ordinary', 'Resolute'], 'isNormalForm': False},
+        '648': {'Meloetta': ['Aria', 'Pirouette'], 'isNormalForm': False},
+        '649': {'Genesect': ['Normal', 'Shock', 'Burn', 'Chill', 'Douse'], 'isNormalForm': False},
+        '656': {'Froakie': ['Normal', 'Battle Bond'], 'isNormalForm': True},
+        '657': {'Frogadier': ['Normal', 'Battle Bond'], 'isNormalForm': False},
+        '658': {'Greninja': ['Normal', 'Battle Bond', 'Ash'], 'isNormalForm': False},
+        '664': {'Scatterbug': ['Meadow', 'Icy Snow', 'Polar', 'Tundra', 'Continental', 'Garden', 'Elegant'], 'isNormalForm': True},
+        '665': {'Spewpa': ['Meadow', 'Icy', 'Polar', 'Tundra', 'Contintental', 'Garden', 'Elegant', 'Modern', 'Marine', 'Archipelago', 'High Plains', 'Sandrstorm', 'River', 'Monsoon', 'Savanna', 'Sun', 'Ocean', 'Jungle', 'Fancy', 'Pokeball'], 'isNormalForm': False},
+        '666': {'Vivillon': ['Meadow', 'Icy', 'Polar', 'Tundra', 'Contintental', 'Garden', 'Elegant', 'Modern', 'Marine', 'Archipelago', 'High Plains', 'Sandrstorm', 'River', 'Monsoon', 'Savanna', 'Sun', 'Ocean', 'Jungle', 'Fancy', 'Pokeball'], 'isNormalForm': False},
+        '669': {'Flabebe': ['Red', 'Yellow', 'Orange', 'Blue', 'White'], 'isNormalForm': True},
+        '670': {'Floette': ['Red', 'Yellow', 'Orange', 'Blue', 'White'], 'isNormalForm': False},
+        '671': {'Florges': ['Red', 'Yellow', 'Orange', 'Blue', 'White'], 'isNormalForm': False},
+        '676': {'Furfrou': ['Natural', 'Heart', 'Star', 'Diamond', 'Debutante', 'Matron', 'Dandy', 'La Reine', 'Kabuki', 'Pharaoh'], 'isNormalForm': True},
+        '678': {'Meowstic': ['Male', 'Female'], 'isNormalForm': False},
+        '681': {'Aegislash': ['Shield', 'Blade'], 'isNormalForm': False},
+        '710': {'Pumpkaboo': ['Average', 'Small', 'Large', 'Super Size'], 'isNormalForm': True},
+        '711': {'Gourgeist': ['Average', 'Small', 'Large', 'Super Size'], 'isNormalForm': False},
+        '716': {'Xerneas': ['Neutral', 'Active'], 'isNormalForm': True},
+        '718': {'Zygarde': ['50%', '10%', '50% Power', '10% Power', 'Complete'], 'isNormalForm': True},
+        '719': {'Diancie': ['Normal', 'Mega'], 'isNormalForm': False},
+        '720': {'Hoopa': ['Confined', 'Unbound'], 'isNormalForm': False},
+        '741': {'Oricorio': ['Baile', 'Pom-Pom', "Pa'u", 'Sensu'], 'isNormalForm': True},
+        '744': {'Rockruff': ['Normal', 'Own Tempo'], 'isNormalForm': True},
+        '745': {'Lycanroc': ['Midday', 'Midnight', 'Dusk'], 'isNormalForm': False},
+        '746': {'Wishiwashi': ['Solo', 'School'], 'isNormalForm': False},
+        '773': {'Silvally': ['Normal', 'Fighting', 'Flying', 'Poison', 'Ground', 'Rock', 'Bug', 'Ghost', 'Steel', 'Fire', 'Water', 'Grass', 'Electric', 'Psychic', 'Ice', 'Dragon', 'Dark', 'Fairy'], 'isNormalForm': False},
+        '774': {'Minior': ['Red Meteor', 'Orange Meteor', 'Yellow Meteor', 'Green Meteor', 'Blue Meteor', 'Indigo Meteor', 'Violet Meteor', 'Red Core', 'Orange Core', 'Yellow Core', 'Green Core', 'Blue Core', 'Indigo Core', 'Violet Core'], 'isNormalForm': True},
+        '800': {'Necrozma': ['Normal', 'Dusk Mane', 'Dawn Wings', 'Ultra'], 'isNormalForm': False},
+        '801': {'Magearna': ['Normal', 'Original'], 'isNormalForm': True},
+        '802': {'Marshadow': ['Normal', 'Zenith'], 'isNormalForm': True},
+        '809': {'Melmetal': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '812': {'Rillaboom': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '815': {'Cinderace': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '818': {'Inteleon': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '823': {'Corviknight': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '826': {'Orbeetle': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '834': {'Drednaw': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '839': {'Coalossal': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '841': {'Flapple': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '842': {'Appletun': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '844': {'Sandaconda': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '845': {'Cramorant': ['Normal', 'Gulping', 'Gorging'], 'isNormalForm': False},
+        '849': {'Toxtricity': ['Amped', 'Low-key', 'G-Max'], 'isNormalForm': False},
+        '851': {'Centiskorch': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '854': {'Sinistea': ['Phony', 'Antique'], 'isNormalForm': False},
+        '855': {'Polteageist': ['Phony', 'Antique'], 'isNormalForm': False},
+        '858': {'Hatterene': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '861': {'Grimmsnarl': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '869': {'Alcremie': ['Vanilla', 'Ruby', 'Matcha', 'Mint', 'Lemon', 'Salted', 'Ruby Swirl', 'Caramel Swirl', 'Rainbow Swirl', 'G-Max'], 'isNormalForm': False},
+        '875': {'Eiscue': ['Ice', 'No Ice'], 'isNormalForm': False},
+        '876': {'Indeedee': ['Male', 'Female'], 'isNormalForm': False},
+        '877': {'Morpeko': ['Full Belly', 'Hangry'], 'isNormalForm': False},
+        '879': {'Copperajah': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '884': {'Duraludon': ['Normal', 'G-Max'], 'isNormalForm': False},
+        '888': {'Zacian': ['Hero of many Battles', 'Crowned'], 'isNormalForm': False},
+        '889': {'Zamazenta': ['Hero of many Battles', 'Crowned'], 'isNormalForm': False},
+        '890': {'Eternatus': ['Normal', 'E-Max'], 'isNormalForm': False},
+        '892': {'Urshifu': ['Single Strike', 'Rapid Strike', 'G-Max Single Strike', 'G-Max Rapid Strike'], 'isNormalForm': False},
+        '893': {'Zarude': ['Normal', 'Dada'], 'isNormalForm': True},
+        '898': {'Calyrex': ['Normal', 'Ice', 'Shadow'], 'isNormalForm': False},
+        '902': {'Basculegion': ['Male', 'Female'], 'isNormalForm': False},
+        '905': {'Enamorus': ['Incarnate', 'Therian'], 'isNormalForm': False},
+        '916': {'Oinkologne': ['Male', 'Female'], 'isNormalForm': False},
+        '925': {'Maushold': ['Family of Four', 'Family of Three'], 'isNormalForm': False},
+        '931': {'Squawkabilly': ['Green', 'Blue', 'Yellow', 'White'], 'isNormalForm': True},
+        '964': {'Palafin': ['Zero', 'Hero'], 'isNormalForm': False},
+        '978': {'Tatsugiri': ['Curly', 'Droopy', 'Stretchy'], 'isNormalForm': True},
+        '982': {'Dudunsparce': ['Two Segment', 'Three Segment'], 'isNormalForm': False},
+        '999': {'Gimmighoul': ['Chest', 'Roaming'], 'isNormalForm': True},
+        '1007': {'Koraidon': ['Apex', 'Limited', 'Sprinting', 'Swimming', 'Gliding'], 'isNormalForm': True},
+        '1008': {'Miraidon': ['Ultimate', 'Low Drive', 'Aquatic', 'Glide'], 'isNormalForm': True},
+        '1012': {'Poltchageist': ['Counterfeit', 'Artisan'], 'isNormalForm': False},
+        '1013': {'Sinistcha': ['Unremarkable', 'Masterpiece'], 'isNormalForm': False},
+        '1017': {'Ogerpon': ['Teal', 'Wellspring', 'Hearthflame', 'Cornerstone', 'Teal Mask Tera', 'Wellspring Mask Tera', 'Hearthflame Mask Tera', 'Cornerstone Mask Tera'], 'isNormalForm': False},
+        '1024': {'Terapagos': ['Normal', 'Terastal', 'Stellar'], 'isNormalForm': False},
+        '4555': {'Galar Darmanitan': ['Standart', 'Zen'], 'isNormalForm': False},
+        '8128': {'Paldea Tauros': ['Combat', 'Blaze', 'Aqua'], 'isNormalForm': True}
+    }
@@ -0,0 +1,73 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+Catalog of natures and their slot indices.
+
+Loaded on first access through utilities.catalogs, see its module docstring.
+"""
+
+from enum import Enum, auto
+
+
+class Nature(Enum):
+    HARDY = auto()
+    LONELY = auto()
+    BRAVE = auto()
+    ADAMANT = auto()
+    NAUGHTY = auto()
+    BOLD = auto()
+    DOCILE = auto()
+    RELAXED = auto()
+    IMPISH = auto()
+    LAX = auto()
+    TIMID = auto()
+    HASTY = auto()
+    SERIOUS = auto()
+    JOLLY = auto()
+    NAIVE = auto()
+    MODEST = auto()
+    MILD = auto()
+    QUIET = auto()
+    BASHFUL = auto()
+    RASH = auto()
+    CALM = auto()
+    GENTLE = auto()
+    SASSY = auto()
+    CAREFUL = auto()
+    QUIRKY = auto()
+    UNLOCK_ALL = auto()
+
+class NatureSlot(Enum):
+    NATURE_SLOT = {
+        'HARDY': 0,
+        'LONELY': 1,
+        'BRAVE': 2,
+        'ADAMANT': 3,
+        'NAUGHTY': 4,
+        'BOLD': 5,
+        'DOCILE': 6,
+        'RELAXED': 7,
+        'IMPISH': 8,
+        'LAX': 9,
+        'TIMID': 10,
+        'HASTY': 11,
+        'SERIOUS': 12,
+        'JOLLY': 13,
+        'NAIVE': 14,
+        'MODEST': 15,
+        'MILD': 16,
+        'QUIET': 17,
+        'BASHFUL': 18,
+        'RASH': 19,
+        'CALM': 20,
+        'GENTLE': 21,
+        'SASSY': 22,
+        'CAREFUL': 23,
+        'QUIRKY': 24
+    }
@@ -0,0 +1,38 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+Catalog of species that have no passive ability.
+
+Loaded on first access through utilities.catalogs, see its module docstring.
+"""
+
+from enum import Enum
+
+
+class NoPassive(Enum):
+    NO_PASSIVE_DICT = {
+        '25': '25',
+        '35': '35',
+        '39': '39',
+        '106': '106',
+        '107': '107',
+        '113': '113',
+        '122': '122',
+        '124': '124',
+        '125': '125',
+        '126': '126',
+        '143': '143',
+        '183': '183',
+        '185': '185',
+        '202': '202',
+        '226': '226',
+        '315': '315',
+        '358': '358',
+        '4122': '4122'
+    }
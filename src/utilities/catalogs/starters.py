@@ -0,0 +1,607 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+Catalog of starter species available in the starter select screen.
+
+Loaded on first access through utilities.catalogs, see its module docstring.
+"""
+
+from enum import Enum
+
+
+class StarterEnum(Enum):
+    STARTER_DICT = {
+        'bulbasaur': 1,
+        'charmander': 4,
+        'squirtle': 7,
+        'caterpie': 10,
+        'weedle': 13,
+        'pidgey': 16,
+        'rattata': 19,
+        'spearow': 21,
+        'ekans': 23,
+        'pikachu': 25,
+        'sandshrew': 27,
+        'nidoran_f': 29,
+        'nidoran_m': 32,
+        'clefairy': 35,
+        'vulpix': 37,
+        'jigglypuff': 39,
+        'zubat': 41,
+        'oddish': 43,
+        'paras': 46,
+        'venonat': 48,
+        'diglett': 50,
+        'meowth': 52,
+        'psyduck': 54,
+        'mankey': 56,
+        'growlithe': 58,
+        'poliwag': 60,
+        'abra': 63,
+        'machop': 66,
+        'bellsprout': 69,
+        'tentacool': 72,
+        'geodude': 74,
+        'ponyta': 77,
+        'slowpoke': 79,
+        'magnemite': 81,
+        'farfetchd': 83,
+        'doduo': 84,
+        'seel': 86,
+        'grimer': 88,
+        'shellder': 90,
+        'gastly': 92,
+        'onix': 95,
+        'drowzee': 96,
+        'krabby': 98,
+        'voltorb': 100,
+        'exeggcute': 102,
+        'cubone': 104,
+        'hitmonlee': 106,
+        'hitmonchan': 107,
+        'lickitung': 108,
+        'koffing': 109,
+        'rhyhorn': 111,
+        'chansey': 113,
+        'tangela': 114,
+        'kangaskhan': 115,
+        'horsea': 116,
+        'goldeen': 118,
+        'staryu': 120,
+        'mr_mime': 122,
+        'scyther': 123,
+        'jynx': 124,
+        'electabuzz': 125,
+        'magmar': 126,
+        'pinsir': 127,
+        'tauros': 128,
+        'magikarp': 129,
+        'lapras': 131,
+        'ditto': 132,
+        'eevee': 133,
+        'porygon': 137,
+        'omanyte': 138,
+        'kabuto': 140,
+        'aerodactyl': 142,
+        'snorlax': 143,
+        'articuno': 144,
+        'zapdos': 145,
+        'moltres': 146,
+        'dratini': 147,
+        'mewtwo': 150,
+        'mew': 151,
+        'chikorita': 152,
+        'cyndaquil': 155,
+        'totodile': 158,
+        'sentret': 161,
+        'hoothoot': 163,
+        'ledyba': 165,
+        'spinarak': 167,
+        'chinchou': 170,
+        'pichu': 172,
+        'cleffa': 173,
+        'igglybuff': 174,
+        'togepi': 175,
+        'natu': 177,
+        'mareep': 179,
+        'marill': 183,
+        'sudowoodo': 185,
+        'hoppip': 187,
+        'aipom': 190,
+        'sunkern': 191,
+        'yanma': 193,
+        'wooper': 194,
+        'murkrow': 198,
+        'misdreavus': 200,
+        'unown': 201,
+        'wobbuffet': 202,
+        'girafarig': 203,
+        'pineco': 204,
+        'dunsparce': 206,
+        'gligar': 207,
+        'snubbull': 209,
+        'qwilfish': 211,
+        'shuckle': 213,
+        'heracross': 214,
+        'sneasel': 215,
+        'teddiursa': 216,
+        'slugma': 218,
+        'swinub': 220,
+        'corsola': 222,
+        'remoraid': 223,
+        'delibird': 225,
+        'mantine': 226,
+        'skarmory': 227,
+        'houndour': 228,
+        'phanpy': 231,
+        'stantler': 234,
+        'smeargle': 235,
+        'tyrogue': 236,
+        'smoochum': 238,
+        'elekid': 239,
+        'magby': 240,
+        'miltank': 241,
+        'raikou': 243,
+        'entei': 244,
+        'suicune': 245,
+        'larvitar': 246,
+        'lugia': 249,
+        'ho_oh': 250,
+        'celebi': 251,
+        'treecko': 252,
+        'torchic': 255,
+        'mudkip': 258,
+        'poochyena': 261,
+        'zigzagoon': 263,
+        'wurmple': 265,
+        'lotad': 270,
+        'seedot': 273,
+        'taillow': 276,
+        'wingull': 278,
+        'ralts': 280,
+        'surskit': 283,
+        'shroomish': 285,
+        'slakoth': 287,
+        'nincada': 290,
+        'whismur': 293,
+        'makuhita': 296,
+        'azurill': 298,
+        'nosepass': 299,
+        'skitty': 300,
+        'sableye': 302,
+        'mawile': 303,
+        'aron': 304,
+        'meditite': 307,
+        'electrike': 309,
+        'plusle': 311,
+        'minun': 312,
+        'volbeat': 313,
+        'illumise': 314,
+        'roselia': 315,
+        'gulpin': 316,
+        'carvanha': 318,
+        'wailmer': 320,
+        'numel': 322,
+        'torkoal': 324,
+        'spoink': 325,
+        'spinda': 327,
+        'trapinch': 328,
+        'cacnea': 331,
+        'swablu': 333,
+        'zangoose': 335,
+        'seviper': 336,
+        'lunatone': 337,
+        'solrock': 338,
+        'barboach': 339,
+        'corphish': 341,
+        'baltoy': 343,
+        'lileep': 345,
+        'anorith': 347,
+        'feebas': 349,
+        'castform': 351,
+        'kecleon': 352,
+        'shuppet': 353,
+        'duskull': 355,
+        'tropius': 357,
+        'chimecho': 358,
+        'absol': 359,
+        'wynaut': 360,
+        'snorunt': 361,
+        'spheal': 363,
+        'clamperl': 366,
+        'relicanth': 369,
+        'luvdisc': 370,
+        'bagon': 371,
+        'beldum': 374,
+        'regirock': 377,
+        'regice': 378,
+        'registeel': 379,
+        'latias': 380,
+        'latios': 381,
+        'kyogre': 382,
+        'groudon': 383,
+        'rayquaza': 384,
+        'jirachi': 385,
+        'deoxys': 386,
+        'turtwig': 387,
+        'chimchar': 390,
+        'piplup': 393,
+        'starly': 396,
+        'bidoof': 399,
+        'kricketot': 401,
+        'shinx': 403,
+        'budew': 406,
+        'cranidos': 408,
+        'shieldon': 410,
+        'burmy': 412,
+        'combee': 415,
+        'pachirisu': 417,
+        'buizel': 418,
+        'cherubi': 420,
+        'shellos': 422,
+        'drifloon': 425,
+        'buneary': 427,
+        'glameow': 431,
+        'chingling': 433,
+        'stunky': 434,
+        'bronzor': 436,
+        'bonsly': 438,
+        'mime_jr': 439,
+        'happiny': 440,
+        'chatot': 441,
+        'spiritomb': 442,
+        'gible': 443,
+        'munchlax': 446,
+        'riolu': 447,
+        'hippopotas': 449,
+        'skorupi': 451,
+        'croagunk': 453,
+        'carnivine': 455,
+        'finneon': 456,
+        'mantyke': 458,
+        'snover': 459,
+        'rotom': 479,
+        'uxie': 480,
+        'mesprit': 481,
+        'azelf': 482,
+        'dialga': 483,
+        'palkia': 484,
+        'heatran': 485,
+        'regigigas': 486,
+        'giratina': 487,
+        'cresselia': 488,
+        'phione': 489,
+        'manaphy': 490,
+        'darkrai': 491,
+        'shaymin': 492,
+        'arceus': 493,
+        'victini': 494,
+        'snivy': 495,
+        'tepig': 498,
+        'oshawott': 501,
+        'patrat': 504,
+        'lillipup': 506,
+        'purrloin': 509,
+        'pansage': 511,
+        'pansear': 513,
+        'panpour': 515,
+        'munna': 517,
+        'pidove': 519,
+        'blitzle': 522,
+        'roggenrola': 524,
+        'woobat': 527,
+        'drilbur': 529,
+        'audino': 531,
+        'timburr': 532,
+        'tympole': 535,
+        'throh': 538,
+        'sawk': 539,
+        'sewaddle': 540,
+        'venipede': 543,
+        'cottonee': 546,
+        'petilil': 548,
+        'basculin': 550,
+        'sandile': 551,
+        'darumaka': 554,
+        'maractus': 556,
+        'dwebble': 557,
+        'scraggy': 559,
+        'sigilyph': 561,
+        'yamask': 562,
+        'tirtouga': 564,
+        'archen': 566,
+        'trubbish': 568,
+        'zorua': 570,
+        'minccino': 572,
+        'gothita': 574,
+        'solosis': 577,
+        'ducklett': 580,
+        'vanillite': 582,
+        'deerling': 585,
+        'emolga': 587,
+        'karrablast': 588,
+        'foongus': 590,
+        'frillish': 592,
+        'alomomola': 594,
+        'joltik': 595,
+        'ferroseed': 597,
+        'klink': 599,
+        'tynamo': 602,
+        'elgyem': 605,
+        'litwick': 607,
+        'axew': 610,
+        'cubchoo': 613,
+        'cryogonal': 615,
+        'shelmet': 616,
+        'stunfisk': 618,
+        'mienfoo': 619,
+        'druddigon': 621,
+        'golett': 622,
+        'pawniard': 624,
+        'bouffalant': 626,
+        'rufflet': 627,
+        'vullaby': 629,
+        'heatmor': 631,
+        'durant': 632,
+        'deino': 633,
+        'larvesta': 636,
+        'cobalion': 638,
+        'terrakion': 639,
+        'virizion': 640,
+        'tornadus': 641,
+        'thundurus': 642,
+        'reshiram': 643,
+        'zekrom': 644,
+        'landorus': 645,
+        'kyurem': 646,
+        'keldeo': 647,
+        'meloetta': 648,
+        'genesect': 649,
+        'chespin': 650,
+        'fennekin': 653,
+        'froakie': 656,
+        'bunnelby': 659,
+        'fletchling': 661,
+        'scatterbug': 664,
+        'litleo': 667,
+        'flabebe': 669,
+        'skiddo': 672,
+        'pancham': 674,
+        'furfrou': 676,
+        'espurr': 677,
+        'honedge': 679,
+        'spritzee': 682,
+        'swirlix': 684,
+        'inkay': 686,
+        'binacle': 688,
+        'skrelp': 690,
+        'clauncher': 692,
+        'helioptile': 694,
+        'tyrunt': 696,
+        'amaura': 698,
+        'hawlucha': 701,
+        'dedenne': 702,
+        'carbink': 703,
+        'goomy': 704,
+        'klefki': 707,
+        'phantump': 708,
+        'pumpkaboo': 710,
+        'bergmite': 712,
+        'noibat': 714,
+        'xerneas': 716,
+        'yveltal': 717,
+        'zygarde': 718,
+        'diancie': 719,
+        'hoopa': 720,
+        'volcanion': 721,
+        'rowlet': 722,
+        'litten': 725,
+        'popplio': 728,
+        'pikipek': 731,
+        'yungoos': 734,
+        'grubbin': 736,
+        'crabrawler': 739,
+        'oricorio': 741,
+        'cutiefly': 742,
+        'rockruff': 744,
+        'wishiwashi': 746,
+        'mareanie': 747,
+        'mudbray': 749,
+        'dewpider': 751,
+        'fomantis': 753,
+        'morelull': 755,
+        'salandit': 757,
+        'stufful': 759,
+        'bounsweet': 761,
+        'comfey': 764,
+        'oranguru': 765,
+        'passimian': 766,
+        'wimpod': 767,
+        'sandygast': 769,
+        'pyukumuku': 771,
+        'type_null': 772,
+        'minior': 774,
+        'komala': 775,
+        'turtonator': 776,
+        'togedemaru': 777,
+        'mimikyu': 778,
+        'bruxish': 779,
+        'drampa': 780,
+        'dhelmise': 781,
+        'jangmo_o': 782,
+        'tapu_koko': 785,
+        'tapu_lele': 786,
+        'tapu_bulu': 787,
+        'tapu_fini': 788,
+        'cosmog': 789,
+        'nihilego': 793,
+        'buzzwole': 794,
+        'pheromosa': 795,
+        'xurkitree': 796,
+        'celesteela': 797,
+        'kartana': 798,
+        'guzzlord': 799,
+        'necrozma': 800,
+        'magearna': 801,
+        'marshadow': 802,
+        'poipole': 803,
+        'stakataka': 805,
+        'blacephalon': 806,
+        'zeraora': 807,
+        'meltan': 808,
+        'grookey': 810,
+        'scorbunny': 813,
+        'sobble': 816,
+        'skwovet': 819,
+        'rookidee': 821,
+        'blipbug': 824,
+        'nickit': 827,
+        'gossifleur': 829,
+        'wooloo': 831,
+        'chewtle': 833,
+        'yamper': 835,
+        'rolycoly': 837,
+        'applin': 840,
+        'silicobra': 843,
+        'cramorant': 845,
+        'arrokuda': 846,
+        'toxel': 848,
+        'sizzlipede': 850,
+        'clobbopus': 852,
+        'sinistea': 854,
+        'hatenna': 856,
+        'impidimp': 859,
+        'milcery': 868,
+        'falinks': 870,
+        'pincurchin': 871,
+        'snom': 872,
+        'stonjourner': 874,
+        'eiscue': 875,
+        'indeedee': 876,
+        'morpeko': 877,
+        'cufant': 878,
+        'dracozolt': 880,
+        'arctozolt': 881,
+        'dracovish': 882,
+        'arctovish': 883,
+        'duraludon': 884,
+        'dreepy': 885,
+        'zacian': 888,
+        'zamazenta': 889,
+        'eternatus': 890,
+        'kubfu': 891,
+        'zarude': 893,
+        'regieleki': 894,
+        'regidrago': 895,
+        'glastrier': 896,
+        'spectrier': 897,
+        'calyrex': 898,
+        'enamorus': 905,
+        'sprigatito': 906,
+        'fuecoco': 909,
+        'quaxly': 912,
+        'lechonk': 915,
+        'tarountula': 917,
+        'nymble': 919,
+        'pawmi': 921,
+        'tandemaus': 924,
+        'fidough': 926,
+        'smoliv': 928,
+        'squawkabilly': 931,
+        'nacli': 932,
+        'charcadet': 935,
+        'tadbulb': 938,
+        'wattrel': 940,
+        'maschiff': 942,
+        'shroodle': 944,
+        'bramblin': 946,
+        'toedscool': 948,
+        'klawf': 950,
+        'capsakid': 951,
+        'rellor': 953,
+        'flittle': 955,
+        'tinkatink': 957,
+        'wiglett': 960,
+        'bombirdier': 962,
+        'finizen': 963,
+        'varoom': 965,
+        'cyclizar': 967,
+        'orthworm': 968,
+        'glimmet': 969,
+        'greavard': 971,
+        'flamigo': 973,
+        'cetoddle': 974,
+        'veluza': 976,
+        'dondozo': 977,
+        'tatsugiri': 978,
+        'great_tusk': 984,
+        'scream_tail': 985,
+        'brute_bonnet': 986,
+        'flutter_mane': 987,
+        'slither_wing': 988,
+        'sandy_shocks': 989,
+        'iron_treads': 990,
+        'iron_bundle': 991,
+        'iron_hands': 992,
+        'iron_jugulis': 993,
+        'iron_moth': 994,
+        'iron_thorns': 995,
+        'frigibax': 996,
+        'gimmighoul': 999,
+        'wo_chien': 1001,
+        'chien_pao': 1002,
+        'ting_lu': 1003,
+        'chi_yu': 1004,
+        'roaring_moon': 1005,
+        'iron_valiant': 1006,
+        'koraidon': 1007,
+        'miraidon': 1008,
+        'walking_wake': 1009,
+        'iron_leaves': 1010,
+        'poltchageist': 1012,
+        'okidogi': 1014,
+        'munkidori': 1015,
+        'fezandipiti': 1016,
+        'ogerpon': 1017,
+        'gouging_fire': 1020,
+        'raging_bolt': 1021,
+        'iron_boulder': 1022,
+        'iron_crown': 1023,
+        'terapagos': 1024,
+        'pecharunt': 1025,
+        'alola_rattata': 2019,
+        'alola_sandshrew': 2027,
+        'alola_vulpix': 2037,
+        'alola_diglett': 2050,
+        'alola_meowth': 2052,
+        'alola_geodude': 2074,
+        'alola_grimer': 2088,
+        'eternal_floette': 2670,
+        'galar_meowth': 4052,
+        'galar_ponyta': 4077,
+        'galar_slowpoke': 4079,
+        'galar_farfetchd': 4083,
+        'galar_mr_mime': 4122,
+        'galar_articuno': 4144,
+        'galar_zapdos': 4145,
+        'galar_moltres': 4146,
+        'galar_corsola': 4222,
+        'galar_zigzagoon': 4263,
+        'galar_darumaka': 4554,
+        'galar_yamask': 4562,
+        'galar_stunfisk': 4618,
+        'hisui_growlithe': 6058,
+        'hisui_voltorb': 6100,
+        'hisui_qwilfish': 6211,
+        'hisui_sneasel': 6215,
+        'hisui_zorua': 6570,
+        'paldea_tauros': 8128,
+        'paldea_wooper': 8194,
+        'bloodmoon_ursaluna': 8901,
+    }
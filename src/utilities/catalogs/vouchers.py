@@ -0,0 +1,162 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+# Based on: https://github.com/pagefaultgames/pokerogue/
+
+"""
+Catalog of vouchers mapped to their IDs.
+
+Loaded on first access through utilities.catalogs, see its module docstring.
+"""
+
+from enum import Enum
+
+
+class Vouchers(Enum):
+    VOUCHERS_DICT = {
+        'CLASSIC_VICTORY': 1,
+        'BROCK': 2,
+        'MISTY': 3,
+        'LT_SURGE': 4,
+        'ERIKA': 5,
+        'JANINE': 6,
+        'SABRINA': 7,
+        'BLAINE': 8,
+        'GIOVANNI': 9,
+        'FALKNER': 10,
+        'BUGSY': 11,
+        'WHITNEY': 12,
+        'MORTY': 13,
+        'CHUCK': 14,
+        'JASMINE': 15,
+        'PRYCE': 16,
+        'CLAIR': 17,
+        'ROXANNE': 18,
+        'BRAWLY': 19,
+        'WATTSON': 20,
+        'FLANNERY': 21,
+        'NORMAN': 22,
+        'WINONA': 23,
+        'TATE': 24,
+        'LIZA': 25,
+        'JUAN': 26,
+        'ROARK': 27,
+        'GARDENIA': 28,
+        'MAYLENE': 29,
+        'CRASHER_WAKE': 30,
+        'FANTINA': 31,
+        'BYRON': 32,
+        'CANDICE': 33,
+        'VOLKNER': 34,
+        'CILAN': 35,
+        'CHILI': 36,
+        'CRESS': 37,
+        'CHEREN': 38,
+        'LENORA': 39,
+        'ROXIE': 40,
+        'BURGH': 41,
+        'ELESA': 42,
+        'CLAY': 43,
+        'SKYLA': 44,
+        'BRYCEN': 45,
+        'DRAYDEN': 46,
+        'MARLON': 47,
+        'VIOLA': 48,
+        'GRANT': 49,
+        'KORRINA': 50,
+        'RAMOS': 51,
+        'CLEMONT': 52,
+        'VALERIE': 53,
+        'OLYMPIA': 54,
+        'WULFRIC': 55,
+        'MILO': 56,
+        'NESSA': 57,
+        'KABU': 58,
+        'BEA': 59,
+        'ALLISTER': 60,
+        'OPAL': 61,
+        'BEDE': 62,
+        'GORDIE': 63,
+        'MELONY': 64,
+        'PIERS': 65,
+        'MARNIE': 66,
+        'RAIHAN': 67,
+        'KATY': 68,
+        'BRASSIUS': 69,
+        'IONO': 70,
+        'KOFU': 71,
+        'LARRY': 72,
+        'RYME': 73,
+        'TULIP': 74,
+        'GRUSHA': 75,
+        'LORELEI': 76,
+        'BRUNO': 77,
+        'AGATHA': 78,
+        'LANCE': 79,
+        'WILL': 80,
+        'KOGA': 81,
+        'KAREN': 82,
+        'SIDNEY': 83,
+        'PHOEBE': 84,
+        'GLACIA': 85,
+        'DRAKE': 86,
+        'AARON': 87,
+        'BERTHA': 88,
+        'FLINT': 89,
+        'LUCIAN': 90,
+        'SHAUNTAL': 91,
+        'MARSHAL': 92,
+        'GRIMSLEY': 93,
+        'CAITLIN': 94,
+        'MALVA': 95,
+        'SIEBOLD': 96,
+        'WIKSTROM': 97,
+        'DRASNA': 98,
+        'HALA': 99,
+        'MOLAYNE': 100,
+        'OLIVIA': 101,
+        'ACEROLA': 102,
+        'KAHILI': 103,
+        'MARNIE_ELITE': 104,
+        'NESSA_ELITE': 105,
+        'BEA_ELITE': 106,
+        'ALLISTER_ELITE': 107,
+        'RAIHAN_ELITE': 108,
+        'RIKA': 109,
+        'POPPY': 110,
+        'LARRY_ELITE': 111,
+        'HASSEL': 112,
+        'CRISPIN': 113,
+        'AMARYS': 114,
+        'LACEY': 115,
+        'DRAYTON': 116,
+        'BLUE': 117,
+        'RED': 118,
+        'LANCE_CHAMPION': 119,
+        'STEVEN': 120,
+        'WALLACE': 121,
+        'CYNTHIA': 122,
+        'ALDER': 123,
+        'IRIS': 124,
+        'DIANTHA': 125,
+        'HAU': 126,
+        'LEON': 127,
+        'GEETA': 128,
+        'NEMONA': 129,
+        'KIERAN': 130,
+        'ROCKET_BOSS_GIOVANNI_1': 131,
+        'ROCKET_BOSS_GIOVANNI_2': 132,
+        'MAXIE': 133,
+        'MAXIE_2': 134,
+        'ARCHIE': 135,
+        'ARCHIE_2': 136,
+        'CYRUS': 137,
+        'CYRUS_2': 138,
+        'GHETSIS': 139,
+        'GHETSIS_2': 140,
+        'LYSANDRE': 141,
+        'LYSANDRE_2': 142
+    }
@@ -146,6 +146,7 @@ export interface IEggOptions {
 import random
 import time
 from typing import List, Tuple, Dict, Optional
+from utilities.catalogStore import fh_getCatalogStore
 
 # Constant from game source code
 EGG_SEED: int = 1073741824
@@ -199,35 +200,42 @@ def generateRandomID(start: int, end: int, manaphy: bool = False) -> int:
 
     return max(result, 1)
 
-def __getRandomSpeciesForShiny(tier: int, eggTypesData) -> Optional[int]:
+def __getRandomSpeciesForShiny(tier: int, eggTypesData=None) -> Optional[int]:
+    # Without explicit data the egg types are taken from the shared catalog store.
+    if eggTypesData is None:
+        eggTypesData = fh_getCatalogStore().f_getCatalog('eggTypes')
+    if isinstance(eggTypesData, dict):
+        entries = eggTypesData.items()
+    else:
+        entries = ((member.name, member.value) for member in eggTypesData)
+
     speciesMatch = []
-    for member in eggTypesData:
-        species = member.value
+    for speciesKey, species in entries:
         if species["isEgg"] is not None:
             # If the tier is 6, match by name substrings
             if tier == 6:
                 if any(substring in species['name'].lower() for substring in ["alola_", "galar_", "hisui_", "paldea_"]):
-                    speciesMatch.append(member)
-                    print(f"Matched species: {species['name']} with index {member.name}")
+                    speciesMatch.append((speciesKey, species))
+                    print(f"Matched species: {species['name']} with index {speciesKey}")
             elif tier == 7:
                 paradoxIDs = [984, 985, 986, 987, 988, 989, 990, 991, 992, 993, 994, 995, 1005, 1006, 1009, 1010, 1020, 1021, 1022, 1023]
-                if paradoxIDs and int(member.name) in paradoxIDs:
-                    speciesMatch.append(member)
-                    print(f"Matched species: {species['name']} with index {member.name}")
+                if paradoxIDs and int(speciesKey) in paradoxIDs:
+                    speciesMatch.append((speciesKey, species))
+                    print(f"Matched species: {species['name']} with index {speciesKey}")
             # For other tiers, match by eggType
             elif species["isEgg"]["eggType"] == tier:
-                speciesMatch.append(member)
-                #print(f"Matched species: {species['name']} with index {member.name}")
+                speciesMatch.append((speciesKey, species))
+                #print(f"Matched species: {species['name']} with index {speciesKey}")
 
     if not speciesMatch:
         # No matching species found
         return None
 
-    rnd = random.choice(speciesMatch)
-    print(f"Randomly chosen species: {rnd.value['name']} with index {rnd.name}")
-    return rnd.name, rnd.value["isEgg"]["eggType"]
+    rndKey, rndSpecies = random.choice(speciesMatch)
+    print(f"Randomly chosen species: {rndSpecies['name']} with index {rndKey}")
+    return rndKey, rndSpecies["isEgg"]["eggType"]
 
-def constructEggs(tier: int, gachaType: int, hatchWaveCount: int, eggAmount: int, eggTypesData, isShiny: bool = False, variantTier: int = 0) -> List[Dict[str, int]]:
+def constructEggs(tier: int, gachaType: int, hatchWaveCount: int, eggAmount: int, eggTypesData=None, isShiny: bool = False, variantTier: int = 0) -> List[Dict[str, int]]:
     """
     Generate eggs with the given properties.
 
@@ -236,6 +244,7 @@ def constructEggs(tier: int, gachaType: int, hatchWaveCount: int, eggAmount: int
         gachaType (int): The gacha type.
         hatchWaveCount (int): The number of hatch waves.
         eggAmount (int): The number of eggs to generate.
+        eggTypesData: Egg type data of the species. Defaults to the shared catalog store.
         isShiny (bool): Whether the egg is shiny. Defaults to False.
         variantTier (int): The variant tier for shiny eggs. Defaults to 0.
 
@@ -7,35 +7,27 @@
 # Based on: https://github.com/pagefaultgames/pokerogue/
 
 """
-This script provides functionalities to load data from JSON files and convert them into Enums.
+This script provides functionalities to load data from the shared catalog store and convert them into Catalogs,
+the lightweight Enum compatible lookup tables of utilities.catalog.
 It includes the capability to handle Pokemon IDs, biomes, moves, natures, vouchers, and nature slots.
 
 Modules:
-- utilities: Custom module for colored printing and logging functionalities (cFormatter and Color).
-- modules: Contains configuration settings (config).
-- json: Provides functionalities to work with JSON data.
-- enum: Provides support for enumerations, a set of symbolic names bound to unique, constant values.
+- utilities.catalogStore: Provides the compiled catalog database shared with dataParser and eggLogic.
+- utilities.catalog: Provides the Catalog type with Enum compatible `.name`/`.value` members.
 
 Workflow:
 1. Initialize the EnumLoader class.
-2. Load data from JSON files located in a specified directory.
-3. Convert loaded data to Enums.
-4. Return the created Enums.
+2. Get the shared Catalog of every catalog from the catalog store.
+3. Return the Catalogs.
 """
 
-from utilities import cFormatter, Color
-# Custom module for colored printing and logging functionalities.
+from utilities.catalogStore import fh_getCatalogStore
+# Provides the compiled catalog database shared with dataParser and eggLogic.
 
-from modules import config
-# Contains configuration settings, specifically for directory paths.
+from utilities.catalog import Catalog
+# Provides the lightweight, Enum compatible lookup tables.
 
-import json
-# Provides functionalities to work with JSON data for reading and writing.
-
-from enum import Enum
-# Provides support for enumerations, a set of symbolic names bound to unique, constant values.
-
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple
 # Provides type hints for better code clarity and type checking.
 
 class EnumLoader:
@@ -43,125 +35,81 @@ class EnumLoader:
         """
         Initialize the EnumLoader object.
 
+        Each attribute is None until f_convertToEnums() sets it to the shared Catalog.
+
         Attributes:
-            starterNameByID (Optional[Dict[str, int]]): Dictionary for starter IDs by name.
-            biomesByID (Optional[Dict[str, int]]): Dictionary for biomes by ID.
-            movesByID (Optional[Dict[str, int]]): Dictionary for moves by ID.
-            natureData (Optional[Dict[str, int]]): Dictionary for natures data.
-            voucherData (Optional[Dict[str, int]]): Dictionary for vouchers data.
-            natureDataSlots (Optional[Dict[str, int]]): Dictionary for nature slot data.
-            noPassiveIDs (Optional[Dict[str, int]]): Dictionary for no passive IDs.
-            hasFormIDs (Optional[Dict[str, int]]): Dictionary for IDs that have forms.
-            speciesNameByID (Optional[Dict[str, int]]): Dictionary for species names by ID.
-            achievementsData (Optional[Dict[str, int]]): Dictionary for achievements data.
+            starterNameByID (Optional[Catalog]): Starter IDs by name.
+            biomesByID (Optional[Catalog]): Biomes by ID.
+            movesByID (Optional[Catalog]): Moves by ID.
+            natureData (Optional[Catalog]): Natures data.
+            voucherData (Optional[Catalog]): Vouchers data.
+            natureDataSlots (Optional[Catalog]): Nature slot data.
+            noPassiveIDs (Optional[Catalog]): No passive IDs.
+            hasFormIDs (Optional[Catalog]): IDs that have forms.
+            speciesNameByID (Optional[Catalog]): Species names by ID.
+            achievementsData (Optional[Catalog]): Achievements data.
+            eggTypesData (Optional[Catalog]): Egg types data.
         """
-        self.starterNameByID: Optional[Dict[str, int]] = None
-        self.biomesByID: Optional[Dict[str, int]] = None
-        self.movesByID: Optional[Dict[str, int]] = None
-        self.natureData: Optional[Dict[str, int]] = None
-        self.voucherData: Optional[Dict[str, int]] = None
-        self.natureDataSlots: Optional[Dict[str, int]] = None
-        self.noPassiveIDs: Optional[Dict[str, int]] = None
-        self.hasFormIDs: Optional[Dict[str, int]] = None
-        self.speciesNameByID: Optional[Dict[str, int]] = None
-        self.achievementsData: Optional[Dict[str, int]] = None
-        self.eggTypesData: Optional[Dict[str, int]] = None
-
-    def __f_loadData(self) -> None:
+        self.starterNameByID: Optional[Catalog] = None
+        self.biomesByID: Optional[Catalog] = None
+        self.movesByID: Optional[Catalog] = None
+        self.natureData: Optional[Catalog] = None
+        self.voucherData: Optional[Catalog] = None
+        self.natureDataSlots: Optional[Catalog] = None
+        self.noPassiveIDs: Optional[Catalog] = None
+        self.hasFormIDs: Optional[Catalog] = None
+        self.speciesNameByID: Optional[Catalog] = None
+        self.achievementsData: Optional[Catalog] = None
+        self.eggTypesData: Optional[Catalog] = None
+
+    def __f_getIndex(self, catalogName: str) -> Catalog:
         """
-        Load data from JSON files located in the directory specified by config.dataDirectory.
-
-        Raises:
-            Exception: If there is an error loading the data files.
-
-        Example:
-            loader = EnumLoader()
-            loader.__f_loadData()
-        """
-        try:
-            dataDir: str = config.dataDirectory
-
-            with open(f'{dataDir}/starter.json') as f:
-                self.starterNameByID: Dict[str, int] = json.load(f)
-
-            with open(f'{dataDir}/biomes.json') as f:
-                self.biomesByID: Dict[str, int] = json.load(f)
-
-            with open(f'{dataDir}/moves.json') as f:
-                self.movesByID: Dict[str, int] = json.load(f)
+        Get the shared Catalog index of a catalog.
 
-            with open(f'{dataDir}/natures.json') as f:
-                self.natureData: Dict[str, int] = json.load(f)
-
-            with open(f'{dataDir}/vouchers.json') as f:
-                self.voucherData: Dict[str, int] = json.load(f)
-            
-            with open(f'{dataDir}/natureSlot.json') as f:
-                self.natureDataSlots: Dict[str, int] = json.load(f)
-
-            with open(f'{dataDir}/achievements.json') as f:
-                self.achievementsData: Dict[str, int] = json.load(f)
-
-            with open(f'{dataDir}/species.json') as f:
-                self.speciesNameByID: Dict[str, int] = json.load(f)
-
-            with open(f'{dataDir}/noPassive.json') as f:
-                self.noPassiveIDs: Dict[str, int] = json.load(f)
-
-            with open(f'{dataDir}/hasForms.json') as f:
-                self.hasFormIDs: Dict[str, int] = json.load(f)
-
-            with open(f'{dataDir}/eggTypes.json') as f:
-                self.eggTypesData: Dict[str, int] = json.load(f)
-
-        except Exception as e:
-            cFormatter.print(Color.CRITICAL, f'Error in enumLoader.__f_loadData(). {e}', isLogging=True)
-
-    def __f_createENUMFromDict(self, dataDict: Dict[str, int], enumName: str) -> Enum:
-        """
-        Create an Enum from a dictionary.
+        A Catalog replaces the Enum classes built here before. It keeps `.name`/`.value` access on its
+        members, but is built from parallel tuples with O(1) lookups instead of one class attribute per member.
+        The catalog store holds exactly one index per catalog, so every EnumLoader and every other module
+        share the same instance.
 
         Args:
-            dataDict (Dict[str, int]): The dictionary to convert to an Enum.
-            enumName (str): The name of the Enum.
+            catalogName (str): The catalog name in the store, e.g. 'species'.
 
         Returns:
-            Enum: The created Enum.
+            Catalog: The shared index.
 
         Example:
             loader = EnumLoader()
-            speciesEnum = loader.__f_createENUMFromDict({'PIKACHU': 25}, 'SpeciesEnum')
+            speciesCatalog = loader.__f_getIndex('species')
         """
-        enumClass: Enum = Enum(enumName, {key: value for key, value in dataDict.items()})
-        return enumClass
+        return fh_getCatalogStore().f_getIndex(catalogName)
 
-    def f_convertToEnums(self) -> Tuple[Enum, Enum, Enum, Enum, Enum, Enum, Enum, Enum, Enum, Enum]:
+    def f_convertToEnums(self) -> Tuple[Catalog, ...]:
         """
-        Convert loaded data to Enums.
+        Get the Catalogs, the Enum compatible lookup tables of utilities.catalog, from the catalog store.
+
+        Every catalog is loaded from the store on first use, see CatalogStore.f_getIndex().
 
         Returns:
-            Tuple[Enum, Enum, Enum, Enum, Enum, Enum, Enum, Enum, Enum, Enum]: 
-            A tuple containing the created Enums for starter names, biomes, moves, vouchers, natures, nature slots,
-            achievements, species names, no passive IDs, and IDs with forms.
+            Tuple[Catalog, ...]:
+            A tuple containing the created Catalogs for starter names, biomes, moves, vouchers, natures, nature slots,
+            achievements, species names, no passive IDs, IDs with forms and egg types.
 
         Example:
             loader = EnumLoader()
             enums = loader.f_convertToEnums()
             StarterEnum = enums[0]  # Access StarterEnum
         """
-        self.__f_loadData()
-
-        self.starterNameByID: Dict[str, int] = self.__f_createENUMFromDict(self.starterNameByID["dex"], 'StarterEnum')
-        self.biomesByID: Dict[str, int] = self.__f_createENUMFromDict(self.biomesByID["biomes"], 'BiomesEnum')
-        self.movesByID: Dict[str, int] = self.__f_createENUMFromDict(self.movesByID["moves"], 'MovesEnum')
-        self.voucherData: Dict[str, int] = self.__f_createENUMFromDict(self.voucherData["vouchers"], 'VouchersEnum')
-        self.natureData: Dict[str, int] = self.__f_createENUMFromDict(self.natureData["natures"], 'NaturesEnum')
-        self.natureDataSlots: Dict[str, int] = self.__f_createENUMFromDict(self.natureDataSlots["natureSlot"], 'NaturesSlotEnum')
-        self.achievementsData: Dict[str, int] = self.__f_createENUMFromDict(self.achievementsData["achvUnlocks"], 'AchievementsEnum')
-        self.speciesNameByID: Dict[str, int] = self.__f_createENUMFromDict(self.speciesNameByID["dex"], 'PokemonEnum')
-        self.noPassiveIDs: Dict[str, int] = self.__f_createENUMFromDict(self.noPassiveIDs["noPassive"], 'NoPassiveEnum')
-        self.hasFormIDs: Dict[str, int] = self.__f_createENUMFromDict(self.hasFormIDs["hasForms"], 'HasFormsEnum')
-        self.eggTypesData: Dict[str, int] = self.__f_createENUMFromDict(self.eggTypesData["eggTypes"], 'eggtypeEnum')
+        self.starterNameByID: Catalog = self.__f_getIndex('starter')
+        self.biomesByID: Catalog = self.__f_getIndex('biomes')
+        self.movesByID: Catalog = self.__f_getIndex('moves')
+        self.voucherData: Catalog = self.__f_getIndex('vouchers')
+        self.natureData: Catalog = self.__f_getIndex('natures')
+        self.natureDataSlots: Catalog = self.__f_getIndex('natureSlot')
+        self.achievementsData: Catalog = self.__f_getIndex('achievements')
+        self.speciesNameByID: Catalog = self.__f_getIndex('species')
+        self.noPassiveIDs: Catalog = self.__f_getIndex('noPassive')
+        self.hasFormIDs: Catalog = self.__f_getIndex('hasForms')
+        self.eggTypesData: Catalog = self.__f_getIndex('eggTypes')
 
 
         return (self.starterNameByID, self.biomesByID, self.movesByID, self.voucherData, 
@@ -13,4216 +13,51 @@ Features:
 - Convert enum data to JSON strings.
 - Save JSON data to files.
 - Handle directories and file operations.
+- Skip unchanged catalogs using a content-hash manifest stored in the data directory.
 
 Modules:
 - typing: Provides type hints for function signatures and variable declarations.
-- enum: Provides support for enumerations, a set of symbolic names bound to unique, constant values.
-- json: Provides functionalities to work with JSON data for reading and writing.
 - os: Provides a way to interact with the operating system, particularly for file and directory operations.
-- utilities: Custom module for colored printing and logging functionalities.
+- hashlib: Provides the content hashes stored in the catalog manifest.
+- utilities: Custom module for colored printing and logging functionalities, and the lazily loaded catalogs.
+- utilities.atomicWriter: Replaces the generated catalogs and the manifest atomically.
+- utilities.jsonBackend: Serializes the catalogs, byte identical to the standard library.
 
 Workflow:
-1. Define enums for various categories (natures, no passive, biomes, vouchers, nature slots).
+1. Enums for the various categories are defined in utilities.catalogs, one module per catalog.
 2. Initialize the Generator class with optional nature names.
-3. Generate JSON strings from the enums.
-4. Save JSON data to files.
+3. Compare each catalog source against the manifest and skip the ones that did not change.
+4. Import and generate JSON strings only from the changed catalogs.
+5. Save JSON data to files and update the manifest.
+6. Recompile the shared catalog database (utilities.catalogStore) if anything changed.
 """
 
-from typing import Optional, List
+from typing import Optional, List, Dict
 # Provides type hints for function signatures and variable declarations.
 
-from enum import Enum, auto
-# Provides support for enumerations, a set of symbolic names bound to unique, constant values.
-
-import json
-# Provides functionalities to work with JSON data for reading and writing.
-
 import os
 # Provides a way to interact with the operating system, particularly for file and directory operations.
 
+import hashlib
+# Provides the content hashes stored in the catalog manifest.
+
 from utilities import cFormatter, Color
 # Custom module for colored printing and logging functionalities.
-from modules.config import dataDirectory
-
-class StarterEnum(Enum):
-    STARTER_DICT = {
-        'bulbasaur': 1,
-        'charmander': 4,
-        'squirtle': 7,
-        'caterpie': 10,
-        'weedle': 13,
-        'pidgey': 16,
-        'rattata': 19,
-        'spearow': 21,
-        'ekans': 23,
-        'pikachu': 25,
-        'sandshrew': 27,
-        'nidoran_f': 29,
-        'nidoran_m': 32,
-        'clefairy': 35,
-        'vulpix': 37,
-        'jigglypuff': 39,
-        'zubat': 41,
-        'oddish': 43,
-        'paras': 46,
-        'venonat': 48,
-        'diglett': 50,
-        'meowth': 52,
-        'psyduck': 54,
-        'mankey': 56,
-        'growlithe': 58,
-        'poliwag': 60,
-        'abra': 63,
-        'machop': 66,
-        'bellsprout': 69,
-        'tentacool': 72,
-        'geodude': 74,
-        'ponyta': 77,
-        'slowpoke': 79,
-        'magnemite': 81,
-        'farfetchd': 83,
-        'doduo': 84,
-        'seel': 86,
-        'grimer': 88,
-        'shellder': 90,
-        'gastly': 92,
-        'onix': 95,
-        'drowzee': 96,
-        'krabby': 98,
-        'voltorb': 100,
-        'exeggcute': 102,
-        'cubone': 104,
-        'hitmonlee': 106,
-        'hitmonchan': 107,
-        'lickitung': 108,
-        'koffing': 109,
-        'rhyhorn': 111,
-        'chansey': 113,
-        'tangela': 114,
-        'kangaskhan': 115,
-        'horsea': 116,
-        'goldeen': 118,
-        'staryu': 120,
-        'mr_mime': 122,
-        'scyther': 123,
-        'jynx': 124,
-        'electabuzz': 125,
-        'magmar': 126,
-        'pinsir': 127,
-        'tauros': 128,
-        'magikarp': 129,
-        'lapras': 131,
-        'ditto': 132,
-        'eevee': 133,
-        'porygon': 137,
-        'omanyte': 138,
-        'kabuto': 140,
-        'aerodactyl': 142,
-        'snorlax': 143,
-        'articuno': 144,
-        'zapdos': 145,
-        'moltres': 146,
-        'dratini': 147,
-        'mewtwo': 150,
-        'mew': 151,
-        'chikorita': 152,
-        'cyndaquil': 155,
-        'totodile': 158,
-        'sentret': 161,
-        'hoothoot': 163,
-        'ledyba': 165,
-        'spinarak': 167,
-        'chinchou': 170,
-        'pichu': 172,
-        'cleffa': 173,
-        'igglybuff': 174,
-        'togepi': 175,
-        'natu': 177,
-        'mareep': 179,
-        'marill': 183,
-        'sudowoodo': 185,
-        'hoppip': 187,
-        'aipom': 190,
-        'sunkern': 191,
-        'yanma': 193,
-        'wooper': 194,
-        'murkrow': 198,
-        'misdreavus': 200,
-        'unown': 201,
-        'wobbuffet': 202,
-        'girafarig': 203,
-        'pineco': 204,
-        'dunsparce': 206,
-        'gligar': 207,
-        'snubbull': 209,
-        'qwilfish': 211,
-        'shuckle': 213,
-        'heracross': 214,
-        'sneasel': 215,
-        'teddiursa': 216,
-        'slugma': 218,
-        'swinub': 220,
-        'corsola': 222,
-        'remoraid': 223,
-        'delibird': 225,
-        'mantine': 226,
-        'skarmory': 227,
-        'houndour': 228,
-        'phanpy': 231,
-        'stantler': 234,
-        'smeargle': 235,
-        'tyrogue': 236,
-        'smoochum': 238,
-        'elekid': 239,
-        'magby': 240,
-        'miltank': 241,
-        'raikou': 243,
-        'entei': 244,
-        'suicune': 245,
-        'larvitar': 246,
-        'lugia': 249,
-        'ho_oh': 250,
-        'celebi': 251,
-        'treecko': 252,
-        'torchic': 255,
-        'mudkip': 258,
-        'poochyena': 261,
-        'zigzagoon': 263,
-        'wurmple': 265,
-        'lotad': 270,
-        'seedot': 273,
-        'taillow': 276,
-        'wingull': 278,
-        'ralts': 280,
-        'surskit': 283,
-        'shroomish': 285,
-        'slakoth': 287,
-        'nincada': 290,
-        'whismur': 293,
-        'makuhita': 296,
-        'azurill': 298,
-        'nosepass': 299,
-        'skitty': 300,
-        'sableye': 302,
-        'mawile': 303,
-        'aron': 304,
-        'meditite': 307,
-        'electrike': 309,
-        'plusle': 311,
-        'minun': 312,
-        'volbeat': 313,
-        'illumise': 314,
-        'roselia': 315,
-        'gulpin': 316,
-        'carvanha': 318,
-        'wailmer': 320,
-        'numel': 322,
-        'torkoal': 324,
-        'spoink': 325,
-        'spinda': 327,
-        'trapinch': 328,
-        'cacnea': 331,
-        'swablu': 333,
-        'zangoose': 335,
-        'seviper': 336,
-        'lunatone': 337,
-        'solrock': 338,
-        'barboach': 339,
-        'corphish': 341,
-        'baltoy': 343,
-        'lileep': 345,
-        'anorith': 347,
-        'feebas': 349,
-        'castform': 351,
-        'kecleon': 352,
-        'shuppet': 353,
-        'duskull': 355,
-        'tropius': 357,
-        'chimecho': 358,
-        'absol': 359,
-        'wynaut': 360,
-        'snorunt': 361,
-        'spheal': 363,
-        'clamperl': 366,
-        'relicanth': 369,
-        'luvdisc': 370,
-        'bagon': 371,
-        'beldum': 374,
-        'regirock': 377,
-        'regice': 378,
-        'registeel': 379,
-        'latias': 380,
-        'latios': 381,
-        'kyogre': 382,
-        'groudon': 383,
-        'rayquaza': 384,
-        'jirachi': 385,
-        'deoxys': 386,
-        'turtwig': 387,
-        'chimchar': 390,
-        'piplup': 393,
-        'starly': 396,
-        'bidoof': 399,
-        'kricketot': 401,
-        'shinx': 403,
-        'budew': 406,
-        'cranidos': 408,
-        'shieldon': 410,
-        'burmy': 412,
-        'combee': 415,
-        'pachirisu': 417,
-        'buizel': 418,
-        'cherubi': 420,
-        'shellos': 422,
-        'drifloon': 425,
-        'buneary': 427,
-        'glameow': 431,
-        'chingling': 433,
-        'stunky': 434,
-        'bronzor': 436,
-        'bonsly': 438,
-        'mime_jr': 439,
-        'happiny': 440,
-        'chatot': 441,
-        'spiritomb': 442,
-        'gible': 443,
-        'munchlax': 446,
-        'riolu': 447,
-        'hippopotas': 449,
-        'skorupi': 451,
-        'croagunk': 453,
-        'carnivine': 455,
-        'finneon': 456,
-        'mantyke': 458,
-        'snover': 459,
-        'rotom': 479,
-        'uxie': 480,
-        'mesprit': 481,
-        'azelf': 482,
-        'dialga': 483,
-        'palkia': 484,
-        'heatran': 485,
-        'regigigas': 486,
-        'giratina': 487,
-        'cresselia': 488,
-        'phione': 489,
-        'manaphy': 490,
-        'darkrai': 491,
-        'shaymin': 492,
-        'arceus': 493,
-        'victini': 494,
-        'snivy': 495,
-        'tepig': 498,
-        'oshawott': 501,
-        'patrat': 504,
-        'lillipup': 506,
-        'purrloin': 509,
-        'pansage': 511,
-        'pansear': 513,
-        'panpour': 515,
-        'munna': 517,
-        'pidove': 519,
-        'blitzle': 522,
-        'roggenrola': 524,
-        'woobat': 527,
-        'drilbur': 529,
-        'audino': 531,
-        'timburr': 532,
-        'tympole': 535,
-        'throh': 538,
-        'sawk': 539,
-        'sewaddle': 540,
-        'venipede': 543,
-        'cottonee': 546,
-        'petilil': 548,
-        'basculin': 550,
-        'sandile': 551,
-        'darumaka': 554,
-        'maractus': 556,
-        'dwebble': 557,
-        'scraggy': 559,
-        'sigilyph': 561,
-        'yamask': 562,
-        'tirtouga': 564,
-        'archen': 566,
-        'trubbish': 568,
-        'zorua': 570,
-        'minccino': 572,
-        'gothita': 574,
-        'solosis': 577,
-        'ducklett': 580,
-        'vanillite': 582,
-        'deerling': 585,
-        'emolga': 587,
-        'karrablast': 588,
-        'foongus': 590,
-        'frillish': 592,
-        'alomomola': 594,
-        'joltik': 595,
-        'ferroseed': 597,
-        'klink': 599,
-        'tynamo': 602,
-        'elgyem': 605,
-        'litwick': 607,
-        'axew': 610,
-        'cubchoo': 613,
-        'cryogonal': 615,
-        'shelmet': 616,
-        'stunfisk': 618,
-        'mienfoo': 619,
-        'druddigon': 621,
-        'golett': 622,
-        'pawniard': 624,
-        'bouffalant': 626,
-        'rufflet': 627,
-        'vullaby': 629,
-        'heatmor': 631,
-        'durant': 632,
-        'deino': 633,
-        'larvesta': 636,
-        'cobalion': 638,
-        'terrakion': 639,
-        'virizion': 640,
-        'tornadus': 641,
-        'thundurus': 642,
-        'reshiram': 643,
-        'zekrom': 644,
-        'landorus': 645,
-        'kyurem': 646,
-        'keldeo': 647,
-        'meloetta': 648,
-        'genesect': 649,
-        'chespin': 650,
-        'fennekin': 653,
-        'froakie': 656,
-        'bunnelby': 659,
-        'fletchling': 661,
-        'scatterbug': 664,
-        'litleo': 667,
-        'flabebe': 669,
-        'skiddo': 672,
-        'pancham': 674,
-        'furfrou': 676,
-        'espurr': 677,
-        'honedge': 679,
-        'spritzee': 682,
-        'swirlix': 684,
-        'inkay': 686,
-        'binacle': 688,
-        'skrelp': 690,
-        'clauncher': 692,
-        'helioptile': 694,
-        'tyrunt': 696,
-        'amaura': 698,
-        'hawlucha': 701,
-        'dedenne': 702,
-        'carbink': 703,
-        'goomy': 704,
-        'klefki': 707,
-        'phantump': 708,
-        'pumpkaboo': 710,
-        'bergmite': 712,
-        'noibat': 714,
-        'xerneas': 716,
-        'yveltal': 717,
-        'zygarde': 718,
-        'diancie': 719,
-        'hoopa': 720,
-        'volcanion': 721,
-        'rowlet': 722,
-        'litten': 725,
-        'popplio': 728,
-        'pikipek': 731,
-        'yungoos': 734,
-        'grubbin': 736,
-        'crabrawler': 739,
-        'oricorio': 741,
-        'cutiefly': 742,
-        'rockruff': 744,
-        'wishiwashi': 746,
-        'mareanie': 747,
-        'mudbray': 749,
-        'dewpider': 751,
-        'fomantis': 753,
-        'morelull': 755,
-        'salandit': 757,
-        'stufful': 759,
-        'bounsweet': 761,
-        'comfey': 764,
-        'oranguru': 765,
-        'passimian': 766,
-        'wimpod': 767,
-        'sandygast': 769,
-        'pyukumuku': 771,
-        'type_null': 772,
-        'minior': 774,
-        'komala': 775,
-        'turtonator': 776,
-        'togedemaru': 777,
-        'mimikyu': 778,
-        'bruxish': 779,
-        'drampa': 780,
-        'dhelmise': 781,
-        'jangmo_o': 782,
-        'tapu_koko': 785,
-        'tapu_lele': 786,
-        'tapu_bulu': 787,
-        'tapu_fini': 788,
-        'cosmog': 789,
-        'nihilego': 793,
-        'buzzwole': 794,
-        'pheromosa': 795,
-        'xurkitree': 796,
-        'celesteela': 797,
-        'kartana': 798,
-        'guzzlord': 799,
-        'necrozma': 800,
-        'magearna': 801,
-        'marshadow': 802,
-        'poipole': 803,
-        'stakataka': 805,
-        'blacephalon': 806,
-        'zeraora': 807,
-        'meltan': 808,
-        'grookey': 810,
-        'scorbunny': 813,
-        'sobble': 816,
-        'skwovet': 819,
-        'rookidee': 821,
-        'blipbug': 824,
-        'nickit': 827,
-        'gossifleur': 829,
-        'wooloo': 831,
-        'chewtle': 833,
-        'yamper': 835,
-        'rolycoly': 837,
-        'applin': 840,
-        'silicobra': 843,
-        'cramorant': 845,
-        'arrokuda': 846,
-        'toxel': 848,
-        'sizzlipede': 850,
-        'clobbopus': 852,
-        'sinistea': 854,
-        'hatenna': 856,
-        'impidimp': 859,
-        'milcery': 868,
-        'falinks': 870,
-        'pincurchin': 871,
-        'snom': 872,
-        'stonjourner': 874,
-        'eiscue': 875,
-        'indeedee': 876,
-        'morpeko': 877,
-        'cufant': 878,
-        'dracozolt': 880,
-        'arctozolt': 881,
-        'dracovish': 882,
-        'arctovish': 883,
-        'duraludon': 884,
-        'dreepy': 885,
-        'zacian': 888,
-        'zamazenta': 889,
-        'eternatus': 890,
-        'kubfu': 891,
-        'zarude': 893,
-        'regieleki': 894,
-        'regidrago': 895,
-        'glastrier': 896,
-        'spectrier': 897,
-        'calyrex': 898,
-        'enamorus': 905,
-        'sprigatito': 906,
-        'fuecoco': 909,
-        'quaxly': 912,
-        'lechonk': 915,
-        'tarountula': 917,
-        'nymble': 919,
-        'pawmi': 921,
-        'tandemaus': 924,
-        'fidough': 926,
-        'smoliv': 928,
-        'squawkabilly': 931,
-        'nacli': 932,
-        'charcadet': 935,
-        'tadbulb': 938,
-        'wattrel': 940,
-        'maschiff': 942,
-        'shroodle': 944,
-        'bramblin': 946,
-        'toedscool': 948,
-        'klawf': 950,
-        'capsakid': 951,
-        'rellor': 953,
-        'flittle': 955,
-        'tinkatink': 957,
-        'wiglett': 960,
-        'bombirdier': 962,
-        'finizen': 963,
-        'varoom': 965,
-        'cyclizar': 967,
-        'orthworm': 968,
-        'glimmet': 969,
-        'greavard': 971,
-        'flamigo': 973,
-        'cetoddle': 974,
-        'veluza': 976,
-        'dondozo': 977,
-        'tatsugiri': 978,
-        'great_tusk': 984,
-        'scream_tail': 985,
-        'brute_bonnet': 986,
-        'flutter_mane': 987,
-        'slither_wing': 988,
-        'sandy_shocks': 989,
-        'iron_treads': 990,
-        'iron_bundle': 991,
-        'iron_hands': 992,
-        'iron_jugulis': 993,
-        'iron_moth': 994,
-        'iron_thorns': 995,
-        'frigibax': 996,
-        'gimmighoul': 999,
-        'wo_chien': 1001,
-        'chien_pao': 1002,
-        'ting_lu': 1003,
-        'chi_yu': 1004,
-        'roaring_moon': 1005,
-        'iron_valiant': 1006,
-        'koraidon': 1007,
-        'miraidon': 1008,
-        'walking_wake': 1009,
-        'iron_leaves': 1010,
-        'poltchageist': 1012,
-        'okidogi': 1014,
-        'munkidori': 1015,
-        'fezandipiti': 1016,
-        'ogerpon': 1017,
-        'gouging_fire': 1020,
-        'raging_bolt': 1021,
-        'iron_boulder': 1022,
-        'iron_crown': 1023,
-        'terapagos': 1024,
-        'pecharunt': 1025,
-        'alola_rattata': 2019,
-        'alola_sandshrew': 2027,
-        'alola_vulpix': 2037,
-        'alola_diglett': 2050,
-        'alola_meowth': 2052,
-        'alola_geodude': 2074,
-        'alola_grimer': 2088,
-        'eternal_floette': 2670,
-        'galar_meowth': 4052,
-        'galar_ponyta': 4077,
-        'galar_slowpoke': 4079,
-        'galar_farfetchd': 4083,
-        'galar_mr_mime': 4122,
-        'galar_articuno': 4144,
-        'galar_zapdos': 4145,
-        'galar_moltres': 4146,
-        'galar_corsola': 4222,
-        'galar_zigzagoon': 4263,
-        'galar_darumaka': 4554,
-        'galar_yamask': 4562,
-        'galar_stunfisk': 4618,
-        'hisui_growlithe': 6058,
-        'hisui_voltorb': 6100,
-        'hisui_qwilfish': 6211,
-        'hisui_sneasel': 6215,
-        'hisui_zorua': 6570,
-        'paldea_tauros': 8128,
-        'paldea_wooper': 8194,
-        'bloodmoon_ursaluna': 8901,
-    }
-
-class SpeciesEnum(Enum):
-    POKEMON_DICT = {
-        'bulbasaur': 1,
-        'ivysaur': 2,
-        'venusaur': 3,
-        'charmander': 4,
-        'charmeleon': 5,
-        'charizard': 6,
-        'squirtle': 7,
-        'wartortle': 8,
-        'blastoise': 9,
-        'caterpie': 10,
-        'metapod': 11,
-        'butterfree': 12,
-        'weedle': 13,
-        'kakuna': 14,
-        'beedrill': 15,
-        'pidgey': 16,
-        'pidgeotto': 17,
-        'pidgeot': 18,
-        'rattata': 19,
-        'raticate': 20,
-        'spearow': 21,
-        'fearow': 22,
-        'ekans': 23,
-        'arbok': 24,
-        'pikachu': 25,
-        'raichu': 26,
-        'sandshrew': 27,
-        'sandslash': 28,
-        'nidoran_f': 29,
-        'nidorina': 30,
-        'nidoqueen': 31,
-        'nidoran_m': 32,
-        'nidorino': 33,
-        'nidoking': 34,
-        'clefairy': 35,
-        'clefable': 36,
-        'vulpix': 37,
-        'ninetales': 38,
-        'jigglypuff': 39,
-        'wigglytuff': 40,
-        'zubat': 41,
-        'golbat': 42,
-        'oddish': 43,
-        'gloom': 44,
-        'vileplume': 45,
-        'paras': 46,
-        'parasect': 47,
-        'venonat': 48,
-        'venomoth': 49,
-        'diglett': 50,
-        'dugtrio': 51,
-        'meowth': 52,
-        'persian': 53,
-        'psyduck': 54,
-        'golduck': 55,
-        'mankey': 56,
-        'primeape': 57,
-        'growlithe': 58,
-        'arcanine': 59,
-        'poliwag': 60,
-        'poliwhirl': 61,
-        'poliwrath': 62,
-        'abra': 63,
-        'kadabra': 64,
-        'alakazam': 65,
-        'machop': 66,
-        'machoke': 67,
-        'machamp': 68,
-        'bellsprout': 69,
-        'weepinbell': 70,
-        'victreebel': 71,
-        'tentacool': 72,
-        'tentacruel': 73,
-        'geodude': 74,
-        'graveler': 75,
-        'golem': 76,
-        'ponyta': 77,
-        'rapidash': 78,
-        'slowpoke': 79,
-        'slowbro': 80,
-        'magnemite': 81,
-        'magneton': 82,
-        'farfetchd': 83,
-        'doduo': 84,
-        'dodrio': 85,
-        'seel': 86,
-        'dewgong': 87,
-        'grimer': 88,
-        'muk': 89,
-        'shellder': 90,
-        'cloyster': 91,
-        'gastly': 92,
-        'haunter': 93,
-        'gengar': 94,
-        'onix': 95,
-        'drowzee': 96,
-        'hypno': 97,
-        'krabby': 98,
-        'kingler': 99,
-        'voltorb': 100,
-        'electrode': 101,
-        'exeggcute': 102,
-        'exeggutor': 103,
-        'cubone': 104,
-        'marowak': 105,
-        'hitmonlee': 106,
-        'hitmonchan': 107,
-        'lickitung': 108,
-        'koffing': 109,
-        'weezing': 110,
-        'rhyhorn': 111,
-        'rhydon': 112,
-        'chansey': 113,
-        'tangela': 114,
-        'kangaskhan': 115,
-        'horsea': 116,
-        'seadra': 117,
-        'goldeen': 118,
-        'seaking': 119,
-        'staryu': 120,
-        'starmie': 121,
-        'mr_mime': 122,
-        'scyther': 123,
-        'jynx': 124,
-        'electabuzz': 125,
-        'magmar': 126,
-        'pinsir': 127,
-        'tauros': 128,
-        'magikarp': 129,
-        'gyarados': 130,
-        'lapras': 131,
-        'ditto': 132,
-        'eevee': 133,
-        'vaporeon': 134,
-        'jolteon': 135,
-        'flareon': 136,
-        'porygon': 137,
-        'omanyte': 138,
-        'omastar': 139,
-        'kabuto': 140,
-        'kabutops': 141,
-        'aerodactyl': 142,
-        'snorlax': 143,
-        'articuno': 144,
-        'zapdos': 145,
-        'moltres': 146,
-        'dratini': 147,
-        'dragonair': 148,
-        'dragonite': 149,
-        'mewtwo': 150,
-        'mew': 151,
-        'chikorita': 152,
-        'bayleef': 153,
-        'meganium': 154,
-        'cyndaquil': 155,
-        'quilava': 156,
-        'typhlosion': 157,
-        'totodile': 158,
-        'croconaw': 159,
-        'feraligatr': 160,
-        'sentret': 161,
-        'furret': 162,
-        'hoothoot': 163,
-        'noctowl': 164,
-        'ledyba': 165,
-        'ledian': 166,
-        'spinarak': 167,
-        'ariados': 168,
-        'crobat': 169,
-        'chinchou': 170,
-        'lanturn': 171,
-        'pichu': 172,
-        'cleffa': 173,
-        'igglybuff': 174,
-        'togepi': 175,
-        'togetic': 176,
-        'natu': 177,
-        'xatu': 178,
-        'mareep': 179,
-        'flaaffy': 180,
-        'ampharos': 181,
-        'bellossom': 182,
-        'marill': 183,
-        'azumarill': 184,
-        'sudowoodo': 185,
-        'politoed': 186,
-        'hoppip': 187,
-        'skiploom': 188,
-        'jumpluff': 189,
-        'aipom': 190,
-        'sunkern': 191,
-        'sunflora': 192,
-        'yanma': 193,
-        'wooper': 194,
-        'quagsire': 195,
-        'espeon': 196,
-        'umbreon': 197,
-        'murkrow': 198,
-        'slowking': 199,
-        'misdreavus': 200,
-        'unown': 201,
-        'wobbuffet': 202,
-        'girafarig': 203,
-        'pineco': 204,
-        'forretress': 205,
-        'dunsparce': 206,
-        'gligar': 207,
-        'steelix': 208,
-        'snubbull': 209,
-        'granbull': 210,
-        'qwilfish': 211,
-        'scizor': 212,
-        'shuckle': 213,
-        'heracross': 214,
-        'sneasel': 215,
-        'teddiursa': 216,
-        'ursaring': 217,
-        'slugma': 218,
-        'magcargo': 219,
-        'swinub': 220,
-        'piloswine': 221,
-        'corsola': 222,
-        'remoraid': 223,
-        'octillery': 224,
-        'delibird': 225,
-        'mantine': 226,
-        'skarmory': 227,
-        'houndour': 228,
-        'houndoom': 229,
-        'kingdra': 230,
-        'phanpy': 231,
-        'donphan': 232,
-        'porygon2': 233,
-        'stantler': 234,
-        'smeargle': 235,
-        'tyrogue': 236,
-        'hitmontop': 237,
-        'smoochum': 238,
-        'elekid': 239,
-        'magby': 240,
-        'miltank': 241,
-        'blissey': 242,
-        'raikou': 243,
-        'entei': 244,
-        'suicune': 245,
-        'larvitar': 246,
-        'pupitar': 247,
-        'tyranitar': 248,
-        'lugia': 249,
-        'ho_oh': 250,
-        'celebi': 251,
-        'treecko': 252,
-        'grovyle': 253,
-        'sceptile': 254,
-        'torchic': 255,
-        'combusken': 256,
-        'blaziken': 257,
-        'mudkip': 258,
-        'marshtomp': 259,
-        'swampert': 260,
-        'poochyena': 261,
-        'mightyena': 262,
-        'zigzagoon': 263,
-        'linoone': 264,
-        'wurmple': 265,
-        'silcoon': 266,
-        'beautifly': 267,
-        'cascoon': 268,
-        'dustox': 269,
-        'lotad': 270,
-        'lombre': 271,
-        'ludicolo': 272,
-        'seedot': 273,
-        'nuzleaf': 274,
-        'shiftry': 275,
-        'taillow': 276,
-        'swellow': 277,
-        'wingull': 278,
-        'pelipper': 279,
-        'ralts': 280,
-        'kirlia': 281,
-        'gardevoir': 282,
-        'surskit': 283,
-        'masquerain': 284,
-        'shroomish': 285,
-        'breloom': 286,
-        'slakoth': 287,
-        'vigoroth': 288,
-        'slaking': 289,
-        'nincada': 290,
-        'ninjask': 291,
-        'shedinja': 292,
-        'whismur': 293,
-        'loudred': 294,
-        'exploud': 295,
-        'makuhita': 296,
-        'hariyama': 297,
-        'azurill': 298,
-        'nosepass': 299,
-        'skitty': 300,
-        'delcatty': 301,
-        'sableye': 302,
-        'mawile': 303,
-        'aron': 304,
-        'lairon': 305,
-        'aggron': 306,
-        'meditite': 307,
-        'medicham': 308,
-        'electrike': 309,
-        'manectric': 310,
-        'plusle': 311,
-        'minun': 312,
-        'volbeat': 313,
-        'illumise': 314,
-        'roselia': 315,
-        'gulpin': 316,
-        'swalot': 317,
-        'carvanha': 318,
-        'sharpedo': 319,
-        'wailmer': 320,
-        'wailord': 321,
-        'numel': 322,
-        'camerupt': 323,
-        'torkoal': 324,
-        'spoink': 325,
-        'grumpig': 326,
-        'spinda': 327,
-        'trapinch': 328,
-        'vibrava': 329,
-        'flygon': 330,
-        'cacnea': 331,
-        'cacturne': 332,
-        'swablu': 333,
-        'altaria': 334,
-        'zangoose': 335,
-        'seviper': 336,
-        'lunatone': 337,
-        'solrock': 338,
-        'barboach': 339,
-        'whiscash': 340,
-        'corphish': 341,
-        'crawdaunt': 342,
-        'baltoy': 343,
-        'claydol': 344,
-        'lileep': 345,
-        'cradily': 346,
-        'anorith': 347,
-        'armaldo': 348,
-        'feebas': 349,
-        'milotic': 350,
-        'castform': 351,
-        'kecleon': 352,
-        'shuppet': 353,
-        'banette': 354,
-        'duskull': 355,
-        'dusclops': 356,
-        'tropius': 357,
-        'chimecho': 358,
-        'absol': 359,
-        'wynaut': 360,
-        'snorunt': 361,
-        'glalie': 362,
-        'spheal': 363,
-        'sealeo': 364,
-        'walrein': 365,
-        'clamperl': 366,
-        'huntail': 367,
-        'gorebyss': 368,
-        'relicanth': 369,
-        'luvdisc': 370,
-        'bagon': 371,
-        'shelgon': 372,
-        'salamence': 373,
-        'beldum': 374,
-        'metang': 375,
-        'metagross': 376,
-        'regirock': 377,
-        'regice': 378,
-        'registeel': 379,
-        'latias': 380,
-        'latios': 381,
-        'kyogre': 382,
-        'groudon': 383,
-        'rayquaza': 384,
-        'jirachi': 385,
-        'deoxys': 386,
-        'turtwig': 387,
-        'grotle': 388,
-        'torterra': 389,
-        'chimchar': 390,
-        'monferno': 391,
-        'infernape': 392,
-        'piplup': 393,
-        'prinplup': 394,
-        'empoleon': 395,
-        'starly': 396,
-        'staravia': 397,
-        'staraptor': 398,
-        'bidoof': 399,
-        'bibarel': 400,
-        'kricketot': 401,
-        'kricketune': 402,
-        'shinx': 403,
-        'luxio': 404,
-        'luxray': 405,
-        'budew': 406,
-        'roserade': 407,
-        'cranidos': 408,
-        'rampardos': 409,
-        'shieldon': 410,
-        'bastiodon': 411,
-        'burmy': 412,
-        'wormadam': 413,
-        'mothim': 414,
-        'combee': 415,
-        'vespiquen': 416,
-        'pachirisu': 417,
-        'buizel': 418,
-        'floatzel': 419,
-        'cherubi': 420,
-        'cherrim': 421,
-        'shellos': 422,
-        'gastrodon': 423,
-        'ambipom': 424,
-        'drifloon': 425,
-        'drifblim': 426,
-        'buneary': 427,
-        'lopunny': 428,
-        'mismagius': 429,
-        'honchkrow': 430,
-        'glameow': 431,
-        'purugly': 432,
-        'chingling': 433,
-        'stunky': 434,
-        'skuntank': 435,
-        'bronzor': 436,
-        'bronzong': 437,
-        'bonsly': 438,
-        'mime_jr': 439,
-        'happiny': 440,
-        'chatot': 441,
-        'spiritomb': 442,
-        'gible': 443,
-        'gabite': 444,
-        'garchomp': 445,
-        'munchlax': 446,
-        'riolu': 447,
-        'lucario': 448,
-        'hippopotas': 449,
-        'hippowdon': 450,
-        'skorupi': 451,
-        'drapion': 452,
-        'croagunk': 453,
-        'toxicroak': 454,
-        'carnivine': 455,
-        'finneon': 456,
-        'lumineon': 457,
-        'mantyke': 458,
-        'snover': 459,
-        'abomasnow': 460,
-        'weavile': 461,
-        'magnezone': 462,
-        'lickilicky': 463,
-        'rhyperior': 464,
-        'tangrowth': 465,
-        'electivire': 466,
-        'magmortar': 467,
-        'togekiss': 468,
-        'yanmega': 469,
-        'leafeon': 470,
-        'glaceon': 471,
-        'gliscor': 472,
-        'mamoswine': 473,
-        'porygon_z': 474,
-        'gallade': 475,
-        'probopass': 476,
-        'dusknoir': 477,
-        'froslass': 478,
-        'rotom': 479,
-        'uxie': 480,
-        'mesprit': 481,
-        'azelf': 482,
-        'dialga': 483,
-        'palkia': 484,
-        'heatran': 485,
-        'regigigas': 486,
-        'giratina': 487,
-        'cresselia': 488,
-        'phione': 489,
-        'manaphy': 490,
-        'darkrai': 491,
-        'shaymin': 492,
-        'arceus': 493,
-        'victini': 494,
-        'snivy': 495,
-        'servine': 496,
-        'serperior': 497,
-        'tepig': 498,
-        'pignite': 499,
-        'emboar': 500,
-        'oshawott': 501,
-        'dewott': 502,
-        'samurott': 503,
-        'patrat': 504,
-        'watchog': 505,
-        'lillipup': 506,
-        'herdier': 507,
-        'stoutland': 508,
-        'purrloin': 509,
-        'liepard': 510,
-        'pansage': 511,
-        'simisage': 512,
-        'pansear': 513,
-        'simisear': 514,
-        'panpour': 515,
-        'simipour': 516,
-        'munna': 517,
-        'musharna': 518,
-        'pidove': 519,
-        'tranquill': 520,
-        'unfezant': 521,
-        'blitzle': 522,
-        'zebstrika': 523,
-        'roggenrola': 524,
-        'boldore': 525,
-        'gigalith': 526,
-        'woobat': 527,
-        'swoobat': 528,
-        'drilbur': 529,
-        'excadrill': 530,
-        'audino': 531,
-        'timburr': 532,
-        'gurdurr': 533,
-        'conkeldurr': 534,
-        'tympole': 535,
-        'palpitoad': 536,
-        'seismitoad': 537,
-        'throh': 538,
-        'sawk': 539,
-        'sewaddle': 540,
-        'swadloon': 541,
-        'leavanny': 542,
-        'venipede': 543,
-        'whirlipede': 544,
-        'scolipede': 545,
-        'cottonee': 546,
-        'whimsicott': 547,
-        'petilil': 548,
-        'lilligant': 549,
-        'basculin': 550,
-        'sandile': 551,
-        'krokorok': 552,
-        'krookodile': 553,
-        'darumaka': 554,
-        'darmanitan': 555,
-        'maractus': 556,
-        'dwebble': 557,
-        'crustle': 558,
-        'scraggy': 559,
-        'scrafty': 560,
-        'sigilyph': 561,
-        'yamask': 562,
-        'cofagrigus': 563,
-        'tirtouga': 564,
-        'carracosta': 565,
-        'archen': 566,
-        'archeops': 567,
-        'trubbish': 568,
-        'garbodor': 569,
-        'zorua': 570,
-        'zoroark': 571,
-        'minccino': 572,
-        'cinccino': 573,
-        'gothita': 574,
-        'gothorita': 575,
-        'gothitelle': 576,
-        'solosis': 577,
-        'duosion': 578,
-        'reuniclus': 579,
-        'ducklett': 580,
-        'swanna': 581,
-        'vanillite': 582,
-        'vanillish': 583,
-        'vanilluxe': 584,
-        'deerling': 585,
-        'sawsbuck': 586,
-        'emolga': 587,
-        'karrablast': 588,
-        'escavalier': 589,
-        'foongus': 590,
-        'amoonguss': 591,
-        'frillish': 592,
-        'jellicent': 593,
-        'alomomola': 594,
-        'joltik': 595,
-        'galvantula': 596,
-        'ferroseed': 597,
-        'ferrothorn': 598,
-        'klink': 599,
-        'klang': 600,
-        'klinklang': 601,
-        'tynamo': 602,
-        'eelektrik': 603,
-        'eelektross': 604,
-        'elgyem': 605,
-        'beheeyem': 606,
-        'litwick': 607,
-        'lampent': 608,
-        'chandelure': 609,
-        'axew': 610,
-        'fraxure': 611,
-        'haxorus': 612,
-        'cubchoo': 613,
-        'beartic': 614,
-        'cryogonal': 615,
-        'shelmet': 616,
-        'accelgor': 617,
-        'stunfisk': 618,
-        'mienfoo': 619,
-        'mienshao': 620,
-        'druddigon': 621,
-        'golett': 622,
-        'golurk': 623,
-        'pawniard': 624,
-        'bisharp': 625,
-        'bouffalant': 626,
-        'rufflet': 627,
-        'braviary': 628,
-        'vullaby': 629,
-        'mandibuzz': 630,
-        'heatmor': 631,
-        'durant': 632,
-        'deino': 633,
-        'zweilous': 634,
-        'hydreigon': 635,
-        'larvesta': 636,
-        'volcarona': 637,
-        'cobalion': 638,
-        'terrakion': 639,
-        'virizion': 640,
-        'tornadus': 641,
-        'thundurus': 642,
-        'reshiram': 643,
-        'zekrom': 644,
-        'landorus': 645,
-        'kyurem': 646,
-        'keldeo': 647,
-        'meloetta': 648,
-        'genesect': 649,
-        'chespin': 650,
-        'quilladin': 651,
-        'chesnaught': 652,
-        'fennekin': 653,
-        'braixen': 654,
-        'delphox': 655,
-        'froakie': 656,
-        'frogadier': 657,
-        'greninja': 658,
-        'bunnelby': 659,
-        'diggersby': 660,
-        'fletchling': 661,
-        'fletchinder': 662,
-        'talonflame': 663,
-        'scatterbug': 664,
-        'spewpa': 665,
-        'vivillon': 666,
-        'litleo': 667,
-        'pyroar': 668,
-        'flabebe': 669,
-        'floette': 670,
-        'florges': 671,
-        'skiddo': 672,
-        'gogoat': 673,
-        'pancham': 674,
-        'pangoro': 675,
-        'furfrou': 676,
-        'espurr': 677,
-        'meowstic': 678,
-        'honedge': 679,
-        'doublade': 680,
-        'aegislash': 681,
-        'spritzee': 682,
-        'aromatisse': 683,
-        'swirlix': 684,
-        'slurpuff': 685,
-        'inkay': 686,
-        'malamar': 687,
-        'binacle': 688,
-        'barbaracle': 689,
-        'skrelp': 690,
-        'dragalge': 691,
-        'clauncher': 692,
-        'clawitzer': 693,
-        'helioptile': 694,
-        'heliolisk': 695,
-        'tyrunt': 696,
-        'tyrantrum': 697,
-        'amaura': 698,
-        'aurorus': 699,
-        'sylveon': 700,
-        'hawlucha': 701,
-        'dedenne': 702,
-        'carbink': 703,
-        'goomy': 704,
-        'sliggoo': 705,
-        'goodra': 706,
-        'klefki': 707,
-        'phantump': 708,
-        'trevenant': 709,
-        'pumpkaboo': 710,
-        'gourgeist': 711,
-        'bergmite': 712,
-        'avalugg': 713,
-        'noibat': 714,
-        'noivern': 715,
-        'xerneas': 716,
-        'yveltal': 717,
-        'zygarde': 718,
-        'diancie': 719,
-        'hoopa': 720,
-        'volcanion': 721,
-        'rowlet': 722,
-        'dartrix': 723,
-        'decidueye': 724,
-        'litten': 725,
-        'torracat': 726,
-        'incineroar': 727,
-        'popplio': 728,
-        'brionne': 729,
-        'primarina': 730,
-        'pikipek': 731,
-        'trumbeak': 732,
-        'toucannon': 733,
-        'yungoos': 734,
-        'gumshoos': 735,
-        'grubbin': 736,
-        'charjabug': 737,
-        'vikavolt': 738,
-        'crabrawler': 739,
-        'crabominable': 740,
-        'oricorio': 741,
-        'cutiefly': 742,
-        'ribombee': 743,
-        'rockruff': 744,
-        'lycanroc': 745,
-        'wishiwashi': 746,
-        'mareanie': 747,
-        'toxapex': 748,
-        'mudbray': 749,
-        'mudsdale': 750,
-        'dewpider': 751,
-        'araquanid': 752,
-        'fomantis': 753,
-        'lurantis': 754,
-        'morelull': 755,
-        'shiinotic': 756,
-        'salandit': 757,
-        'salazzle': 758,
-        'stufful': 759,
-        'bewear': 760,
-        'bounsweet': 761,
-        'steenee': 762,
-        'tsareena': 763,
-        'comfey': 764,
-        'oranguru': 765,
-        'passimian': 766,
-        'wimpod': 767,
-        'golisopod': 768,
-        'sandygast': 769,
-        'palossand': 770,
-        'pyukumuku': 771,
-        'type_null': 772,
-        'silvally': 773,
-        'minior': 774,
-        'komala': 775,
-        'turtonator': 776,
-        'togedemaru': 777,
-        'mimikyu': 778,
-        'bruxish': 779,
-        'drampa': 780,
-        'dhelmise': 781,
-        'jangmo_o': 782,
-        'hakamo_o': 783,
-        'kommo_o': 784,
-        'tapu_koko': 785,
-        'tapu_lele': 786,
-        'tapu_bulu': 787,
-        'tapu_fini': 788,
-        'cosmog': 789,
-        'cosmoem': 790,
-        'solgaleo': 791,
-        'lunala': 792,
-        'nihilego': 793,
-        'buzzwole': 794,
-        'pheromosa': 795,
-        'xurkitree': 796,
-        'celesteela': 797,
-        'kartana': 798,
-        'guzzlord': 799,
-        'necrozma': 800,
-        'magearna': 801,
-        'marshadow': 802,
-        'poipole': 803,
-        'naganadel': 804,
-        'stakataka': 805,
-        'blacephalon': 806,
-        'zeraora': 807,
-        'meltan': 808,
-        'melmetal': 809,
-        'grookey': 810,
-        'thwackey': 811,
-        'rillaboom': 812,
-        'scorbunny': 813,
-        'raboot': 814,
-        'cinderace': 815,
-        'sobble': 816,
-        'drizzile': 817,
-        'inteleon': 818,
-        'skwovet': 819,
-        'greedent': 820,
-        'rookidee': 821,
-        'corvisquire': 822,
-        'corviknight': 823,
-        'blipbug': 824,
-        'dottler': 825,
-        'orbeetle': 826,
-        'nickit': 827,
-        'thievul': 828,
-        'gossifleur': 829,
-        'eldegoss': 830,
-        'wooloo': 831,
-        'dubwool': 832,
-        'chewtle': 833,
-        'drednaw': 834,
-        'yamper': 835,
-        'boltund': 836,
-        'rolycoly': 837,
-        'carkol': 838,
-        'coalossal': 839,
-        'applin': 840,
-        'flapple': 841,
-        'appletun': 842,
-        'silicobra': 843,
-        'sandaconda': 844,
-        'cramorant': 845,
-        'arrokuda': 846,
-        'barraskewda': 847,
-        'toxel': 848,
-        'toxtricity': 849,
-        'sizzlipede': 850,
-        'centiskorch': 851,
-        'clobbopus': 852,
-        'grapploct': 853,
-        'sinistea': 854,
-        'polteageist': 855,
-        'hatenna': 856,
-        'hattrem': 857,
-        'hatterene': 858,
-        'impidimp': 859,
-        'morgrem': 860,
-        'grimmsnarl': 861,
-        'obstagoon': 862,
-        'perrserker': 863,
-        'cursola': 864,
-        'sirfetchd': 865,
-        'mr_rime': 866,
-        'runerigus': 867,
-        'milcery': 868,
-        'alcremie': 869,
-        'falinks': 870,
-        'pincurchin': 871,
-        'snom': 872,
-        'frosmoth': 873,
-        'stonjourner': 874,
-        'eiscue': 875,
-        'indeedee': 876,
-        'morpeko': 877,
-        'cufant': 878,
-        'copperajah': 879,
-        'dracozolt': 880,
-        'arctozolt': 881,
-        'dracovish': 882,
-        'arctovish': 883,
-        'duraludon': 884,
-        'dreepy': 885,
-        'drakloak': 886,
-        'dragapult': 887,
-        'zacian': 888,
-        'zamazenta': 889,
-        'eternatus': 890,
-        'kubfu': 891,
-        'urshifu': 892,
-        'zarude': 893,
-        'regieleki': 894,
-        'regidrago': 895,
-        'glastrier': 896,
-        'spectrier': 897,
-        'calyrex': 898,
-        'wyrdeer': 899,
-        'kleavor': 900,
-        'ursaluna': 901,
-        'basculegion': 902,
-        'sneasler': 903,
-        'overqwil': 904,
-        'enamorus': 905,
-        'sprigatito': 906,
-        'floragato': 907,
-        'meowscarada': 908,
-        'fuecoco': 909,
-        'crocalor': 910,
-        'skeledirge': 911,
-        'quaxly': 912,
-        'quaxwell': 913,
-        'quaquaval': 914,
-        'lechonk': 915,
-        'oinkologne': 916,
-        'tarountula': 917,
-        'spidops': 918,
-        'nymble': 919,
-        'lokix': 920,
-        'pawmi': 921,
-        'pawmo': 922,
-        'pawmot': 923,
-        'tandemaus': 924,
-        'maushold': 925,
-        'fidough': 926,
-        'dachsbun': 927,
-        'smoliv': 928,
-        'dolliv': 929,
-        'arboliva': 930,
-        'squawkabilly': 931,
-        'nacli': 932,
-        'naclstack': 933,
-        'garganacl': 934,
-        'charcadet': 935,
-        'armarouge': 936,
-        'ceruledge': 937,
-        'tadbulb': 938,
-        'bellibolt': 939,
-        'wattrel': 940,
-        'kilowattrel': 941,
-        'maschiff': 942,
-        'mabosstiff': 943,
-        'shroodle': 944,
-        'grafaiai': 945,
-        'bramblin': 946,
-        'brambleghast': 947,
-        'toedscool': 948,
-        'toedscruel': 949,
-        'klawf': 950,
-        'capsakid': 951,
-        'scovillain': 952,
-        'rellor': 953,
-        'rabsca': 954,
-        'flittle': 955,
-        'espathra': 956,
-        'tinkatink': 957,
-        'tinkatuff': 958,
-        'tinkaton': 959,
-        'wiglett': 960,
-        'wugtrio': 961,
-        'bombirdier': 962,
-        'finizen': 963,
-        'palafin': 964,
-        'varoom': 965,
-        'revavroom': 966,
-        'cyclizar': 967,
-        'orthworm': 968,
-        'glimmet': 969,
-        'glimmora': 970,
-        'greavard': 971,
-        'houndstone': 972,
-        'flamigo': 973,
-        'cetoddle': 974,
-        'cetitan': 975,
-        'veluza': 976,
-        'dondozo': 977,
-        'tatsugiri': 978,
-        'annihilape': 979,
-        'clodsire': 980,
-        'farigiraf': 981,
-        'dudunsparce': 982,
-        'kingambit': 983,
-        'great_tusk': 984,
-        'scream_tail': 985,
-        'brute_bonnet': 986,
-        'flutter_mane': 987,
-        'slither_wing': 988,
-        'sandy_shocks': 989,
-        'iron_treads': 990,
-        'iron_bundle': 991,
-        'iron_hands': 992,
-        'iron_jugulis': 993,
-        'iron_moth': 994,
-        'iron_thorns': 995,
-        'frigibax': 996,
-        'arctibax': 997,
-        'baxcalibur': 998,
-        'gimmighoul': 999,
-        'gholdengo': 1000,
-        'wo_chien': 1001,
-        'chien_pao': 1002,
-        'ting_lu': 1003,
-        'chi_yu': 1004,
-        'roaring_moon': 1005,
-        'iron_valiant': 1006,
-        'koraidon': 1007,
-        'miraidon': 1008,
-        'walking_wake': 1009,
-        'iron_leaves': 1010,
-        'dipplin': 1011,
-        'poltchageist': 1012,
-        'sinistcha': 1013,
-        'okidogi': 1014,
-        'munkidori': 1015,
-        'fezandipiti': 1016,
-        'ogerpon': 1017,
-        'archaludon': 1018,
-        'hydrapple': 1019,
-        'gouging_fire': 1020,
-        'raging_bolt': 1021,
-        'iron_boulder': 1022,
-        'iron_crown': 1023,
-        'terapagos': 1024,
-        'pecharunt': 1025,
-        'alola_rattata': 2019,
-        'alola_raticate': 2020,
-        'alola_raichu': 2026,
-        'alola_sandshrew': 2027,
-        'alola_sandslash': 2028,
-        'alola_vulpix': 2037,
-        'alola_ninetales': 2038,
-        'alola_diglett': 2050,
-        'alola_dugtrio': 2051,
-        'alola_meowth': 2052,
-        'alola_persian': 2053,
-        'alola_geodude': 2074,
-        'alola_graveler': 2075,
-        'alola_golem': 2076,
-        'alola_grimer': 2088,
-        'alola_muk': 2089,
-        'alola_exeggutor': 2103,
-        'alola_marowak': 2105,
-        'eternal_floette': 2670,
-        'galar_meowth': 4052,
-        'galar_ponyta': 4077,
-        'galar_rapidash': 4078,
-        'galar_slowpoke': 4079,
-        'galar_slowbro': 4080,
-        'galar_farfetchd': 4083,
-        'galar_weezing': 4110,
-        'galar_mr_mime': 4122,
-        'galar_articuno': 4144,
-        'galar_zapdos': 4145,
-        'galar_moltres': 4146,
-        'galar_slowking': 4199,
-        'galar_corsola': 4222,
-        'galar_zigzagoon': 4263,
-        'galar_linoone': 4264,
-        'galar_darumaka': 4554,
-        'galar_darmanitan': 4555,
-        'galar_yamask': 4562,
-        'galar_stunfisk': 4618,
-        'hisui_growlithe': 6058,
-        'hisui_arcanine': 6059,
-        'hisui_voltorb': 6100,
-        'hisui_electrode': 6101,
-        'hisui_typhlosion': 6157,
-        'hisui_qwilfish': 6211,
-        'hisui_sneasel': 6215,
-        'hisui_samurott': 6503,
-        'hisui_lilligant': 6549,
-        'hisui_zorua': 6570,
-        'hisui_zoroark': 6571,
-        'hisui_braviary': 6628,
-        'hisui_sliggoo': 6705,
-        'hisui_goodra': 6706,
-        'hisui_avalugg': 6713,
-        'hisui_decidueye': 6724,
-        'paldea_tauros': 8128,
-        'paldea_wooper': 8194,
-        'bloodmoon_ursaluna': 8901,
-    }
-    
-class Nature(Enum):
-    HARDY = auto()
-    LONELY = auto()
-    BRAVE = auto()
-    ADAMANT = auto()
-    NAUGHTY = auto()
-    BOLD = auto()
-    DOCILE = auto()
-    RELAXED = auto()
-    IMPISH = auto()
-    LAX = auto()
-    TIMID = auto()
-    HASTY = auto()
-    SERIOUS = auto()
-    JOLLY = auto()
-    NAIVE = auto()
-    MODEST = auto()
-    MILD = auto()
-    QUIET = auto()
-    BASHFUL = auto()
-    RASH = auto()
-    CALM = auto()
-    GENTLE = auto()
-    SASSY = auto()
-    CAREFUL = auto()
-    QUIRKY = auto()
-    UNLOCK_ALL = auto()
-
-class NatureSlot(Enum):
-    NATURE_SLOT = {
-        'HARDY': 0,
-        'LONELY': 1,
-        'BRAVE': 2,
-        'ADAMANT': 3,
-        'NAUGHTY': 4,
-        'BOLD': 5,
-        'DOCILE': 6,
-        'RELAXED': 7,
-        'IMPISH': 8,
-        'LAX': 9,
-        'TIMID': 10,
-        'HASTY': 11,
-        'SERIOUS': 12,
-        'JOLLY': 13,
-        'NAIVE': 14,
-        'MODEST': 15,
-        'MILD': 16,
-        'QUIET': 17,
-        'BASHFUL': 18,
-        'RASH': 19,
-        'CALM': 20,
-        'GENTLE': 21,
-        'SASSY': 22,
-        'CAREFUL': 23,
-        'QUIRKY': 24
-    }
-
-class NoPassive(Enum):
-    NO_PASSIVE_DICT = {
-        '25': '25',
-        '35': '35',
-        '39': '39',
-        '106': '106',
-        '107': '107',
-        '113': '113',
-        '122': '122',
-        '124': '124',
-        '125': '125',
-        '126': '126',
-        '143': '143',
-        '183': '183',
-        '185': '185',
-        '202': '202',
-        '226': '226',
-        '315': '315',
-        '358': '358',
-        '4122': '4122'
-    }
-
-class Biome(Enum):
-    BIOMES_DICT = {
-        'TOWN': '0',
-        'PLAINS': '1',
-        'GRASS': '2',
-        'TALL_GRASS': '3',
-        'METROPOLIS': '4',
-        'FOREST': '5',
-        'SEA': '6',
-        'SWAMP': '7',
-        'BEACH': '8',
-        'LAKE': '9',
-        'SEABED': '10',
-        'MOUNTAIN': '11',
-        'BADLANDS': '12',
-        'CAVE': '13',
-        'DESERT': '14',
-        'ICE_CAVE': '15',
-        'MEADOW': '16',
-        'POWER_PLANT': '17',
-        'VOLCANO': '18',
-        'GRAVEYARD': '19',
-        'DOJO': '20',
-        'FACTORY': '21',
-        'RUINS': '22',
-        'WASTELAND': '23',
-        'ABYSS': '24',
-        'SPACE': '25',
-        'CONSTRUCTION_SITE': '26',
-        'JUNGLE': '27',
-        'FAIRY_CAVE': '28',
-        'TEMPLE': '29',
-        'SLUM': '30',
-        'SNOWY_FOREST': '31',
-        'ISLAND': '40',
-        'LABORATORY': '41',
-        'END': '50'
-    }
-
-class Vouchers(Enum):
-    VOUCHERS_DICT = {
-        'CLASSIC_VICTORY': 1,
-        'BROCK': 2,
-        'MISTY': 3,
-        'LT_SURGE': 4,
-        'ERIKA': 5,
-        'JANINE': 6,
-        'SABRINA': 7,
-        'BLAINE': 8,
-        'GIOVANNI': 9,
-        'FALKNER': 10,
-        'BUGSY': 11,
-        'WHITNEY': 12,
-        'MORTY': 13,
-        'CHUCK': 14,
-        'JASMINE': 15,
-        'PRYCE': 16,
-        'CLAIR': 17,
-        'ROXANNE': 18,
-        'BRAWLY': 19,
-        'WATTSON': 20,
-        'FLANNERY': 21,
-        'NORMAN': 22,
-        'WINONA': 23,
-        'TATE': 24,
-        'LIZA': 25,
-        'JUAN': 26,
-        'ROARK': 27,
-        'GARDENIA': 28,
-        'MAYLENE': 29,
-        'CRASHER_WAKE': 30,
-        'FANTINA': 31,
-        'BYRON': 32,
-        'CANDICE': 33,
-        'VOLKNER': 34,
-        'CILAN': 35,
-        'CHILI': 36,
-        'CRESS': 37,
-        'CHEREN': 38,
-        'LENORA': 39,
-        'ROXIE': 40,
-        'BURGH': 41,
-        'ELESA': 42,
-        'CLAY': 43,
-        'SKYLA': 44,
-        'BRYCEN': 45,
-        'DRAYDEN': 46,
-        'MARLON': 47,
-        'VIOLA': 48,
-        'GRANT': 49,
-        'KORRINA': 50,
-        'RAMOS': 51,
-        'CLEMONT': 52,
-        'VALERIE': 53,
-        'OLYMPIA': 54,
-        'WULFRIC': 55,
-        'MILO': 56,
-        'NESSA': 57,
-        'KABU': 58,
-        'BEA': 59,
-        'ALLISTER': 60,
-        'OPAL': 61,
-        'BEDE': 62,
-        'GORDIE': 63,
-        'MELONY': 64,
-        'PIERS': 65,
-        'MARNIE': 66,
-        'RAIHAN': 67,
-        'KATY': 68,
-        'BRASSIUS': 69,
-        'IONO': 70,
-        'KOFU': 71,
-        'LARRY': 72,
-        'RYME': 73,
-        'TULIP': 74,
-        'GRUSHA': 75,
-        'LORELEI': 76,
-        'BRUNO': 77,
-        'AGATHA': 78,
-        'LANCE': 79,
-        'WILL': 80,
-        'KOGA': 81,
-        'KAREN': 82,
-        'SIDNEY': 83,
-        'PHOEBE': 84,
-        'GLACIA': 85,
-        'DRAKE': 86,
-        'AARON': 87,
-        'BERTHA': 88,
-        'FLINT': 89,
-        'LUCIAN': 90,
-        'SHAUNTAL': 91,
-        'MARSHAL': 92,
-        'GRIMSLEY': 93,
-        'CAITLIN': 94,
-        'MALVA': 95,
-        'SIEBOLD': 96,
-        'WIKSTROM': 97,
-        'DRASNA': 98,
-        'HALA': 99,
-        'MOLAYNE': 100,
-        'OLIVIA': 101,
-        'ACEROLA': 102,
-        'KAHILI': 103,
-        'MARNIE_ELITE': 104,
-        'NESSA_ELITE': 105,
-        'BEA_ELITE': 106,
-        'ALLISTER_ELITE': 107,
-        'RAIHAN_ELITE': 108,
-        'RIKA': 109,
-        'POPPY': 110,
-        'LARRY_ELITE': 111,
-        'HASSEL': 112,
-        'CRISPIN': 113,
-        'AMARYS': 114,
-        'LACEY': 115,
-        'DRAYTON': 116,
-        'BLUE': 117,
-        'RED': 118,
-        'LANCE_CHAMPION': 119,
-        'STEVEN': 120,
-        'WALLACE': 121,
-        'CYNTHIA': 122,
-        'ALDER': 123,
-        'IRIS': 124,
-        'DIANTHA': 125,
-        'HAU': 126,
-        'LEON': 127,
-        'GEETA': 128,
-        'NEMONA': 129,
-        'KIERAN': 130,
-        'ROCKET_BOSS_GIOVANNI_1': 131,
-        'ROCKET_BOSS_GIOVANNI_2': 132,
-        'MAXIE': 133,
-        'MAXIE_2': 134,
-        'ARCHIE': 135,
-        'ARCHIE_2': 136,
-        'CYRUS': 137,
-        'CYRUS_2': 138,
-        'GHETSIS': 139,
-        'GHETSIS_2': 140,
-        'LYSANDRE': 141,
-        'LYSANDRE_2': 142
-    }
-
-class AchievementEnum(Enum):
-    ACHIEVEMENTS_DICT = {
-        '_10K_MONEY': 1,
-        '_100K_MONEY': 2,
-        '_1M_MONEY': 3,
-        '_10M_MONEY': 4,
-        '_250_DMG': 5,
-        '_1000_DMG': 6,
-        '_2500_DMG': 7,
-        '_10000_DMG': 8,
-        '_250_HEAL': 9,
-        '_1000_HEAL': 10,
-        '_2500_HEAL': 11,
-        '_10000_HEAL': 12,
-        'LV_100': 13,
-        'LV_250': 14,
-        'LV_1000': 15,
-        '_10_RIBBONS': 16,
-        '_25_RIBBONS': 17,
-        '_50_RIBBONS': 18,
-        '_75_RIBBONS': 19,
-        '_100_RIBBONS': 20,
-        'TRANSFER_MAX_BATTLE_STAT': 21,
-        'MAX_FRIENDSHIP': 22,
-        'MEGA_EVOLVE': 23,
-        'GIGANTAMAX': 24,
-        'TERASTALLIZE': 25,
-        'STELLAR_TERASTALLIZE': 26,
-        'SPLICE': 27,
-        'MINI_BLACK_HOLE': 28,
-        'CATCH_MYTHICAL': 29,
-        'CATCH_SUB_LEGENDARY': 30,
-        'CATCH_LEGENDARY': 31,
-        'SEE_SHINY': 32,
-        'SHINY_PARTY': 33,
-        'HATCH_MYTHICAL': 34,
-        'HATCH_SUB_LEGENDARY': 35,
-        'HATCH_LEGENDARY': 36,
-        'HATCH_SHINY': 37,
-        'HIDDEN_ABILITY': 38,
-        'PERFECT_IVS': 39,
-        'CLASSIC_VICTORY': 40,
-        'MONO_GEN_ONE_VICTORY': 41,
-        'MONO_GEN_TWO_VICTORY': 42,
-        'MONO_GEN_THREE_VICTORY': 43,
-        'MONO_GEN_FOUR_VICTORY': 44,
-        'MONO_GEN_FIVE_VICTORY': 45,
-        'MONO_GEN_SIX_VICTORY': 46,
-        'MONO_GEN_SEVEN_VICTORY': 47,
-        'MONO_GEN_EIGHT_VICTORY': 48,
-        'MONO_GEN_NINE_VICTORY': 49,
-        'MONO_NORMAL': 50,
-        'MONO_FIGHTING': 51,
-        'MONO_FLYING': 52,
-        'MONO_POISON': 53,
-        'MONO_GROUND': 54,
-        'MONO_ROCK': 55,
-        'MONO_BUG': 56,
-        'MONO_GHOST': 57,
-        'MONO_STEEL': 58,
-        'MONO_FIRE': 59,
-        'MONO_WATER': 60,
-        'MONO_GRASS': 61,
-        'MONO_ELECTRIC': 62,
-        'MONO_PSYCHIC': 63,
-        'MONO_ICE': 64,
-        'MONO_DRAGON': 65,
-        'MONO_DARK': 66,
-        'MONO_FAIRY': 67
-    }
-
-class MovesEnum(Enum):
-    MOVES_DICT = {
-        'NONE': 0,
-        'POUND': 1,
-        'KARATE_CHOP': 2,
-        'DOUBLE_SLAP': 3,
-        'COMET_PUNCH': 4,
-        'MEGA_PUNCH': 5,
-        'PAY_DAY': 6,
-        'FIRE_PUNCH': 7,
-        'ICE_PUNCH': 8,
-        'THUNDER_PUNCH': 9,
-        'SCRATCH': 10,
-        'VISE_GRIP': 11,
-        'GUILLOTINE': 12,
-        'RAZOR_WIND': 13,
-        'SWORDS_DANCE': 14,
-        'CUT': 15,
-        'GUST': 16,
-        'WING_ATTACK': 17,
-        'WHIRLWIND': 18,
-        'FLY': 19,
-        'BIND': 20,
-        'SLAM': 21,
-        'VINE_WHIP': 22,
-        'STOMP': 23,
-        'DOUBLE_KICK': 24,
-        'MEGA_KICK': 25,
-        'JUMP_KICK': 26,
-        'ROLLING_KICK': 27,
-        'SAND_ATTACK': 28,
-        'HEADBUTT': 29,
-        'HORN_ATTACK': 30,
-        'FURY_ATTACK': 31,
-        'HORN_DRILL': 32,
-        'TACKLE': 33,
-        'BODY_SLAM': 34,
-        'WRAP': 35,
-        'TAKE_DOWN': 36,
-        'THRASH': 37,
-        'DOUBLE_EDGE': 38,
-        'TAIL_WHIP': 39,
-        'POISON_STING': 40,
-        'TWINEEDLE': 41,
-        'PIN_MISSILE': 42,
-        'LEER': 43,
-        'BITE': 44,
-        'GROWL': 45,
-        'ROAR': 46,
-        'SING': 47,
-        'SUPERSONIC': 48,
-        'SONIC_BOOM': 49,
-        'DISABLE': 50,
-        'ACID': 51,
-        'EMBER': 52,
-        'FLAMETHROWER': 53,
-        'MIST': 54,
-        'WATER_GUN': 55,
-        'HYDRO_PUMP': 56,
-        'SURF': 57,
-        'ICE_BEAM': 58,
-        'BLIZZARD': 59,
-        'PSYBEAM': 60,
-        'BUBBLE_BEAM': 61,
-        'AURORA_BEAM': 62,
-        'HYPER_BEAM': 63,
-        'PECK': 64,
-        'DRILL_PECK': 65,
-        'SUBMISSION': 66,
-        'LOW_KICK': 67,
-        'COUNTER': 68,
-        'SEISMIC_TOSS': 69,
-        'STRENGTH': 70,
-        'ABSORB': 71,
-        'MEGA_DRAIN': 72,
-        'LEECH_SEED': 73,
-        'GROWTH': 74,
-        'RAZOR_LEAF': 75,
-        'SOLAR_BEAM': 76,
-        'POISON_POWDER': 77,
-        'STUN_SPORE': 78,
-        'SLEEP_POWDER': 79,
-        'PETAL_DANCE': 80,
-        'STRING_SHOT': 81,
-        'DRAGON_RAGE': 82,
-        'FIRE_SPIN': 83,
-        'THUNDER_SHOCK': 84,
-        'THUNDERBOLT': 85,
-        'THUNDER_WAVE': 86,
-        'THUNDER': 87,
-        'ROCK_THROW': 88,
-        'EARTHQUAKE': 89,
-        'FISSURE': 90,
-        'DIG': 91,
-        'TOXIC': 92,
-        'CONFUSION': 93,
-        'PSYCHIC': 94,
-        'HYPNOSIS': 95,
-        'MEDITATE': 96,
-        'AGILITY': 97,
-        'QUICK_ATTACK': 98,
-        'RAGE': 99,
-        'TELEPORT': 100,
-        'NIGHT_SHADE': 101,
-        'MIMIC': 102,
-        'SCREECH': 103,
-        'DOUBLE_TEAM': 104,
-        'RECOVER': 105,
-        'HARDEN': 106,
-        'MINIMIZE': 107,
-        'SMOKESCREEN': 108,
-        'CONFUSE_RAY': 109,
-        'WITHDRAW': 110,
-        'DEFENSE_CURL': 111,
-        'BARRIER': 112,
-        'LIGHT_SCREEN': 113,
-        'HAZE': 114,
-        'REFLECT': 115,
-        'FOCUS_ENERGY': 116,
-        'BIDE': 117,
-        'METRONOME': 118,
-        'MIRROR_MOVE': 119,
-        'SELF_DESTRUCT': 120,
-        'EGG_BOMB': 121,
-        'LICK': 122,
-        'SMOG': 123,
-        'SLUDGE': 124,
-        'BONE_CLUB': 125,
-        'FIRE_BLAST': 126,
-        'WATERFALL': 127,
-        'CLAMP': 128,
-        'SWIFT': 129,
-        'SKULL_BASH': 130,
-        'SPIKE_CANNON': 131,
-        'CONSTRICT': 132,
-        'AMNESIA': 133,
-        'KINESIS': 134,
-        'SOFT_BOILED': 135,
-        'HIGH_JUMP_KICK': 136,
-        'GLARE': 137,
-        'DREAM_EATER': 138,
-        'POISON_GAS': 139,
-        'BARRAGE': 140,
-        'LEECH_LIFE': 141,
-        'LOVELY_KISS': 142,
-        'SKY_ATTACK': 143,
-        'TRANSFORM': 144,
-        'BUBBLE': 145,
-        'DIZZY_PUNCH': 146,
-        'SPORE': 147,
-        'FLASH': 148,
-        'PSYWAVE': 149,
-        'SPLASH': 150,
-        'ACID_ARMOR': 151,
-        'CRABHAMMER': 152,
-        'EXPLOSION': 153,
-        'FURY_SWIPES': 154,
-        'BONEMERANG': 155,
-        'REST': 156,
-        'ROCK_SLIDE': 157,
-        'HYPER_FANG': 158,
-        'SHARPEN': 159,
-        'CONVERSION': 160,
-        'TRI_ATTACK': 161,
-        'SUPER_FANG': 162,
-        'SLASH': 163,
-        'SUBSTITUTE': 164,
-        'STRUGGLE': 165,
-        'SKETCH': 166,
-        'TRIPLE_KICK': 167,
-        'THIEF': 168,
-        'SPIDER_WEB': 169,
-        'MIND_READER': 170,
-        'NIGHTMARE': 171,
-        'FLAME_WHEEL': 172,
-        'SNORE': 173,
-        'CURSE': 174,
-        'FLAIL': 175,
-        'CONVERSION_2': 176,
-        'AEROBLAST': 177,
-        'COTTON_SPORE': 178,
-        'REVERSAL': 179,
-        'SPITE': 180,
-        'POWDER_SNOW': 181,
-        'PROTECT': 182,
-        'MACH_PUNCH': 183,
-        'SCARY_FACE': 184,
-        'FEINT_ATTACK': 185,
-        'SWEET_KISS': 186,
-        'BELLY_DRUM': 187,
-        'SLUDGE_BOMB': 188,
-        'MUD_SLAP': 189,
-        'OCTAZOOKA': 190,
-        'SPIKES': 191,
-        'ZAP_CANNON': 192,
-        'FORESIGHT': 193,
-        'DESTINY_BOND': 194,
-        'PERISH_SONG': 195,
-        'ICY_WIND': 196,
-        'DETECT': 197,
-        'BONE_RUSH': 198,
-        'LOCK_ON': 199,
-        'OUTRAGE': 200,
-        'SANDSTORM': 201,
-        'GIGA_DRAIN': 202,
-        'ENDURE': 203,
-        'CHARM': 204,
-        'ROLLOUT': 205,
-        'FALSE_SWIPE': 206,
-        'SWAGGER': 207,
-        'MILK_DRINK': 208,
-        'SPARK': 209,
-        'FURY_CUTTER': 210,
-        'STEEL_WING': 211,
-        'MEAN_LOOK': 212,
-        'ATTRACT': 213,
-        'SLEEP_TALK': 214,
-        'HEAL_BELL': 215,
-        'RETURN': 216,
-        'PRESENT': 217,
-        'FRUSTRATION': 218,
-        'SAFEGUARD': 219,
-        'PAIN_SPLIT': 220,
-        'SACRED_FIRE': 221,
-        'MAGNITUDE': 222,
-        'DYNAMIC_PUNCH': 223,
-        'MEGAHORN': 224,
-        'DRAGON_BREATH': 225,
-        'BATON_PASS': 226,
-        'ENCORE': 227,
-        'PURSUIT': 228,
-        'RAPID_SPIN': 229,
-        'SWEET_SCENT': 230,
-        'IRON_TAIL': 231,
-        'METAL_CLAW': 232,
-        'VITAL_THROW': 233,
-        'MORNING_SUN': 234,
-        'SYNTHESIS': 235,
-        'MOONLIGHT': 236,
-        'HIDDEN_POWER': 237,
-        'CROSS_CHOP': 238,
-        'TWISTER': 239,
-        'RAIN_DANCE': 240,
-        'SUNNY_DAY': 241,
-        'CRUNCH': 242,
-        'MIRROR_COAT': 243,
-        'PSYCH_UP': 244,
-        'EXTREME_SPEED': 245,
-        'ANCIENT_POWER': 246,
-        'SHADOW_BALL': 247,
-        'FUTURE_SIGHT': 248,
-        'ROCK_SMASH': 249,
-        'WHIRLPOOL': 250,
-        'BEAT_UP': 251,
-        'FAKE_OUT': 252,
-        'UPROAR': 253,
-        'STOCKPILE': 254,
-        'SPIT_UP': 255,
-        'SWALLOW': 256,
-        'HEAT_WAVE': 257,
-        'HAIL': 258,
-        'TORMENT': 259,
-        'FLATTER': 260,
-        'WILL_O_WISP': 261,
-        'MEMENTO': 262,
-        'FACADE': 263,
-        'FOCUS_PUNCH': 264,
-        'SMELLING_SALTS': 265,
-        'FOLLOW_ME': 266,
-        'NATURE_POWER': 267,
-        'CHARGE': 268,
-        'TAUNT': 269,
-        'HELPING_HAND': 270,
-        'TRICK': 271,
-        'ROLE_PLAY': 272,
-        'WISH': 273,
-        'ASSIST': 274,
-        'INGRAIN': 275,
-        'SUPERPOWER': 276,
-        'MAGIC_COAT': 277,
-        'RECYCLE': 278,
-        'REVENGE': 279,
-        'BRICK_BREAK': 280,
-        'YAWN': 281,
-        'KNOCK_OFF': 282,
-        'ENDEAVOR': 283,
-        'ERUPTION': 284,
-        'SKILL_SWAP': 285,
-        'IMPRISON': 286,
-        'REFRESH': 287,
-        'GRUDGE': 288,
-        'SNATCH': 289,
-        'SECRET_POWER': 290,
-        'DIVE': 291,
-        'ARM_THRUST': 292,
-        'CAMOUFLAGE': 293,
-        'TAIL_GLOW': 294,
-        'LUSTER_PURGE': 295,
-        'MIST_BALL': 296,
-        'FEATHER_DANCE': 297,
-        'TEETER_DANCE': 298,
-        'BLAZE_KICK': 299,
-        'MUD_SPORT': 300,
-        'ICE_BALL': 301,
-        'NEEDLE_ARM': 302,
-        'SLACK_OFF': 303,
-        'HYPER_VOICE': 304,
-        'POISON_FANG': 305,
-        'CRUSH_CLAW': 306,
-        'BLAST_BURN': 307,
-        'HYDRO_CANNON': 308,
-        'METEOR_MASH': 309,
-        'ASTONISH': 310,
-        'WEATHER_BALL': 311,
-        'AROMATHERAPY': 312,
-        'FAKE_TEARS': 313,
-        'AIR_CUTTER': 314,
-        'OVERHEAT': 315,
-        'ODOR_SLEUTH': 316,
-        'ROCK_TOMB': 317,
-        'SILVER_WIND': 318,
-        'METAL_SOUND': 319,
-        'GRASS_WHISTLE': 320,
-        'TICKLE': 321,
-        'COSMIC_POWER': 322,
-        'WATER_SPOUT': 323,
-        'SIGNAL_BEAM': 324,
-        'SHADOW_PUNCH': 325,
-        'EXTRASENSORY': 326,
-        'SKY_UPPERCUT': 327,
-        'SAND_TOMB': 328,
-        'SHEER_COLD': 329,
-        'MUDDY_WATER': 330,
-        'BULLET_SEED': 331,
-        'AERIAL_ACE': 332,
-        'ICICLE_SPEAR': 333,
-        'IRON_DEFENSE': 334,
-        'BLOCK': 335,
-        'HOWL': 336,
-        'DRAGON_CLAW': 337,
-        'FRENZY_PLANT': 338,
-        'BULK_UP': 339,
-        'BOUNCE': 340,
-        'MUD_SHOT': 341,
-        'POISON_TAIL': 342,
-        'COVET': 343,
-        'VOLT_TACKLE': 344,
-        'MAGICAL_LEAF': 345,
-        'WATER_SPORT': 346,
-        'CALM_MIND': 347,
-        'LEAF_BLADE': 348,
-        'DRAGON_DANCE': 349,
-        'ROCK_BLAST': 350,
-        'SHOCK_WAVE': 351,
-        'WATER_PULSE': 352,
-        'DOOM_DESIRE': 353,
-        'PSYCHO_BOOST': 354,
-        'ROOST': 355,
-        'GRAVITY': 356,
-        'MIRACLE_EYE': 357,
-        'WAKE_UP_SLAP': 358,
-        'HAMMER_ARM': 359,
-        'GYRO_BALL': 360,
-        'HEALING_WISH': 361,
-        'BRINE': 362,
-        'NATURAL_GIFT': 363,
-        'FEINT': 364,
-        'PLUCK': 365,
-        'TAILWIND': 366,
-        'ACUPRESSURE': 367,
-        'METAL_BURST': 368,
-        'U_TURN': 369,
-        'CLOSE_COMBAT': 370,
-        'PAYBACK': 371,
-        'ASSURANCE': 372,
-        'EMBARGO': 373,
-        'FLING': 374,
-        'PSYCHO_SHIFT': 375,
-        'TRUMP_CARD': 376,
-        'HEAL_BLOCK': 377,
-        'WRING_OUT': 378,
-        'POWER_TRICK': 379,
-        'GASTRO_ACID': 380,
-        'LUCKY_CHANT': 381,
-        'ME_FIRST': 382,
-        'COPYCAT': 383,
-        'POWER_SWAP': 384,
-        'GUARD_SWAP': 385,
-        'PUNISHMENT': 386,
-        'LAST_RESORT': 387,
-        'WORRY_SEED': 388,
-        'SUCKER_PUNCH': 389,
-        'TOXIC_SPIKES': 390,
-        'HEART_SWAP': 391,
-        'AQUA_RING': 392,
-        'MAGNET_RISE': 393,
-        'FLARE_BLITZ': 394,
-        'FORCE_PALM': 395,
-        'AURA_SPHERE': 396,
-        'ROCK_POLISH': 397,
-        'POISON_JAB': 398,
-        'DARK_PULSE': 399,
-        'NIGHT_SLASH': 400,
-        'AQUA_TAIL': 401,
-        'SEED_BOMB': 402,
-        'AIR_SLASH': 403,
-        'X_SCISSOR': 404,
-        'BUG_BUZZ': 405,
-        'DRAGON_PULSE': 406,
-        'DRAGON_RUSH': 407,
-        'POWER_GEM': 408,
-        'DRAIN_PUNCH': 409,
-        'VACUUM_WAVE': 410,
-        'FOCUS_BLAST': 411,
-        'ENERGY_BALL': 412,
-        'BRAVE_BIRD': 413,
-        'EARTH_POWER': 414,
-        'SWITCHEROO': 415,
-        'GIGA_IMPACT': 416,
-        'NASTY_PLOT': 417,
-        'BULLET_PUNCH': 418,
-        'AVALANCHE': 419,
-        'ICE_SHARD': 420,
-        'SHADOW_CLAW': 421,
-        'THUNDER_FANG': 422,
-        'ICE_FANG': 423,
-        'FIRE_FANG': 424,
-        'SHADOW_SNEAK': 425,
-        'MUD_BOMB': 426,
-        'PSYCHO_CUT': 427,
-        'ZEN_HEADBUTT': 428,
-        'MIRROR_SHOT': 429,
-        'FLASH_CANNON': 430,
-        'ROCK_CLIMB': 431,
-        'DEFOG': 432,
-        'TRICK_ROOM': 433,
-        'DRACO_METEOR': 434,
-        'DISCHARGE': 435,
-        'LAVA_PLUME': 436,
-        'LEAF_STORM': 437,
-        'POWER_WHIP': 438,
-        'ROCK_WRECKER': 439,
-        'CROSS_POISON': 440,
-        'GUNK_SHOT': 441,
-        'IRON_HEAD': 442,
-        'MAGNET_BOMB': 443,
-        'STONE_EDGE': 444,
-        'CAPTIVATE': 445,
-        'STEALTH_ROCK': 446,
-        'GRASS_KNOT': 447,
-        'CHATTER': 448,
-        'JUDGMENT': 449,
-        'BUG_BITE': 450,
-        'CHARGE_BEAM': 451,
-        'WOOD_HAMMER': 452,
-        'AQUA_JET': 453,
-        'ATTACK_ORDER': 454,
-        'DEFEND_ORDER': 455,
-        'HEAL_ORDER': 456,
-        'HEAD_SMASH': 457,
-        'DOUBLE_HIT': 458,
-        'ROAR_OF_TIME': 459,
-        'SPACIAL_REND': 460,
-        'LUNAR_DANCE': 461,
-        'CRUSH_GRIP': 462,
-        'MAGMA_STORM': 463,
-        'DARK_VOID': 464,
-        'SEED_FLARE': 465,
-        'OMINOUS_WIND': 466,
-        'SHADOW_FORCE': 467,
-        'HONE_CLAWS': 468,
-        'WIDE_GUARD': 469,
-        'GUARD_SPLIT': 470,
-        'POWER_SPLIT': 471,
-        'WONDER_ROOM': 472,
-        'PSYSHOCK': 473,
-        'VENOSHOCK': 474,
-        'AUTOTOMIZE': 475,
-        'RAGE_POWDER': 476,
-        'TELEKINESIS': 477,
-        'MAGIC_ROOM': 478,
-        'SMACK_DOWN': 479,
-        'STORM_THROW': 480,
-        'FLAME_BURST': 481,
-        'SLUDGE_WAVE': 482,
-        'QUIVER_DANCE': 483,
-        'HEAVY_SLAM': 484,
-        'SYNCHRONOISE': 485,
-        'ELECTRO_BALL': 486,
-        'SOAK': 487,
-        'FLAME_CHARGE': 488,
-        'COIL': 489,
-        'LOW_SWEEP': 490,
-        'ACID_SPRAY': 491,
-        'FOUL_PLAY': 492,
-        'SIMPLE_BEAM': 493,
-        'ENTRAINMENT': 494,
-        'AFTER_YOU': 495,
-        'ROUND': 496,
-        'ECHOED_VOICE': 497,
-        'CHIP_AWAY': 498,
-        'CLEAR_SMOG': 499,
-        'STORED_POWER': 500,
-        'QUICK_GUARD': 501,
-        'ALLY_SWITCH': 502,
-        'SCALD': 503,
-        'SHELL_SMASH': 504,
-        'HEAL_PULSE': 505,
-        'HEX': 506,
-        'SKY_DROP': 507,
-        'SHIFT_GEAR': 508,
-        'CIRCLE_THROW': 509,
-        'INCINERATE': 510,
-        'QUASH': 511,
-        'ACROBATICS': 512,
-        'REFLECT_TYPE': 513,
-        'RETALIATE': 514,
-        'FINAL_GAMBIT': 515,
-        'BESTOW': 516,
-        'INFERNO': 517,
-        'WATER_PLEDGE': 518,
-        'FIRE_PLEDGE': 519,
-        'GRASS_PLEDGE': 520,
-        'VOLT_SWITCH': 521,
-        'STRUGGLE_BUG': 522,
-        'BULLDOZE': 523,
-        'FROST_BREATH': 524,
-        'DRAGON_TAIL': 525,
-        'WORK_UP': 526,
-        'ELECTROWEB': 527,
-        'WILD_CHARGE': 528,
-        'DRILL_RUN': 529,
-        'DUAL_CHOP': 530,
-        'HEART_STAMP': 531,
-        'HORN_LEECH': 532,
-        'SACRED_SWORD': 533,
-        'RAZOR_SHELL': 534,
-        'HEAT_CRASH': 535,
-        'LEAF_TORNADO': 536,
-        'STEAMROLLER': 537,
-        'COTTON_GUARD': 538,
-        'NIGHT_DAZE': 539,
-        'PSYSTRIKE': 540,
-        'TAIL_SLAP': 541,
-        'HURRICANE': 542,
-        'HEAD_CHARGE': 543,
-        'GEAR_GRIND': 544,
-        'SEARING_SHOT': 545,
-        'TECHNO_BLAST': 546,
-        'RELIC_SONG': 547,
-        'SECRET_SWORD': 548,
-        'GLACIATE': 549,
-        'BOLT_STRIKE': 550,
-        'BLUE_FLARE': 551,
-        'FIERY_DANCE': 552,
-        'FREEZE_SHOCK': 553,
-        'ICE_BURN': 554,
-        'SNARL': 555,
-        'ICICLE_CRASH': 556,
-        'V_CREATE': 557,
-        'FUSION_FLARE': 558,
-        'FUSION_BOLT': 559,
-        'FLYING_PRESS': 560,
-        'MAT_BLOCK': 561,
-        'BELCH': 562,
-        'ROTOTILLER': 563,
-        'STICKY_WEB': 564,
-        'FELL_STINGER': 565,
-        'PHANTOM_FORCE': 566,
-        'TRICK_OR_TREAT': 567,
-        'NOBLE_ROAR': 568,
-        'ION_DELUGE': 569,
-        'PARABOLIC_CHARGE': 570,
-        'FORESTS_CURSE': 571,
-        'PETAL_BLIZZARD': 572,
-        'FREEZE_DRY': 573,
-        'DISARMING_VOICE': 574,
-        'PARTING_SHOT': 575,
-        'TOPSY_TURVY': 576,
-        'DRAINING_KISS': 577,
-        'CRAFTY_SHIELD': 578,
-        'FLOWER_SHIELD': 579,
-        'GRASSY_TERRAIN': 580,
-        'MISTY_TERRAIN': 581,
-        'ELECTRIFY': 582,
-        'PLAY_ROUGH': 583,
-        'FAIRY_WIND': 584,
-        'MOONBLAST': 585,
-        'BOOMBURST': 586,
-        'FAIRY_LOCK': 587,
-        'KINGS_SHIELD': 588,
-        'PLAY_NICE': 589,
-        'CONFIDE': 590,
-        'DIAMOND_STORM': 591,
-        'STEAM_ERUPTION': 592,
-        'HYPERSPACE_HOLE': 593,
-        'WATER_SHURIKEN': 594,
-        'MYSTICAL_FIRE': 595,
-        'SPIKY_SHIELD': 596,
-        'AROMATIC_MIST': 597,
-        'EERIE_IMPULSE': 598,
-        'VENOM_DRENCH': 599,
-        'POWDER': 600,
-        'GEOMANCY': 601,
-        'MAGNETIC_FLUX': 602,
-        'HAPPY_HOUR': 603,
-        'ELECTRIC_TERRAIN': 604,
-        'DAZZLING_GLEAM': 605,
-        'CELEBRATE': 606,
-        'HOLD_HANDS': 607,
-        'BABY_DOLL_EYES': 608,
-        'NUZZLE': 609,
-        'HOLD_BACK': 610,
-        'INFESTATION': 611,
-        'POWER_UP_PUNCH': 612,
-        'OBLIVION_WING': 613,
-        'THOUSAND_ARROWS': 614,
-        'THOUSAND_WAVES': 615,
-        'LANDS_WRATH': 616,
-        'LIGHT_OF_RUIN': 617,
-        'ORIGIN_PULSE': 618,
-        'PRECIPICE_BLADES': 619,
-        'DRAGON_ASCENT': 620,
-        'HYPERSPACE_FURY': 621,
-        'BREAKNECK_BLITZ__PHYSICAL': 622,
-        'BREAKNECK_BLITZ__SPECIAL': 623,
-        'ALL_OUT_PUMMELING__PHYSICAL': 624,
-        'ALL_OUT_PUMMELING__SPECIAL': 625,
-        'SUPERSONIC_SKYSTRIKE__PHYSICAL': 626,
-        'SUPERSONIC_SKYSTRIKE__SPECIAL': 627,
-        'ACID_DOWNPOUR__PHYSICAL': 628,
-        'ACID_DOWNPOUR__SPECIAL': 629,
-        'TECTONIC_RAGE__PHYSICAL': 630,
-        'TECTONIC_RAGE__SPECIAL': 631,
-        'CONTINENTAL_CRUSH__PHYSICAL': 632,
-        'CONTINENTAL_CRUSH__SPECIAL': 633,
-        'SAVAGE_SPIN_OUT__PHYSICAL': 634,
-        'SAVAGE_SPIN_OUT__SPECIAL': 635,
-        'NEVER_ENDING_NIGHTMARE__PHYSICAL': 636,
-        'NEVER_ENDING_NIGHTMARE__SPECIAL': 637,
-        'CORKSCREW_CRASH__PHYSICAL': 638,
-        'CORKSCREW_CRASH__SPECIAL': 639,
-        'INFERNO_OVERDRIVE__PHYSICAL': 640,
-        'INFERNO_OVERDRIVE__SPECIAL': 641,
-        'HYDRO_VORTEX__PHYSICAL': 642,
-        'HYDRO_VORTEX__SPECIAL': 643,
-        'BLOOM_DOOM__PHYSICAL': 644,
-        'BLOOM_DOOM__SPECIAL': 645,
-        'GIGAVOLT_HAVOC__PHYSICAL': 646,
-        'GIGAVOLT_HAVOC__SPECIAL': 647,
-        'SHATTERED_PSYCHE__PHYSICAL': 648,
-        'SHATTERED_PSYCHE__SPECIAL': 649,
-        'SUBZERO_SLAMMER__PHYSICAL': 650,
-        'SUBZERO_SLAMMER__SPECIAL': 651,
-        'DEVASTATING_DRAKE__PHYSICAL': 652,
-        'DEVASTATING_DRAKE__SPECIAL': 653,
-        'BLACK_HOLE_ECLIPSE__PHYSICAL': 654,
-        'BLACK_HOLE_ECLIPSE__SPECIAL': 655,
-        'TWINKLE_TACKLE__PHYSICAL': 656,
-        'TWINKLE_TACKLE__SPECIAL': 657,
-        'CATASTROPIKA': 658,
-        'SHORE_UP': 659,
-        'FIRST_IMPRESSION': 660,
-        'BANEFUL_BUNKER': 661,
-        'SPIRIT_SHACKLE': 662,
-        'DARKEST_LARIAT': 663,
-        'SPARKLING_ARIA': 664,
-        'ICE_HAMMER': 665,
-        'FLORAL_HEALING': 666,
-        'HIGH_HORSEPOWER': 667,
-        'STRENGTH_SAP': 668,
-        'SOLAR_BLADE': 669,
-        'LEAFAGE': 670,
-        'SPOTLIGHT': 671,
-        'TOXIC_THREAD': 672,
-        'LASER_FOCUS': 673,
-        'GEAR_UP': 674,
-        'THROAT_CHOP': 675,
-        'POLLEN_PUFF': 676,
-        'ANCHOR_SHOT': 677,
-        'PSYCHIC_TERRAIN': 678,
-        'LUNGE': 679,
-        'FIRE_LASH': 680,
-        'POWER_TRIP': 681,
-        'BURN_UP': 682,
-        'SPEED_SWAP': 683,
-        'SMART_STRIKE': 684,
-        'PURIFY': 685,
-        'REVELATION_DANCE': 686,
-        'CORE_ENFORCER': 687,
-        'TROP_KICK': 688,
-        'INSTRUCT': 689,
-        'BEAK_BLAST': 690,
-        'CLANGING_SCALES': 691,
-        'DRAGON_HAMMER': 692,
-        'BRUTAL_SWING': 693,
-        'AURORA_VEIL': 694,
-        'SINISTER_ARROW_RAID': 695,
-        'MALICIOUS_MOONSAULT': 696,
-        'OCEANIC_OPERETTA': 697,
-        'GUARDIAN_OF_ALOLA': 698,
-        'SOUL_STEALING_7_STAR_STRIKE': 699,
-        'STOKED_SPARKSURFER': 700,
-        'PULVERIZING_PANCAKE': 701,
-        'EXTREME_EVOBOOST': 702,
-        'GENESIS_SUPERNOVA': 703,
-        'SHELL_TRAP': 704,
-        'FLEUR_CANNON': 705,
-        'PSYCHIC_FANGS': 706,
-        'STOMPING_TANTRUM': 707,
-        'SHADOW_BONE': 708,
-        'ACCELEROCK': 709,
-        'LIQUIDATION': 710,
-        'PRISMATIC_LASER': 711,
-        'SPECTRAL_THIEF': 712,
-        'SUNSTEEL_STRIKE': 713,
-        'MOONGEIST_BEAM': 714,
-        'TEARFUL_LOOK': 715,
-        'ZING_ZAP': 716,
-        'NATURES_MADNESS': 717,
-        'MULTI_ATTACK': 718,
-        'TEN_MILLION_VOLT_THUNDERBOLT': 719,
-        'MIND_BLOWN': 720,
-        'PLASMA_FISTS': 721,
-        'PHOTON_GEYSER': 722,
-        'LIGHT_THAT_BURNS_THE_SKY': 723,
-        'SEARING_SUNRAZE_SMASH': 724,
-        'MENACING_MOONRAZE_MAELSTROM': 725,
-        'LETS_SNUGGLE_FOREVER': 726,
-        'SPLINTERED_STORMSHARDS': 727,
-        'CLANGOROUS_SOULBLAZE': 728,
-        'ZIPPY_ZAP': 729,
-        'SPLISHY_SPLASH': 730,
-        'FLOATY_FALL': 731,
-        'PIKA_PAPOW': 732,
-        'BOUNCY_BUBBLE': 733,
-        'BUZZY_BUZZ': 734,
-        'SIZZLY_SLIDE': 735,
-        'GLITZY_GLOW': 736,
-        'BADDY_BAD': 737,
-        'SAPPY_SEED': 738,
-        'FREEZY_FROST': 739,
-        'SPARKLY_SWIRL': 740,
-        'VEEVEE_VOLLEY': 741,
-        'DOUBLE_IRON_BASH': 742,
-        'MAX_GUARD': 743,
-        'DYNAMAX_CANNON': 744,
-        'SNIPE_SHOT': 745,
-        'JAW_LOCK': 746,
-        'STUFF_CHEEKS': 747,
-        'NO_RETREAT': 748,
-        'TAR_SHOT': 749,
-        'MAGIC_POWDER': 750,
-        'DRAGON_DARTS': 751,
-        'TEATIME': 752,
-        'OCTOLOCK': 753,
-        'BOLT_BEAK': 754,
-        'FISHIOUS_REND': 755,
-        'COURT_CHANGE': 756,
-        'MAX_FLARE': 757,
-        'MAX_FLUTTERBY': 758,
-        'MAX_LIGHTNING': 759,
-        'MAX_STRIKE': 760,
-        'MAX_KNUCKLE': 761,
-        'MAX_PHANTASM': 762,
-        'MAX_HAILSTORM': 763,
-        'MAX_OOZE': 764,
-        'MAX_GEYSER': 765,
-        'MAX_AIRSTREAM': 766,
-        'MAX_STARFALL': 767,
-        'MAX_WYRMWIND': 768,
-        'MAX_MINDSTORM': 769,
-        'MAX_ROCKFALL': 770,
-        'MAX_QUAKE': 771,
-        'MAX_DARKNESS': 772,
-        'MAX_OVERGROWTH': 773,
-        'MAX_STEELSPIKE': 774,
-        'CLANGOROUS_SOUL': 775,
-        'BODY_PRESS': 776,
-        'DECORATE': 777,
-        'DRUM_BEATING': 778,
-        'SNAP_TRAP': 779,
-        'PYRO_BALL': 780,
-        'BEHEMOTH_BLADE': 781,
-        'BEHEMOTH_BASH': 782,
-        'AURA_WHEEL': 783,
-        'BREAKING_SWIPE': 784,
-        'BRANCH_POKE': 785,
-        'OVERDRIVE': 786,
-        'APPLE_ACID': 787,
-        'GRAV_APPLE': 788,
-        'SPIRIT_BREAK': 789,
-        'STRANGE_STEAM': 790,
-        'LIFE_DEW': 791,
-        'OBSTRUCT': 792,
-        'FALSE_SURRENDER': 793,
-        'METEOR_ASSAULT': 794,
-        'ETERNABEAM': 795,
-        'STEEL_BEAM': 796,
-        'EXPANDING_FORCE': 797,
-        'STEEL_ROLLER': 798,
-        'SCALE_SHOT': 799,
-        'METEOR_BEAM': 800,
-        'SHELL_SIDE_ARM': 801,
-        'MISTY_EXPLOSION': 802,
-        'GRASSY_GLIDE': 803,
-        'RISING_VOLTAGE': 804,
-        'TERRAIN_PULSE': 805,
-        'SKITTER_SMACK': 806,
-        'BURNING_JEALOUSY': 807,
-        'LASH_OUT': 808,
-        'POLTERGEIST': 809,
-        'CORROSIVE_GAS': 810,
-        'COACHING': 811,
-        'FLIP_TURN': 812,
-        'TRIPLE_AXEL': 813,
-        'DUAL_WINGBEAT': 814,
-        'SCORCHING_SANDS': 815,
-        'JUNGLE_HEALING': 816,
-        'WICKED_BLOW': 817,
-        'SURGING_STRIKES': 818,
-        'THUNDER_CAGE': 819,
-        'DRAGON_ENERGY': 820,
-        'FREEZING_GLARE': 821,
-        'FIERY_WRATH': 822,
-        'THUNDEROUS_KICK': 823,
-        'GLACIAL_LANCE': 824,
-        'ASTRAL_BARRAGE': 825,
-        'EERIE_SPELL': 826,
-        'DIRE_CLAW': 827,
-        'PSYSHIELD_BASH': 828,
-        'POWER_SHIFT': 829,
-        'STONE_AXE': 830,
-        'SPRINGTIDE_STORM': 831,
-        'MYSTICAL_POWER': 832,
-        'RAGING_FURY': 833,
-        'WAVE_CRASH': 834,
-        'CHLOROBLAST': 835,
-        'MOUNTAIN_GALE': 836,
-        'VICTORY_DANCE': 837,
-        'HEADLONG_RUSH': 838,
-        'BARB_BARRAGE': 839,
-        'ESPER_WING': 840,
-        'BITTER_MALICE': 841,
-        'SHELTER': 842,
-        'TRIPLE_ARROWS': 843,
-        'INFERNAL_PARADE': 844,
-        'CEASELESS_EDGE': 845,
-        'BLEAKWIND_STORM': 846,
-        'WILDBOLT_STORM': 847,
-        'SANDSEAR_STORM': 848,
-        'LUNAR_BLESSING': 849,
-        'TAKE_HEART': 850,
-        'TERA_BLAST': 851,
-        'SILK_TRAP': 852,
-        'AXE_KICK': 853,
-        'LAST_RESPECTS': 854,
-        'LUMINA_CRASH': 855,
-        'ORDER_UP': 856,
-        'JET_PUNCH': 857,
-        'SPICY_EXTRACT': 858,
-        'SPIN_OUT': 859,
-        'POPULATION_BOMB': 860,
-        'ICE_SPINNER': 861,
-        'GLAIVE_RUSH': 862,
-        'REVIVAL_BLESSING': 863,
-        'SALT_CURE': 864,
-        'TRIPLE_DIVE': 865,
-        'MORTAL_SPIN': 866,
-        'DOODLE': 867,
-        'FILLET_AWAY': 868,
-        'KOWTOW_CLEAVE': 869,
-        'FLOWER_TRICK': 870,
-        'TORCH_SONG': 871,
-        'AQUA_STEP': 872,
-        'RAGING_BULL': 873,
-        'MAKE_IT_RAIN': 874,
-        'PSYBLADE': 875,
-        'HYDRO_STEAM': 876,
-        'RUINATION': 877,
-        'COLLISION_COURSE': 878,
-        'ELECTRO_DRIFT': 879,
-        'SHED_TAIL': 880,
-        'CHILLY_RECEPTION': 881,
-        'TIDY_UP': 882,
-        'SNOWSCAPE': 883,
-        'POUNCE': 884,
-        'TRAILBLAZE': 885,
-        'CHILLING_WATER': 886,
-        'HYPER_DRILL': 887,
-        'TWIN_BEAM': 888,
-        'RAGE_FIST': 889,
-        'ARMOR_CANNON': 890,
-        'BITTER_BLADE': 891,
-        'DOUBLE_SHOCK': 892,
-        'GIGATON_HAMMER': 893,
-        'COMEUPPANCE': 894,
-        'AQUA_CUTTER': 895,
-        'BLAZING_TORQUE': 896,
-        'WICKED_TORQUE': 897,
-        'NOXIOUS_TORQUE': 898,
-        'COMBAT_TORQUE': 899,
-        'MAGICAL_TORQUE': 900,
-        'BLOOD_MOON': 901,
-        'MATCHA_GOTCHA': 902,
-        'SYRUP_BOMB': 903,
-        'IVY_CUDGEL': 904,
-        'ELECTRO_SHOT': 905,
-        'TERA_STARSTORM': 906,
-        'FICKLE_BEAM': 907,
-        'BURNING_BULWARK': 908,
-        'THUNDERCLAP': 909,
-        'MIGHTY_CLEAVE': 910,
-        'TACHYON_CUTTER': 911,
-        'HARD_PRESS': 912,
-        'DRAGON_CHEER': 913,
-        'ALLURING_VOICE': 914,
-        'TEMPER_FLARE': 915,
-        'SUPERCELL_SLAM': 916,
-        'PSYCHIC_NOISE': 917,
-        'UPPER_HAND': 918,
-        'MALIGNANT_CHAIN': 919,
-    }
-
-class hasFormsEnum(Enum):
-    FORMID_DICT = {
-        '3': {'Venusaur': ['Normal', 'Mega', 'G-Max'], 'isNormalForm': False},
-        '6': {'Charizard': ['Normal', 'Mega-X', 'Mega-Y', 'G-Max'], 'isNormalForm': False},
-        '9': {'Blastoise': ['Normal', 'Mega', 'G-Max'], 'isNormalForm': False},
-        '12': {'Butterfree': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '18': {'Pidgeot': ['Normal', 'Mega'], 'isNormalForm': False},
-        '25': {'Pikachu': ['Normal', 'Partner', 'Cosplay', 'Cool Cosplay', 'Beauty Cosplay', 'Cute Cosplay', 'Smart Cosplay', 'Tough Cosplay', 'G-Max'], 'isNormalForm': True},
-        '52': {'Meowth': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '65': {'Alakazam': ['Normal', 'Mega'], 'isNormalForm': False},
-        '68': {'Machamp': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '80': {'Slowbro': ['Normal', 'Mega'], 'isNormalForm': False},
-        '94': {'Gengar': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '115': {'Kangaskhan': ['Normal', 'Mega'], 'isNormalForm': False},
-        '127': {'Pinsir': ['Normal', 'Mega'], 'isNormalForm': False},
-        '130': {'Gyarados': ['Normal', 'Mega'], 'isNormalForm': False},
-        '131': {'Lapras': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '133': {'Eevee': ['Normal', 'Partner', 'G-Max'], 'isNormalForm': True},
-        '142': {'Aerodactyl': ['Normal', 'Mega'], 'isNormalForm': False},
-        '143': {'Snorlax': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '150': {'Mewtwo': ['Normal', 'Mega-X', 'Mega-Y'], 'isNormalForm': False},
-        '172': {'Pichu': ['Normal', 'Spiky-Eared'], 'isNormalForm': False},
-        '181': {'Ampharos': ['Normal', 'Mega'], 'isNormalForm': False},
-        '201': {'Unown': ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', '!', '?'], 'isNormalForm': False},
-        '208': {'Steelix': ['Normal', 'Mega'], 'isNormalForm': False},
-        '212': {'Scizor': ['Normal', 'Mega'], 'isNormalForm': False},
-        '214': {'Heracross': ['Normal', 'Mega'], 'isNormalForm': False},
-        '229': {'Houndoom': ['Normal', 'Mega'], 'isNormalForm': False},
-        '248': {'Tyranitar': ['Normal', 'Mega'], 'isNormalForm': False},
-        '254': {'Sceptile': ['Normal', 'Mega'], 'isNormalForm': False},
-        '257': {'Blaziken': ['Normal', 'Mega'], 'isNormalForm': False},
-        '260': {'Swampert': ['Normal', 'Mega'], 'isNormalForm': False},
-        '282': {'Gardevoir': ['Normal', 'Mega'], 'isNormalForm': False},
-        '302': {'Sableye': ['Normal', 'Mega'], 'isNormalForm': False},
-        '303': {'Mawile': ['Normal', 'Mega'], 'isNormalForm': False},
-        '306': {'Aggron': ['Normal', 'Mega'], 'isNormalForm': False},
-        '308': {'Medicham': ['Normal', 'Mega'], 'isNormalForm': False},
-        '310': {'Manectric': ['Normal', 'Mega'], 'isNormalForm': False},
-        '319': {'Sharpedo': ['Normal', 'Mega'], 'isNormalForm': False},
-        '323': {'Camerupt': ['Normal', 'Mega'], 'isNormalForm': False},
-        '334': {'Altaria': ['Normal', 'Mega'], 'isNormalForm': False},
-        '351': {'Castform': ['Normal', 'Sunny', 'Rainy', 'Snowy'], 'isNormalForm': True},
-        '354': {'Banette': ['Normal', 'Mega'], 'isNormalForm': False},
-        '359': {'Absol': ['Normal', 'Mega'], 'isNormalForm': False},
-        '362': {'Glalie': ['Normal', 'Mega'], 'isNormalForm': False},
-        '373': {'Salamence': ['Normal', 'Mega'], 'isNormalForm': False},
-        '376': {'Metagross': ['Normal', 'Mega'], 'isNormalForm': False},
-        '380': {'Latias': ['Normal', 'Mega'], 'isNormalForm': False},
-        '381': {'Latios': ['Normal', 'Mega'], 'isNormalForm': False},
-        '382': {'Kyogre': ['Normal', 'Primal'], 'isNormalForm': False},
-        '383': {'Groudon': ['Normal', 'Primal'], 'isNormalForm': False},
-        '384': {'Rayquaza': ['Normal', 'Mega'], 'isNormalForm': False},
-        '386': {'Deoxys': ['Normal', 'Attack', 'Defense', 'Speed'], 'isNormalForm': False},
-        '412': {'Burmy': ['Plant', 'Sandy', 'Trash'], 'isNormalForm': True},
-        '413': {'Wormadam': ['Plant', 'Sandy', 'Trash'], 'isNormalForm': False},
-        '421': {'Cherrim': ['Overcast', 'Sunshine'], 'isNormalForm': False},
-        '422': {'Shellos': ['East Sea', 'West Sea'], 'isNormalForm': True},
-        '423': {'Gastrodon': ['East Sea', 'West Sea'], 'isNormalForm': False},
-        '428': {'Lopunny': ['Normal', 'Mega'], 'isNormalForm': False},
-        '445': {'Garchomp': ['Normal', 'Mega'], 'isNormalForm': False},
-        '448': {'Lucario': ['Normal', 'Mega'], 'isNormalForm': False},
-        '460': {'Abomasnow': ['Normal', 'Mega'], 'isNormalForm': False},
-        '475': {'Gallade': ['Normal', 'Mega'], 'isNormalForm': False},
-        '479': {'Rotom': ['Normal', 'Heat', 'Wash', 'Frost', 'Fan', 'Mow'], 'isNormalForm': True},
-        '483': {'Dialga': ['Normal', 'Origin'], 'isNormalForm': False},
-        '484': {'Palkia': ['Normal', 'Origin'], 'isNormalForm': False},
-        '487': {'Giratina': ['Normal', 'Origin'], 'isNormalForm': False},
-        '492': {'Shaymin': ['Land', 'Sky'], 'isNormalForm': False},
-        '493': {'Arceus': ['Normal', 'Fighting', 'Flying', 'Poison', 'Ground', 'rock', 'Bug', 'Ghost', 'Steel', 'Fire', 'Water', 'Grass', 'Electric', 'Psychic', 'Ice', 'Dragon', 'Dark', 'Fairy', '???'], 'isNormalForm': False},
-        '531': {'Audino': ['Normal', 'Mega'], 'isNormalForm': False},
-        '550': {'Basculin': ['Red-Striped', 'Blue-Striped', 'White-Striped'], 'isNormalForm': True},
-        '555': {'Darmanitan': ['Standart', 'Zen'], 'isNormalForm': False},
-        '569': {'Garbodor': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '585': {'Deerling': ['Spring', 'Summer', 'Autumn', 'Winter'], 'isNormalForm': True},
-        '586': {'Sawsbuck': ['Spring', 'Summer', 'Autumn', 'Winter'], 'isNormalForm': False},
-        '641': {'Tornadus': ['Incarnate', 'Therian'], 'isNormalForm': False},
-        '642': {'Thundurus': ['Incarnate', 'Therian'], 'isNormalForm': False},
-        '645': {'Landorus': ['Incarnate', 'Therian'], 'isNormalForm': False},
-        '646': {'Kyurem': ['Normal', 'Black', 'White'], 'isNormalForm': False},
-        '647': {'Keldeo': ['Ordinary', 'Resolute'], 'isNormalForm': False},
-        '648': {'Meloetta': ['Aria', 'Pirouette'], 'isNormalForm': False},
-        '649': {'Genesect': ['Normal', 'Shock', 'Burn', 'Chill', 'Douse'], 'isNormalForm': False},
-        '656': {'Froakie': ['Normal', 'Battle Bond'], 'isNormalForm': True},
-        '657': {'Frogadier': ['Normal', 'Battle Bond'], 'isNormalForm': False},
-        '658': {'Greninja': ['Normal', 'Battle Bond', 'Ash'], 'isNormalForm': False},
-        '664': {'Scatterbug': ['Meadow', 'Icy Snow', 'Polar', 'Tundra', 'Continental', 'Garden', 'Elegant'], 'isNormalForm': True},
-        '665': {'Spewpa': ['Meadow', 'Icy', 'Polar', 'Tundra', 'Contintental', 'Garden', 'Elegant', 'Modern', 'Marine', 'Archipelago', 'High Plains', 'Sandrstorm', 'River', 'Monsoon', 'Savanna', 'Sun', 'Ocean', 'Jungle', 'Fancy', 'Pokeball'], 'isNormalForm': False},
-        '666': {'Vivillon': ['Meadow', 'Icy', 'Polar', 'Tundra', 'Contintental', 'Garden', 'Elegant', 'Modern', 'Marine', 'Archipelago', 'High Plains', 'Sandrstorm', 'River', 'Monsoon', 'Savanna', 'Sun', 'Ocean', 'Jungle', 'Fancy', 'Pokeball'], 'isNormalForm': False},
-        '669': {'Flabebe': ['Red', 'Yellow', 'Orange', 'Blue', 'White'], 'isNormalForm': True},
-        '670': {'Floette': ['Red', 'Yellow', 'Orange', 'Blue', 'White'], 'isNormalForm': False},
-        '671': {'Florges': ['Red', 'Yellow', 'Orange', 'Blue', 'White'], 'isNormalForm': False},
-        '676': {'Furfrou': ['Natural', 'Heart', 'Star', 'Diamond', 'Debutante', 'Matron', 'Dandy', 'La Reine', 'Kabuki', 'Pharaoh'], 'isNormalForm': True},
-        '678': {'Meowstic': ['Male', 'Female'], 'isNormalForm': False},
-        '681': {'Aegislash': ['Shield', 'Blade'], 'isNormalForm': False},
-        '710': {'Pumpkaboo': ['Average', 'Small', 'Large', 'Super Size'], 'isNormalForm': True},
-        '711': {'Gourgeist': ['Average', 'Small', 'Large', 'Super Size'], 'isNormalForm': False},
-        '716': {'Xerneas': ['Neutral', 'Active'], 'isNormalForm': True},
-        '718': {'Zygarde': ['50%', '10%', '50% Power', '10% Power', 'Complete'], 'isNormalForm': True},
-        '719': {'Diancie': ['Normal', 'Mega'], 'isNormalForm': False},
-        '720': {'Hoopa': ['Confined', 'Unbound'], 'isNormalForm': False},
-        '741': {'Oricorio': ['Baile', 'Pom-Pom', "Pa'u", 'Sensu'], 'isNormalForm': True},
-        '744': {'Rockruff': ['Normal', 'Own Tempo'], 'isNormalForm': True},
-        '745': {'Lycanroc': ['Midday', 'Midnight', 'Dusk'], 'isNormalForm': False},
-        '746': {'Wishiwashi': ['Solo', 'School'], 'isNormalForm': False},
-        '773': {'Silvally': ['Normal', 'Fighting', 'Flying', 'Poison', 'Ground', 'Rock', 'Bug', 'Ghost', 'Steel', 'Fire', 'Water', 'Grass', 'Electric', 'Psychic', 'Ice', 'Dragon', 'Dark', 'Fairy'], 'isNormalForm': False},
-        '774': {'Minior': ['Red Meteor', 'Orange Meteor', 'Yellow Meteor', 'Green Meteor', 'Blue Meteor', 'Indigo Meteor', 'Violet Meteor', 'Red Core', 'Orange Core', 'Yellow Core', 'Green Core', 'Blue Core', 'Indigo Core', 'Violet Core'], 'isNormalForm': True},
-        '800': {'Necrozma': ['Normal', 'Dusk Mane', 'Dawn Wings', 'Ultra'], 'isNormalForm': False},
-        '801': {'Magearna': ['Normal', 'Original'], 'isNormalForm': True},
-        '802': {'Marshadow': ['Normal', 'Zenith'], 'isNormalForm': True},
-        '809': {'Melmetal': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '812': {'Rillaboom': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '815': {'Cinderace': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '818': {'Inteleon': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '823': {'Corviknight': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '826': {'Orbeetle': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '834': {'Drednaw': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '839': {'Coalossal': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '841': {'Flapple': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '842': {'Appletun': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '844': {'Sandaconda': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '845': {'Cramorant': ['Normal', 'Gulping', 'Gorging'], 'isNormalForm': False},
-        '849': {'Toxtricity': ['Amped', 'Low-key', 'G-Max'], 'isNormalForm': False},
-        '851': {'Centiskorch': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '854': {'Sinistea': ['Phony', 'Antique'], 'isNormalForm': False},
-        '855': {'Polteageist': ['Phony', 'Antique'], 'isNormalForm': False},
-        '858': {'Hatterene': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '861': {'Grimmsnarl': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '869': {'Alcremie': ['Vanilla', 'Ruby', 'Matcha', 'Mint', 'Lemon', 'Salted', 'Ruby Swirl', 'Caramel Swirl', 'Rainbow Swirl', 'G-Max'], 'isNormalForm': False},
-        '875': {'Eiscue': ['Ice', 'No Ice'], 'isNormalForm': False},
-        '876': {'Indeedee': ['Male', 'Female'], 'isNormalForm': False},
-        '877': {'Morpeko': ['Full Belly', 'Hangry'], 'isNormalForm': False},
-        '879': {'Copperajah': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '884': {'Duraludon': ['Normal', 'G-Max'], 'isNormalForm': False},
-        '888': {'Zacian': ['Hero of many Battles', 'Crowned'], 'isNormalForm': False},
-        '889': {'Zamazenta': ['Hero of many Battles', 'Crowned'], 'isNormalForm': False},
-        '890': {'Eternatus': ['Normal', 'E-Max'], 'isNormalForm': False},
-        '892': {'Urshifu': ['Single Strike', 'Rapid Strike', 'G-Max Single Strike', 'G-Max Rapid Strike'], 'isNormalForm': False},
-        '893': {'Zarude': ['Normal', 'Dada'], 'isNormalForm': True},
-        '898': {'Calyrex': ['Normal', 'Ice', 'Shadow'], 'isNormalForm': False},
-        '902': {'Basculegion': ['Male', 'Female'], 'isNormalForm': False},
-        '905': {'Enamorus': ['Incarnate', 'Therian'], 'isNormalForm': False},
-        '916': {'Oinkologne': ['Male', 'Female'], 'isNormalForm': False},
-        '925': {'Maushold': ['Family of Four', 'Family of Three'], 'isNormalForm': False},
-        '931': {'Squawkabilly': ['Green', 'Blue', 'Yellow', 'White'], 'isNormalForm': True},
-        '964': {'Palafin': ['Zero', 'Hero'], 'isNormalForm': False},
-        '978': {'Tatsugiri': ['Curly', 'Droopy', 'Stretchy'], 'isNormalForm': True},
-        '982': {'Dudunsparce': ['Two Segment', 'Three Segment'], 'isNormalForm': False},
-        '999': {'Gimmighoul': ['Chest', 'Roaming'], 'isNormalForm': True},
-        '1007': {'Koraidon': ['Apex', 'Limited', 'Sprinting', 'Swimming', 'Gliding'], 'isNormalForm': True},
-        '1008': {'Miraidon': ['Ultimate', 'Low Drive', 'Aquatic', 'Glide'], 'isNormalForm': True},
-        '1012': {'Poltchageist': ['Counterfeit', 'Artisan'], 'isNormalForm': False},
-        '1013': {'Sinistcha': ['Unremarkable', 'Masterpiece'], 'isNormalForm': False},
-        '1017': {'Ogerpon': ['Teal', 'Wellspring', 'Hearthflame', 'Cornerstone', 'Teal Mask Tera', 'Wellspring Mask Tera', 'Hearthflame Mask Tera', 'Cornerstone Mask Tera'], 'isNormalForm': False},
-        '1024': {'Terapagos': ['Normal', 'Terastal', 'Stellar'], 'isNormalForm': False},
-        '4555': {'Galar Darmanitan': ['Standart', 'Zen'], 'isNormalForm': False},
-        '8128': {'Paldea Tauros': ['Combat', 'Blaze', 'Aqua'], 'isNormalForm': True}
-    }
-
-class eggTypesEnum(Enum):
-    EGGTYPES_DICT = {
-        '1': {'name': 'bulbasaur', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '2': {'name': 'ivysaur', 'isEgg': None},
-        '3': {'name': 'venusaur', 'isEgg': None},
-        '4': {'name': 'charmander', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '5': {'name': 'charmeleon', 'isEgg': None},
-        '6': {'name': 'charizard', 'isEgg': None},
-        '7': {'name': 'squirtle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '8': {'name': 'wartortle', 'isEgg': None},
-        '9': {'name': 'blastoise', 'isEgg': None},
-        '10': {'name': 'caterpie', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '11': {'name': 'metapod', 'isEgg': None},
-        '12': {'name': 'butterfree', 'isEgg': None},
-        '13': {'name': 'weedle', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '14': {'name': 'kakuna', 'isEgg': None},
-        '15': {'name': 'beedrill', 'isEgg': None},
-        '16': {'name': 'pidgey', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '17': {'name': 'pidgeotto', 'isEgg': None},
-        '18': {'name': 'pidgeot', 'isEgg': None},
-        '19': {'name': 'rattata', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '20': {'name': 'raticate', 'isEgg': None},
-        '21': {'name': 'spearow', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '22': {'name': 'fearow', 'isEgg': None},
-        '23': {'name': 'ekans', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '24': {'name': 'arbok', 'isEgg': None},
-        '25': {'name': 'pikachu', 'isEgg': None},
-        '26': {'name': 'raichu', 'isEgg': None},
-        '27': {'name': 'sandshrew', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '28': {'name': 'sandslash', 'isEgg': None},
-        '29': {'name': 'nidoran_f', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '30': {'name': 'nidorina', 'isEgg': None},
-        '31': {'name': 'nidoqueen', 'isEgg': None},
-        '32': {'name': 'nidoran_m', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '33': {'name': 'nidorino', 'isEgg': None},
-        '34': {'name': 'nidoking', 'isEgg': None},
-        '35': {'name': 'clefairy', 'isEgg': None},
-        '36': {'name': 'clefable', 'isEgg': None},
-        '37': {'name': 'vulpix', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '38': {'name': 'ninetales', 'isEgg': None},
-        '39': {'name': 'jigglypuff', 'isEgg': None},
-        '40': {'name': 'wigglytuff', 'isEgg': None},
-        '41': {'name': 'zubat', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '42': {'name': 'golbat', 'isEgg': None},
-        '43': {'name': 'oddish', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '44': {'name': 'gloom', 'isEgg': None},
-        '45': {'name': 'vileplume', 'isEgg': None},
-        '46': {'name': 'paras', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '47': {'name': 'parasect', 'isEgg': None},
-        '48': {'name': 'venonat', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '49': {'name': 'venomoth', 'isEgg': None},
-        '50': {'name': 'diglett', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '51': {'name': 'dugtrio', 'isEgg': None},
-        '52': {'name': 'meowth', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '53': {'name': 'persian', 'isEgg': None},
-        '54': {'name': 'psyduck', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '55': {'name': 'golduck', 'isEgg': None},
-        '56': {'name': 'mankey', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '57': {'name': 'primeape', 'isEgg': None},
-        '58': {'name': 'growlithe', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '59': {'name': 'arcanine', 'isEgg': None},
-        '60': {'name': 'poliwag', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '61': {'name': 'poliwhirl', 'isEgg': None},
-        '62': {'name': 'poliwrath', 'isEgg': None},
-        '63': {'name': 'abra', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '64': {'name': 'kadabra', 'isEgg': None},
-        '65': {'name': 'alakazam', 'isEgg': None},
-        '66': {'name': 'machop', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '67': {'name': 'machoke', 'isEgg': None},
-        '68': {'name': 'machamp', 'isEgg': None},
-        '69': {'name': 'bellsprout', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '70': {'name': 'weepinbell', 'isEgg': None},
-        '71': {'name': 'victreebel', 'isEgg': None},
-        '72': {'name': 'tentacool', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '73': {'name': 'tentacruel', 'isEgg': None},
-        '74': {'name': 'geodude', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '75': {'name': 'graveler', 'isEgg': None},
-        '76': {'name': 'golem', 'isEgg': None},
-        '77': {'name': 'ponyta', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '78': {'name': 'rapidash', 'isEgg': None},
-        '79': {'name': 'slowpoke', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '80': {'name': 'slowbro', 'isEgg': None},
-        '81': {'name': 'magnemite', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '82': {'name': 'magneton', 'isEgg': None},
-        '83': {'name': 'farfetchd', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '84': {'name': 'doduo', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '85': {'name': 'dodrio', 'isEgg': None},
-        '86': {'name': 'seel', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '87': {'name': 'dewgong', 'isEgg': None},
-        '88': {'name': 'grimer', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '89': {'name': 'muk', 'isEgg': None},
-        '90': {'name': 'shellder', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '91': {'name': 'cloyster', 'isEgg': None},
-        '92': {'name': 'gastly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '93': {'name': 'haunter', 'isEgg': None},
-        '94': {'name': 'gengar', 'isEgg': None},
-        '95': {'name': 'onix', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '96': {'name': 'drowzee', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '97': {'name': 'hypno', 'isEgg': None},
-        '98': {'name': 'krabby', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '99': {'name': 'kingler', 'isEgg': None},
-        '100': {'name': 'voltorb', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '101': {'name': 'electrode', 'isEgg': None},
-        '102': {'name': 'exeggcute', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '103': {'name': 'exeggutor', 'isEgg': None},
-        '104': {'name': 'cubone', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '105': {'name': 'marowak', 'isEgg': None},
-        '106': {'name': 'hitmonlee', 'isEgg': None},
-        '107': {'name': 'hitmonchan', 'isEgg': None},
-        '108': {'name': 'lickitung', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '109': {'name': 'koffing', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '110': {'name': 'weezing', 'isEgg': None},
-        '111': {'name': 'rhyhorn', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '112': {'name': 'rhydon', 'isEgg': None},
-        '113': {'name': 'chansey', 'isEgg': None},
-        '114': {'name': 'tangela', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '115': {'name': 'kangaskhan', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '116': {'name': 'horsea', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '117': {'name': 'seadra', 'isEgg': None},
-        '118': {'name': 'goldeen', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '119': {'name': 'seaking', 'isEgg': None},
-        '120': {'name': 'staryu', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '121': {'name': 'starmie', 'isEgg': None},
-        '122': {'name': 'mr_mime', 'isEgg': None},
-        '123': {'name': 'scyther', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '124': {'name': 'jynx', 'isEgg': None},
-        '125': {'name': 'electabuzz', 'isEgg': None},
-        '126': {'name': 'magmar', 'isEgg': None},
-        '127': {'name': 'pinsir', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '128': {'name': 'tauros', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '129': {'name': 'magikarp', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '130': {'name': 'gyarados', 'isEgg': None},
-        '131': {'name': 'lapras', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '132': {'name': 'ditto', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '133': {'name': 'eevee', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '134': {'name': 'vaporeon', 'isEgg': None},
-        '135': {'name': 'jolteon', 'isEgg': None},
-        '136': {'name': 'flareon', 'isEgg': None},
-        '137': {'name': 'porygon', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '138': {'name': 'omanyte', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '139': {'name': 'omastar', 'isEgg': None},
-        '140': {'name': 'kabuto', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '141': {'name': 'kabutops', 'isEgg': None},
-        '142': {'name': 'aerodactyl', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '143': {'name': 'snorlax', 'isEgg': None},
-        '144': {'name': 'articuno', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '145': {'name': 'zapdos', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '146': {'name': 'moltres', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '147': {'name': 'dratini', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '148': {'name': 'dragonair', 'isEgg': None},
-        '149': {'name': 'dragonite', 'isEgg': None},
-        '150': {'name': 'mewtwo', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '151': {'name': 'mew', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '152': {'name': 'chikorita', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '153': {'name': 'bayleef', 'isEgg': None},
-        '154': {'name': 'meganium', 'isEgg': None},
-        '155': {'name': 'cyndaquil', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '156': {'name': 'quilava', 'isEgg': None},
-        '157': {'name': 'typhlosion', 'isEgg': None},
-        '158': {'name': 'totodile', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '159': {'name': 'croconaw', 'isEgg': None},
-        '160': {'name': 'feraligatr', 'isEgg': None},
-        '161': {'name': 'sentret', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '162': {'name': 'furret', 'isEgg': None},
-        '163': {'name': 'hoothoot', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '164': {'name': 'noctowl', 'isEgg': None},
-        '165': {'name': 'ledyba', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '166': {'name': 'ledian', 'isEgg': None},
-        '167': {'name': 'spinarak', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '168': {'name': 'ariados', 'isEgg': None},
-        '169': {'name': 'crobat', 'isEgg': None},
-        '170': {'name': 'chinchou', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '171': {'name': 'lanturn', 'isEgg': None},
-        '172': {'name': 'pichu', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '173': {'name': 'cleffa', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '174': {'name': 'igglybuff', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '175': {'name': 'togepi', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '176': {'name': 'togetic', 'isEgg': None},
-        '177': {'name': 'natu', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '178': {'name': 'xatu', 'isEgg': None},
-        '179': {'name': 'mareep', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '180': {'name': 'flaaffy', 'isEgg': None},
-        '181': {'name': 'ampharos', 'isEgg': None},
-        '182': {'name': 'bellossom', 'isEgg': None},
-        '183': {'name': 'marill', 'isEgg': None},
-        '184': {'name': 'azumarill', 'isEgg': None},
-        '185': {'name': 'sudowoodo', 'isEgg': None},
-        '186': {'name': 'politoed', 'isEgg': None},
-        '187': {'name': 'hoppip', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '188': {'name': 'skiploom', 'isEgg': None},
-        '189': {'name': 'jumpluff', 'isEgg': None},
-        '190': {'name': 'aipom', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '191': {'name': 'sunkern', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '192': {'name': 'sunflora', 'isEgg': None},
-        '193': {'name': 'yanma', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '194': {'name': 'wooper', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '195': {'name': 'quagsire', 'isEgg': None},
-        '196': {'name': 'espeon', 'isEgg': None},
-        '197': {'name': 'umbreon', 'isEgg': None},
-        '198': {'name': 'murkrow', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '199': {'name': 'slowking', 'isEgg': None},
-        '200': {'name': 'misdreavus', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '201': {'name': 'unown', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '202': {'name': 'wobbuffet', 'isEgg': None},
-        '203': {'name': 'girafarig', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '204': {'name': 'pineco', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '205': {'name': 'forretress', 'isEgg': None},
-        '206': {'name': 'dunsparce', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '207': {'name': 'gligar', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '208': {'name': 'steelix', 'isEgg': None},
-        '209': {'name': 'snubbull', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '210': {'name': 'granbull', 'isEgg': None},
-        '211': {'name': 'qwilfish', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '212': {'name': 'scizor', 'isEgg': None},
-        '213': {'name': 'shuckle', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '214': {'name': 'heracross', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '215': {'name': 'sneasel', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '216': {'name': 'teddiursa', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '217': {'name': 'ursaring', 'isEgg': None},
-        '218': {'name': 'slugma', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '219': {'name': 'magcargo', 'isEgg': None},
-        '220': {'name': 'swinub', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '221': {'name': 'piloswine', 'isEgg': None},
-        '222': {'name': 'corsola', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '223': {'name': 'remoraid', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '224': {'name': 'octillery', 'isEgg': None},
-        '225': {'name': 'delibird', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '226': {'name': 'mantine', 'isEgg': None},
-        '227': {'name': 'skarmory', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '228': {'name': 'houndour', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '229': {'name': 'houndoom', 'isEgg': None},
-        '230': {'name': 'kingdra', 'isEgg': None},
-        '231': {'name': 'phanpy', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '232': {'name': 'donphan', 'isEgg': None},
-        '233': {'name': 'porygon2', 'isEgg': None},
-        '234': {'name': 'stantler', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '235': {'name': 'smeargle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '236': {'name': 'tyrogue', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '237': {'name': 'hitmontop', 'isEgg': None},
-        '238': {'name': 'smoochum', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '239': {'name': 'elekid', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '240': {'name': 'magby', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '241': {'name': 'miltank', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '242': {'name': 'blissey', 'isEgg': None},
-        '243': {'name': 'raikou', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '244': {'name': 'entei', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '245': {'name': 'suicune', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '246': {'name': 'larvitar', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '247': {'name': 'pupitar', 'isEgg': None},
-        '248': {'name': 'tyranitar', 'isEgg': None},
-        '249': {'name': 'lugia', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '250': {'name': 'ho_oh', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '251': {'name': 'celebi', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '252': {'name': 'treecko', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '253': {'name': 'grovyle', 'isEgg': None},
-        '254': {'name': 'sceptile', 'isEgg': None},
-        '255': {'name': 'torchic', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '256': {'name': 'combusken', 'isEgg': None},
-        '257': {'name': 'blaziken', 'isEgg': None},
-        '258': {'name': 'mudkip', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '259': {'name': 'marshtomp', 'isEgg': None},
-        '260': {'name': 'swampert', 'isEgg': None},
-        '261': {'name': 'poochyena', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '262': {'name': 'mightyena', 'isEgg': None},
-        '263': {'name': 'zigzagoon', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '264': {'name': 'linoone', 'isEgg': None},
-        '265': {'name': 'wurmple', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '266': {'name': 'silcoon', 'isEgg': None},
-        '267': {'name': 'beautifly', 'isEgg': None},
-        '268': {'name': 'cascoon', 'isEgg': None},
-        '269': {'name': 'dustox', 'isEgg': None},
-        '270': {'name': 'lotad', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '271': {'name': 'lombre', 'isEgg': None},
-        '272': {'name': 'ludicolo', 'isEgg': None},
-        '273': {'name': 'seedot', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '274': {'name': 'nuzleaf', 'isEgg': None},
-        '275': {'name': 'shiftry', 'isEgg': None},
-        '276': {'name': 'taillow', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '277': {'name': 'swellow', 'isEgg': None},
-        '278': {'name': 'wingull', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '279': {'name': 'pelipper', 'isEgg': None},
-        '280': {'name': 'ralts', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '281': {'name': 'kirlia', 'isEgg': None},
-        '282': {'name': 'gardevoir', 'isEgg': None},
-        '283': {'name': 'surskit', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '284': {'name': 'masquerain', 'isEgg': None},
-        '285': {'name': 'shroomish', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '286': {'name': 'breloom', 'isEgg': None},
-        '287': {'name': 'slakoth', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '288': {'name': 'vigoroth', 'isEgg': None},
-        '289': {'name': 'slaking', 'isEgg': None},
-        '290': {'name': 'nincada', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '291': {'name': 'ninjask', 'isEgg': None},
-        '292': {'name': 'shedinja', 'isEgg': None},
-        '293': {'name': 'whismur', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '294': {'name': 'loudred', 'isEgg': None},
-        '295': {'name': 'exploud', 'isEgg': None},
-        '296': {'name': 'makuhita', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '297': {'name': 'hariyama', 'isEgg': None},
-        '298': {'name': 'azurill', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '299': {'name': 'nosepass', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '300': {'name': 'skitty', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '301': {'name': 'delcatty', 'isEgg': None},
-        '302': {'name': 'sableye', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '303': {'name': 'mawile', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '304': {'name': 'aron', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '305': {'name': 'lairon', 'isEgg': None},
-        '306': {'name': 'aggron', 'isEgg': None},
-        '307': {'name': 'meditite', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '308': {'name': 'medicham', 'isEgg': None},
-        '309': {'name': 'electrike', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '310': {'name': 'manectric', 'isEgg': None},
-        '311': {'name': 'plusle', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '312': {'name': 'minun', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '313': {'name': 'volbeat', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '314': {'name': 'illumise', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '315': {'name': 'roselia', 'isEgg': None},
-        '316': {'name': 'gulpin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '317': {'name': 'swalot', 'isEgg': None},
-        '318': {'name': 'carvanha', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '319': {'name': 'sharpedo', 'isEgg': None},
-        '320': {'name': 'wailmer', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '321': {'name': 'wailord', 'isEgg': None},
-        '322': {'name': 'numel', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '323': {'name': 'camerupt', 'isEgg': None},
-        '324': {'name': 'torkoal', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '325': {'name': 'spoink', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '326': {'name': 'grumpig', 'isEgg': None},
-        '327': {'name': 'spinda', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '328': {'name': 'trapinch', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '329': {'name': 'vibrava', 'isEgg': None},
-        '330': {'name': 'flygon', 'isEgg': None},
-        '331': {'name': 'cacnea', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '332': {'name': 'cacturne', 'isEgg': None},
-        '333': {'name': 'swablu', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '334': {'name': 'altaria', 'isEgg': None},
-        '335': {'name': 'zangoose', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '336': {'name': 'seviper', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '337': {'name': 'lunatone', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '338': {'name': 'solrock', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '339': {'name': 'barboach', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '340': {'name': 'whiscash', 'isEgg': None},
-        '341': {'name': 'corphish', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '342': {'name': 'crawdaunt', 'isEgg': None},
-        '343': {'name': 'baltoy', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '344': {'name': 'claydol', 'isEgg': None},
-        '345': {'name': 'lileep', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '346': {'name': 'cradily', 'isEgg': None},
-        '347': {'name': 'anorith', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '348': {'name': 'armaldo', 'isEgg': None},
-        '349': {'name': 'feebas', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '350': {'name': 'milotic', 'isEgg': None},
-        '351': {'name': 'castform', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '352': {'name': 'kecleon', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '353': {'name': 'shuppet', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '354': {'name': 'banette', 'isEgg': None},
-        '355': {'name': 'duskull', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '356': {'name': 'dusclops', 'isEgg': None},
-        '357': {'name': 'tropius', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '358': {'name': 'chimecho', 'isEgg': None},
-        '359': {'name': 'absol', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '360': {'name': 'wynaut', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '361': {'name': 'snorunt', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '362': {'name': 'glalie', 'isEgg': None},
-        '363': {'name': 'spheal', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '364': {'name': 'sealeo', 'isEgg': None},
-        '365': {'name': 'walrein', 'isEgg': None},
-        '366': {'name': 'clamperl', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '367': {'name': 'huntail', 'isEgg': None},
-        '368': {'name': 'gorebyss', 'isEgg': None},
-        '369': {'name': 'relicanth', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '370': {'name': 'luvdisc', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '371': {'name': 'bagon', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '372': {'name': 'shelgon', 'isEgg': None},
-        '373': {'name': 'salamence', 'isEgg': None},
-        '374': {'name': 'beldum', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '375': {'name': 'metang', 'isEgg': None},
-        '376': {'name': 'metagross', 'isEgg': None},
-        '377': {'name': 'regirock', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '378': {'name': 'regice', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '379': {'name': 'registeel', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '380': {'name': 'latias', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '381': {'name': 'latios', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '382': {'name': 'kyogre', 'isEgg': {'eggType': 4, 'chance': 2.86}},
-        '383': {'name': 'groudon', 'isEgg': {'eggType': 4, 'chance': 2.86}},
-        '384': {'name': 'rayquaza', 'isEgg': {'eggType': 4, 'chance': 2.86}},
-        '385': {'name': 'jirachi', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '386': {'name': 'deoxys', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '387': {'name': 'turtwig', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '388': {'name': 'grotle', 'isEgg': None},
-        '389': {'name': 'torterra', 'isEgg': None},
-        '390': {'name': 'chimchar', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '391': {'name': 'monferno', 'isEgg': None},
-        '392': {'name': 'infernape', 'isEgg': None},
-        '393': {'name': 'piplup', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '394': {'name': 'prinplup', 'isEgg': None},
-        '395': {'name': 'empoleon', 'isEgg': None},
-        '396': {'name': 'starly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '397': {'name': 'staravia', 'isEgg': None},
-        '398': {'name': 'staraptor', 'isEgg': None},
-        '399': {'name': 'bidoof', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '400': {'name': 'bibarel', 'isEgg': None},
-        '401': {'name': 'kricketot', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '402': {'name': 'kricketune', 'isEgg': None},
-        '403': {'name': 'shinx', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '404': {'name': 'luxio', 'isEgg': None},
-        '405': {'name': 'luxray', 'isEgg': None},
-        '406': {'name': 'budew', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '407': {'name': 'roserade', 'isEgg': None},
-        '408': {'name': 'cranidos', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '409': {'name': 'rampardos', 'isEgg': None},
-        '410': {'name': 'shieldon', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '411': {'name': 'bastiodon', 'isEgg': None},
-        '412': {'name': 'burmy', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '413': {'name': 'wormadam', 'isEgg': None},
-        '414': {'name': 'mothim', 'isEgg': None},
-        '415': {'name': 'combee', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '416': {'name': 'vespiquen', 'isEgg': None},
-        '417': {'name': 'pachirisu', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '418': {'name': 'buizel', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '419': {'name': 'floatzel', 'isEgg': None},
-        '420': {'name': 'cherubi', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '421': {'name': 'cherrim', 'isEgg': None},
-        '422': {'name': 'shellos', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '423': {'name': 'gastrodon', 'isEgg': None},
-        '424': {'name': 'ambipom', 'isEgg': None},
-        '425': {'name': 'drifloon', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '426': {'name': 'drifblim', 'isEgg': None},
-        '427': {'name': 'buneary', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '428': {'name': 'lopunny', 'isEgg': None},
-        '429': {'name': 'mismagius', 'isEgg': None},
-        '430': {'name': 'honchkrow', 'isEgg': None},
-        '431': {'name': 'glameow', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '432': {'name': 'purugly', 'isEgg': None},
-        '433': {'name': 'chingling', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '434': {'name': 'stunky', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '435': {'name': 'skuntank', 'isEgg': None},
-        '436': {'name': 'bronzor', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '437': {'name': 'bronzong', 'isEgg': None},
-        '438': {'name': 'bonsly', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '439': {'name': 'mime_jr', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '440': {'name': 'happiny', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '441': {'name': 'chatot', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '442': {'name': 'spiritomb', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '443': {'name': 'gible', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '444': {'name': 'gabite', 'isEgg': None},
-        '445': {'name': 'garchomp', 'isEgg': None},
-        '446': {'name': 'munchlax', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '447': {'name': 'riolu', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '448': {'name': 'lucario', 'isEgg': None},
-        '449': {'name': 'hippopotas', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '450': {'name': 'hippowdon', 'isEgg': None},
-        '451': {'name': 'skorupi', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '452': {'name': 'drapion', 'isEgg': None},
-        '453': {'name': 'croagunk', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '454': {'name': 'toxicroak', 'isEgg': None},
-        '455': {'name': 'carnivine', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '456': {'name': 'finneon', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '457': {'name': 'lumineon', 'isEgg': None},
-        '458': {'name': 'mantyke', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '459': {'name': 'snover', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '460': {'name': 'abomasnow', 'isEgg': None},
-        '461': {'name': 'weavile', 'isEgg': None},
-        '462': {'name': 'magnezone', 'isEgg': None},
-        '463': {'name': 'lickilicky', 'isEgg': None},
-        '464': {'name': 'rhyperior', 'isEgg': None},
-        '465': {'name': 'tangrowth', 'isEgg': None},
-        '466': {'name': 'electivire', 'isEgg': None},
-        '467': {'name': 'magmortar', 'isEgg': None},
-        '468': {'name': 'togekiss', 'isEgg': None},
-        '469': {'name': 'yanmega', 'isEgg': None},
-        '470': {'name': 'leafeon', 'isEgg': None},
-        '471': {'name': 'glaceon', 'isEgg': None},
-        '472': {'name': 'gliscor', 'isEgg': None},
-        '473': {'name': 'mamoswine', 'isEgg': None},
-        '474': {'name': 'porygon_z', 'isEgg': None},
-        '475': {'name': 'gallade', 'isEgg': None},
-        '476': {'name': 'probopass', 'isEgg': None},
-        '477': {'name': 'dusknoir', 'isEgg': None},
-        '478': {'name': 'froslass', 'isEgg': None},
-        '479': {'name': 'rotom', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '480': {'name': 'uxie', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '481': {'name': 'mesprit', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '482': {'name': 'azelf', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '483': {'name': 'dialga', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '484': {'name': 'palkia', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '485': {'name': 'heatran', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '486': {'name': 'regigigas', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '487': {'name': 'giratina', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '488': {'name': 'cresselia', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '489': {'name': 'phione', 'isEgg': {'eggType': 5, 'chance': 0.25}},
-        '490': {'name': 'manaphy', 'isEgg': {'eggType': 5, 'chance': 0.75}},
-        '491': {'name': 'darkrai', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '492': {'name': 'shaymin', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '493': {'name': 'arceus', 'isEgg': {'eggType': 4, 'chance': 2.86}},
-        '494': {'name': 'victini', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '495': {'name': 'snivy', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '496': {'name': 'servine', 'isEgg': None},
-        '497': {'name': 'serperior', 'isEgg': None},
-        '498': {'name': 'tepig', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '499': {'name': 'pignite', 'isEgg': None},
-        '500': {'name': 'emboar', 'isEgg': None},
-        '501': {'name': 'oshawott', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '502': {'name': 'dewott', 'isEgg': None},
-        '503': {'name': 'samurott', 'isEgg': None},
-        '504': {'name': 'patrat', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '505': {'name': 'watchog', 'isEgg': None},
-        '506': {'name': 'lillipup', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '507': {'name': 'herdier', 'isEgg': None},
-        '508': {'name': 'stoutland', 'isEgg': None},
-        '509': {'name': 'purrloin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '510': {'name': 'liepard', 'isEgg': None},
-        '511': {'name': 'pansage', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '512': {'name': 'simisage', 'isEgg': None},
-        '513': {'name': 'pansear', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '514': {'name': 'simisear', 'isEgg': None},
-        '515': {'name': 'panpour', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '516': {'name': 'simipour', 'isEgg': None},
-        '517': {'name': 'munna', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '518': {'name': 'musharna', 'isEgg': None},
-        '519': {'name': 'pidove', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '520': {'name': 'tranquill', 'isEgg': None},
-        '521': {'name': 'unfezant', 'isEgg': None},
-        '522': {'name': 'blitzle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '523': {'name': 'zebstrika', 'isEgg': None},
-        '524': {'name': 'roggenrola', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '525': {'name': 'boldore', 'isEgg': None},
-        '526': {'name': 'gigalith', 'isEgg': None},
-        '527': {'name': 'woobat', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '528': {'name': 'swoobat', 'isEgg': None},
-        '529': {'name': 'drilbur', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '530': {'name': 'excadrill', 'isEgg': None},
-        '531': {'name': 'audino', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '532': {'name': 'timburr', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '533': {'name': 'gurdurr', 'isEgg': None},
-        '534': {'name': 'conkeldurr', 'isEgg': None},
-        '535': {'name': 'tympole', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '536': {'name': 'palpitoad', 'isEgg': None},
-        '537': {'name': 'seismitoad', 'isEgg': None},
-        '538': {'name': 'throh', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '539': {'name': 'sawk', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '540': {'name': 'sewaddle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '541': {'name': 'swadloon', 'isEgg': None},
-        '542': {'name': 'leavanny', 'isEgg': None},
-        '543': {'name': 'venipede', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '544': {'name': 'whirlipede', 'isEgg': None},
-        '545': {'name': 'scolipede', 'isEgg': None},
-        '546': {'name': 'cottonee', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '547': {'name': 'whimsicott', 'isEgg': None},
-        '548': {'name': 'petilil', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '549': {'name': 'lilligant', 'isEgg': None},
-        '550': {'name': 'basculin', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '551': {'name': 'sandile', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '552': {'name': 'krokorok', 'isEgg': None},
-        '553': {'name': 'krookodile', 'isEgg': None},
-        '554': {'name': 'darumaka', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '555': {'name': 'darmanitan', 'isEgg': None},
-        '556': {'name': 'maractus', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '557': {'name': 'dwebble', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '558': {'name': 'crustle', 'isEgg': None},
-        '559': {'name': 'scraggy', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '560': {'name': 'scrafty', 'isEgg': None},
-        '561': {'name': 'sigilyph', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '562': {'name': 'yamask', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '563': {'name': 'cofagrigus', 'isEgg': None},
-        '564': {'name': 'tirtouga', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '565': {'name': 'carracosta', 'isEgg': None},
-        '566': {'name': 'archen', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '567': {'name': 'archeops', 'isEgg': None},
-        '568': {'name': 'trubbish', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '569': {'name': 'garbodor', 'isEgg': None},
-        '570': {'name': 'zorua', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '571': {'name': 'zoroark', 'isEgg': None},
-        '572': {'name': 'minccino', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '573': {'name': 'cinccino', 'isEgg': None},
-        '574': {'name': 'gothita', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '575': {'name': 'gothorita', 'isEgg': None},
-        '576': {'name': 'gothitelle', 'isEgg': None},
-        '577': {'name': 'solosis', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '578': {'name': 'duosion', 'isEgg': None},
-        '579': {'name': 'reuniclus', 'isEgg': None},
-        '580': {'name': 'ducklett', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '581': {'name': 'swanna', 'isEgg': None},
-        '582': {'name': 'vanillite', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '583': {'name': 'vanillish', 'isEgg': None},
-        '584': {'name': 'vanilluxe', 'isEgg': None},
-        '585': {'name': 'deerling', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '586': {'name': 'sawsbuck', 'isEgg': None},
-        '587': {'name': 'emolga', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '588': {'name': 'karrablast', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '589': {'name': 'escavalier', 'isEgg': None},
-        '590': {'name': 'foongus', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '591': {'name': 'amoonguss', 'isEgg': None},
-        '592': {'name': 'frillish', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '593': {'name': 'jellicent', 'isEgg': None},
-        '594': {'name': 'alomomola', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '595': {'name': 'joltik', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '596': {'name': 'galvantula', 'isEgg': None},
-        '597': {'name': 'ferroseed', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '598': {'name': 'ferrothorn', 'isEgg': None},
-        '599': {'name': 'klink', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '600': {'name': 'klang', 'isEgg': None},
-        '601': {'name': 'klinklang', 'isEgg': None},
-        '602': {'name': 'tynamo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '603': {'name': 'eelektrik', 'isEgg': None},
-        '604': {'name': 'eelektross', 'isEgg': None},
-        '605': {'name': 'elgyem', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '606': {'name': 'beheeyem', 'isEgg': None},
-        '607': {'name': 'litwick', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '608': {'name': 'lampent', 'isEgg': None},
-        '609': {'name': 'chandelure', 'isEgg': None},
-        '610': {'name': 'axew', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '611': {'name': 'fraxure', 'isEgg': None},
-        '612': {'name': 'haxorus', 'isEgg': None},
-        '613': {'name': 'cubchoo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '614': {'name': 'beartic', 'isEgg': None},
-        '615': {'name': 'cryogonal', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '616': {'name': 'shelmet', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '617': {'name': 'accelgor', 'isEgg': None},
-        '618': {'name': 'stunfisk', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '619': {'name': 'mienfoo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '620': {'name': 'mienshao', 'isEgg': None},
-        '621': {'name': 'druddigon', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '622': {'name': 'golett', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '623': {'name': 'golurk', 'isEgg': None},
-        '624': {'name': 'pawniard', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '625': {'name': 'bisharp', 'isEgg': None},
-        '626': {'name': 'bouffalant', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '627': {'name': 'rufflet', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '628': {'name': 'braviary', 'isEgg': None},
-        '629': {'name': 'vullaby', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '630': {'name': 'mandibuzz', 'isEgg': None},
-        '631': {'name': 'heatmor', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '632': {'name': 'durant', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '633': {'name': 'deino', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '634': {'name': 'zweilous', 'isEgg': None},
-        '635': {'name': 'hydreigon', 'isEgg': None},
-        '636': {'name': 'larvesta', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '637': {'name': 'volcarona', 'isEgg': None},
-        '638': {'name': 'cobalion', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '639': {'name': 'terrakion', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '640': {'name': 'virizion', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '641': {'name': 'tornadus', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '642': {'name': 'thundurus', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '643': {'name': 'reshiram', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '644': {'name': 'zekrom', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '645': {'name': 'landorus', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '646': {'name': 'kyurem', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '647': {'name': 'keldeo', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '648': {'name': 'meloetta', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '649': {'name': 'genesect', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '650': {'name': 'chespin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '651': {'name': 'quilladin', 'isEgg': None},
-        '652': {'name': 'chesnaught', 'isEgg': None},
-        '653': {'name': 'fennekin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '654': {'name': 'braixen', 'isEgg': None},
-        '655': {'name': 'delphox', 'isEgg': None},
-        '656': {'name': 'froakie', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '657': {'name': 'frogadier', 'isEgg': None},
-        '658': {'name': 'greninja', 'isEgg': None},
-        '659': {'name': 'bunnelby', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '660': {'name': 'diggersby', 'isEgg': None},
-        '661': {'name': 'fletchling', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '662': {'name': 'fletchinder', 'isEgg': None},
-        '663': {'name': 'talonflame', 'isEgg': None},
-        '664': {'name': 'scatterbug', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '665': {'name': 'spewpa', 'isEgg': None},
-        '666': {'name': 'vivillon', 'isEgg': None},
-        '667': {'name': 'litleo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '668': {'name': 'pyroar', 'isEgg': None},
-        '669': {'name': 'flabebe', 'isEgg': None},
-        '670': {'name': 'floette', 'isEgg': None},
-        '671': {'name': 'florges', 'isEgg': None},
-        '672': {'name': 'skiddo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '673': {'name': 'gogoat', 'isEgg': None},
-        '674': {'name': 'pancham', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '675': {'name': 'pangoro', 'isEgg': None},
-        '676': {'name': 'furfrou', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '677': {'name': 'espurr', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '678': {'name': 'meowstic', 'isEgg': None},
-        '679': {'name': 'honedge', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '680': {'name': 'doublade', 'isEgg': None},
-        '681': {'name': 'aegislash', 'isEgg': None},
-        '682': {'name': 'spritzee', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '683': {'name': 'aromatisse', 'isEgg': None},
-        '684': {'name': 'swirlix', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '685': {'name': 'slurpuff', 'isEgg': None},
-        '686': {'name': 'inkay', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '687': {'name': 'malamar', 'isEgg': None},
-        '688': {'name': 'binacle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '689': {'name': 'barbaracle', 'isEgg': None},
-        '690': {'name': 'skrelp', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '691': {'name': 'dragalge', 'isEgg': None},
-        '692': {'name': 'clauncher', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '693': {'name': 'clawitzer', 'isEgg': None},
-        '694': {'name': 'helioptile', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '695': {'name': 'heliolisk', 'isEgg': None},
-        '696': {'name': 'tyrunt', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '697': {'name': 'tyrantrum', 'isEgg': None},
-        '698': {'name': 'amaura', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '699': {'name': 'aurorus', 'isEgg': None},
-        '700': {'name': 'sylveon', 'isEgg': None},
-        '701': {'name': 'hawlucha', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '702': {'name': 'dedenne', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '703': {'name': 'carbink', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '704': {'name': 'goomy', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '705': {'name': 'sliggoo', 'isEgg': None},
-        '706': {'name': 'goodra', 'isEgg': None},
-        '707': {'name': 'klefki', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '708': {'name': 'phantump', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '709': {'name': 'trevenant', 'isEgg': None},
-        '710': {'name': 'pumpkaboo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '711': {'name': 'gourgeist', 'isEgg': None},
-        '712': {'name': 'bergmite', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '713': {'name': 'avalugg', 'isEgg': None},
-        '714': {'name': 'noibat', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '715': {'name': 'noivern', 'isEgg': None},
-        '716': {'name': 'xerneas', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '717': {'name': 'yveltal', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '718': {'name': 'zygarde', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '719': {'name': 'diancie', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '720': {'name': 'hoopa', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '721': {'name': 'volcanion', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '722': {'name': 'rowlet', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '723': {'name': 'dartrix', 'isEgg': None},
-        '724': {'name': 'decidueye', 'isEgg': None},
-        '725': {'name': 'litten', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '726': {'name': 'torracat', 'isEgg': None},
-        '727': {'name': 'incineroar', 'isEgg': None},
-        '728': {'name': 'popplio', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '729': {'name': 'brionne', 'isEgg': None},
-        '730': {'name': 'primarina', 'isEgg': None},
-        '731': {'name': 'pikipek', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '732': {'name': 'trumbeak', 'isEgg': None},
-        '733': {'name': 'toucannon', 'isEgg': None},
-        '734': {'name': 'yungoos', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '735': {'name': 'gumshoos', 'isEgg': None},
-        '736': {'name': 'grubbin', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '737': {'name': 'charjabug', 'isEgg': None},
-        '738': {'name': 'vikavolt', 'isEgg': None},
-        '739': {'name': 'crabrawler', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '740': {'name': 'crabominable', 'isEgg': None},
-        '741': {'name': 'oricorio', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '742': {'name': 'cutiefly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '743': {'name': 'ribombee', 'isEgg': None},
-        '744': {'name': 'rockruff', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '745': {'name': 'lycanroc', 'isEgg': None},
-        '746': {'name': 'wishiwashi', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '747': {'name': 'mareanie', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '748': {'name': 'toxapex', 'isEgg': None},
-        '749': {'name': 'mudbray', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '750': {'name': 'mudsdale', 'isEgg': None},
-        '751': {'name': 'dewpider', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '752': {'name': 'araquanid', 'isEgg': None},
-        '753': {'name': 'fomantis', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '754': {'name': 'lurantis', 'isEgg': None},
-        '755': {'name': 'morelull', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '756': {'name': 'shiinotic', 'isEgg': None},
-        '757': {'name': 'salandit', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '758': {'name': 'salazzle', 'isEgg': None},
-        '759': {'name': 'stufful', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '760': {'name': 'bewear', 'isEgg': None},
-        '761': {'name': 'bounsweet', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '762': {'name': 'steenee', 'isEgg': None},
-        '763': {'name': 'tsareena', 'isEgg': None},
-        '764': {'name': 'comfey', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '765': {'name': 'oranguru', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '766': {'name': 'passimian', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '767': {'name': 'wimpod', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '768': {'name': 'golisopod', 'isEgg': None},
-        '769': {'name': 'sandygast', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '770': {'name': 'palossand', 'isEgg': None},
-        '771': {'name': 'pyukumuku', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '772': {'name': 'type_null', 'isEgg': None},
-        '773': {'name': 'silvally', 'isEgg': None},
-        '774': {'name': 'minior', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '775': {'name': 'komala', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '776': {'name': 'turtonator', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '777': {'name': 'togedemaru', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '778': {'name': 'mimikyu', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '779': {'name': 'bruxish', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '780': {'name': 'drampa', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '781': {'name': 'dhelmise', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '782': {'name': 'jangmo_o', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '783': {'name': 'hakamo_o', 'isEgg': None},
-        '784': {'name': 'kommo_o', 'isEgg': None},
-        '785': {'name': 'tapu_koko', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '786': {'name': 'tapu_lele', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '787': {'name': 'tapu_bulu', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '788': {'name': 'tapu_fini', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '789': {'name': 'cosmog', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '790': {'name': 'cosmoem', 'isEgg': None},
-        '791': {'name': 'solgaleo', 'isEgg': None},
-        '792': {'name': 'lunala', 'isEgg': None},
-        '793': {'name': 'nihilego', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '794': {'name': 'buzzwole', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '795': {'name': 'pheromosa', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '796': {'name': 'xurkitree', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '797': {'name': 'celesteela', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '798': {'name': 'kartana', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '799': {'name': 'guzzlord', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '800': {'name': 'necrozma', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '801': {'name': 'magearna', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '802': {'name': 'marshadow', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '803': {'name': 'poipole', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '804': {'name': 'naganadel', 'isEgg': None},
-        '805': {'name': 'stakataka', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '806': {'name': 'blacephalon', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '807': {'name': 'zeraora', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '808': {'name': 'meltan', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '809': {'name': 'melmetal', 'isEgg': None},
-        '810': {'name': 'grookey', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '811': {'name': 'thwackey', 'isEgg': None},
-        '812': {'name': 'rillaboom', 'isEgg': None},
-        '813': {'name': 'scorbunny', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '814': {'name': 'raboot', 'isEgg': None},
-        '815': {'name': 'cinderace', 'isEgg': None},
-        '816': {'name': 'sobble', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '817': {'name': 'drizzile', 'isEgg': None},
-        '818': {'name': 'inteleon', 'isEgg': None},
-        '819': {'name': 'skwovet', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '820': {'name': 'greedent', 'isEgg': None},
-        '821': {'name': 'rookidee', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '822': {'name': 'corvisquire', 'isEgg': None},
-        '823': {'name': 'corviknight', 'isEgg': None},
-        '824': {'name': 'blipbug', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '825': {'name': 'dottler', 'isEgg': None},
-        '826': {'name': 'orbeetle', 'isEgg': None},
-        '827': {'name': 'nickit', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '828': {'name': 'thievul', 'isEgg': None},
-        '829': {'name': 'gossifleur', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '830': {'name': 'eldegoss', 'isEgg': None},
-        '831': {'name': 'wooloo', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '832': {'name': 'dubwool', 'isEgg': None},
-        '833': {'name': 'chewtle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '834': {'name': 'drednaw', 'isEgg': None},
-        '835': {'name': 'yamper', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '836': {'name': 'boltund', 'isEgg': None},
-        '837': {'name': 'rolycoly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '838': {'name': 'carkol', 'isEgg': None},
-        '839': {'name': 'coalossal', 'isEgg': None},
-        '840': {'name': 'applin', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '841': {'name': 'flapple', 'isEgg': None},
-        '842': {'name': 'appletun', 'isEgg': None},
-        '843': {'name': 'silicobra', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '844': {'name': 'sandaconda', 'isEgg': None},
-        '845': {'name': 'cramorant', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '846': {'name': 'arrokuda', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '847': {'name': 'barraskewda', 'isEgg': None},
-        '848': {'name': 'toxel', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '849': {'name': 'toxtricity', 'isEgg': None},
-        '850': {'name': 'sizzlipede', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '851': {'name': 'centiskorch', 'isEgg': None},
-        '852': {'name': 'clobbopus', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '853': {'name': 'grapploct', 'isEgg': None},
-        '854': {'name': 'sinistea', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '855': {'name': 'polteageist', 'isEgg': None},
-        '856': {'name': 'hatenna', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '857': {'name': 'hattrem', 'isEgg': None},
-        '858': {'name': 'hatterene', 'isEgg': None},
-        '859': {'name': 'impidimp', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '860': {'name': 'morgrem', 'isEgg': None},
-        '861': {'name': 'grimmsnarl', 'isEgg': None},
-        '862': {'name': 'obstagoon', 'isEgg': None},
-        '863': {'name': 'perrserker', 'isEgg': None},
-        '864': {'name': 'cursola', 'isEgg': None},
-        '865': {'name': 'sirfetchd', 'isEgg': None},
-        '866': {'name': 'mr_rime', 'isEgg': None},
-        '867': {'name': 'runerigus', 'isEgg': None},
-        '868': {'name': 'milcery', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '869': {'name': 'alcremie', 'isEgg': None},
-        '870': {'name': 'falinks', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '871': {'name': 'pincurchin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '872': {'name': 'snom', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '873': {'name': 'frosmoth', 'isEgg': None},
-        '874': {'name': 'stonjourner', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '875': {'name': 'eiscue', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '876': {'name': 'indeedee', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '877': {'name': 'morpeko', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '878': {'name': 'cufant', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '879': {'name': 'copperajah', 'isEgg': None},
-        '880': {'name': 'dracozolt', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '881': {'name': 'arctozolt', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '882': {'name': 'dracovish', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '883': {'name': 'arctovish', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '884': {'name': 'duraludon', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '885': {'name': 'dreepy', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '886': {'name': 'drakloak', 'isEgg': None},
-        '887': {'name': 'dragapult', 'isEgg': None},
-        '888': {'name': 'zacian', 'isEgg': {'eggType': 4, 'chance': 2.86}},
-        '889': {'name': 'zamazenta', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '890': {'name': 'eternatus', 'isEgg': None},
-        '891': {'name': 'kubfu', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '892': {'name': 'urshifu', 'isEgg': None},
-        '893': {'name': 'zarude', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '894': {'name': 'regieleki', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '895': {'name': 'regidrago', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '896': {'name': 'glastrier', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '897': {'name': 'spectrier', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '898': {'name': 'calyrex', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '899': {'name': 'wyrdeer', 'isEgg': None},
-        '900': {'name': 'kleavor', 'isEgg': None},
-        '901': {'name': 'ursaluna', 'isEgg': None},
-        '902': {'name': 'basculegion', 'isEgg': None},
-        '903': {'name': 'sneasler', 'isEgg': None},
-        '904': {'name': 'overqwil', 'isEgg': None},
-        '905': {'name': 'enamorus', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '906': {'name': 'sprigatito', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '907': {'name': 'floragato', 'isEgg': None},
-        '908': {'name': 'meowscarada', 'isEgg': None},
-        '909': {'name': 'fuecoco', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '910': {'name': 'crocalor', 'isEgg': None},
-        '911': {'name': 'skeledirge', 'isEgg': None},
-        '912': {'name': 'quaxly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '913': {'name': 'quaxwell', 'isEgg': None},
-        '914': {'name': 'quaquaval', 'isEgg': None},
-        '915': {'name': 'lechonk', 'isEgg': {'eggType': 1, 'chance': 0.46}},
-        '916': {'name': 'oinkologne', 'isEgg': None},
-        '917': {'name': 'tarountula', 'isEgg': {'eggType': 1, 'chance': 0.62}},
-        '918': {'name': 'spidops', 'isEgg': None},
-        '919': {'name': 'nymble', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '920': {'name': 'lokix', 'isEgg': None},
-        '921': {'name': 'pawmi', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '922': {'name': 'pawmo', 'isEgg': None},
-        '923': {'name': 'pawmot', 'isEgg': None},
-        '924': {'name': 'tandemaus', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '925': {'name': 'maushold', 'isEgg': None},
-        '926': {'name': 'fidough', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '927': {'name': 'dachsbun', 'isEgg': None},
-        '928': {'name': 'smoliv', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '929': {'name': 'dolliv', 'isEgg': None},
-        '930': {'name': 'arboliva', 'isEgg': None},
-        '931': {'name': 'squawkabilly', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '932': {'name': 'nacli', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '933': {'name': 'naclstack', 'isEgg': None},
-        '934': {'name': 'garganacl', 'isEgg': None},
-        '935': {'name': 'charcadet', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '936': {'name': 'armarouge', 'isEgg': None},
-        '937': {'name': 'ceruledge', 'isEgg': None},
-        '938': {'name': 'tadbulb', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '939': {'name': 'bellibolt', 'isEgg': None},
-        '940': {'name': 'wattrel', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '941': {'name': 'kilowattrel', 'isEgg': None},
-        '942': {'name': 'maschiff', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '943': {'name': 'mabosstiff', 'isEgg': None},
-        '944': {'name': 'shroodle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '945': {'name': 'grafaiai', 'isEgg': None},
-        '946': {'name': 'bramblin', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '947': {'name': 'brambleghast', 'isEgg': None},
-        '948': {'name': 'toedscool', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '949': {'name': 'toedscruel', 'isEgg': None},
-        '950': {'name': 'klawf', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '951': {'name': 'capsakid', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '952': {'name': 'scovillain', 'isEgg': None},
-        '953': {'name': 'rellor', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '954': {'name': 'rabsca', 'isEgg': None},
-        '955': {'name': 'flittle', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '956': {'name': 'espathra', 'isEgg': None},
-        '957': {'name': 'tinkatink', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '958': {'name': 'tinkatuff', 'isEgg': None},
-        '959': {'name': 'tinkaton', 'isEgg': None},
-        '960': {'name': 'wiglett', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '961': {'name': 'wugtrio', 'isEgg': None},
-        '962': {'name': 'bombirdier', 'isEgg': {'eggType': 1, 'chance': 0.31}},
-        '963': {'name': 'finizen', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '964': {'name': 'palafin', 'isEgg': None},
-        '965': {'name': 'varoom', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '966': {'name': 'revavroom', 'isEgg': None},
-        '967': {'name': 'cyclizar', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '968': {'name': 'orthworm', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '969': {'name': 'glimmet', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '970': {'name': 'glimmora', 'isEgg': None},
-        '971': {'name': 'greavard', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '972': {'name': 'houndstone', 'isEgg': None},
-        '973': {'name': 'flamigo', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '974': {'name': 'cetoddle', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '975': {'name': 'cetitan', 'isEgg': None},
-        '976': {'name': 'veluza', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '977': {'name': 'dondozo', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '978': {'name': 'tatsugiri', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '979': {'name': 'annihilape', 'isEgg': None},
-        '980': {'name': 'clodsire', 'isEgg': None},
-        '981': {'name': 'farigiraf', 'isEgg': None},
-        '982': {'name': 'dudunsparce', 'isEgg': None},
-        '983': {'name': 'kingambit', 'isEgg': None},
-        '984': {'name': 'great_tusk', 'isEgg': None},
-        '985': {'name': 'scream_tail', 'isEgg': None},
-        '986': {'name': 'brute_bonnet', 'isEgg': None},
-        '987': {'name': 'flutter_mane', 'isEgg': None},
-        '988': {'name': 'slither_wing', 'isEgg': None},
-        '989': {'name': 'sandy_shocks', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '990': {'name': 'iron_treads', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '991': {'name': 'iron_bundle', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '992': {'name': 'iron_hands', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '993': {'name': 'iron_jugulis', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '994': {'name': 'iron_moth', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '995': {'name': 'iron_thorns', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '996': {'name': 'frigibax', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '997': {'name': 'arctibax', 'isEgg': None},
-        '998': {'name': 'baxcalibur', 'isEgg': None},
-        '999': {'name': 'gimmighoul', 'isEgg': {'eggType': 2, 'chance': 0.45}},
-        '1000': {'name': 'gholdengo', 'isEgg': None},
-        '1001': {'name': 'wo_chien', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '1002': {'name': 'chien_pao', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '1003': {'name': 'ting_lu', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '1004': {'name': 'chi_yu', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '1005': {'name': 'roaring_moon', 'isEgg': None},
-        '1006': {'name': 'iron_valiant', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '1007': {'name': 'koraidon', 'isEgg': {'eggType': 4, 'chance': 2.86}},
-        '1008': {'name': 'miraidon', 'isEgg': {'eggType': 4, 'chance': 2.86}},
-        '1009': {'name': 'walking_wake', 'isEgg': None},
-        '1010': {'name': 'iron_leaves', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '1011': {'name': 'dipplin', 'isEgg': None},
-        '1012': {'name': 'poltchageist', 'isEgg': {'eggType': 2, 'chance': 0.8}},
-        '1013': {'name': 'sinistcha', 'isEgg': None},
-        '1014': {'name': 'okidogi', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '1015': {'name': 'munkidori', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '1016': {'name': 'fezandipiti', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '1017': {'name': 'ogerpon', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '1018': {'name': 'archaludon', 'isEgg': None},
-        '1019': {'name': 'hydrapple', 'isEgg': None},
-        '1020': {'name': 'gouging_fire', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '1021': {'name': 'raging_bolt', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '1022': {'name': 'iron_boulder', 'isEgg': {'eggType': 3, 'chance': 0.69}},
-        '1023': {'name': 'iron_crown', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '1024': {'name': 'terapagos', 'isEgg': {'eggType': 4, 'chance': 5.0}},
-        '1025': {'name': 'pecharunt', 'isEgg': {'eggType': 3, 'chance': 1.2}},
-        '2019': {'name': 'alola_rattata', 'isEgg': {'eggType': 1, 'chance': 0.23}},
-        '2020': {'name': 'alola_raticate', 'isEgg': None},
-        '2026': {'name': 'alola_raichu', 'isEgg': None},
-        '2027': {'name': 'alola_sandshrew', 'isEgg': None},
-        '2028': {'name': 'alola_sandslash', 'isEgg': None},
-        '2037': {'name': 'alola_vulpix', 'isEgg': None},
-        '2038': {'name': 'alola_ninetales', 'isEgg': None},
-        '2050': {'name': 'alola_diglett', 'isEgg': {'eggType': 1, 'chance': 0.15}},
-        '2051': {'name': 'alola_dugtrio', 'isEgg': None},
-        '2052': {'name': 'alola_meowth', 'isEgg': None},
-        '2053': {'name': 'alola_persian', 'isEgg': None},
-        '2074': {'name': 'alola_geodude', 'isEgg': {'eggType': 1, 'chance': 0.15}},
-        '2075': {'name': 'alola_graveler', 'isEgg': None},
-        '2076': {'name': 'alola_golem', 'isEgg': None},
-        '2088': {'name': 'alola_grimer', 'isEgg': {'eggType': 1, 'chance': 0.15}},
-        '2089': {'name': 'alola_muk', 'isEgg': None},
-        '2103': {'name': 'alola_exeggutor', 'isEgg': None},
-        '2105': {'name': 'alola_marowak', 'isEgg': None},
-        '2670': {'name': 'eternal_floette', 'isEgg': None},
-        '4052': {'name': 'galar_meowth', 'isEgg': {'eggType': 2, 'chance': 0.4}},
-        '4077': {'name': 'galar_ponyta', 'isEgg': {'eggType': 2, 'chance': 0.4}},
-        '4078': {'name': 'galar_rapidash', 'isEgg': None},
-        '4079': {'name': 'galar_slowpoke', 'isEgg': {'eggType': 1, 'chance': 0.15}},
-        '4080': {'name': 'galar_slowbro', 'isEgg': None},
-        '4083': {'name': 'galar_farfetchd', 'isEgg': {'eggType': 2, 'chance': 0.23}},
-        '4110': {'name': 'galar_weezing', 'isEgg': None},
-        '4122': {'name': 'galar_mr_mime', 'isEgg': None},
-        '4144': {'name': 'galar_articuno', 'isEgg': {'eggType': 3, 'chance': 0.6}},
-        '4145': {'name': 'galar_zapdos', 'isEgg': {'eggType': 3, 'chance': 0.6}},
-        '4146': {'name': 'galar_moltres', 'isEgg': {'eggType': 3, 'chance': 0.6}},
-        '4199': {'name': 'galar_slowking', 'isEgg': None},
-        '4222': {'name': 'galar_corsola', 'isEgg': {'eggType': 2, 'chance': 0.4}},
-        '4263': {'name': 'galar_zigzagoon', 'isEgg': {'eggType': 1, 'chance': 0.15}},
-        '4264': {'name': 'galar_linoone', 'isEgg': None},
-        '4554': {'name': 'galar_darumaka', 'isEgg': {'eggType': 2, 'chance': 0.4}},
-        '4555': {'name': 'galar_darmanitan', 'isEgg': None},
-        '4562': {'name': 'galar_yamask', 'isEgg': {'eggType': 1, 'chance': 0.15}},
-        '4618': {'name': 'galar_stunfisk', 'isEgg': {'eggType': 2, 'chance': 0.4}},
-        '6058': {'name': 'hisui_growlithe', 'isEgg': {'eggType': 2, 'chance': 0.1}},
-        '6059': {'name': 'hisui_arcanine', 'isEgg': None},
-        '6100': {'name': 'hisui_voltorb', 'isEgg': {'eggType': 1, 'chance': 0.04}},
-        '6101': {'name': 'hisui_electrode', 'isEgg': None},
-        '6157': {'name': 'hisui_typhlosion', 'isEgg': None},
-        '6211': {'name': 'hisui_qwilfish', 'isEgg': {'eggType': 2, 'chance': 0.1}},
-        '6215': {'name': 'hisui_sneasel', 'isEgg': {'eggType': 2, 'chance': 0.1}},
-        '6503': {'name': 'hisui_samurott', 'isEgg': None},
-        '6549': {'name': 'hisui_lilligant', 'isEgg': None},
-        '6570': {'name': 'hisui_zorua', 'isEgg': {'eggType': 2, 'chance': 0.1}},
-        '6571': {'name': 'hisui_zoroark', 'isEgg': None},
-        '6628': {'name': 'hisui_braviary', 'isEgg': None},
-        '6705': {'name': 'hisui_sliggoo', 'isEgg': None},
-        '6706': {'name': 'hisui_goodra', 'isEgg': None},
-        '6713': {'name': 'hisui_avalugg', 'isEgg': None},
-        '6724': {'name': 'hisui_decidueye', 'isEgg': None},
-        '8128': {'name': 'paldea_tauros', 'isEgg': {'eggType': 2, 'chance': 0.23}},
-        '8194': {'name': 'paldea_wooper', 'isEgg': {'eggType': 1, 'chance': 0.15}},
-        '8901': {'name': 'bloodmoon_ursaluna', 'isEgg': {'eggType': 3, 'chance': 0.34}}
-    }
+from utilities import catalogs
+# Lazily loaded catalog modules, only imported when a catalog actually needs to be regenerated.
+from utilities.catalogStore import CatalogStore
+# Compiles the generated catalogs into the shared catalog database.
+from utilities.atomicWriter import fh_writeJSONAtomic
+# Replaces the generated catalogs and the manifest atomically.
+from utilities.jsonBackend import fh_dumps, fh_load, fh_loads
+# Serializes the catalogs with the fastest installed JSON library, byte identical to json.dumps.
+from modules.config import dataDirectory, catalogManifestFile
+
+def __getattr__(name: str) -> object:
+    # Keep `from utilities.generator import MovesEnum` working without importing every catalog.
+    if name in catalogs.catalogModules:
+        return getattr(catalogs, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 class Generator:
@@ -4235,24 +70,37 @@ class Generator:
             self.natureNames. If not provided, all names from the Nature enum will be used.
 
         Attributes:
-            natureNames (List[str]): List of nature names.
-            natureIDs (List[int]): List of nature IDs generated from the names.
+            natureNames (List[str]): List of nature names, read from the Nature enum on first use.
+            natureIDs (List[int]): List of nature IDs generated from the names on first use.
             maxId (int): Maximum value in the list of nature IDs.
 
         Example:
             generator = Generator(['Hardy', 'Brave', 'Adamant'])
         """
-        if natureNames is not None:
-            self.natureNames: List[str] = natureNames
-        else:
-            self.natureNames: List[str] = [nature.name for nature in Nature]  # Include all natures
-        self.natureIDs: List[int] = [2 ** i for i in range(1, len(self.natureNames) + 1)]
-
-        # Reduce the last ID by 2
-        if len(self.natureIDs) > 0:
-            self.natureIDs[-1] -= 2
-
-        self.maxId: int = max(self.natureIDs)  # Calculate max ID
+        # Walking catalogs.Nature imports the natures catalog, only done when natures.json is generated.
+        self.__customNatureNames: Optional[List[str]] = natureNames
+        self.__natureNames: Optional[List[str]] = natureNames
+        self.__natureIDs: Optional[List[int]] = None
+
+    @property
+    def natureNames(self) -> List[str]:
+        if self.__natureNames is None:
+            self.__natureNames = [nature.name for nature in catalogs.Nature]  # Include all natures
+        return self.__natureNames
+
+    @property
+    def natureIDs(self) -> List[int]:
+        if self.__natureIDs is None:
+            natureIDs = [2 ** i for i in range(1, len(self.natureNames) + 1)]
+            # Reduce the last ID by 2
+            if len(natureIDs) > 0:
+                natureIDs[-1] -= 2
+            self.__natureIDs = natureIDs
+        return self.__natureIDs
+
+    @property
+    def maxId(self) -> int:
+        return max(self.natureIDs)  # Calculate max ID
 
     def __writeJSON(self, filePath: str, jsonData: str) -> None:
         """
@@ -4268,19 +116,18 @@ class Generator:
 
         Modules:
             - os: Provides a way to interact with the operating system, particularly for file and directory operations.
-            - json: Provides functions for parsing and writing JSON data.
+            - utilities.jsonBackend: Provides functions for parsing and writing JSON data.
         """
         existingFile = os.path.exists(filePath)
         
         # Load existing data if the file exists
         if existingFile:
-            with open(filePath, 'r') as file:
-                existingData = json.load(file)
+            existingData = fh_load(filePath)
         else:
             existingData = {}
 
         # Load new data from the provided jsonData string
-        newData = json.loads(jsonData)
+        newData = fh_loads(jsonData)
 
         # Merge the existing data with the new data
         mergedData = {**existingData, **newData}
@@ -4288,8 +135,7 @@ class Generator:
         # Check if there are any changes to be made
         if existingData != mergedData:
             # Write the merged data back to the file
-            with open(filePath, 'w') as file:
-                json.dump(mergedData, file, indent=4)
+            fh_writeJSONAtomic(filePath, mergedData)
 
             # Print success message
             if existingFile:
@@ -4309,7 +155,7 @@ class Generator:
             json_data = generator.__natureToJSON()
         """
         natureDict = {name: id for name, id in zip(self.natureNames, self.natureIDs)}
-        return json.dumps({'natures': natureDict}, indent=4)
+        return fh_dumps({'natures': natureDict}, indent=4)
     
     def __noPassiveToJSON(self) -> str:
         """
@@ -4322,7 +168,7 @@ class Generator:
             generator = Generator()
             json_data = generator.__noPassiveToJSON()
         """
-        return json.dumps({'noPassive': NoPassive.NO_PASSIVE_DICT.value}, indent=4)
+        return fh_dumps({'noPassive': catalogs.NoPassive.NO_PASSIVE_DICT.value}, indent=4)
     
     def __biomesToJSON(self) -> str:
         """
@@ -4335,7 +181,7 @@ class Generator:
             generator = Generator()
             json_data = generator.__biomesToJSON()
         """
-        return json.dumps({'biomes': Biome.BIOMES_DICT.value}, indent=4)
+        return fh_dumps({'biomes': catalogs.Biome.BIOMES_DICT.value}, indent=4)
     
     def __vouchersToJSON(self) -> str:
         """
@@ -4348,7 +194,7 @@ class Generator:
             generator = Generator()
             json_data = generator.__vouchersToJSON()
         """
-        return json.dumps({'vouchers': Vouchers.VOUCHERS_DICT.value}, indent=4)
+        return fh_dumps({'vouchers': catalogs.Vouchers.VOUCHERS_DICT.value}, indent=4)
     
     def __natureSlotToJSON(self) -> str:
         """
@@ -4361,7 +207,7 @@ class Generator:
             generator = Generator()
             json_data = generator.__natureSlotToJSON()
         """
-        return json.dumps({'natureSlot': NatureSlot.NATURE_SLOT.value}, indent=4)
+        return fh_dumps({'natureSlot': catalogs.NatureSlot.NATURE_SLOT.value}, indent=4)
     
     def __achievmentsToJSON(self) -> str:
         """
@@ -4374,7 +220,7 @@ class Generator:
             generator = Generator()
             json_data = generator.__achievmentsToJSON()
         """
-        return json.dumps({'achvUnlocks': AchievementEnum.ACHIEVEMENTS_DICT.value}, indent=4)
+        return fh_dumps({'achvUnlocks': catalogs.AchievementEnum.ACHIEVEMENTS_DICT.value}, indent=4)
     
     def __speciesToJSON(self) -> str:
         """
@@ -4387,7 +233,7 @@ class Generator:
             generator = Generator()
             json_data = generator.__speciesToJSON()
         """
-        return json.dumps({'dex': SpeciesEnum.POKEMON_DICT.value}, indent=4)
+        return fh_dumps({'dex': catalogs.SpeciesEnum.POKEMON_DICT.value}, indent=4)
     
     def __startersToJSON(self) -> str:
         """
@@ -4400,7 +246,7 @@ class Generator:
             generator = Generator()
             json_data = generator.__startersToJSON()
         """
-        return json.dumps({'dex': StarterEnum.STARTER_DICT.value}, indent=4)
+        return fh_dumps({'dex': catalogs.StarterEnum.STARTER_DICT.value}, indent=4)
     
     def __movesToJSON(self) -> str:
         """
@@ -4413,7 +259,7 @@ class Generator:
             generator = Generator()
             json_data = generator.__movesToJSON()
         """
-        return json.dumps({'moves': MovesEnum.MOVES_DICT.value}, indent=4)
+        return fh_dumps({'moves': catalogs.MovesEnum.MOVES_DICT.value}, indent=4)
 
     def __hasFormsToJSON(self) -> str:
         """
@@ -4426,7 +272,7 @@ class Generator:
             generator = Generator()
             json_data = generator.__hasFormsToJSON()
         """
-        return json.dumps({'hasForms': hasFormsEnum.FORMID_DICT.value}, indent=4)
+        return fh_dumps({'hasForms': catalogs.hasFormsEnum.FORMID_DICT.value}, indent=4)
     
     def __eggTypesToJSON(self) -> str:
         """
@@ -4439,36 +285,121 @@ class Generator:
             generator = Generator()
             json_data = generator.__hasFormsToJSON()
         """
-        return json.dumps({'eggTypes': eggTypesEnum.EGGTYPES_DICT.value}, indent=4)
+        return fh_dumps({'eggTypes': catalogs.eggTypesEnum.EGGTYPES_DICT.value}, indent=4)
+
+    @staticmethod
+    def __fh_catalogHash(moduleName: str, *extraSources: object) -> str:
+        """
+        Compute the content hash of a catalog without importing it.
+
+        Args:
+            moduleName (str): The catalog module in utilities.catalogs, e.g. 'moves'.
+            *extraSources (object): Additional python data the generated file depends on.
+
+        Returns:
+            str: Hex digest identifying the catalog content.
+
+        Example:
+            generator = Generator()
+            catalogHash = generator.__fh_catalogHash('biomes')
+        """
+        catalogHash = catalogs.fh_getSourceHash(moduleName)
+        if extraSources:
+            catalogHash = hashlib.sha256(f'{catalogHash}{extraSources!r}'.encode('utf-8')).hexdigest()
+        return catalogHash
+
+    @staticmethod
+    def __fh_loadManifest() -> Dict[str, Dict[str, object]]:
+        """
+        Load the catalog manifest from the data directory.
+
+        Returns:
+            Dict[str, Dict[str, object]]: Mapping of filename to its stored hash, size and modification time.
+            An empty dictionary if the manifest does not exist or is unreadable.
+
+        Example:
+            generator = Generator()
+            manifest = generator.__fh_loadManifest()
+        """
+        try:
+            manifest = fh_load(catalogManifestFile)
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def __fh_isUnchanged(manifestEntry: Optional[Dict[str, object]], catalogHash: str, filePath: str) -> bool:
+        """
+        Check whether a generated catalog file is still up to date.
+
+        A catalog is unchanged when its source hash matches the manifest and the file on disk
+        still has the size and modification time recorded when it was written.
+
+        Args:
+            manifestEntry (Optional[Dict[str, object]]): The manifest entry for the file, if any.
+            catalogHash (str): The current content hash of the catalog source.
+            filePath (str): The path of the generated JSON file.
+
+        Returns:
+            bool: True if the file can be left untouched.
+        """
+        if not manifestEntry or manifestEntry.get('hash') != catalogHash:
+            return False
+        try:
+            stat = os.stat(filePath)
+        except OSError:
+            return False
+        return manifestEntry.get('size') == stat.st_size and manifestEntry.get('mtime') == stat.st_mtime_ns
 
     def generate(self) -> None:
         """
         Generate and save various JSON files for natures, no passives, biomes, vouchers, nature slots, achievements, species, starters, moves, and forms.
 
+        Catalogs whose source hash and file stats match the manifest are skipped without being imported
+        and without any JSON encoding, decoding or merging. The catalog database is recompiled whenever
+        a catalog changed or the database is missing or outdated.
+
         Example:
             generator = Generator()
             generator.generate()
 
         Modules:
-            - json: Provides functionalities to work with JSON data for reading and writing.
             - os: Provides a way to interact with the operating system, particularly for file and directory operations.
-            - utilities: Custom module for colored printing and logging functionalities.
+            - hashlib: Provides the content hashes stored in the catalog manifest.
+            - utilities: Custom module for colored printing and logging functionalities, and the catalog store.
         """
         appData = [
-            (self.__natureToJSON, 'natures.json'),
-            (self.__noPassiveToJSON, 'noPassive.json'),
-            (self.__biomesToJSON, 'biomes.json'),
-            (self.__vouchersToJSON, 'vouchers.json'),
-            (self.__natureSlotToJSON, 'natureSlot.json'),
-            (self.__achievmentsToJSON, 'achievements.json'),
-            (self.__speciesToJSON, 'species.json'),
-            (self.__startersToJSON, 'starter.json'),
-            (self.__movesToJSON, 'moves.json'),
-            (self.__hasFormsToJSON, 'hasForms.json'),
-            (self.__eggTypesToJSON, 'eggTypes.json')
+            # The default nature names and IDs follow from the natures source, only custom names are hashed too.
+            (self.__natureToJSON, 'natures.json', self.__fh_catalogHash('natures', *([self.__customNatureNames] if self.__customNatureNames is not None else []))),
+            (self.__noPassiveToJSON, 'noPassive.json', self.__fh_catalogHash('noPassive')),
+            (self.__biomesToJSON, 'biomes.json', self.__fh_catalogHash('biomes')),
+            (self.__vouchersToJSON, 'vouchers.json', self.__fh_catalogHash('vouchers')),
+            (self.__natureSlotToJSON, 'natureSlot.json', self.__fh_catalogHash('natures')),
+            (self.__achievmentsToJSON, 'achievements.json', self.__fh_catalogHash('achievements')),
+            (self.__speciesToJSON, 'species.json', self.__fh_catalogHash('species')),
+            (self.__startersToJSON, 'starter.json', self.__fh_catalogHash('starters')),
+            (self.__movesToJSON, 'moves.json', self.__fh_catalogHash('moves')),
+            (self.__hasFormsToJSON, 'hasForms.json', self.__fh_catalogHash('hasForms')),
+            (self.__eggTypesToJSON, 'eggTypes.json', self.__fh_catalogHash('eggTypes'))
         ]
 
-        for JSONFunc, filename in appData:
-            JSONData = JSONFunc()
+        manifest = self.__fh_loadManifest()
+        manifestChanged = False
+
+        for JSONFunc, filename, catalogHash in appData:
             filePath = os.path.join(dataDirectory, filename)
+            if self.__fh_isUnchanged(manifest.get(filename), catalogHash, filePath):
+                continue
+
+            JSONData = JSONFunc()
             self.__writeJSON(filePath, JSONData)
+
+            stat = os.stat(filePath)
+            manifest[filename] = {'hash': catalogHash, 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+            manifestChanged = True
+
+        if manifestChanged:
+            fh_writeJSONAtomic(catalogManifestFile, manifest)
+
+        if manifestChanged or CatalogStore.fh_needsRebuild():
+            CatalogStore.fh_build()
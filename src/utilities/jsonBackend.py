@@ -0,0 +1,189 @@
+# Authors https://github.com/JulianStiebler/
+# Organization: https://github.com/rogueEdit/
+# Repository: https://github.com/rogueEdit/OnlineRogueEditor
+# Contributors: https://github.com/claudiunderthehood
+# Date of release: 06.06.2024
+# Last Edited: 28.06.2024
+
+"""
+This script provides the JSON encoder and decoder used for every save file, backup and catalog.
+
+It picks the fastest installed library, orjson first, then ujson, and falls back to the standard
+library json module. config.jsonBackend can force one of them.
+
+The output is byte for byte what the standard library writes, so save files, backups and their
+hashes do not change when another backend is installed:
+- orjson only knows two layouts, compact and two space indentation. The indented layout is widened
+  to the requested indentation, every other layout is written by the standard library.
+- orjson writes non-ASCII characters unescaped, formats some floats differently (1e16 instead of
+  1e+16, 0.00001 instead of 1e-05), writes NaN and Infinity as null and cannot encode integers
+  beyond 64 bit or non string keys. Output that may contain one of these is written by the standard
+  library instead.
+- ujson and orjson parse integers beyond 64 bit as floats or not at all; documents containing a
+  number with 19 or more digits are parsed by the standard library.
+- ujson is only used for decoding, its encoder does not match the standard library output.
+- Every decode error is a json.JSONDecodeError, no matter which backend raised it.
+
+Modules:
+- json: The standard library fallback and the reference output.
+- importlib: Imports the optional backends.
+- math: Finds NaN and Infinity, which orjson writes as null.
+- typing: Provides type hints for better code clarity and type checking.
+- modules.config: Provides the configured backend.
+
+Usage Example:
+    >>> from utilities import fh_loads, fh_dumps
+    >>> data = fh_loads(b'{"money": 1000}')
+    >>> fh_dumps(data, indent=4)
+    '{\\n    "money": 1000\\n}'
+"""
+
+import json
+# The standard library fallback and the reference output.
+
+import importlib
+# Imports the optional backends.
+
+import math
+# Finds NaN and Infinity, which orjson writes as null.
+
+from typing import Any, Optional, Union
+# Provides type hints for better code clarity and type checking.
+
+from modules import config
+# Provides the configured backend.
+
+BACKENDS = ('orjson', 'ujson', 'json')
+
+# Raised by fh_loads for invalid documents, whichever backend parsed them.
+JSONDecodeError = json.JSONDecodeError
+
+# Maps every digit to 0 so numbers can be checked with plain substring searches, which are much
+# faster than a regular expression over a whole save file.
+_DIGITS = bytes.maketrans(b'123456789E', b'000000000e')
+# Every integer with up to 18 digits fits into int64 and is parsed exactly by every backend.
+_LONG_INTEGER = b'0' * 19
+_CONTAINERS = (dict, list, tuple)
+
+def fh_selectBackend(name: str = 'auto') -> Any:
+    """
+    Import a JSON backend.
+
+    Args:
+        name (str): 'auto' or one of BACKENDS.
+
+    Returns:
+        Any: The backend module, json if the requested one is not installed.
+    """
+    for candidate in (BACKENDS if name == 'auto' else (name,)):
+        try:
+            return importlib.import_module(candidate)
+        except ImportError:
+            continue
+    return json
+
+backend = fh_selectBackend(config.jsonBackend)
+# Name of the active backend, e.g. 'orjson'.
+BACKEND: str = backend.__name__
+
+def __fh_isStandardOutput(output: bytes) -> bool:
+    # False if json.dumps may have written something else: non-ASCII and DEL are escaped by json,
+    # floats below 1e-4 or from 1e16 on use another notation (digit + e, or 0.0000...).
+    if not output.isascii() or b'\x7f' in output:
+        return False
+    normalized = output.translate(_DIGITS)
+    return b'0e' not in normalized and b'0.0000' not in normalized
+
+def __fh_hasNonFiniteFloat(data: Any) -> bool:
+    # True if the data holds NaN or Infinity, json.dumps writes them as such, orjson as null.
+    # Plain scalars are skipped by their exact type first, they make up nearly all of a save file.
+    stack = [data]
+    while stack:
+        container = stack.pop()
+        if not isinstance(container, _CONTAINERS):
+            if isinstance(container, float) and not math.isfinite(container):
+                return True
+            continue
+        for value in (container.values() if isinstance(container, dict) else container):
+            kind = type(value)
+            if kind is int or kind is str or kind is bool or value is None:
+                continue
+            stack.append(value)
+    return False
+
+def fh_loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data (Union[str, bytes, bytearray]): The document, bytes avoid a decode with orjson.
+
+    Returns:
+        Any: The parsed data, identical to json.loads.
+
+    Raises:
+        json.JSONDecodeError: If the document is no valid JSON.
+    """
+    if backend is not json:
+        raw = data.encode() if isinstance(data, str) else data
+        if _LONG_INTEGER not in raw.translate(_DIGITS):
+            try:
+                return backend.loads(data)
+            except (ValueError, OverflowError):
+                # Let the standard library decide and report the error with line and column.
+                pass
+    return json.loads(data)
+
+def fh_load(path: str) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Args:
+        path (str): The file.
+
+    Returns:
+        Any: The parsed data.
+
+    Raises:
+        OSError: If the file cannot be read.
+        json.JSONDecodeError: If the file is no valid JSON.
+    """
+    with open(path, 'rb') as file:
+        return fh_loads(file.read())
+
+def fh_dumps(data: Any, indent: Optional[int] = None, compact: bool = False) -> str:
+    """
+    Serialize data exactly like json.dumps with ensure_ascii.
+
+    Args:
+        data (Any): The data to serialize.
+        indent (Optional[int]): Indentation like json.dumps, e.g. 4 for the save files.
+        compact (bool): No spaces after separators, the layout JSON.stringify of the game uses.
+            Ignored if indent is given.
+
+    Returns:
+        str: The JSON text.
+
+    Usage Example:
+        >>> fh_dumps({'a': [1, 2]}, compact=True)
+        '{"a":[1,2]}'
+    """
+    if BACKEND == 'orjson' and ((indent is None and compact) or indent in (2, 4)):
+        try:
+            output = backend.dumps(data)
+        except TypeError:
+            output = None
+        if output is not None and __fh_isStandardOutput(output) and not (b'null' in output and __fh_hasNonFiniteFloat(data)):
+            if indent is None:
+                return output.decode('ascii')
+            # The compact output has no whitespace outside of strings. Without a double space in any
+            # string, every double space of the indented output is indentation and can be widened.
+            if indent == 2 or b'  ' not in output:
+                output = backend.dumps(data, option=backend.OPT_INDENT_2)
+                return (output if indent == 2 else output.replace(b'  ', b'    ')).decode('ascii')
+
+    if indent is not None:
+        return json.dumps(data, indent=indent)
+    if compact:
+        return json.dumps(data, separators=(',', ':'))
+    return json.dumps(data)
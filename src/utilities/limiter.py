@@ -32,6 +32,8 @@ import json
 import time
 from functools import wraps
 from utilities import cFormatter, Color
+from utilities.atomicWriter import fh_writeAtomic, fh_writeJSONAtomic
+from utilities.jsonBackend import fh_load, JSONDecodeError
 from modules.config import timestampFile
 
 class Limiter:
@@ -74,8 +76,7 @@ class Limiter:
         if not os.path.exists(os.path.dirname(self.timestampFile)):
             os.makedirs(os.path.dirname(self.timestampFile))
         if not os.path.exists(self.timestampFile):
-            with open(self.timestampFile, 'w') as f:
-                json.dump({}, f)
+            fh_writeAtomic(self.timestampFile, json.dumps({}))
 
     def lockout(self, func):
         """
@@ -130,8 +131,7 @@ class Limiter:
         Modules:
             - json: Provides functionalities to work with JSON data for reading and writing timestamps.
         """
-        with open(self.timestampFile, 'r') as f:
-            timestamps = json.load(f)
+        timestamps = fh_load(self.timestampFile)
         return timestamps.get(function, 0)
 
     def _fh_updateLastExecTime(self, function: str, timestamp: float) -> None:
@@ -149,12 +149,9 @@ class Limiter:
         Modules:
             - json: Provides functionalities to work with JSON data for reading and writing timestamps.
         """
-        with open(self.timestampFile, 'r+') as f:
-            try:
-                timestamps = json.load(f)
-            except json.decoder.JSONDecodeError:
-                timestamps = {}
-            timestamps[function] = timestamp
-            f.seek(0)
-            json.dump(timestamps, f, indent=4)
-            f.truncate()
+        try:
+            timestamps = fh_load(self.timestampFile)
+        except (OSError, JSONDecodeError):
+            timestamps = {}
+        timestamps[function] = timestamp
+        fh_writeJSONAtomic(self.timestampFile, timestamps)
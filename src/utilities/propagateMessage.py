@@ -5,31 +5,35 @@
 # Date of release: 25.06.2024
 # Last Edited: 28.06.2024
 
+import threading
 from utilities import cFormatter, Color
 
 # Initialize a global message buffer list
 messageBuffer = []
+# Background threads (e.g. the update check in config) post messages as well
+messageBufferLock = threading.Lock()
 
 # Function to clear the message buffer
 def fh_clearMessageBuffer():
-    global messageBuffer
-    messageBuffer = []
+    with messageBufferLock:
+        messageBuffer.clear()
 
 # Function to append messages to the message buffer
 def fh_appendMessageBuffer(type, message, isLogging=False):
-    global messageBuffer
-    messageBuffer.append((type, message, isLogging))
+    with messageBufferLock:
+        messageBuffer.append((type, message, isLogging))
 
 # Function to print messages from the message buffer
 def fh_printMessageBuffer():
-    global messageBuffer
-    for color, text, isLogging in messageBuffer:
+    with messageBufferLock:
+        pending = list(messageBuffer)
+        messageBuffer.clear()  # Clear buffer after printing
+    for color, text, isLogging in pending:
         if isinstance(color, Color):  # Check if color is a valid Color enum
             cFormatter.fh_centerText(text, length=55, fillChar='>')
             cFormatter.print(color, f'{text}', isLogging)
         else:
             print(text)
-    messageBuffer = []  # Clear buffer after printing
 
 def fh_redundantMesage(changedItems, message, target=None, propagate=True):
     if target: